@@ -20,6 +20,26 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_name(name: str | None, type_: str, parent_names: object) -> bool:
+    # Only compare tables the ORM knows about. Dialect-specific structures created
+    # by raw DDL (the full-text search index and its shadow tables) would otherwise
+    # show up in autogenerate as tables to drop.
+    if type_ == "table":
+        return name in target_metadata.tables
+    return True
+
+
+def include_object(
+    obj: object, name: str | None, type_: str, reflected: bool, compare_to: object
+) -> bool:
+    # On PostgreSQL databases migrated with partition_incident_updates=true the
+    # (incident_id, sequence) unique constraint is a plain index of the same
+    # name, as partitioned tables only allow uniqueness that includes the
+    # partition key. Leave it out of the comparison so autogenerate does not
+    # try to swap it back on either kind of database.
+    return name != "uq_incident_updates_incident_id_sequence"
+
+
 def run_migrations_offline() -> None:
     # Offline mode generates SQL scripts without a live DB connection,
     # useful for reviewing or applying migrations manually.
@@ -27,6 +47,8 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -40,6 +62,8 @@ def do_run_migrations(connection: object) -> None:
     context.configure(
         connection=connection,  # type: ignore[arg-type]
         target_metadata=target_metadata,
+        include_name=include_name,
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
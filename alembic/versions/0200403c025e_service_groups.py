@@ -0,0 +1,62 @@
+"""service groups
+
+Revision ID: 0200403c025e
+Revises: 7a4f7ebb8264
+Create Date: 2026-10-19 04:01:28.403953
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0200403c025e'
+down_revision: str | Sequence[str] | None = '7a4f7ebb8264'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('service_groups',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('parent_id', sa.Uuid(), nullable=True),
+    sa.Column('service_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('degraded_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('outage_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['parent_id'], ['service_groups.id']),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('service_group_closure',
+    sa.Column('ancestor_id', sa.Uuid(), nullable=False),
+    sa.Column('descendant_id', sa.Uuid(), nullable=False),
+    sa.Column('depth', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ancestor_id'], ['service_groups.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['descendant_id'], ['service_groups.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id')
+    )
+    op.create_index('ix_service_group_closure_descendant_id', 'service_group_closure', ['descendant_id'], unique=False)
+    op.create_table('service_group_members',
+    sa.Column('service_id', sa.Uuid(), nullable=False),
+    sa.Column('group_id', sa.Uuid(), nullable=False),
+    sa.ForeignKeyConstraint(['group_id'], ['service_groups.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['service_id'], ['services.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('service_id')
+    )
+    op.create_index('ix_service_group_members_group_id', 'service_group_members', ['group_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_service_group_members_group_id', table_name='service_group_members')
+    op.drop_table('service_group_members')
+    op.drop_index('ix_service_group_closure_descendant_id', table_name='service_group_closure')
+    op.drop_table('service_group_closure')
+    op.drop_table('service_groups')
@@ -0,0 +1,64 @@
+"""incident list filter indexes
+
+Revision ID: 5b8e0d6f1c27
+Revises: 7f3a9c41e2b8
+Create Date: 2026-10-19 14:02:55.904113
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e0d6f1c27'
+down_revision: str | Sequence[str] | None = '7f3a9c41e2b8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The server default only exists so the column can be added as NOT NULL to a
+    # populated table; the ORM always sets severity_rank from severity. It is not
+    # removed on SQLite, where dropping it would need a table rebuild (and a
+    # rebuild would also drop the full-text search triggers on incidents).
+    op.add_column(
+        'incidents',
+        sa.Column('severity_rank', sa.SmallInteger(), server_default='0', nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE incidents SET severity_rank = CASE severity
+            WHEN 'critical' THEN 0
+            WHEN 'high' THEN 1
+            WHEN 'medium' THEN 2
+            ELSE 3
+        END
+        """
+    )
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column('incidents', 'severity_rank', server_default=None)
+
+    op.create_index('ix_incidents_created_at', 'incidents', ['created_at'])
+    op.create_index('ix_incidents_status_created_at', 'incidents', ['status', 'created_at'])
+    op.create_index('ix_incidents_severity_created_at', 'incidents', ['severity', 'created_at'])
+    op.create_index(
+        'ix_incidents_severity_rank_created_at',
+        'incidents',
+        ['severity_rank', sa.text('created_at DESC')],
+    )
+    op.create_index('ix_incidents_resolved_at', 'incidents', ['resolved_at'])
+    op.create_index('ix_service_incidents_incident_id', 'service_incidents', ['incident_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_service_incidents_incident_id', table_name='service_incidents')
+    op.drop_index('ix_incidents_resolved_at', table_name='incidents')
+    op.drop_index('ix_incidents_severity_rank_created_at', table_name='incidents')
+    op.drop_index('ix_incidents_severity_created_at', table_name='incidents')
+    op.drop_index('ix_incidents_status_created_at', table_name='incidents')
+    op.drop_index('ix_incidents_created_at', table_name='incidents')
+    op.drop_column('incidents', 'severity_rank')
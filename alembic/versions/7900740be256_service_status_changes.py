@@ -0,0 +1,43 @@
+"""service status changes
+
+Revision ID: 7900740be256
+Revises: e6b9d3a05f71
+Create Date: 2026-10-19 03:40:48.297572
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7900740be256'
+down_revision: str | Sequence[str] | None = 'e6b9d3a05f71'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The log for existing services is built by running
+    # `opstatus status-history-backfill` after upgrading.
+    op.create_table('service_status_changes',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+    sa.Column('service_id', sa.Uuid(), nullable=False),
+    sa.Column('status', sa.Enum('operational', 'degraded', 'outage', name='servicestatus'), nullable=False),
+    sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('incident_id', sa.Uuid(), nullable=True),
+    sa.ForeignKeyConstraint(['incident_id'], ['incidents.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['service_id'], ['services.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_service_status_changes_service_id_changed_at_id', 'service_status_changes', ['service_id', 'changed_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_service_status_changes_service_id_changed_at_id', table_name='service_status_changes')
+    op.drop_table('service_status_changes')
+    # drop_table leaves the PostgreSQL enum type behind; a no-op on SQLite.
+    sa.Enum(name='servicestatus').drop(op.get_bind(), checkfirst=True)
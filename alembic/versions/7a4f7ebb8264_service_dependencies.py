@@ -0,0 +1,62 @@
+"""service dependencies
+
+Revision ID: 7a4f7ebb8264
+Revises: a7d4e2f9c315
+Create Date: 2026-10-19 03:54:15.987538
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4f7ebb8264'
+down_revision: str | Sequence[str] | None = 'a7d4e2f9c315'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The enum type already exists on PostgreSQL (service status changes).
+SERVICE_STATUS = sa.Enum('operational', 'degraded', 'outage', name='servicestatus').with_variant(
+    postgresql.ENUM('operational', 'degraded', 'outage', name='servicestatus', create_type=False),
+    'postgresql',
+)
+
+# No service has dependencies yet, so each effective status starts out as the
+# service's latest logged status.
+BACKFILL_EFFECTIVE_STATUS = """
+    UPDATE services SET effective_status = coalesce(
+        (
+            SELECT status FROM service_status_changes
+            WHERE service_status_changes.service_id = services.id
+            ORDER BY changed_at DESC, id DESC
+            LIMIT 1
+        ),
+        'operational'
+    )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('service_dependencies',
+    sa.Column('service_id', sa.Uuid(), nullable=False),
+    sa.Column('depends_on_id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.CheckConstraint('service_id != depends_on_id', name='ck_service_dependencies_not_self'),
+    sa.ForeignKeyConstraint(['depends_on_id'], ['services.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['service_id'], ['services.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('service_id', 'depends_on_id')
+    )
+    op.create_index('ix_service_dependencies_depends_on_id', 'service_dependencies', ['depends_on_id'], unique=False)
+    op.add_column('services', sa.Column('effective_status', SERVICE_STATUS, server_default='operational', nullable=False))
+    op.execute(BACKFILL_EFFECTIVE_STATUS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('services', 'effective_status')
+    op.drop_index('ix_service_dependencies_depends_on_id', table_name='service_dependencies')
+    op.drop_table('service_dependencies')
@@ -0,0 +1,155 @@
+"""incident full-text search
+
+Revision ID: 7f3a9c41e2b8
+Revises: d2c199d251db
+Create Date: 2026-10-19 11:40:07.218844
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3a9c41e2b8'
+down_revision: str | Sequence[str] | None = 'd2c199d251db'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The search index is dialect-specific and maintained by triggers, so it is
+# written as raw DDL rather than autogenerated. Existing incidents are indexed
+# by running `opstatus search-backfill` after upgrading.
+SQLITE_UPGRADE = [
+    """
+    CREATE TABLE incident_rowids (
+        id INTEGER PRIMARY KEY,
+        incident_id CHAR(32) NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE TRIGGER incident_rowids_bi BEFORE INSERT ON incidents BEGIN
+        INSERT OR IGNORE INTO incident_rowids (incident_id) VALUES (new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER incident_rowids_ad AFTER DELETE ON incidents BEGIN
+        DELETE FROM incident_rowids WHERE incident_id = old.id;
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE incident_search USING fts5(
+        title, body, messages, tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER incident_search_ai AFTER INSERT ON incidents BEGIN
+        INSERT INTO incident_search (rowid, title, body, messages)
+        SELECT id, new.title, coalesce(new.body, ''), ''
+        FROM incident_rowids WHERE incident_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER incident_search_au AFTER UPDATE OF title, body ON incidents BEGIN
+        UPDATE incident_search SET title = new.title, body = coalesce(new.body, '')
+        WHERE rowid = (SELECT id FROM incident_rowids WHERE incident_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER incident_search_bd BEFORE DELETE ON incidents BEGIN
+        DELETE FROM incident_search
+        WHERE rowid = (SELECT id FROM incident_rowids WHERE incident_id = old.id);
+    END
+    """,
+    """
+    CREATE TRIGGER incident_search_updates_ai AFTER INSERT ON incident_updates BEGIN
+        UPDATE incident_search SET messages = messages || char(10) || new.message
+        WHERE rowid = (
+            SELECT id FROM incident_rowids WHERE incident_id = new.incident_id
+        );
+    END
+    """,
+]
+
+POSTGRES_UPGRADE = [
+    """
+    CREATE TABLE incident_search (
+        incident_id UUID PRIMARY KEY REFERENCES incidents (id) ON DELETE CASCADE,
+        header TSVECTOR NOT NULL DEFAULT ''::tsvector,
+        messages TSVECTOR NOT NULL DEFAULT ''::tsvector,
+        document TSVECTOR NOT NULL DEFAULT ''::tsvector
+    )
+    """,
+    "CREATE INDEX ix_incident_search_document ON incident_search USING gin (document)",
+    """
+    CREATE FUNCTION incident_search_index_incident() RETURNS trigger AS $$
+    DECLARE
+        new_header tsvector := setweight(to_tsvector('english', NEW.title), 'A')
+            || setweight(to_tsvector('english', coalesce(NEW.body, '')), 'B');
+    BEGIN
+        INSERT INTO incident_search (incident_id, header, document)
+        VALUES (NEW.id, new_header, new_header)
+        ON CONFLICT (incident_id) DO UPDATE
+            SET header = EXCLUDED.header,
+                document = EXCLUDED.header || incident_search.messages;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER incident_search_incident
+        AFTER INSERT OR UPDATE OF title, body ON incidents
+        FOR EACH ROW EXECUTE FUNCTION incident_search_index_incident()
+    """,
+    """
+    CREATE FUNCTION incident_search_index_update() RETURNS trigger AS $$
+    DECLARE
+        message_vector tsvector := setweight(
+            to_tsvector('english', NEW.message), 'C'
+        );
+    BEGIN
+        UPDATE incident_search
+        SET messages = messages || message_vector,
+            document = header || messages || message_vector
+        WHERE incident_id = NEW.incident_id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER incident_search_update
+        AFTER INSERT ON incident_updates
+        FOR EACH ROW EXECUTE FUNCTION incident_search_index_update()
+    """,
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS incident_search_updates_ai",
+    "DROP TRIGGER IF EXISTS incident_search_bd",
+    "DROP TRIGGER IF EXISTS incident_search_au",
+    "DROP TRIGGER IF EXISTS incident_search_ai",
+    "DROP TRIGGER IF EXISTS incident_rowids_ad",
+    "DROP TRIGGER IF EXISTS incident_rowids_bi",
+    "DROP TABLE IF EXISTS incident_search",
+    "DROP TABLE IF EXISTS incident_rowids",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP TABLE IF EXISTS incident_search",
+    "DROP FUNCTION IF EXISTS incident_search_index_update() CASCADE",
+    "DROP FUNCTION IF EXISTS incident_search_index_incident() CASCADE",
+]
+
+
+def _statements(sqlite: list[str], postgres: list[str]) -> list[str]:
+    return postgres if op.get_bind().dialect.name == 'postgresql' else sqlite
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in _statements(SQLITE_UPGRADE, POSTGRES_UPGRADE):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in _statements(SQLITE_DOWNGRADE, POSTGRES_DOWNGRADE):
+        op.execute(statement)
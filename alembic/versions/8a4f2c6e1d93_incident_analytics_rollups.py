@@ -0,0 +1,62 @@
+"""incident analytics rollups
+
+Revision ID: 8a4f2c6e1d93
+Revises: c3e81f47a9d2
+Create Date: 2026-10-19 17:48:12.604391
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4f2c6e1d93'
+down_revision: str | Sequence[str] | None = 'c3e81f47a9d2'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The incidentseverity type already exists on PostgreSQL (initial schema).
+SEVERITY = sa.Enum('critical', 'high', 'medium', 'low', name='incidentseverity').with_variant(
+    postgresql.ENUM('critical', 'high', 'medium', 'low', name='incidentseverity', create_type=False),
+    'postgresql',
+)
+
+
+def _counter_columns() -> list[sa.Column]:
+    return [
+        sa.Column('opened', sa.Integer(), nullable=False),
+        sa.Column('resolved', sa.Integer(), nullable=False),
+        sa.Column('resolve_seconds', sa.Float(), nullable=False),
+        sa.Column('investigating_seconds', sa.Float(), nullable=False),
+        sa.Column('identified_seconds', sa.Float(), nullable=False),
+        sa.Column('monitoring_seconds', sa.Float(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rollups for existing incidents are computed by running
+    # `opstatus analytics-backfill` after upgrading.
+    op.create_table('incident_daily_rollups',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('severity', SEVERITY, nullable=False),
+    *_counter_columns(),
+    sa.PrimaryKeyConstraint('day', 'severity')
+    )
+    op.create_table('service_incident_daily_rollups',
+    sa.Column('service_id', sa.Uuid(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('severity', SEVERITY, nullable=False),
+    *_counter_columns(),
+    sa.ForeignKeyConstraint(['service_id'], ['services.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('service_id', 'day', 'severity')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('service_incident_daily_rollups')
+    op.drop_table('incident_daily_rollups')
@@ -0,0 +1,97 @@
+"""incident archive
+
+Revision ID: 8ec13f45d315
+Revises: 7900740be256
+Create Date: 2026-10-19 03:44:52.135300
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8ec13f45d315'
+down_revision: str | Sequence[str] | None = '7900740be256'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Both enum types already exist on PostgreSQL (initial schema).
+SEVERITY = sa.Enum('critical', 'high', 'medium', 'low', name='incidentseverity').with_variant(
+    postgresql.ENUM('critical', 'high', 'medium', 'low', name='incidentseverity', create_type=False),
+    'postgresql',
+)
+STATUS = sa.Enum('investigating', 'identified', 'monitoring', 'resolved', name='incidentstatus').with_variant(
+    postgresql.ENUM('investigating', 'identified', 'monitoring', 'resolved', name='incidentstatus', create_type=False),
+    'postgresql',
+)
+
+# service_status_changes.incident_id stops being a foreign key, as archiving
+# removes incidents the log still refers to. It was created unnamed: PostgreSQL
+# named it by its default convention, and on SQLite batch mode needs a naming
+# convention to address it.
+PG_STATUS_FK = 'service_status_changes_incident_id_fkey'
+SQLITE_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+SQLITE_STATUS_FK = 'fk_service_status_changes_incident_id_incidents'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('archived_incidents',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('body', sa.Text(), nullable=True),
+    sa.Column('severity', SEVERITY, nullable=False),
+    sa.Column('severity_rank', sa.SmallInteger(), nullable=False),
+    sa.Column('status', STATUS, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('resolved_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_update_sequence', sa.Integer(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_archived_incidents_created_at', 'archived_incidents', ['created_at'], unique=False)
+    op.create_table('archived_incident_updates',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('incident_id', sa.Uuid(), nullable=False),
+    sa.Column('sequence', sa.Integer(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('status', STATUS, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['incident_id'], ['archived_incidents.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('incident_id', 'sequence', name='uq_archived_incident_updates_incident_id_sequence')
+    )
+    op.create_table('archived_service_incidents',
+    sa.Column('service_id', sa.Uuid(), nullable=False),
+    sa.Column('incident_id', sa.Uuid(), nullable=False),
+    sa.ForeignKeyConstraint(['incident_id'], ['archived_incidents.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['service_id'], ['services.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('service_id', 'incident_id')
+    )
+    op.create_index('ix_archived_service_incidents_incident_id', 'archived_service_incidents', ['incident_id'], unique=False)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_constraint(PG_STATUS_FK, 'service_status_changes', type_='foreignkey')
+    else:
+        with op.batch_alter_table('service_status_changes', naming_convention=SQLITE_CONVENTION) as batch_op:
+            batch_op.drop_constraint(SQLITE_STATUS_FK, type_='foreignkey')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Archived incidents are dropped with their tables; run this only on a
+    # database that has never been archived, or accept losing that history.
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_foreign_key(PG_STATUS_FK, 'service_status_changes', 'incidents', ['incident_id'], ['id'], ondelete='SET NULL')
+    else:
+        with op.batch_alter_table('service_status_changes') as batch_op:
+            batch_op.create_foreign_key(SQLITE_STATUS_FK, 'incidents', ['incident_id'], ['id'], ondelete='SET NULL')
+    op.drop_index('ix_archived_service_incidents_incident_id', table_name='archived_service_incidents')
+    op.drop_table('archived_service_incidents')
+    op.drop_table('archived_incident_updates')
+    op.drop_index('ix_archived_incidents_created_at', table_name='archived_incidents')
+    op.drop_table('archived_incidents')
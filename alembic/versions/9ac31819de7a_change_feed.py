@@ -0,0 +1,49 @@
+"""change feed
+
+Revision ID: 9ac31819de7a
+Revises: 0fd6e08d3912
+Create Date: 2026-10-19 04:13:56.577225
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9ac31819de7a'
+down_revision: str | Sequence[str] | None = '0fd6e08d3912'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('changes',
+    sa.Column('seq', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+    sa.Column('entity_type', sa.Enum('service', 'incident', name='changeentity'), nullable=False),
+    sa.Column('entity_id', sa.Uuid(), nullable=False),
+    sa.Column('operation', sa.Enum('created', 'updated', 'deleted', 'archived', name='changeoperation'), nullable=False),
+    sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('seq'),
+    sqlite_autoincrement=True
+    )
+    op.create_index('ix_changes_entity_type_entity_id_seq', 'changes', ['entity_type', 'entity_id', 'seq'], unique=False)
+    # Existing services and incidents enter the feed as created, oldest first,
+    # so a new consumer can start from after=0 instead of re-listing.
+    for entity, table in (('service', 'services'), ('incident', 'incidents')):
+        op.execute(
+            f"INSERT INTO changes (entity_type, entity_id, operation, changed_at) "
+            f"SELECT '{entity}', id, 'created', created_at FROM {table} "
+            f"ORDER BY created_at, id"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_changes_entity_type_entity_id_seq', table_name='changes')
+    op.drop_table('changes')
+    # drop_table leaves the PostgreSQL enum types behind; a no-op on SQLite.
+    sa.Enum(name='changeoperation').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='changeentity').drop(op.get_bind(), checkfirst=True)
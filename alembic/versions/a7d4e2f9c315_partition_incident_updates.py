@@ -0,0 +1,161 @@
+"""partition incident updates
+
+Revision ID: a7d4e2f9c315
+Revises: 8ec13f45d315
+Create Date: 2026-10-19 04:02:11.418305
+
+"""
+from collections.abc import Sequence
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e2f9c315'
+down_revision: str | Sequence[str] | None = '8ec13f45d315'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Opt-in, PostgreSQL only: converts incident_updates into a table partitioned
+# by created_at month when run as
+#   alembic -x partition_incident_updates=true upgrade head
+# Without the flag, and always on SQLite, this revision changes nothing. Later
+# partitions are created, and expired ones dropped, by
+# `opstatus maintain-partitions` (app/services/partitions.py).
+#
+# A unique constraint on a partitioned table must include the partition key, so
+# (incident_id, sequence) becomes a plain index of the same name. Sequences stay
+# unique because they are handed out by the atomic Incident.last_update_sequence
+# increment, which was always what guaranteed them.
+
+MONTHS_AHEAD = 3
+
+COLUMNS = """
+    id UUID NOT NULL,
+    incident_id UUID NOT NULL REFERENCES incidents (id) ON DELETE CASCADE,
+    sequence INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    status incidentstatus NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL
+"""
+COLUMN_NAMES = 'id, incident_id, sequence, message, status, created_at'
+
+SEARCH_TRIGGER = """
+    CREATE TRIGGER incident_search_update
+        AFTER INSERT ON incident_updates
+        FOR EACH ROW EXECUTE FUNCTION incident_search_index_update()
+"""
+
+# One partition per UTC month, from the month of the oldest update (or the
+# current month) through MONTHS_AHEAD months ahead. Rows outside every range,
+# e.g. if maintenance stops running, land in the DEFAULT partition and are
+# moved out when their month's partition is created.
+CREATE_PARTITIONS = f"""
+    DO $$
+    DECLARE
+        first_month timestamp := date_trunc('month', coalesce(
+            (SELECT min(created_at) FROM incident_updates_unpartitioned),
+            now()
+        ) AT TIME ZONE 'UTC');
+        last_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC')
+            + interval '{MONTHS_AHEAD} months';
+        partition_month timestamp;
+    BEGIN
+        FOR partition_month IN
+            SELECT generate_series(first_month, last_month, interval '1 month')
+        LOOP
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF incident_updates '
+                'FOR VALUES FROM (%L) TO (%L)',
+                'incident_updates_p' || to_char(partition_month, 'YYYYMM'),
+                partition_month AT TIME ZONE 'UTC',
+                (partition_month + interval '1 month') AT TIME ZONE 'UTC'
+            );
+        END LOOP;
+    END
+    $$
+"""
+
+
+def _is_partitioned() -> bool:
+    return bool(op.get_bind().exec_driver_sql(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+        "WHERE partrelid = to_regclass('incident_updates'))"
+    ).scalar())
+
+
+def _release_names(table: str) -> None:
+    # Index names are schema-wide, so the old table's indexes are dropped before
+    # the new table recreates them under the same names.
+    op.execute(f'DROP TRIGGER incident_search_update ON {table}')
+    op.execute(f'ALTER TABLE {table} DROP CONSTRAINT incident_updates_pkey')
+    op.execute('DROP INDEX ix_incident_updates_incident_id_created_at_id')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    opted_in = context.get_x_argument(as_dictionary=True).get('partition_incident_updates')
+    if op.get_bind().dialect.name != 'postgresql' or opted_in != 'true':
+        return
+
+    op.execute('ALTER TABLE incident_updates RENAME TO incident_updates_unpartitioned')
+    _release_names('incident_updates_unpartitioned')
+    op.execute(
+        'ALTER TABLE incident_updates_unpartitioned '
+        'DROP CONSTRAINT uq_incident_updates_incident_id_sequence'
+    )
+    op.execute(
+        f"""
+        CREATE TABLE incident_updates ({COLUMNS},
+            CONSTRAINT incident_updates_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute(
+        'CREATE INDEX uq_incident_updates_incident_id_sequence '
+        'ON incident_updates (incident_id, sequence)'
+    )
+    op.execute(
+        'CREATE INDEX ix_incident_updates_incident_id_created_at_id '
+        'ON incident_updates (incident_id, created_at, id)'
+    )
+    op.execute('CREATE TABLE incident_updates_default PARTITION OF incident_updates DEFAULT')
+    op.execute(CREATE_PARTITIONS)
+    # Copied before the search trigger exists, so messages are not appended to
+    # the search documents a second time.
+    op.execute(
+        f'INSERT INTO incident_updates ({COLUMN_NAMES}) '
+        f'SELECT {COLUMN_NAMES} FROM incident_updates_unpartitioned'
+    )
+    op.execute('DROP TABLE incident_updates_unpartitioned')
+    op.execute(SEARCH_TRIGGER)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Reverts whatever state upgrade() left, flag or not.
+    if op.get_bind().dialect.name != 'postgresql' or not _is_partitioned():
+        return
+
+    op.execute('ALTER TABLE incident_updates RENAME TO incident_updates_partitioned')
+    _release_names('incident_updates_partitioned')
+    op.execute('DROP INDEX uq_incident_updates_incident_id_sequence')
+    op.execute(
+        f"""
+        CREATE TABLE incident_updates ({COLUMNS},
+            CONSTRAINT incident_updates_pkey PRIMARY KEY (id),
+            CONSTRAINT uq_incident_updates_incident_id_sequence
+                UNIQUE (incident_id, sequence)
+        )
+        """
+    )
+    op.execute(
+        'CREATE INDEX ix_incident_updates_incident_id_created_at_id '
+        'ON incident_updates (incident_id, created_at, id)'
+    )
+    op.execute(
+        f'INSERT INTO incident_updates ({COLUMN_NAMES}) '
+        f'SELECT {COLUMN_NAMES} FROM incident_updates_partitioned'
+    )
+    # Dropping the parent drops every partition with it.
+    op.execute('DROP TABLE incident_updates_partitioned')
+    op.execute(SEARCH_TRIGGER)
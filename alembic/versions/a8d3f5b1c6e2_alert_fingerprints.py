@@ -0,0 +1,33 @@
+"""alert fingerprints
+
+Revision ID: a8d3f5b1c6e2
+Revises: f4a7c2d9e8b3
+Create Date: 2026-10-19 08:02:17.391845
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d3f5b1c6e2'
+down_revision: str | Sequence[str] | None = 'f4a7c2d9e8b3'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('alert_fingerprints',
+    sa.Column('fingerprint', sa.String(length=255), nullable=False),
+    sa.Column('incident_id', sa.Uuid(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('fingerprint')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('alert_fingerprints')
@@ -0,0 +1,108 @@
+"""incident active interval index
+
+Revision ID: c3e81f47a9d2
+Revises: 5b8e0d6f1c27
+Create Date: 2026-10-19 16:21:38.417265
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e81f47a9d2'
+down_revision: str | Sequence[str] | None = '5b8e0d6f1c27'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Like the search index, the interval index is dialect-specific raw DDL. Unlike
+# search, existing incidents are indexed here: the backfill is a single
+# set-based statement over columns the migration already has.
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE incident_intervals
+    USING rtree_i32(id, start_minute, end_minute)
+    """,
+    """
+    CREATE TRIGGER incident_intervals_ai AFTER INSERT ON incidents BEGIN
+        INSERT INTO incident_intervals (id, start_minute, end_minute)
+        SELECT id,
+               CAST(strftime('%s', new.created_at) AS INTEGER) / 60,
+               CASE WHEN new.resolved_at IS NULL THEN 2147483647
+               ELSE max(
+                   CAST(strftime('%s', new.created_at) AS INTEGER) / 60,
+                   (CAST(strftime('%s', new.resolved_at) AS INTEGER) + 59) / 60
+               ) END
+        FROM incident_rowids WHERE incident_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER incident_intervals_au
+    AFTER UPDATE OF created_at, resolved_at ON incidents BEGIN
+        UPDATE incident_intervals
+        SET start_minute = CAST(strftime('%s', new.created_at) AS INTEGER) / 60,
+            end_minute = CASE WHEN new.resolved_at IS NULL THEN 2147483647
+            ELSE max(
+                CAST(strftime('%s', new.created_at) AS INTEGER) / 60,
+                (CAST(strftime('%s', new.resolved_at) AS INTEGER) + 59) / 60
+            ) END
+        WHERE id = (SELECT id FROM incident_rowids WHERE incident_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER incident_intervals_bd BEFORE DELETE ON incidents BEGIN
+        DELETE FROM incident_intervals
+        WHERE id = (SELECT id FROM incident_rowids WHERE incident_id = old.id);
+    END
+    """,
+    # Incidents that predate the search migration's backfill may not have a key.
+    "INSERT OR IGNORE INTO incident_rowids (incident_id) SELECT id FROM incidents",
+    """
+    INSERT INTO incident_intervals (id, start_minute, end_minute)
+    SELECT k.id,
+           CAST(strftime('%s', i.created_at) AS INTEGER) / 60,
+           CASE WHEN i.resolved_at IS NULL THEN 2147483647
+           ELSE max(
+               CAST(strftime('%s', i.created_at) AS INTEGER) / 60,
+               (CAST(strftime('%s', i.resolved_at) AS INTEGER) + 59) / 60
+           ) END
+    FROM incidents AS i
+    JOIN incident_rowids AS k ON k.incident_id = i.id
+    """,
+]
+
+POSTGRES_UPGRADE = [
+    """
+    CREATE INDEX ix_incidents_active_range ON incidents
+    USING gist ((
+        tstzrange(created_at, coalesce(resolved_at, 'infinity'::timestamptz), '[]')
+    ))
+    """,
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS incident_intervals_bd",
+    "DROP TRIGGER IF EXISTS incident_intervals_au",
+    "DROP TRIGGER IF EXISTS incident_intervals_ai",
+    "DROP TABLE IF EXISTS incident_intervals",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_incidents_active_range",
+]
+
+
+def _statements(sqlite: list[str], postgres: list[str]) -> list[str]:
+    return postgres if op.get_bind().dialect.name == 'postgresql' else sqlite
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in _statements(SQLITE_UPGRADE, POSTGRES_UPGRADE):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in _statements(SQLITE_DOWNGRADE, POSTGRES_DOWNGRADE):
+        op.execute(statement)
@@ -0,0 +1,32 @@
+"""cache versions
+
+Revision ID: c6d1e8a4b7f2
+Revises: a8d3f5b1c6e2
+Create Date: 2026-10-19 14:36:52.118204
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6d1e8a4b7f2'
+down_revision: str | Sequence[str] | None = 'a8d3f5b1c6e2'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cache_versions',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.Uuid(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cache_versions')
@@ -0,0 +1,74 @@
+"""incident update sequence
+
+Revision ID: d2c199d251db
+Revises: 394bc6fdde38
+Create Date: 2026-10-19 09:12:41.530712
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2c199d251db'
+down_revision: str | Sequence[str] | None = '394bc6fdde38'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'incidents',
+        sa.Column('last_update_sequence', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column('incident_updates', sa.Column('sequence', sa.Integer(), nullable=True))
+
+    # Number existing timelines in (created_at, id) order, then seed each
+    # incident's counter so new updates continue from the highest sequence.
+    op.execute(
+        """
+        UPDATE incident_updates
+        SET sequence = (
+            SELECT numbered.rn FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY incident_id ORDER BY created_at, id
+                ) AS rn
+                FROM incident_updates
+            ) AS numbered
+            WHERE numbered.id = incident_updates.id
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE incidents
+        SET last_update_sequence = (
+            SELECT COUNT(*) FROM incident_updates
+            WHERE incident_updates.incident_id = incidents.id
+        )
+        """
+    )
+
+    # batch_alter_table recreates the table on SQLite, which cannot ALTER COLUMN.
+    with op.batch_alter_table('incident_updates') as batch_op:
+        batch_op.alter_column('sequence', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_unique_constraint(
+            'uq_incident_updates_incident_id_sequence', ['incident_id', 'sequence']
+        )
+    op.create_index(
+        'ix_incident_updates_incident_id_created_at_id',
+        'incident_updates',
+        ['incident_id', 'created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_incident_updates_incident_id_created_at_id', table_name='incident_updates')
+    with op.batch_alter_table('incident_updates') as batch_op:
+        batch_op.drop_constraint('uq_incident_updates_incident_id_sequence', type_='unique')
+        batch_op.drop_column('sequence')
+    op.drop_column('incidents', 'last_update_sequence')
@@ -0,0 +1,36 @@
+"""service daily availability
+
+Revision ID: e6b9d3a05f71
+Revises: 8a4f2c6e1d93
+Create Date: 2026-10-19 19:05:27.113580
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b9d3a05f71'
+down_revision: str | Sequence[str] | None = '8a4f2c6e1d93'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filled lazily by uptime reports; no backfill is needed.
+    op.create_table('service_daily_availability',
+    sa.Column('service_id', sa.Uuid(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('outage_seconds', sa.Float(), nullable=False),
+    sa.Column('degraded_seconds', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['service_id'], ['services.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('service_id', 'day')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('service_daily_availability')
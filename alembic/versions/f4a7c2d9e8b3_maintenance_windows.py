@@ -0,0 +1,57 @@
+"""maintenance windows
+
+Revision ID: f4a7c2d9e8b3
+Revises: b5e2a9c7d410
+Create Date: 2026-10-19 07:14:52.604113
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a7c2d9e8b3'
+down_revision: str | Sequence[str] | None = 'b5e2a9c7d410'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('maintenance_windows',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('starts_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('ends_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.CheckConstraint('starts_at < ends_at', name='ck_maintenance_windows_order'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_maintenance_windows_ends_at', 'maintenance_windows', ['ends_at'], unique=False)
+    op.create_table('maintenance_window_services',
+    sa.Column('window_id', sa.Uuid(), nullable=False),
+    sa.Column('service_id', sa.Uuid(), nullable=False),
+    sa.ForeignKeyConstraint(['service_id'], ['services.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['window_id'], ['maintenance_windows.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('window_id', 'service_id')
+    )
+    op.create_index('ix_maintenance_window_services_service_id', 'maintenance_window_services', ['service_id'], unique=False)
+    # The status is only ever computed, never stored, but the enum type has to
+    # know the value. ADD VALUE cannot run inside a transaction block before
+    # PostgreSQL 12; SQLite stores the enum as plain VARCHAR.
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE servicestatus ADD VALUE IF NOT EXISTS 'maintenance'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # PostgreSQL cannot drop an enum value; 'maintenance' stays in
+    # servicestatus, unused.
+    op.drop_index('ix_maintenance_window_services_service_id', table_name='maintenance_window_services')
+    op.drop_table('maintenance_window_services')
+    op.drop_index('ix_maintenance_windows_ends_at', table_name='maintenance_windows')
+    op.drop_table('maintenance_windows')
@@ -1,12 +1,24 @@
 from fastapi import APIRouter
 
+from app.api.v1.alerts import router as alerts_router
+from app.api.v1.analytics import router as analytics_router
+from app.api.v1.changes import router as changes_router
+from app.api.v1.groups import router as groups_router
 from app.api.v1.health import router as health_router
 from app.api.v1.incidents import router as incidents_router
+from app.api.v1.maintenance import router as maintenance_router
 from app.api.v1.metrics import router as metrics_router
 from app.api.v1.services import router as services_router
+from app.api.v1.webhooks import router as webhooks_router
 
 api_router = APIRouter()
 api_router.include_router(services_router, prefix="/api/v1")
+api_router.include_router(groups_router, prefix="/api/v1")
 api_router.include_router(incidents_router, prefix="/api/v1")
+api_router.include_router(maintenance_router, prefix="/api/v1")
+api_router.include_router(alerts_router, prefix="/api/v1")
+api_router.include_router(analytics_router, prefix="/api/v1")
+api_router.include_router(webhooks_router, prefix="/api/v1")
+api_router.include_router(changes_router, prefix="/api/v1")
 api_router.include_router(health_router)
 api_router.include_router(metrics_router)
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_session
+from app.models.schemas.alerts import AlertBatch, AlertBatchResponse
+from app.services import alerts as alert_service
+
+router = APIRouter(prefix="/alerts", tags=["Alerts"])
+
+
+@router.post(
+    "",
+    response_model=AlertBatchResponse,
+    summary="Ingest alerts",
+    description=(
+        "Accepts a batch of alerts in Alertmanager webhook format (Grafana sends "
+        "the same). A firing alert opens an incident on the service named by its "
+        "service label, or adds a timeline update to the one it already has, at "
+        "most once per debounce window. A resolved alert resolves its incident. "
+        "Alerts are deduplicated by fingerprint, so resending a batch is safe."
+    ),
+)
+async def ingest_alerts(
+    payload: AlertBatch,
+    session: AsyncSession = Depends(get_session),
+) -> AlertBatchResponse:
+    return await alert_service.ingest_alerts(session=session, alerts=payload.alerts)
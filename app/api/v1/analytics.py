@@ -0,0 +1,68 @@
+import uuid
+from datetime import UTC, date, datetime, timedelta
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.params import CommaSeparated
+from app.db.session import get_session
+from app.models.enums import IncidentSeverity, TimeBucket
+from app.models.schemas.analytics import AnalyticsResponse
+from app.services import analytics as analytics_service
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+# Default report window when no start date is given: the last 12 months.
+DEFAULT_WINDOW = timedelta(days=365)
+
+
+@router.get(
+    "",
+    response_model=AnalyticsResponse,
+    summary="Incident reliability analytics",
+    description=(
+        "Returns incident counts, mean time to resolve and mean time spent in each "
+        "status per time bucket and severity, optionally for a single service. "
+        "Served from daily rollups that are updated as incidents open and resolve."
+    ),
+)
+async def get_analytics(
+    start: date | None = Query(
+        None, description="First day of the report (UTC); defaults to a year ago"
+    ),
+    end: date | None = Query(
+        None, description="Last day of the report (UTC, inclusive); defaults to today"
+    ),
+    bucket: TimeBucket = Query(TimeBucket.day, description="day, week or month"),
+    service_id: uuid.UUID | None = Query(
+        None, description="Only incidents affecting this service"
+    ),
+    severity: Annotated[
+        list[IncidentSeverity] | None,
+        CommaSeparated,
+        Query(description="Filter by incident severity (comma-separated)"),
+    ] = None,
+    session: AsyncSession = Depends(get_session),
+) -> AnalyticsResponse:
+    end = end or datetime.now(UTC).date()
+    start = start or end - DEFAULT_WINDOW + timedelta(days=1)
+    if start > end:
+        raise RequestValidationError(
+            [
+                {
+                    "loc": ("query", "start"),
+                    "msg": "start must not be after end",
+                    "type": "value_error",
+                }
+            ]
+        )
+    return await analytics_service.get_analytics(
+        session=session,
+        start=start,
+        end=end,
+        bucket=bucket,
+        service_id=service_id,
+        severities=severity,
+    )
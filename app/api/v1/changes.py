@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_session
+from app.models.schemas.changes import ChangeListResponse
+from app.services import changes as change_service
+
+router = APIRouter(prefix="/changes", tags=["Changes"])
+
+
+@router.get(
+    "",
+    response_model=ChangeListResponse,
+    summary="Read the change feed",
+    description=(
+        "Returns service and incident changes with a sequence number greater than "
+        "`after`, oldest first. Pass `meta.next_after` as `after` to continue; "
+        "an empty page means the consumer is up to date."
+    ),
+)
+async def list_changes(
+    after: int = Query(0, ge=0, description="Last sequence number already read"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of changes"),
+    session: AsyncSession = Depends(get_session),
+) -> ChangeListResponse:
+    return await change_service.list_changes(session=session, after=after, limit=limit)
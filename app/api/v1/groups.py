@@ -0,0 +1,153 @@
+import uuid
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_session
+from app.models.schemas.groups import (
+    ServiceGroupCreate,
+    ServiceGroupListResponse,
+    ServiceGroupMemberCreate,
+    ServiceGroupResponse,
+    ServiceGroupUpdate,
+)
+from app.models.schemas.services import ServiceListResponse
+from app.services import groups as group_service
+
+router = APIRouter(prefix="/groups", tags=["Groups"])
+
+
+@router.get(
+    "",
+    response_model=ServiceGroupListResponse,
+    summary="List all groups",
+    description=(
+        "Returns every service group with its rollup status: the worst effective "
+        "status among the services in it and in the groups below it."
+    ),
+)
+async def list_groups(
+    session: AsyncSession = Depends(get_session),
+) -> ServiceGroupListResponse:
+    return await group_service.list_groups(session)
+
+
+@router.post(
+    "",
+    response_model=ServiceGroupResponse,
+    status_code=201,
+    summary="Create a group",
+    description="Creates a group, optionally nested under `parent_id`.",
+)
+async def create_group(
+    payload: ServiceGroupCreate,
+    session: AsyncSession = Depends(get_session),
+) -> ServiceGroupResponse:
+    return await group_service.create_group(
+        session=session,
+        name=payload.name,
+        description=payload.description,
+        parent_id=payload.parent_id,
+    )
+
+
+@router.get(
+    "/{group_id}",
+    response_model=ServiceGroupResponse,
+    summary="Get a group by ID",
+    description="Returns a single group and its rollup status.",
+)
+async def get_group(
+    group_id: uuid.UUID,
+    session: AsyncSession = Depends(get_session),
+) -> ServiceGroupResponse:
+    return await group_service.get_group(session=session, group_id=group_id)
+
+
+@router.patch(
+    "/{group_id}",
+    response_model=ServiceGroupResponse,
+    summary="Update a group",
+    description=(
+        "Updates a group. Only provided fields are changed; `parent_id` moves the "
+        "group and everything below it, and `null` makes it top-level."
+    ),
+)
+async def update_group(
+    group_id: uuid.UUID,
+    payload: ServiceGroupUpdate,
+    session: AsyncSession = Depends(get_session),
+) -> ServiceGroupResponse:
+    return await group_service.update_group(
+        session=session,
+        group_id=group_id,
+        name=payload.name,
+        description=payload.description,
+        parent_id=payload.parent_id,
+        move="parent_id" in payload.model_fields_set,
+    )
+
+
+@router.delete(
+    "/{group_id}",
+    status_code=204,
+    summary="Delete a group",
+    description="Deletes a group. The group must have no subgroups or services.",
+)
+async def delete_group(
+    group_id: uuid.UUID,
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    await group_service.delete_group(session=session, group_id=group_id)
+    return Response(status_code=204)
+
+
+@router.get(
+    "/{group_id}/services",
+    response_model=ServiceListResponse,
+    summary="List a group's services",
+    description="Returns the services in the group and in every group below it.",
+)
+async def list_group_services(
+    group_id: uuid.UUID,
+    session: AsyncSession = Depends(get_session),
+) -> ServiceListResponse:
+    return await group_service.list_group_services(session=session, group_id=group_id)
+
+
+@router.post(
+    "/{group_id}/services",
+    response_model=ServiceGroupResponse,
+    status_code=201,
+    summary="Add a service to a group",
+    description=(
+        "Places a service in this group, taking it out of any other group. "
+        "Returns the group with its updated rollup."
+    ),
+)
+async def add_group_service(
+    group_id: uuid.UUID,
+    payload: ServiceGroupMemberCreate,
+    session: AsyncSession = Depends(get_session),
+) -> ServiceGroupResponse:
+    return await group_service.add_group_service(
+        session=session, group_id=group_id, service_id=payload.service_id
+    )
+
+
+@router.delete(
+    "/{group_id}/services/{service_id}",
+    status_code=204,
+    summary="Remove a service from a group",
+    description="Takes a service out of this group, leaving it ungrouped.",
+)
+async def remove_group_service(
+    group_id: uuid.UUID,
+    service_id: uuid.UUID,
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    await group_service.remove_group_service(
+        session=session, group_id=group_id, service_id=service_id
+    )
+    return Response(status_code=204)
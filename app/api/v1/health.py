@@ -1,7 +1,7 @@
 import time
 
 import structlog
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,11 +25,23 @@ async def liveness() -> JSONResponse:
 @router.get(
     "/health/ready",
     summary="Readiness probe",
-    description="Returns 200 only if the database connection pool is healthy.",
+    description=(
+        "Returns 200 only once start-up warm-up has finished and the database "
+        "connection pool is healthy."
+    ),
 )
 async def readiness(
+    request: Request,
     session: AsyncSession = Depends(get_session),
 ) -> JSONResponse:
+    if not request.app.state.warmed_up:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "unavailable",
+                "checks": {"warmup": {"status": "pending"}},
+            },
+        )
     start = time.perf_counter()
     try:
         await session.execute(text("SELECT 1"))
@@ -1,19 +1,36 @@
 import uuid
+from datetime import datetime
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.exceptions import RequestValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.params import CommaSeparated, IdempotencyKeyHeader, TimeWindow
 from app.db.session import get_session
-from app.models.enums import IncidentSeverity, IncidentStatus
+from app.models.enums import (
+    IncidentSeverity,
+    IncidentSort,
+    IncidentStatus,
+    ServiceMatch,
+)
 from app.models.schemas.incidents import (
     IncidentAppendUpdate,
     IncidentCreate,
     IncidentListResponse,
     IncidentResponse,
+    IncidentSearchResponse,
     IncidentUpdate,
+    IncidentUpdateListResponse,
     IncidentUpdateResponse,
 )
+from app.models.schemas.lookup import MAX_LOOKUP_IDS, IdLookup
 from app.services import incidents as incident_service
+from app.services.idempotency import (
+    REPLAYED_HEADER,
+    request_fingerprint,
+    run_idempotent,
+)
 
 router = APIRouter(prefix="/incidents", tags=["Incidents"])
 
@@ -23,26 +40,115 @@ router = APIRouter(prefix="/incidents", tags=["Incidents"])
     response_model=IncidentListResponse,
     summary="List incidents",
     description=(
-        "Returns all incidents with optional filtering by status, severity, or service."
+        "Returns incidents with optional filtering by status, severity, affected "
+        "services and time range. List filters accept comma-separated values. "
+        "With `ids`, returns just those incidents, archived ones included, in the "
+        "order given, with unknown IDs listed under `missing`."
     ),
 )
 async def list_incidents(
-    status: IncidentStatus | None = Query(
-        None, description="Filter by incident status"
-    ),
-    severity: IncidentSeverity | None = Query(
-        None, description="Filter by incident severity"
-    ),
+    ids: Annotated[
+        list[uuid.UUID] | None,
+        CommaSeparated,
+        Query(
+            max_length=MAX_LOOKUP_IDS,
+            description="Only these incident IDs (comma-separated); "
+            "not combinable with filters",
+        ),
+    ] = None,
+    status: Annotated[
+        list[IncidentStatus] | None,
+        CommaSeparated,
+        Query(description="Filter by incident status (comma-separated)"),
+    ] = None,
+    severity: Annotated[
+        list[IncidentSeverity] | None,
+        CommaSeparated,
+        Query(description="Filter by incident severity (comma-separated)"),
+    ] = None,
     service_id: uuid.UUID | None = Query(
         None, description="Filter by affected service ID"
     ),
+    service_ids: Annotated[
+        list[uuid.UUID] | None,
+        CommaSeparated,
+        Query(description="Filter by affected service IDs (comma-separated)"),
+    ] = None,
+    service_match: ServiceMatch = Query(
+        ServiceMatch.any,
+        description="Match incidents affecting any or all of service_ids",
+    ),
+    created_after: datetime | None = Query(
+        None, description="Only incidents created at or after this time"
+    ),
+    created_before: datetime | None = Query(
+        None, description="Only incidents created before this time"
+    ),
+    resolved_after: datetime | None = Query(
+        None, description="Only incidents resolved at or after this time"
+    ),
+    active: bool | None = Query(
+        None, description="true for unresolved incidents, false for resolved ones"
+    ),
+    active_during: Annotated[
+        list[datetime] | None,
+        CommaSeparated,
+        TimeWindow,
+        Query(
+            description=(
+                "Only incidents that were open at any point in this window, "
+                "given as start,end"
+            )
+        ),
+    ] = None,
+    sort: IncidentSort = Query(
+        IncidentSort.recent,
+        description="recent (newest first), oldest, or severity (most severe first)",
+    ),
+    include_archived: bool = Query(
+        False, description="Also return archived incidents (resolved long ago)"
+    ),
     session: AsyncSession = Depends(get_session),
 ) -> IncidentListResponse:
+    if ids is not None:
+        filters: list[object] = [
+            status,
+            severity,
+            service_id,
+            service_ids,
+            created_after,
+            created_before,
+            resolved_after,
+            active,
+            active_during,
+        ]
+        if any(f is not None for f in filters):
+            raise RequestValidationError(
+                [
+                    {
+                        "loc": ("query", "ids"),
+                        "msg": "ids cannot be combined with filters",
+                        "type": "value_error",
+                    }
+                ]
+            )
+        return await incident_service.lookup_incidents(session, ids)
+    # service_id predates service_ids and is kept for existing clients.
+    if service_id is not None:
+        service_ids = [*(service_ids or []), service_id]
     items = await incident_service.list_incidents(
         session=session,
-        status=status,
-        severity=severity,
-        service_id=service_id,
+        statuses=status,
+        severities=severity,
+        service_ids=service_ids,
+        service_match=service_match,
+        created_after=created_after,
+        created_before=created_before,
+        resolved_after=resolved_after,
+        active=active,
+        active_during=(active_during[0], active_during[1]) if active_during else None,
+        sort=sort,
+        include_archived=include_archived,
     )
     return IncidentListResponse(
         data=items,
@@ -57,27 +163,82 @@ async def list_incidents(
     summary="Create an incident",
     description=(
         "Opens a new incident against one or more services. "
-        "Initial status is always investigating."
+        "Initial status is always investigating. Send an Idempotency-Key to "
+        "retry safely."
     ),
 )
 async def create_incident(
     payload: IncidentCreate,
+    response: Response,
+    idempotency_key: Annotated[str | None, IdempotencyKeyHeader] = None,
     session: AsyncSession = Depends(get_session),
 ) -> IncidentResponse:
-    return await incident_service.create_incident(
+    incident, replayed = await run_idempotent(
+        session,
+        idempotency_key,
+        request_fingerprint("POST /incidents", payload),
+        lambda: incident_service.create_incident(
+            session=session,
+            title=payload.title,
+            severity=payload.severity,
+            service_ids=payload.service_ids,
+            body=payload.body,
+        ),
+    )
+    if replayed:
+        response.headers[REPLAYED_HEADER] = "true"
+    return IncidentResponse.model_validate(incident)
+
+
+# Declared before /{incident_id} so "search" is not parsed as an incident ID.
+@router.get(
+    "/search",
+    response_model=IncidentSearchResponse,
+    summary="Search incidents",
+    description=(
+        "Full-text search over incident titles, bodies and timeline messages. "
+        "Results are ranked by relevance and include highlighted snippets."
+    ),
+)
+async def search_incidents(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    session: AsyncSession = Depends(get_session),
+) -> IncidentSearchResponse:
+    return await incident_service.search_incidents(
         session=session,
-        title=payload.title,
-        severity=payload.severity,
-        service_ids=payload.service_ids,
-        body=payload.body,
+        query=q,
+        limit=limit,
+        offset=offset,
     )
 
 
+@router.post(
+    "/lookup",
+    response_model=IncidentListResponse,
+    summary="Look up incidents by ID",
+    description=(
+        "Returns the incidents with the given IDs, archived ones included, in the "
+        "order given, with unknown IDs listed under `missing`. For ID lists too "
+        "long for a URL."
+    ),
+)
+async def lookup_incidents(
+    payload: IdLookup,
+    session: AsyncSession = Depends(get_session),
+) -> IncidentListResponse:
+    return await incident_service.lookup_incidents(session, payload.ids)
+
+
 @router.get(
     "/{incident_id}",
     response_model=IncidentResponse,
     summary="Get an incident by ID",
-    description="Returns a single incident with its full update timeline.",
+    description=(
+        "Returns a single incident with its full update timeline. Archived "
+        "incidents are returned too."
+    ),
 )
 async def get_incident(
     incident_id: uuid.UUID,
@@ -110,6 +271,32 @@ async def update_incident(
     )
 
 
+@router.get(
+    "/{incident_id}/updates",
+    response_model=IncidentUpdateListResponse,
+    summary="List incident updates",
+    description=(
+        "Returns the incident timeline in sequence order, one page at a time. "
+        "Pass the previous response's next_cursor (or the last sequence seen) "
+        "as since to fetch only newer entries."
+    ),
+)
+async def list_incident_updates(
+    incident_id: uuid.UUID,
+    since: int | None = Query(
+        None, ge=0, description="Only return updates with a sequence after this one"
+    ),
+    limit: int = Query(50, ge=1, le=500, description="Maximum updates to return"),
+    session: AsyncSession = Depends(get_session),
+) -> IncidentUpdateListResponse:
+    return await incident_service.list_incident_updates(
+        session=session,
+        incident_id=incident_id,
+        since=since,
+        limit=limit,
+    )
+
+
 @router.post(
     "/{incident_id}/updates",
     response_model=IncidentUpdateResponse,
@@ -117,20 +304,30 @@ async def update_incident(
     summary="Append an incident update",
     description=(
         "Appends a new status update to the incident timeline. "
-        "Cannot be edited or deleted."
+        "Cannot be edited or deleted. Send an Idempotency-Key to retry safely."
     ),
 )
 async def append_incident_update(
     incident_id: uuid.UUID,
     payload: IncidentAppendUpdate,
+    response: Response,
+    idempotency_key: Annotated[str | None, IdempotencyKeyHeader] = None,
     session: AsyncSession = Depends(get_session),
 ) -> IncidentUpdateResponse:
-    return await incident_service.append_incident_update(
-        session=session,
-        incident_id=incident_id,
-        message=payload.message,
-        status=payload.status,
+    update, replayed = await run_idempotent(
+        session,
+        idempotency_key,
+        request_fingerprint(f"POST /incidents/{incident_id}/updates", payload),
+        lambda: incident_service.append_incident_update(
+            session=session,
+            incident_id=incident_id,
+            message=payload.message,
+            status=payload.status,
+        ),
     )
+    if replayed:
+        response.headers[REPLAYED_HEADER] = "true"
+    return IncidentUpdateResponse.model_validate(update)
 
 
 @router.post(
@@ -0,0 +1,95 @@
+import uuid
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_session
+from app.models.schemas.maintenance import (
+    MaintenanceWindowCreate,
+    MaintenanceWindowListResponse,
+    MaintenanceWindowResponse,
+)
+from app.services import maintenance as maintenance_service
+
+router = APIRouter(prefix="/maintenance", tags=["Maintenance"])
+
+
+@router.get(
+    "",
+    response_model=MaintenanceWindowListResponse,
+    summary="List maintenance windows",
+    description=(
+        "Returns current and upcoming maintenance windows, earliest first. "
+        "`include_past` adds windows that have already ended."
+    ),
+)
+async def list_maintenance_windows(
+    service_id: uuid.UUID | None = Query(
+        None, description="Only windows covering this service"
+    ),
+    include_past: bool = Query(False, description="Include windows that have ended"),
+    session: AsyncSession = Depends(get_session),
+) -> MaintenanceWindowListResponse:
+    return await maintenance_service.list_maintenance_windows(
+        session=session, service_id=service_id, include_past=include_past
+    )
+
+
+@router.post(
+    "",
+    response_model=MaintenanceWindowResponse,
+    status_code=201,
+    summary="Schedule a maintenance window",
+    description=(
+        "Schedules maintenance for one or more services. While the window is open "
+        "they report `maintenance` as their status, and outage or degraded time "
+        "in it is left out of uptime."
+    ),
+)
+async def create_maintenance_window(
+    payload: MaintenanceWindowCreate,
+    session: AsyncSession = Depends(get_session),
+) -> MaintenanceWindowResponse:
+    return await maintenance_service.create_maintenance_window(
+        session=session,
+        title=payload.title,
+        starts_at=payload.starts_at,
+        ends_at=payload.ends_at,
+        service_ids=payload.service_ids,
+        description=payload.description,
+    )
+
+
+@router.get(
+    "/{window_id}",
+    response_model=MaintenanceWindowResponse,
+    summary="Get a maintenance window by ID",
+    description="Returns a single maintenance window and the services it covers.",
+)
+async def get_maintenance_window(
+    window_id: uuid.UUID,
+    session: AsyncSession = Depends(get_session),
+) -> MaintenanceWindowResponse:
+    return await maintenance_service.get_maintenance_window(
+        session=session, window_id=window_id
+    )
+
+
+@router.delete(
+    "/{window_id}",
+    status_code=204,
+    summary="Cancel a maintenance window",
+    description=(
+        "Deletes a maintenance window. Uptime for the days it covered is "
+        "recomputed as if it had never been scheduled."
+    ),
+)
+async def delete_maintenance_window(
+    window_id: uuid.UUID,
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    await maintenance_service.delete_maintenance_window(
+        session=session, window_id=window_id
+    )
+    return Response(status_code=204)
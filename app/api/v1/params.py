@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Any
+
+from fastapi import Header
+from pydantic import AfterValidator, BeforeValidator
+
+from app.db.repositories.base import as_utc
+
+
+def _split_comma_separated(value: Any) -> Any:
+    # FastAPI collects repeated query parameters (?status=a&status=b) into a list;
+    # splitting each item on commas also accepts the compact ?status=a,b form.
+    if isinstance(value, list):
+        return [
+            part.strip()
+            for item in value
+            for part in str(item).split(",")
+            if part.strip()
+        ]
+    return value
+
+
+# Annotated metadata for list-valued query parameters, e.g.
+# status: Annotated[list[IncidentStatus] | None, CommaSeparated, Query()] = None
+CommaSeparated = BeforeValidator(_split_comma_separated)
+
+
+def _check_time_window(value: list[datetime] | None) -> list[datetime] | None:
+    if value is None:
+        return value
+    if len(value) != 2:
+        raise ValueError("expected two timestamps: start,end")
+    # Naive timestamps are UTC, as the filter itself reads them; comparing a
+    # naive bound with an aware one directly would raise TypeError.
+    if as_utc(value[0]) > as_utc(value[1]):
+        raise ValueError("start must not be after end")
+    return value
+
+
+# Annotated metadata for a "start,end" pair of timestamps, applied after
+# CommaSeparated has split and parsed the values.
+TimeWindow = AfterValidator(_check_time_window)
+
+
+# Annotated metadata for the Idempotency-Key header of writes that clients may
+# retry, e.g. idempotency_key: Annotated[str | None, IdempotencyKeyHeader] = None
+IdempotencyKeyHeader = Header(
+    alias="Idempotency-Key",
+    min_length=1,
+    max_length=255,
+    description=(
+        "Client-chosen unique key (a UUID, say). Repeats of the request with the "
+        "same key return the first response, with Idempotent-Replayed: true, "
+        "instead of writing again."
+    ),
+)
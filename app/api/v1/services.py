@@ -1,17 +1,29 @@
 import uuid
+from datetime import datetime
+from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.params import CommaSeparated
 from app.db.session import get_session
+from app.models.schemas.lookup import MAX_LOOKUP_IDS, IdLookup
 from app.models.schemas.services import (
     ServiceCreate,
+    ServiceDependencyCreate,
     ServiceListResponse,
     ServiceResponse,
+    ServiceStatusAtResponse,
+    ServiceStatusHistoryResponse,
     ServiceUpdate,
+    ServiceUptimeListResponse,
+    ServiceUptimeResponse,
 )
+from app.services import dependencies as dependency_service
+from app.services import service_status as status_service
 from app.services import services as service_layer
+from app.services import uptime as uptime_service
 
 router = APIRouter(prefix="/services", tags=["Services"])
 
@@ -20,11 +32,25 @@ router = APIRouter(prefix="/services", tags=["Services"])
     "",
     response_model=ServiceListResponse,
     summary="List all services",
-    description="Returns all tracked services with their derived health status.",
+    description=(
+        "Returns all tracked services with their derived health status, or with "
+        "`ids`, just those services, in the order given, with unknown IDs listed "
+        "under `missing`."
+    ),
 )
 async def list_services(
+    ids: Annotated[
+        list[uuid.UUID] | None,
+        CommaSeparated,
+        Query(
+            max_length=MAX_LOOKUP_IDS,
+            description="Only these service IDs (comma-separated)",
+        ),
+    ] = None,
     session: AsyncSession = Depends(get_session),
 ) -> ServiceListResponse:
+    if ids is not None:
+        return await service_layer.lookup_services(session, ids)
     items = await service_layer.list_services(session)
     return ServiceListResponse(
         data=items,
@@ -50,6 +76,39 @@ async def create_service(
     )
 
 
+@router.post(
+    "/lookup",
+    response_model=ServiceListResponse,
+    summary="Look up services by ID",
+    description=(
+        "Returns the services with the given IDs, in the order given, with "
+        "unknown IDs listed under `missing`. For ID lists too long for a URL."
+    ),
+)
+async def lookup_services(
+    payload: IdLookup,
+    session: AsyncSession = Depends(get_session),
+) -> ServiceListResponse:
+    return await service_layer.lookup_services(session, payload.ids)
+
+
+# Declared before /{service_id} so "uptime" is not parsed as a service ID.
+@router.get(
+    "/uptime",
+    response_model=ServiceUptimeListResponse,
+    summary="Uptime for all services",
+    description=(
+        "Returns daily outage and degraded time and availability percentages for "
+        "every service over the last `days` days, including today so far."
+    ),
+)
+async def list_services_uptime(
+    days: int = Query(90, ge=1, le=366, description="Number of days, ending today"),
+    session: AsyncSession = Depends(get_session),
+) -> ServiceUptimeListResponse:
+    return await uptime_service.get_services_uptime(session=session, days=days)
+
+
 @router.get(
     "/{service_id}",
     response_model=ServiceResponse,
@@ -66,6 +125,124 @@ async def get_service(
     )
 
 
+@router.get(
+    "/{service_id}/uptime",
+    response_model=ServiceUptimeResponse,
+    summary="Uptime for a service",
+    description=(
+        "Returns daily outage and degraded time and availability percentages for "
+        "one service over the last `days` days, including today so far."
+    ),
+)
+async def get_service_uptime(
+    service_id: uuid.UUID,
+    days: int = Query(90, ge=1, le=366, description="Number of days, ending today"),
+    session: AsyncSession = Depends(get_session),
+) -> ServiceUptimeResponse:
+    return await uptime_service.get_service_uptime(
+        session=session, service_id=service_id, days=days
+    )
+
+
+@router.get(
+    "/{service_id}/status",
+    response_model=ServiceStatusAtResponse,
+    summary="Service status at a point in time",
+    description=(
+        "Returns the status the service had at `at` (default: now), read from the "
+        "service's status change log, along with when it entered that status."
+    ),
+)
+async def get_service_status_at(
+    service_id: uuid.UUID,
+    at: datetime | None = Query(
+        None, description="Point in time; naive timestamps are taken as UTC"
+    ),
+    session: AsyncSession = Depends(get_session),
+) -> ServiceStatusAtResponse:
+    return await status_service.get_status_at(
+        session=session, service_id=service_id, at=at
+    )
+
+
+@router.get(
+    "/{service_id}/status-history",
+    response_model=ServiceStatusHistoryResponse,
+    summary="Service status history",
+    description=(
+        "Returns the service's status changes between `start` and `end`, oldest "
+        "first. Each entry is a transition to a different status."
+    ),
+)
+async def get_service_status_history(
+    service_id: uuid.UUID,
+    start: datetime | None = Query(
+        None, description="Only changes at or after this time"
+    ),
+    end: datetime | None = Query(
+        None, description="Only changes at or before this time"
+    ),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of changes"),
+    session: AsyncSession = Depends(get_session),
+) -> ServiceStatusHistoryResponse:
+    return await status_service.get_status_history(
+        session=session, service_id=service_id, start=start, end=end, limit=limit
+    )
+
+
+@router.get(
+    "/{service_id}/dependencies",
+    response_model=ServiceListResponse,
+    summary="List a service's dependencies",
+    description="Returns the services this service directly depends on.",
+)
+async def list_service_dependencies(
+    service_id: uuid.UUID,
+    session: AsyncSession = Depends(get_session),
+) -> ServiceListResponse:
+    return await dependency_service.list_dependencies(
+        session=session, service_id=service_id
+    )
+
+
+@router.post(
+    "/{service_id}/dependencies",
+    response_model=ServiceListResponse,
+    status_code=201,
+    summary="Add a dependency",
+    description=(
+        "Records that this service depends on another, so that an impaired "
+        "dependency degrades its effective status. Edges that would create a "
+        "cycle are rejected with 409. Returns the updated dependency list."
+    ),
+)
+async def add_service_dependency(
+    service_id: uuid.UUID,
+    payload: ServiceDependencyCreate,
+    session: AsyncSession = Depends(get_session),
+) -> ServiceListResponse:
+    return await dependency_service.add_dependency(
+        session=session, service_id=service_id, depends_on_id=payload.depends_on_id
+    )
+
+
+@router.delete(
+    "/{service_id}/dependencies/{depends_on_id}",
+    status_code=204,
+    summary="Remove a dependency",
+    description="Removes the edge from this service to the given dependency.",
+)
+async def remove_service_dependency(
+    service_id: uuid.UUID,
+    depends_on_id: uuid.UUID,
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    await dependency_service.remove_dependency(
+        session=session, service_id=service_id, depends_on_id=depends_on_id
+    )
+    return Response(status_code=204)
+
+
 @router.patch(
     "/{service_id}",
     response_model=ServiceResponse,
@@ -0,0 +1,103 @@
+import uuid
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_session
+from app.models.schemas.webhooks import (
+    WebhookDeadLetterListResponse,
+    WebhookSubscriptionCreate,
+    WebhookSubscriptionListResponse,
+    WebhookSubscriptionResponse,
+)
+from app.services import webhooks as webhook_service
+
+router = APIRouter(prefix="/webhooks", tags=["Webhooks"])
+
+
+@router.get(
+    "",
+    response_model=WebhookSubscriptionListResponse,
+    summary="List webhook subscriptions",
+    description=(
+        "Returns every webhook subscription with its number of pending deliveries."
+    ),
+)
+async def list_subscriptions(
+    session: AsyncSession = Depends(get_session),
+) -> WebhookSubscriptionListResponse:
+    return await webhook_service.list_subscriptions(session)
+
+
+@router.post(
+    "",
+    response_model=WebhookSubscriptionResponse,
+    status_code=201,
+    summary="Create a webhook subscription",
+    description=(
+        "Subscribes an endpoint to the given event types. Events are POSTed to it "
+        "in batches by the webhook worker, signed with `secret` when one is set."
+    ),
+)
+async def create_subscription(
+    payload: WebhookSubscriptionCreate,
+    session: AsyncSession = Depends(get_session),
+) -> WebhookSubscriptionResponse:
+    return await webhook_service.create_subscription(
+        session=session,
+        url=str(payload.url),
+        events=payload.events,
+        max_concurrency=payload.max_concurrency,
+        secret=payload.secret,
+    )
+
+
+@router.get(
+    "/{subscription_id}",
+    response_model=WebhookSubscriptionResponse,
+    summary="Get a webhook subscription by ID",
+    description="Returns a single webhook subscription.",
+)
+async def get_subscription(
+    subscription_id: uuid.UUID,
+    session: AsyncSession = Depends(get_session),
+) -> WebhookSubscriptionResponse:
+    return await webhook_service.get_subscription(
+        session=session, subscription_id=subscription_id
+    )
+
+
+@router.delete(
+    "/{subscription_id}",
+    status_code=204,
+    summary="Delete a webhook subscription",
+    description="Deletes a subscription with its pending deliveries and dead letters.",
+)
+async def delete_subscription(
+    subscription_id: uuid.UUID,
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    await webhook_service.delete_subscription(
+        session=session, subscription_id=subscription_id
+    )
+    return Response(status_code=204)
+
+
+@router.get(
+    "/{subscription_id}/dead-letters",
+    response_model=WebhookDeadLetterListResponse,
+    summary="List failed deliveries",
+    description=(
+        "Returns the events that could not be delivered to this endpoint within "
+        "the maximum number of attempts, most recent first."
+    ),
+)
+async def list_dead_letters(
+    subscription_id: uuid.UUID,
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of events"),
+    session: AsyncSession = Depends(get_session),
+) -> WebhookDeadLetterListResponse:
+    return await webhook_service.list_dead_letters(
+        session=session, subscription_id=subscription_id, limit=limit
+    )
@@ -0,0 +1,233 @@
+import argparse
+import asyncio
+import signal
+from collections.abc import Awaitable, Callable
+
+import structlog
+from prometheus_client import start_http_server
+
+from app.core.config import settings
+from app.core.logging import configure_logging
+from app.db.repositories.analytics import AnalyticsRepository
+from app.db.repositories.incident_search import IncidentSearchRepository
+from app.db.session import AsyncSessionLocal, engine
+from app.services.archive import archive_resolved_incidents
+from app.services.changes import compact_changes as compact_change_feed
+from app.services.idempotency import expire_idempotency_keys
+from app.services.partitions import maintain_incident_update_partitions
+from app.services.service_status import rebuild_status_history
+from app.services.webhooks import WebhookWorker, create_http_client
+
+logger: structlog.BoundLogger = structlog.get_logger()
+
+
+# Operational maintenance commands, run out-of-band from the API process
+# (e.g. `opstatus search-backfill` after `alembic upgrade head`).
+async def search_backfill(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        count = await IncidentSearchRepository(session).rebuild()
+    await logger.ainfo("Search index rebuilt", incidents=count)
+
+
+async def analytics_backfill(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        count = await AnalyticsRepository(session).rebuild()
+    await logger.ainfo("Analytics rollups rebuilt", rows=count)
+
+
+async def status_history_backfill(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        count = await rebuild_status_history(session)
+    await logger.ainfo("Service status history rebuilt", changes=count)
+
+
+async def archive_incidents(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        count = await archive_resolved_incidents(
+            session, args.older_than_days, args.batch_size
+        )
+    await logger.ainfo(
+        "Resolved incidents archived",
+        incidents=count,
+        older_than_days=args.older_than_days,
+    )
+
+
+async def maintain_partitions(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        result = await maintain_incident_update_partitions(
+            session, args.months_ahead, args.retention_days
+        )
+    if result is None:
+        await logger.ainfo("incident_updates is not partitioned, nothing to do")
+        return
+    await logger.ainfo(
+        "incident_updates partitions maintained",
+        created=[f"{month:%Y-%m}" for month in result.created],
+        dropped=[f"{month:%Y-%m}" for month in result.dropped],
+        retained=[f"{month:%Y-%m}" for month in result.retained],
+    )
+
+
+async def compact_changes(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        result = await compact_change_feed(
+            session, args.tombstone_retention_days, args.batch_size
+        )
+    await logger.ainfo(
+        "Change feed compacted",
+        superseded=result.superseded,
+        tombstones=result.tombstones,
+    )
+
+
+async def expire_idempotency(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        count = await expire_idempotency_keys(session, args.batch_size)
+    await logger.ainfo("Idempotency keys expired", keys=count)
+
+
+async def webhook_worker(args: argparse.Namespace) -> None:
+    # Long-running, unlike the other commands: delivers queued webhook events
+    # until SIGINT or SIGTERM, finishing the pass in progress first.
+    if args.metrics_port:
+        start_http_server(args.metrics_port)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    async with create_http_client() as client:
+        worker = WebhookWorker(AsyncSessionLocal, client)
+        await logger.ainfo("Webhook worker started", metrics_port=args.metrics_port)
+        await worker.run(stop)
+    await logger.ainfo("Webhook worker stopped")
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="opstatus", description="opstatus maintenance commands"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    search = subparsers.add_parser(
+        "search-backfill",
+        help="Rebuild the incident full-text search index from existing data",
+    )
+    search.set_defaults(handler=search_backfill)
+
+    analytics = subparsers.add_parser(
+        "analytics-backfill",
+        help="Recompute the daily analytics rollups from incident history",
+    )
+    analytics.set_defaults(handler=analytics_backfill)
+
+    status_history = subparsers.add_parser(
+        "status-history-backfill",
+        help="Rebuild the service status change log from incident history",
+    )
+    status_history.set_defaults(handler=status_history_backfill)
+
+    archive = subparsers.add_parser(
+        "archive-incidents",
+        help="Move incidents resolved before the retention period to the archive",
+    )
+    archive.add_argument(
+        "--older-than-days",
+        type=_positive_int,
+        default=settings.incident_retention_days,
+        help="Archive incidents resolved more than this many days ago",
+    )
+    archive.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=settings.archive_batch_size,
+        help="Incidents moved per transaction",
+    )
+    archive.set_defaults(handler=archive_incidents)
+
+    partitions = subparsers.add_parser(
+        "maintain-partitions",
+        help="Create upcoming incident_updates partitions and drop expired ones",
+    )
+    partitions.add_argument(
+        "--months-ahead",
+        type=_positive_int,
+        default=settings.incident_update_partition_months_ahead,
+        help="Months after the current one to keep partitions ready for",
+    )
+    partitions.add_argument(
+        "--retention-days",
+        type=_positive_int,
+        default=settings.incident_retention_days,
+        help="Drop empty partitions whose whole month is older than this",
+    )
+    partitions.set_defaults(handler=maintain_partitions)
+
+    changes = subparsers.add_parser(
+        "compact-changes",
+        help="Drop superseded change feed rows and expired deletion rows",
+    )
+    changes.add_argument(
+        "--tombstone-retention-days",
+        type=_positive_int,
+        default=settings.change_tombstone_retention_days,
+        help="Keep rows for deleted entities this many days",
+    )
+    changes.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=settings.change_compaction_batch_size,
+        help="Rows deleted per transaction",
+    )
+    changes.set_defaults(handler=compact_changes)
+
+    idempotency = subparsers.add_parser(
+        "expire-idempotency-keys",
+        help="Delete Idempotency-Key records older than their TTL",
+    )
+    idempotency.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=settings.idempotency_expiry_batch_size,
+        help="Keys deleted per transaction",
+    )
+    idempotency.set_defaults(handler=expire_idempotency)
+
+    webhooks = subparsers.add_parser(
+        "webhook-worker",
+        help="Deliver queued webhook events until stopped",
+    )
+    webhooks.add_argument(
+        "--metrics-port",
+        type=int,
+        default=settings.webhook_worker_metrics_port,
+        help="Port to serve the worker's Prometheus metrics on; 0 disables it",
+    )
+    webhooks.set_defaults(handler=webhook_worker)
+
+    return parser
+
+
+async def run(args: argparse.Namespace) -> None:
+    handler: Callable[[argparse.Namespace], Awaitable[None]] = args.handler
+    try:
+        await handler(args)
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    configure_logging()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import Settings
+from app.core.metrics import admission_queue_depth, admission_requests_total
+from app.models.schemas.errors import ErrorDetail, ErrorResponse
+
+
+class Lane(StrEnum):
+    health = "health"
+    write = "write"
+    read = "read"
+
+
+# Served without touching the database, so never held back.
+UNGATED_PATHS = {"/health/live", "/metrics"}
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def classify(method: str, path: str) -> Lane | None:
+    if path in UNGATED_PATHS:
+        return None
+    if path.startswith("/health/"):
+        return Lane.health
+    if method not in SAFE_METHODS:
+        return Lane.write
+    return Lane.read
+
+
+class PressureMonitor:
+    # Tracks the worst recent database pool checkout wait and event loop lag.
+    # Each is held at its peak and halves every `half_life` seconds, so one
+    # slow checkout keeps reads shed briefly, and shedding ends on its own once
+    # samples return to normal, even if no reads are being admitted.
+    def __init__(
+        self, half_life: float = 1.0, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.half_life = half_life
+        self.clock = clock
+        self._checkout_wait = (0.0, 0.0)
+        self._loop_lag = (0.0, 0.0)
+
+    def _decayed(self, sample: tuple[float, float]) -> float:
+        value, at = sample
+        return value * math.pow(0.5, (self.clock() - at) / self.half_life)
+
+    def _peak(self, sample: tuple[float, float], seconds: float) -> tuple[float, float]:
+        return max(self._decayed(sample), seconds), self.clock()
+
+    def record_checkout_wait(self, seconds: float) -> None:
+        self._checkout_wait = self._peak(self._checkout_wait, seconds)
+
+    def record_loop_lag(self, seconds: float) -> None:
+        self._loop_lag = self._peak(self._loop_lag, seconds)
+
+    @property
+    def checkout_wait(self) -> float:
+        return self._decayed(self._checkout_wait)
+
+    @property
+    def loop_lag(self) -> float:
+        return self._decayed(self._loop_lag)
+
+
+pressure = PressureMonitor()
+
+
+LOOP_LAG_INTERVAL = 0.1
+
+
+async def monitor_loop_lag(monitor: PressureMonitor, interval: float) -> None:
+    # A sleep that overruns means something held the loop for that long: every
+    # request waiting on it was delayed by the same amount.
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        monitor.record_loop_lag(max(0.0, time.perf_counter() - start - interval))
+
+
+class LaneGate:
+    # A concurrency limit with a FIFO queue. A request waits at most
+    # `queue_seconds` for a slot; a finishing request hands its slot straight to
+    # the oldest waiter, so late arrivals cannot jump the queue. Like the rate
+    # limiter, it never awaits between reading and updating its state, so no
+    # lock is needed within one event loop.
+    def __init__(self, lane: Lane, limit: int, queue_seconds: float) -> None:
+        self.lane = lane
+        self.limit = limit
+        self.queue_seconds = queue_seconds
+        self.active = 0
+        self.queued = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        # Export the lane's depth as 0 before anything queues.
+        admission_queue_depth.labels(lane=lane).set(0)
+
+    async def acquire(self, limit: int | None = None, queue: bool = True) -> bool:
+        # `limit` lowers the limit for this request only.
+        if self.active < min(self.limit, limit or self.limit) and not self.queued:
+            self.active += 1
+            admission_requests_total.labels(lane=self.lane, outcome="admitted").inc()
+            return True
+        if not queue or self.queue_seconds <= 0:
+            admission_requests_total.labels(lane=self.lane, outcome="shed").inc()
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        admission_queue_depth.labels(lane=self.lane).inc()
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_seconds)
+        except BaseException:
+            # Cancelled while queued: pass on a slot that was handed over.
+            if waiter.done():
+                self.release()
+            else:
+                waiter.cancel()
+            raise
+        finally:
+            self.queued -= 1
+            admission_queue_depth.labels(lane=self.lane).dec()
+        if not waiter.done():
+            # Timed out. release() skips cancelled waiters.
+            waiter.cancel()
+            admission_requests_total.labels(lane=self.lane, outcome="shed").inc()
+            return False
+        admission_requests_total.labels(lane=self.lane, outcome="queued").inc()
+        return True
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        gates: dict[Lane, LaneGate],
+        monitor: PressureMonitor,
+        shed_checkout_wait: float,
+        shed_loop_lag: float,
+        retry_after: int,
+    ) -> None:
+        self.gates = gates
+        self.monitor = monitor
+        self.shed_checkout_wait = shed_checkout_wait
+        self.shed_loop_lag = shed_loop_lag
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings, monitor: PressureMonitor
+    ) -> "AdmissionController":
+        limits = {
+            Lane.health: (
+                settings.admission_health_concurrency,
+                settings.admission_health_queue_seconds,
+            ),
+            Lane.write: (
+                settings.admission_write_concurrency,
+                settings.admission_write_queue_seconds,
+            ),
+            Lane.read: (
+                settings.admission_read_concurrency,
+                settings.admission_read_queue_seconds,
+            ),
+        }
+        return cls(
+            {
+                lane: LaneGate(lane, limit, queue_seconds)
+                for lane, (limit, queue_seconds) in limits.items()
+            },
+            monitor,
+            settings.admission_shed_checkout_wait_seconds,
+            settings.admission_shed_loop_lag_seconds,
+            settings.admission_retry_after_seconds,
+        )
+
+    def under_pressure(self) -> bool:
+        return (
+            self.monitor.checkout_wait > self.shed_checkout_wait
+            or self.monitor.loop_lag > self.shed_loop_lag
+        )
+
+    async def admit(self, lane: Lane) -> bool:
+        # Under pressure, reads get half their slots and do not queue: the rest
+        # are turned away at once rather than waiting on the database, which
+        # leaves what capacity there is to writes and health probes.
+        gate = self.gates[lane]
+        if lane is Lane.read and self.under_pressure():
+            return await gate.acquire(limit=max(1, gate.limit // 2), queue=False)
+        return await gate.acquire()
+
+    def release(self, lane: Lane) -> None:
+        self.gates[lane].release()
+
+
+class AdmissionMiddleware(BaseHTTPMiddleware):
+    # The controller lives on app.state (None disables it).
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        controller: AdmissionController | None = getattr(
+            request.app.state, "admission", None
+        )
+        lane = classify(request.method, request.url.path)
+        if controller is None or lane is None:
+            return await call_next(request)
+
+        if not await controller.admit(lane):
+            body = ErrorResponse(
+                error=ErrorDetail(
+                    code="OVERLOADED",
+                    message="The server is overloaded; retry after the "
+                    "Retry-After delay.",
+                    request_id=str(getattr(request.state, "request_id", "unknown")),
+                )
+            )
+            return JSONResponse(
+                status_code=503,
+                content=body.model_dump(),
+                headers={"Retry-After": str(controller.retry_after)},
+            )
+        try:
+            return await call_next(request)
+        finally:
+            controller.release(lane)
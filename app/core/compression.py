@@ -0,0 +1,130 @@
+import gzip
+import importlib
+from collections.abc import Callable, Mapping
+from types import ModuleType
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _optional(module: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        return None
+
+
+def _codecs() -> dict[str, Callable[[bytes], bytes]]:
+    # Levels favour speed: responses are compressed on the request path.
+    codecs: dict[str, Callable[[bytes], bytes]] = {
+        "gzip": lambda body: gzip.compress(body, compresslevel=6, mtime=0),
+    }
+    # brotli and zstandard come with the `compression` extra.
+    brotli = _optional("brotli")
+    if brotli is not None:
+        codecs["br"] = lambda body: bytes(brotli.compress(body, quality=5))
+    zstandard = _optional("zstandard")
+    if zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=3)
+        codecs["zstd"] = lambda body: bytes(compressor.compress(body))
+    return codecs
+
+
+CODECS = _codecs()
+
+# Used to break ties between encodings the client likes equally.
+PREFERENCE = ("zstd", "br", "gzip")
+
+# Streamed bodies are sent as they are produced; buffering one to compress it
+# would hold back every event until the stream ends.
+STREAMING_TYPES = ("text/event-stream", "application/x-ndjson")
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    # Picks the encoding the client rates highest (q=1 unless given), or None
+    # for identity.
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    wildcard = weights.get("*", 0.0)
+    candidates = [
+        (weights.get(name, wildcard), -rank, name)
+        for rank, name in enumerate(PREFERENCE)
+        if name in CODECS
+    ]
+    q, _, name = max(candidates)
+    return name if q > 0 else None
+
+
+def should_compress(
+    status_code: int, headers: Mapping[str, str], minimum_size: int
+) -> bool:
+    # Only bodies of known size are compressed, so the decision is made before
+    # any of the body is held back. Tiny bodies would grow or barely shrink.
+    content_length = headers.get("content-length")
+    content_type = headers.get("content-type", "")
+    return (
+        200 <= status_code < 300
+        and status_code != 204
+        and "content-encoding" not in headers
+        and content_length is not None
+        and int(content_length) >= minimum_size
+        and not content_type.startswith(STREAMING_TYPES)
+    )
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    return CODECS[encoding](body)
+
+
+class CompressionMiddleware:
+    # A plain ASGI middleware rather than BaseHTTPMiddleware: responses it does
+    # not compress, streams in particular, pass through message by message.
+    def __init__(self, app: ASGIApp, minimum_size: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        chunks: list[bytes] = []
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if should_compress(message["status"], headers, self.minimum_size):
+                    start = message
+                    return
+            elif start is not None and message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+                body = compress(b"".join(chunks), encoding)
+                response_headers = MutableHeaders(raw=start["headers"])
+                response_headers["content-encoding"] = encoding
+                response_headers["content-length"] = str(len(body))
+                response_headers.add_vary_header("Accept-Encoding")
+                await send(start)
+                message = {"type": "http.response.body", "body": body}
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -9,10 +9,112 @@ class Settings(BaseSettings):
     )
 
     database_url: str = "sqlite+aiosqlite:///./opstatus.db"
+    # asyncpg: statements each connection keeps prepared on the server, so a
+    # repeated query skips parsing and planning. Behind PgBouncer in transaction
+    # mode consecutive statements may run on different server connections; set
+    # db_pgbouncer_transaction_mode to turn the cache off and give each prepared
+    # statement a unique name.
+    db_statement_cache_size: int = 500
+    db_pgbouncer_transaction_mode: bool = False
     log_level: str = "INFO"
     app_env: str = "development"
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    # Incidents resolved longer ago than this are moved to the archive tables by
+    # `opstatus archive-incidents`. Longer than the 366-day maximum uptime window,
+    # so uptime reports never need archived incidents.
+    incident_retention_days: int = 400
+    archive_batch_size: int = 500
+    # Monthly incident_updates partitions kept ready ahead of the current month
+    # by `opstatus maintain-partitions` (PostgreSQL, when partitioned).
+    incident_update_partition_months_ahead: int = 3
+    # `opstatus compact-changes`: change feed rows for deleted services are kept
+    # this long, so consumers polling at least this often never miss one.
+    change_tombstone_retention_days: int = 30
+    change_compaction_batch_size: int = 5000
+    # Idempotency-Key on incident and update creation: repeats of a request are
+    # answered with its stored response for idempotency_key_ttl_hours. A repeat
+    # that arrives while the first is still running waits up to
+    # idempotency_wait_seconds for it; a claim still unfinished after
+    # idempotency_lease_seconds is taken to have died with its process.
+    # `opstatus expire-idempotency-keys` deletes expired keys.
+    idempotency_key_ttl_hours: int = 24
+    idempotency_wait_seconds: float = 10.0
+    idempotency_lease_seconds: int = 60
+    idempotency_expiry_batch_size: int = 5000
+    # POST /api/v1/alerts: an alert's service is named by its alert_service_label
+    # label. A firing alert already tracked by an active incident adds a
+    # timeline update at most once per alert_debounce_seconds. Recently seen
+    # fingerprints, up to alert_cache_size, are answered from memory.
+    alert_service_label: str = "service"
+    alert_debounce_seconds: float = 300.0
+    alert_cache_size: int = 10000
+    # Webhook delivery, by `opstatus webhook-worker`. Events to one endpoint are
+    # sent up to webhook_batch_size per request; failed requests are retried
+    # after an exponentially growing delay, capped at webhook_backoff_max_seconds,
+    # until webhook_max_attempts is reached and the events are dead-lettered.
+    webhook_batch_size: int = 20
+    webhook_max_attempts: int = 8
+    webhook_backoff_base_seconds: float = 5.0
+    webhook_backoff_max_seconds: float = 3600.0
+    webhook_timeout_seconds: float = 10.0
+    # Connections the worker's shared HTTP client keeps open across endpoints.
+    webhook_max_connections: int = 100
+    webhook_poll_interval_seconds: float = 1.0
+    # Deliveries claimed per pass, and how long a claim lasts before a crashed
+    # worker's deliveries become due again.
+    webhook_claim_limit: int = 500
+    webhook_lease_seconds: int = 300
+    webhook_worker_metrics_port: int = 9100
+    # Per-client token buckets in front of /api/: each client may make `burst`
+    # requests at once, refilled at `per_second`. Clients are told apart by
+    # their address. Set rate_limit_client_header only to a header that a
+    # trusted proxy sets or validates (X-Real-IP, or a gateway-checked API
+    # key): the API has no authentication of its own, so a header the client
+    # chooses freely would get it a fresh bucket with every new value.
+    rate_limit_enabled: bool = True
+    rate_limit_client_header: str = ""
+    rate_limit_read_per_second: float = 20.0
+    rate_limit_read_burst: int = 60
+    rate_limit_write_per_second: float = 5.0
+    rate_limit_write_burst: int = 20
+    # Analytics and uptime reports.
+    rate_limit_export_per_second: float = 0.5
+    rate_limit_export_burst: int = 5
+    # Clients tracked per route class; the least recently seen is dropped first.
+    rate_limit_max_clients: int = 10000
+    # Admission control: requests per lane allowed to run at once, and how long
+    # one may wait for a slot before a 503. Keep write + read concurrency near
+    # the database pool size (5 + 10 overflow by default) so requests queue
+    # here, in priority lanes, rather than inside the pool. Reads are shed
+    # early while the pool checkout wait or the event loop lag is above its
+    # threshold.
+    admission_enabled: bool = True
+    admission_health_concurrency: int = 2
+    admission_health_queue_seconds: float = 1.0
+    admission_write_concurrency: int = 8
+    admission_write_queue_seconds: float = 5.0
+    admission_read_concurrency: int = 6
+    admission_read_queue_seconds: float = 0.5
+    admission_shed_checkout_wait_seconds: float = 0.1
+    admission_shed_loop_lag_seconds: float = 0.1
+    admission_retry_after_seconds: int = 2
+    # Single flight: identical concurrent GET requests share one response, which
+    # is then reused for single_flight_ttl_seconds (0 only coalesces requests
+    # in flight). Each read near expiry refreshes early with a probability that
+    # grows with single_flight_early_refresh_beta and the response's cost.
+    single_flight_enabled: bool = True
+    single_flight_ttl_seconds: float = 1.0
+    single_flight_early_refresh_beta: float = 1.0
+    single_flight_max_entries: int = 1000
+    # Responses of at least compression_minimum_size bytes are sent gzip, br or
+    # zstd compressed, as the client prefers (br and zstd need the
+    # `compression` extra).
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024
+    # Database connections opened at start-up, before readiness passes, so the
+    # first requests do not pay for connecting (capped at the pool size).
+    warmup_connections: int = 5
 
 
 settings = Settings()
@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+from typing import Any
+
 import structlog
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
@@ -64,18 +67,20 @@ async def service_unavailable_handler(request: Request, exc: Exception) -> JSONR
     )
 
 
-async def validation_error_handler(request: Request, exc: Exception) -> JSONResponse:
-    assert isinstance(exc, RequestValidationError)
+def format_validation_errors(errors: Sequence[Any]) -> str:
     # Flatten all Pydantic validation errors into a single human-readable string.
     # Each error: "field -> subfield: message"; multiple errors joined with "; ".
-    message = "; ".join(
-        f"{' -> '.join(str(loc) for loc in err['loc'])}: {err['msg']}"
-        for err in exc.errors()
+    return "; ".join(
+        f"{' -> '.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in errors
     )
+
+
+async def validation_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    assert isinstance(exc, RequestValidationError)
     return _make_error_response(
         status_code=422,
         code="VALIDATION_ERROR",
-        message=message,
+        message=format_validation_errors(exc.errors()),
         request_id=_get_request_id(request),
     )
 
@@ -24,3 +24,66 @@ services_total = Gauge(
     "services_total",
     "Total number of tracked services",
 )
+
+# Webhook delivery metrics are recorded by the webhook worker process, which
+# serves them on its own metrics port.
+webhook_delivery_latency_seconds = Histogram(
+    "webhook_delivery_latency_seconds",
+    "Time from an event being queued to its successful delivery",
+    # Retries put the tail in minutes to hours.
+    buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 1800.0, 3600.0],
+)
+
+webhook_request_duration_seconds = Histogram(
+    "webhook_request_duration_seconds",
+    "Duration of webhook HTTP requests, one batch of events each",
+    buckets=[0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
+
+webhook_deliveries_total = Counter(
+    "webhook_deliveries_total",
+    "Webhook deliveries processed, by outcome",
+    ["outcome"],
+)
+
+# Admission control, by lane (health, write, read). "admitted" requests got a
+# slot at once and "queued" ones after waiting; "shed" ones were turned away
+# with a 503.
+admission_requests_total = Counter(
+    "admission_requests_total",
+    "Requests seen by admission control, by lane and outcome",
+    ["lane", "outcome"],
+)
+
+admission_queue_depth = Gauge(
+    "admission_queue_depth",
+    "Requests waiting for an admission slot, by lane",
+    ["lane"],
+)
+
+# Requests answered from another request's result by the single-flight layer:
+# "flight" ones waited on a computation already running, "cache" ones were
+# served its stored result.
+http_requests_coalesced_total = Counter(
+    "http_requests_coalesced_total",
+    "GET requests served from another request's result, by source",
+    ["source"],
+)
+
+# Writes answered with the response of an earlier request with the same
+# Idempotency-Key: "flight" ones waited on that request in this process,
+# "stored" ones read its response back from the database.
+idempotent_replays_total = Counter(
+    "idempotent_replays_total",
+    "Writes answered with an earlier request's response, by source",
+    ["source"],
+)
+
+# Alerts received on POST /api/v1/alerts, by what they did: "opened",
+# "updated" or "resolved" an incident, were "suppressed" as repeats, or were
+# "unmatched" because they name no known service.
+alerts_received_total = Counter(
+    "alerts_received_total",
+    "Alerts received, by outcome",
+    ["outcome"],
+)
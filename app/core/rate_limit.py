@@ -0,0 +1,171 @@
+import math
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import Settings
+from app.models.schemas.errors import ErrorDetail, ErrorResponse
+
+
+class RouteClass(StrEnum):
+    read = "read"
+    write = "write"
+    export = "export"
+
+
+# Reports that aggregate many rows per request get their own, tighter budget.
+EXPORT_PATHS = re.compile(r"/api/v1/(analytics|services(/[^/]+)?/uptime)/?")
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def classify(method: str, path: str) -> RouteClass:
+    if method not in SAFE_METHODS:
+        return RouteClass.write
+    if EXPORT_PATHS.fullmatch(path):
+        return RouteClass.export
+    return RouteClass.read
+
+
+class TokenBucketLimiter:
+    # One bucket per client: `burst` tokens, refilled at `rate` per second, one
+    # spent per request. Buckets are kept in least recently used order, so
+    # every operation is O(1) amortised. A bucket left alone long enough to
+    # refill completely is indistinguishable from a new one and is dropped;
+    # max_clients caps memory when many clients are active at once.
+    #
+    # acquire() never awaits, so within one event loop no other request can
+    # run between reading a bucket and writing it back; no lock is needed.
+    # Each worker process keeps its own buckets.
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_clients: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self.clock = clock
+        self._refill_seconds = burst / rate
+        # client -> (tokens, time they were counted)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, client: str) -> float:
+        # Returns 0 if the request may proceed, otherwise the seconds until it
+        # would be allowed.
+        now = self.clock()
+        bucket = self._buckets.pop(client, None)
+        if bucket is None:
+            tokens = float(self.burst)
+        else:
+            tokens, counted_at = bucket
+            tokens = min(self.burst, tokens + (now - counted_at) * self.rate)
+        self._evict(now)
+
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+        else:
+            wait = (1 - tokens) / self.rate
+        self._buckets[client] = (tokens, now)
+        return wait
+
+    def _evict(self, now: float) -> None:
+        buckets = self._buckets
+        while buckets:
+            client, (_, counted_at) = next(iter(buckets.items()))
+            if (
+                now - counted_at < self._refill_seconds
+                and len(buckets) < self.max_clients
+            ):
+                break
+            del buckets[client]
+
+
+class RateLimiter:
+    def __init__(
+        self, limiters: dict[RouteClass, TokenBucketLimiter], client_header: str = ""
+    ) -> None:
+        self.limiters = limiters
+        self.client_header = client_header
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RateLimiter":
+        limits = {
+            RouteClass.read: (
+                settings.rate_limit_read_per_second,
+                settings.rate_limit_read_burst,
+            ),
+            RouteClass.write: (
+                settings.rate_limit_write_per_second,
+                settings.rate_limit_write_burst,
+            ),
+            RouteClass.export: (
+                settings.rate_limit_export_per_second,
+                settings.rate_limit_export_burst,
+            ),
+        }
+        return cls(
+            {
+                route_class: TokenBucketLimiter(
+                    rate, burst, settings.rate_limit_max_clients
+                )
+                for route_class, (rate, burst) in limits.items()
+            },
+            settings.rate_limit_client_header,
+        )
+
+    def client_key(self, request: Request) -> str:
+        # The peer address, unless the deployment names a header its proxy
+        # sets or validates; see Settings.rate_limit_client_header.
+        if self.client_header:
+            value = request.headers.get(self.client_header)
+            if value:
+                return f"header:{value}"
+        host = request.client.host if request.client else "unknown"
+        return f"ip:{host}"
+
+    def check(self, request: Request) -> float:
+        route_class = classify(request.method, request.url.path)
+        return self.limiters[route_class].acquire(self.client_key(request))
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    # Runs before routing, so a throttled request never reaches a database
+    # session. The limiter lives on app.state (None disables it).
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        limiter: RateLimiter | None = getattr(request.app.state, "rate_limiter", None)
+        if limiter is None or not request.url.path.startswith("/api/"):
+            return await call_next(request)
+
+        wait = limiter.check(request)
+        if wait == 0:
+            return await call_next(request)
+
+        body = ErrorResponse(
+            error=ErrorDetail(
+                code="RATE_LIMITED",
+                message="Too many requests; retry after the Retry-After delay.",
+                request_id=str(getattr(request.state, "request_id", "unknown")),
+            )
+        )
+        return JSONResponse(
+            status_code=429,
+            content=body.model_dump(),
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
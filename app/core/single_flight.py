@@ -0,0 +1,181 @@
+import asyncio
+import math
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import NamedTuple
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.compression import compress, negotiate, should_compress
+from app.core.config import settings
+from app.core.metrics import http_requests_coalesced_total
+
+# Headers that may change what a caller is allowed to see. Responses are only
+# shared between requests that agree on all of them.
+SCOPE_HEADERS = ("authorization", "x-api-key")
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    # Compressed bodies by content encoding, filled in as clients ask for them.
+    variants: dict[str, bytes]
+
+
+class _Entry(NamedTuple):
+    response: CachedResponse
+    expires_at: float
+    # How long the response took to compute; scales early refresh.
+    delta: float
+
+
+class SingleFlight:
+    # Identical concurrent reads share one computation: the first request for
+    # a key runs the handler and the rest await its result. Successful results
+    # are then served for `ttl` seconds, and each read near the end of that
+    # window recomputes early with a probability that rises as expiry nears and
+    # with how slow the response is to compute ("XFetch"), so a hot key is
+    # refreshed by one request before it expires rather than by all of them
+    # after. Any write through the API drops every cached response.
+    def __init__(
+        self,
+        ttl: float,
+        beta: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.ttl = ttl
+        self.beta = beta
+        self.max_entries = max_entries
+        self.clock = clock
+        self.rng = rng
+        self._generation = 0
+        self._cache: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._flights: dict[Hashable, asyncio.Future[CachedResponse | None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def invalidate(self) -> None:
+        # Flights already running may have read the old state; the generation
+        # in every key keeps their results from being cached or joined later.
+        self._generation += 1
+        self._cache.clear()
+
+    def _refresh_early(self, entry: _Entry) -> bool:
+        # 1 - random() is in (0, 1], so the log is finite and <= 0.
+        jitter = entry.delta * self.beta * -math.log(1 - self.rng())
+        return self.clock() + jitter >= entry.expires_at
+
+    async def fetch(
+        self, key: Hashable, compute: Callable[[], Awaitable[CachedResponse]]
+    ) -> CachedResponse:
+        generation = self._generation
+        key = (generation, key)
+        flight = self._flights.get(key)
+        entry = self._cache.get(key)
+        if entry is not None and (flight is not None or not self._refresh_early(entry)):
+            self._cache.move_to_end(key)
+            http_requests_coalesced_total.labels(source="cache").inc()
+            return entry.response
+        if flight is not None:
+            http_requests_coalesced_total.labels(source="flight").inc()
+            # Shielded: a follower that goes away must not cancel the flight.
+            shared = await asyncio.shield(flight)
+            # None: the leader failed, so this request runs on its own.
+            return shared if shared is not None else await compute()
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        start = self.clock()
+        try:
+            response = await compute()
+        except BaseException:
+            del self._flights[key]
+            flight.set_result(None)
+            raise
+        del self._flights[key]
+        flight.set_result(response)
+        if (
+            response.status_code == 200
+            and self.ttl > 0
+            and generation == self._generation
+        ):
+            now = self.clock()
+            self._cache[key] = _Entry(response, now + self.ttl, now - start)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return response
+
+
+def request_key(request: Request) -> Hashable:
+    return (
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+        tuple(request.headers.get(name) for name in SCOPE_HEADERS),
+    )
+
+
+class SingleFlightMiddleware(BaseHTTPMiddleware):
+    # GET requests under /api/ are coalesced; anything else passes through and,
+    # if it could have written, invalidates. The SingleFlight instance lives
+    # on app.state (None disables it).
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        single_flight: SingleFlight | None = getattr(
+            request.app.state, "single_flight", None
+        )
+        if (
+            single_flight is None
+            or not request.url.path.startswith("/api/")
+            or request.method in ("HEAD", "OPTIONS")
+        ):
+            return await call_next(request)
+        if request.method != "GET":
+            try:
+                return await call_next(request)
+            finally:
+                single_flight.invalidate()
+
+        async def compute() -> CachedResponse:
+            response = await call_next(request)
+            body = b"".join(
+                [
+                    chunk if isinstance(chunk, bytes) else chunk.encode()
+                    async for chunk in response.body_iterator  # type: ignore[attr-defined]
+                ]
+            )
+            return CachedResponse(
+                response.status_code, list(response.headers.items()), body, {}
+            )
+
+        cached = await single_flight.fetch(request_key(request), compute)
+        headers = dict(cached.headers)
+        body = cached.body
+        # Compressed here, once per response and encoding, instead of by
+        # CompressionMiddleware for every request that shares it.
+        encoding = negotiate(request.headers.get("accept-encoding", ""))
+        if (
+            settings.compression_enabled
+            and encoding is not None
+            and should_compress(
+                cached.status_code, headers, settings.compression_minimum_size
+            )
+        ):
+            if encoding not in cached.variants:
+                cached.variants[encoding] = compress(body, encoding)
+            body = cached.variants[encoding]
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(body))
+            headers["vary"] = "Accept-Encoding"
+        return Response(content=body, status_code=cached.status_code, headers=headers)
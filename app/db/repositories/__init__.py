@@ -1,5 +1,13 @@
+from app.db.repositories.analytics import AnalyticsRepository
+from app.db.repositories.incident_search import IncidentSearchRepository
 from app.db.repositories.incident_updates import IncidentUpdateRepository
 from app.db.repositories.incidents import IncidentRepository
 from app.db.repositories.services import ServiceRepository
 
-__all__ = ["IncidentRepository", "IncidentUpdateRepository", "ServiceRepository"]
+__all__ = [
+    "AnalyticsRepository",
+    "IncidentRepository",
+    "IncidentSearchRepository",
+    "IncidentUpdateRepository",
+    "ServiceRepository",
+]
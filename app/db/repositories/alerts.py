@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.repositories.base import BaseRepository, as_utc
+from app.models.enums import IncidentStatus
+from app.models.orm.alert import AlertFingerprint
+from app.models.orm.incident import Incident
+
+# Built once and reused with the batch's fingerprints bound; see
+# IncidentRepository.get_by_id.
+_STATES = (
+    select(
+        AlertFingerprint.fingerprint,
+        AlertFingerprint.incident_id,
+        AlertFingerprint.updated_at,
+        Incident.status,
+    )
+    .outerjoin(Incident, Incident.id == AlertFingerprint.incident_id)
+    .where(AlertFingerprint.fingerprint.in_(bindparam("fingerprints", expanding=True)))
+)
+
+
+class AlertState(NamedTuple):
+    incident_id: uuid.UUID
+    updated_at: datetime
+    # None when the incident is not a live one: archived, or not created yet.
+    incident_status: IncidentStatus | None
+
+    @property
+    def active_status(self) -> IncidentStatus | None:
+        # The incident's status while it is active, else None.
+        if self.incident_status == IncidentStatus.resolved:
+            return None
+        return self.incident_status
+
+
+class AlertRepository(BaseRepository):
+    async def get_states(self, fingerprints: Sequence[str]) -> dict[str, AlertState]:
+        # One query for a whole batch, with the status of each incident.
+        result = await self.session.execute(
+            _STATES, {"fingerprints": list(fingerprints)}
+        )
+        return {
+            fingerprint: AlertState(incident_id, as_utc(updated_at), status)
+            for fingerprint, incident_id, updated_at, status in result
+        }
+
+    async def claim(
+        self,
+        fingerprint: str,
+        incident_id: uuid.UUID,
+        now: datetime,
+        previous_id: uuid.UUID | None,
+    ) -> bool:
+        # Points the fingerprint at a new incident, to be created next. False
+        # if another request got there first: the row already exists, or no
+        # longer names previous_id. Committed at once, so a concurrent request
+        # sees the claim before the incident exists and leaves it alone.
+        if previous_id is None:
+            dialect = postgresql if self.dialect_name == "postgresql" else sqlite
+            statement = (
+                dialect.insert(AlertFingerprint)
+                .values(
+                    fingerprint=fingerprint, incident_id=incident_id, updated_at=now
+                )
+                .on_conflict_do_nothing(index_elements=["fingerprint"])
+            )
+        else:
+            statement = (
+                update(AlertFingerprint)
+                .where(
+                    AlertFingerprint.fingerprint == fingerprint,
+                    AlertFingerprint.incident_id == previous_id,
+                )
+                .values(incident_id=incident_id, updated_at=now)
+            )
+        result = await self.session.execute(statement)
+        await self.session.commit()
+        return bool(result.rowcount == 1)  # type: ignore[attr-defined]
+
+    async def touch_due(
+        self, fingerprints: Sequence[str], now: datetime, due_before: datetime
+    ) -> set[str]:
+        # Moves updated_at to now for those of the fingerprints last updated
+        # before due_before, and returns them. The check and the write are one
+        # statement, so of two requests only one gets each due update.
+        result = await self.session.execute(
+            update(AlertFingerprint)
+            .where(
+                AlertFingerprint.fingerprint.in_(fingerprints),
+                AlertFingerprint.updated_at < due_before,
+            )
+            .values(updated_at=now)
+            .returning(AlertFingerprint.fingerprint)
+        )
+        touched = set(result.scalars().all())
+        await self.session.commit()
+        return touched
@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import date
+from typing import Any, NamedTuple
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Enum,
+    Float,
+    Integer,
+    Select,
+    Table,
+    and_,
+    case,
+    cast,
+    delete,
+    extract,
+    func,
+    literal,
+    literal_column,
+    select,
+    true,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.repositories.base import BaseRepository
+from app.models.enums import IncidentSeverity, IncidentStatus, TimeBucket
+from app.models.orm.analytics import (
+    ROLLUP_COUNTERS,
+    TIMED_STATUSES,
+    incident_daily_rollups,
+    service_incident_daily_rollups,
+)
+from app.models.orm.associations import service_incidents
+from app.models.orm.incident import Incident
+from app.models.orm.incident_update import IncidentUpdate
+
+
+class AnalyticsRow(NamedTuple):
+    bucket_start: date
+    severity: IncidentSeverity
+    opened: int
+    resolved: int
+    resolve_seconds: float
+    status_seconds: dict[IncidentStatus, float]
+
+
+# Expressions below are built per dialect: SQLite stores timestamps as UTC text
+# and has no interval type, PostgreSQL stores timestamptz. Unit and timezone
+# names are rendered as literals rather than bound parameters because
+# PostgreSQL only matches a SELECT expression to its GROUP BY expression when
+# both are textually identical, and two bound parameters never are.
+
+
+def _epoch_seconds(dialect_name: str, value: Any) -> ColumnElement[float]:
+    if dialect_name == "postgresql":
+        return type_coerce(extract("epoch", value), Float)
+    return type_coerce(func.julianday(value) * 86400.0, Float)
+
+
+def _utc_day(dialect_name: str, value: Any) -> ColumnElement[date]:
+    if dialect_name == "postgresql":
+        return type_coerce(
+            func.timezone(literal_column("'UTC'"), value).cast(Date), Date
+        )
+    return type_coerce(func.date(value), Date)
+
+
+def _bucket_start(
+    dialect_name: str, day: ColumnElement[date], bucket: TimeBucket
+) -> ColumnElement[date]:
+    if bucket == TimeBucket.day:
+        return day
+    if dialect_name == "postgresql":
+        unit: ColumnElement[str] = literal_column(f"'{bucket.value}'")
+        return type_coerce(func.date_trunc(unit, day).cast(Date), Date)
+    # Monday on or before the day; or the first of the month.
+    modifiers: list[ColumnElement[str]] = (
+        [literal_column("'-6 days'"), literal_column("'weekday 1'")]
+        if bucket == TimeBucket.week
+        else [literal_column("'start of month'")]
+    )
+    return type_coerce(func.date(day, *modifiers), Date)
+
+
+def _resolved_facts(dialect_name: str, condition: ColumnElement[bool]) -> Any:
+    # One row per resolved incident with its time to resolve and the time spent
+    # in each status. The timeline is the incident's creation (in the initial
+    # "investigating" status) followed by its updates in sequence order; each
+    # status lasts until the next entry, and the last one until resolved_at.
+    transitions = union_all(
+        select(
+            Incident.id.label("incident_id"),
+            # Cast so PostgreSQL types the UNION column as the status enum.
+            cast(literal(IncidentStatus.investigating), Enum(IncidentStatus)).label(
+                "status"
+            ),
+            Incident.created_at.label("entered_at"),
+            literal(0, Integer).label("sequence"),
+        ).where(condition),
+        select(
+            IncidentUpdate.incident_id,
+            IncidentUpdate.status,
+            IncidentUpdate.created_at,
+            IncidentUpdate.sequence,
+        )
+        .join(Incident, Incident.id == IncidentUpdate.incident_id)
+        .where(condition),
+    ).subquery()
+
+    segments = select(
+        transitions.c.incident_id,
+        transitions.c.status,
+        transitions.c.entered_at,
+        func.lead(transitions.c.entered_at)
+        .over(
+            partition_by=transitions.c.incident_id,
+            order_by=transitions.c.sequence,
+        )
+        .label("left_at"),
+    ).subquery()
+
+    duration = _epoch_seconds(
+        dialect_name, func.coalesce(segments.c.left_at, Incident.resolved_at)
+    ) - _epoch_seconds(dialect_name, segments.c.entered_at)
+
+    return (
+        select(
+            Incident.id.label("incident_id"),
+            Incident.severity,
+            _utc_day(dialect_name, Incident.resolved_at).label("day"),
+            (
+                _epoch_seconds(dialect_name, Incident.resolved_at)
+                - _epoch_seconds(dialect_name, Incident.created_at)
+            ).label("resolve_seconds"),
+            *(
+                func.sum(
+                    case((segments.c.status == status, duration), else_=0.0)
+                ).label(f"{status}_seconds")
+                for status in TIMED_STATUSES
+            ),
+        )
+        .join(segments, segments.c.incident_id == Incident.id)
+        .where(condition, Incident.resolved_at.is_not(None))
+        .group_by(Incident.id)
+        .subquery()
+    )
+
+
+class AnalyticsRepository(BaseRepository):
+    def _upsert(self, table: Table, keys: list[str], rows: Select[Any]) -> Any:
+        # INSERT ... SELECT ... ON CONFLICT: the aggregate is computed and added
+        # onto existing rollup rows by the database in a single statement.
+        names = [c.name for c in rows.selected_columns]
+        dialect = postgresql if self.dialect_name == "postgresql" else sqlite
+        insert = dialect.insert(table).from_select(names, rows)
+        return insert.on_conflict_do_update(
+            index_elements=keys,
+            set_={
+                name: table.c[name] + insert.excluded[name]
+                for name in names
+                if name not in keys
+            },
+        )
+
+    def _zero_counters(self, produced: Sequence[str]) -> list[Any]:
+        # Fills the counters a statement does not produce, so new rows start at
+        # zero and existing ones are incremented by nothing.
+        return [
+            literal(0, Integer).label(name)
+            for name in ROLLUP_COUNTERS
+            if name not in produced
+        ]
+
+    async def _record_opened(self, condition: ColumnElement[bool]) -> None:
+        day = _utc_day(self.dialect_name, Incident.created_at).label("day")
+        zeros = self._zero_counters(["opened"])
+        await self.session.execute(
+            self._upsert(
+                incident_daily_rollups,
+                ["day", "severity"],
+                select(day, Incident.severity, func.count().label("opened"), *zeros)
+                .where(condition)
+                .group_by(day, Incident.severity),
+            )
+        )
+        link = service_incidents.c
+        await self.session.execute(
+            self._upsert(
+                service_incident_daily_rollups,
+                ["service_id", "day", "severity"],
+                select(
+                    link.service_id,
+                    day,
+                    Incident.severity,
+                    func.count().label("opened"),
+                    *zeros,
+                )
+                .join(service_incidents, link.incident_id == Incident.id)
+                .where(condition)
+                .group_by(link.service_id, day, Incident.severity),
+            )
+        )
+
+    async def _record_resolved(self, condition: ColumnElement[bool]) -> None:
+        facts = _resolved_facts(self.dialect_name, condition)
+        sums = [
+            func.count().label("resolved"),
+            func.sum(facts.c.resolve_seconds).label("resolve_seconds"),
+            *(
+                func.sum(facts.c[f"{status}_seconds"]).label(f"{status}_seconds")
+                for status in TIMED_STATUSES
+            ),
+        ]
+        zeros = self._zero_counters([s.name for s in sums])
+        await self.session.execute(
+            self._upsert(
+                incident_daily_rollups,
+                ["day", "severity"],
+                select(facts.c.day, facts.c.severity, *sums, *zeros).group_by(
+                    facts.c.day, facts.c.severity
+                ),
+            )
+        )
+        link = service_incidents.c
+        await self.session.execute(
+            self._upsert(
+                service_incident_daily_rollups,
+                ["service_id", "day", "severity"],
+                select(link.service_id, facts.c.day, facts.c.severity, *sums, *zeros)
+                .join(service_incidents, link.incident_id == facts.c.incident_id)
+                .group_by(link.service_id, facts.c.day, facts.c.severity),
+            )
+        )
+
+    # Both run in the caller's transaction, so the rollups move with the
+    # incident write that changes them.
+    async def record_opened(self, incident_id: uuid.UUID) -> None:
+        await self._record_opened(Incident.id == incident_id)
+
+    async def record_resolved(self, incident_id: uuid.UUID) -> None:
+        # Called once per incident: resolution is terminal, so each incident's
+        # durations are added to the rollups exactly once.
+        await self._record_resolved(Incident.id == incident_id)
+
+    async def rebuild(self) -> int:
+        # Recomputes every rollup from raw history, for databases that predate
+        # the rollup tables or to repair drift. Runs in one transaction so
+        # reports never observe a partially rebuilt table.
+        for table in (incident_daily_rollups, service_incident_daily_rollups):
+            await self.session.execute(delete(table))
+        await self._record_opened(true())
+        await self._record_resolved(true())
+        await self.session.commit()
+        count = await self.session.scalar(
+            select(func.count()).select_from(incident_daily_rollups)
+        )
+        return count or 0
+
+    async def get_report(
+        self,
+        start: date,
+        end: date,
+        bucket: TimeBucket = TimeBucket.day,
+        service_id: uuid.UUID | None = None,
+        severities: Sequence[IncidentSeverity] | None = None,
+    ) -> list[AnalyticsRow]:
+        # Reads rollup rows only, so the cost scales with the number of days in
+        # the range rather than the number of incidents in it.
+        table = (
+            incident_daily_rollups
+            if service_id is None
+            else service_incident_daily_rollups
+        )
+        bucket_start = _bucket_start(self.dialect_name, table.c.day, bucket).label(
+            "bucket_start"
+        )
+        conditions = [table.c.day >= start, table.c.day <= end]
+        if service_id is not None:
+            conditions.append(table.c.service_id == service_id)
+        if severities:
+            conditions.append(table.c.severity.in_(severities))
+
+        result = await self.session.execute(
+            select(
+                bucket_start,
+                table.c.severity,
+                *(func.sum(table.c[name]).label(name) for name in ROLLUP_COUNTERS),
+            )
+            .where(and_(*conditions))
+            .group_by(bucket_start, table.c.severity)
+            .order_by(bucket_start)
+        )
+        return [
+            AnalyticsRow(
+                bucket_start=row.bucket_start,
+                severity=row.severity,
+                opened=int(row.opened),
+                resolved=int(row.resolved),
+                resolve_seconds=float(row.resolve_seconds),
+                status_seconds={
+                    status: float(row._mapping[f"{status}_seconds"])
+                    for status in TIMED_STATUSES
+                },
+            )
+            for row in result.all()
+        ]
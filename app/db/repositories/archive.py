@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import DateTime, delete, insert, literal, select
+
+from app.db.repositories.base import BaseRepository, as_utc
+from app.db.repositories.changes import ChangeRepository
+from app.db.repositories.incidents import service_filter
+from app.db.repositories.uptime import ImpactRow
+from app.models.enums import (
+    ChangeEntity,
+    ChangeOperation,
+    IncidentSeverity,
+    IncidentStatus,
+    ServiceMatch,
+)
+from app.models.orm.archive import (
+    ArchivedIncident,
+    ArchivedIncidentUpdate,
+    archived_service_incidents,
+)
+from app.models.orm.associations import service_incidents
+from app.models.orm.incident import Incident
+from app.models.orm.incident_update import IncidentUpdate
+
+
+class ArchiveRepository(BaseRepository):
+    async def archive_batch(
+        self, resolved_before: datetime, limit: int, archived_at: datetime
+    ) -> int:
+        # Moves up to `limit` incidents resolved before the cutoff, with their
+        # updates and service links, in one short transaction. Rows are copied
+        # with INSERT ... SELECT so they never pass through the application, and
+        # deleted by primary key, so each batch only locks the rows it moves.
+        # The candidates are found through ix_incidents_resolved_at.
+        result = await self.session.execute(
+            select(Incident.id)
+            .where(
+                Incident.status == IncidentStatus.resolved,
+                Incident.resolved_at < resolved_before,
+            )
+            .order_by(Incident.resolved_at)
+            .limit(limit)
+        )
+        ids = list(result.scalars().all())
+        if not ids:
+            return 0
+
+        incident_columns = [c.name for c in Incident.__table__.columns]
+        await self.session.execute(
+            insert(ArchivedIncident).from_select(
+                [*incident_columns, "archived_at"],
+                select(
+                    *(Incident.__table__.c[name] for name in incident_columns),
+                    literal(as_utc(archived_at), DateTime(timezone=True)),
+                ).where(Incident.id.in_(ids)),
+            )
+        )
+        update_columns = [c.name for c in IncidentUpdate.__table__.columns]
+        await self.session.execute(
+            insert(ArchivedIncidentUpdate).from_select(
+                update_columns,
+                select(IncidentUpdate.__table__).where(
+                    IncidentUpdate.incident_id.in_(ids)
+                ),
+            )
+        )
+        await self.session.execute(
+            insert(archived_service_incidents).from_select(
+                ["service_id", "incident_id"],
+                select(service_incidents).where(
+                    service_incidents.c.incident_id.in_(ids)
+                ),
+            )
+        )
+
+        # Children first: SQLite does not enforce the ON DELETE CASCADE clauses.
+        await self.session.execute(
+            delete(service_incidents).where(service_incidents.c.incident_id.in_(ids))
+        )
+        await self.session.execute(
+            delete(IncidentUpdate).where(IncidentUpdate.incident_id.in_(ids))
+        )
+        await self.session.execute(delete(Incident).where(Incident.id.in_(ids)))
+        await ChangeRepository(self.session).record(
+            ChangeEntity.incident, ChangeOperation.archived, ids
+        )
+        await self.session.commit()
+        return len(ids)
+
+    async def get_by_id(self, incident_id: uuid.UUID) -> ArchivedIncident | None:
+        return await self.session.get(ArchivedIncident, incident_id)
+
+    async def get_many(
+        self, incident_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, ArchivedIncident]:
+        result = await self.session.execute(
+            select(ArchivedIncident).where(ArchivedIncident.id.in_(incident_ids))
+        )
+        return {i.id: i for i in result.scalars().all()}
+
+    async def get_impact_rows(self) -> list[ImpactRow]:
+        # Every archived incident's service links, shaped like the live rows of
+        # UptimeRepository.get_impact_rows. Only the status history rebuild
+        # reads the archive whole; every row in it is resolved.
+        link = archived_service_incidents.c
+        result = await self.session.execute(
+            select(
+                link.service_id,
+                ArchivedIncident.severity,
+                ArchivedIncident.created_at,
+                ArchivedIncident.resolved_at,
+                ArchivedIncident.id,
+            ).join(archived_service_incidents, link.incident_id == ArchivedIncident.id)
+        )
+        return [
+            ImpactRow(
+                service_id=row.service_id,
+                severity=row.severity,
+                created_at=as_utc(row.created_at),
+                resolved_at=as_utc(row.resolved_at) if row.resolved_at else None,
+                incident_id=row.id,
+            )
+            for row in result.all()
+        ]
+
+    async def get_all(
+        self,
+        severities: Sequence[IncidentSeverity] | None = None,
+        service_ids: Sequence[uuid.UUID] | None = None,
+        service_match: ServiceMatch = ServiceMatch.any,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        resolved_after: datetime | None = None,
+        active_during: tuple[datetime, datetime] | None = None,
+    ) -> list[ArchivedIncident]:
+        # The archive is only queried on explicit request and every incident in
+        # it is resolved, so status filters are settled by the caller and the
+        # remaining ones run as plain predicates. Ordering is left to the caller,
+        # which merges these with live incidents.
+        query = select(ArchivedIncident)
+        if severities:
+            query = query.where(ArchivedIncident.severity.in_(severities))
+        if created_after is not None:
+            query = query.where(ArchivedIncident.created_at >= created_after)
+        if created_before is not None:
+            query = query.where(ArchivedIncident.created_at < created_before)
+        if resolved_after is not None:
+            query = query.where(ArchivedIncident.resolved_at >= resolved_after)
+        if active_during is not None:
+            start, end = as_utc(active_during[0]), as_utc(active_during[1])
+            query = query.where(
+                ArchivedIncident.created_at <= end,
+                ArchivedIncident.resolved_at >= start,
+            )
+        if service_ids:
+            query = query.where(
+                service_filter(
+                    service_ids,
+                    service_match,
+                    ArchivedIncident.id,
+                    archived_service_incidents,
+                )
+            )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
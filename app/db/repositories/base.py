@@ -1,8 +1,24 @@
+from datetime import UTC, datetime
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+def as_utc(value: datetime) -> datetime:
+    # SQLite hands timestamps back naive; they are stored in UTC. Aware values
+    # from PostgreSQL or API input are converted so comparisons never mix the two.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
 # All repositories accept an already-open AsyncSession so that the caller
 # (typically a service layer function) controls the transaction boundary.
 class BaseRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+
+    # Name of the bound database dialect ("sqlite" or "postgresql"), for the few
+    # queries that rely on dialect-specific features such as full-text search.
+    @property
+    def dialect_name(self) -> str:
+        return self.session.get_bind().dialect.name
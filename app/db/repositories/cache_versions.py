@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.repositories.base import BaseRepository
+from app.models.orm.cache_version import cache_versions
+
+
+class CacheVersionRepository(BaseRepository):
+    async def get(self, name: str) -> uuid.UUID | None:
+        version: uuid.UUID | None = await self.session.scalar(
+            select(cache_versions.c.version).where(cache_versions.c.name == name)
+        )
+        return version
+
+    async def bump(self, name: str) -> None:
+        # Runs in the caller's transaction, with the write that invalidates the
+        # cache.
+        dialect = postgresql if self.dialect_name == "postgresql" else sqlite
+        statement = dialect.insert(cache_versions).values(
+            name=name, version=uuid.uuid4()
+        )
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=["name"],
+                set_={"version": statement.excluded.version},
+            )
+        )
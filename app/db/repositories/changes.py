@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, delete, exists, func, insert, select
+from sqlalchemy.orm import aliased
+
+from app.db.repositories.base import BaseRepository
+from app.models.enums import ChangeEntity, ChangeOperation
+from app.models.orm.change import CHANGE_LOCK, Change
+
+
+class ChangeRepository(BaseRepository):
+    async def lock(self) -> None:
+        # Takes CHANGE_LOCK ahead of the first change row, for writes whose
+        # reads must also be serialised; see app/models/orm/change.py.
+        if self.dialect_name == "postgresql":
+            await self.session.execute(CHANGE_LOCK)
+
+    async def record(
+        self,
+        entity_type: ChangeEntity,
+        operation: ChangeOperation,
+        entity_ids: Sequence[uuid.UUID],
+    ) -> None:
+        # For writes made with bulk statements, which the flush hook in
+        # app/models/orm/change.py does not see. Runs in the caller's
+        # transaction, so the rows commit with the change they describe.
+        if not entity_ids:
+            return
+        await self.lock()
+        await self.session.execute(
+            insert(Change),
+            [
+                {"entity_type": entity_type, "entity_id": i, "operation": operation}
+                for i in entity_ids
+            ],
+        )
+
+    async def get_page(self, after: int, limit: int) -> list[Change]:
+        result = await self.session.execute(
+            select(Change).where(Change.seq > after).order_by(Change.seq).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_latest_seq(self) -> int:
+        # max() of the primary key: one index probe.
+        return await self.session.scalar(select(func.max(Change.seq))) or 0
+
+    async def delete_superseded(self, limit: int) -> int:
+        # Rows with a later row for the same entity. Any consumer, however far
+        # behind, still reaches that later row, and it only ever needed the
+        # latest one to know which entities to re-fetch.
+        later = aliased(Change)
+        batch = (
+            select(Change.seq)
+            .where(
+                exists().where(
+                    later.entity_type == Change.entity_type,
+                    later.entity_id == Change.entity_id,
+                    later.seq > Change.seq,
+                )
+            )
+            .limit(limit)
+        )
+        return await self._delete_batch(batch)
+
+    async def delete_tombstones(self, before: datetime, limit: int) -> int:
+        # Deletions are the only rows that can go for good, once every consumer
+        # can be expected to have read them.
+        batch = (
+            select(Change.seq)
+            .where(
+                Change.operation == ChangeOperation.deleted,
+                Change.changed_at < before,
+            )
+            .limit(limit)
+        )
+        return await self._delete_batch(batch)
+
+    async def _delete_batch(self, batch: Select[Any]) -> int:
+        seqs = list((await self.session.execute(batch)).scalars().all())
+        if seqs:
+            await self.session.execute(delete(Change).where(Change.seq.in_(seqs)))
+        await self.session.commit()
+        return len(seqs)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+
+from sqlalchemy import delete, exists, insert, select, text, update
+
+from app.db.repositories.base import BaseRepository, as_utc
+from app.db.repositories.cache_versions import CacheVersionRepository
+from app.db.repositories.changes import ChangeRepository
+from app.models.enums import ChangeEntity, ChangeOperation, ServiceStatus
+from app.models.orm.associations import service_dependencies
+from app.models.orm.service import Service
+
+# Serialises dependency edits across processes on PostgreSQL, so two concurrent
+# additions cannot each pass the cycle check and close a cycle between them.
+# SQLite already serialises writers.
+_LOCK = text("SELECT pg_advisory_xact_lock(hashtext('service_dependencies'))")
+
+# The cache_versions row of the dependency graph.
+CACHE_NAME = "dependency_graph"
+
+
+class DependencyRepository(BaseRepository):
+    async def lock(self) -> None:
+        if self.dialect_name == "postgresql":
+            await self.session.execute(_LOCK)
+
+    async def get_version(self) -> uuid.UUID | None:
+        # Changes whenever an edge is added or removed; one primary key lookup,
+        # so cheap enough to check on every use of the cached graph.
+        return await CacheVersionRepository(self.session).get(CACHE_NAME)
+
+    async def get_edges(self) -> list[tuple[uuid.UUID, uuid.UUID]]:
+        link = service_dependencies.c
+        result = await self.session.execute(select(link.service_id, link.depends_on_id))
+        return [(service_id, depends_on_id) for service_id, depends_on_id in result]
+
+    async def exists(self, service_id: uuid.UUID, depends_on_id: uuid.UUID) -> bool:
+        link = service_dependencies.c
+        result = await self.session.scalar(
+            select(
+                exists().where(
+                    link.service_id == service_id, link.depends_on_id == depends_on_id
+                )
+            )
+        )
+        return bool(result)
+
+    async def add(
+        self, service_id: uuid.UUID, depends_on_id: uuid.UUID, created_at: datetime
+    ) -> None:
+        # add() and remove() run in the caller's transaction, which commits the
+        # edge with the effective statuses it changes.
+        await self.session.execute(
+            insert(service_dependencies).values(
+                service_id=service_id,
+                depends_on_id=depends_on_id,
+                created_at=as_utc(created_at),
+            )
+        )
+        await self._record_change([service_id])
+        await CacheVersionRepository(self.session).bump(CACHE_NAME)
+
+    async def remove(self, service_id: uuid.UUID, depends_on_id: uuid.UUID) -> None:
+        link = service_dependencies.c
+        await self.session.execute(
+            delete(service_dependencies).where(
+                link.service_id == service_id, link.depends_on_id == depends_on_id
+            )
+        )
+        await self._record_change([service_id])
+        await CacheVersionRepository(self.session).bump(CACHE_NAME)
+
+    async def get_services(self, service_ids: Sequence[uuid.UUID]) -> list[Service]:
+        if not service_ids:
+            return []
+        result = await self.session.execute(
+            select(Service).where(Service.id.in_(service_ids)).order_by(Service.name)
+        )
+        return list(result.scalars().all())
+
+    async def get_effective_statuses(
+        self, service_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, ServiceStatus]:
+        # Column-only select: loading Service would also load every incident.
+        if not service_ids:
+            return {}
+        result = await self.session.execute(
+            select(Service.id, Service.effective_status).where(
+                Service.id.in_(service_ids)
+            )
+        )
+        return {service_id: status for service_id, status in result}
+
+    async def set_effective_statuses(
+        self, statuses: Mapping[uuid.UUID, ServiceStatus]
+    ) -> None:
+        # One UPDATE per target status, however many services change. The ORM
+        # statement also updates services already loaded in the session, and
+        # updated_at is assigned to itself so its onupdate hook does not fire:
+        # a dependency's incident is not an edit to this service. Runs in the
+        # caller's transaction, with the write that moved the statuses.
+        by_status: dict[ServiceStatus, list[uuid.UUID]] = defaultdict(list)
+        for service_id, status in statuses.items():
+            by_status[status].append(service_id)
+        for status, service_ids in by_status.items():
+            await self.session.execute(
+                update(Service)
+                .where(Service.id.in_(service_ids))
+                .values(effective_status=status, updated_at=Service.updated_at)
+            )
+        await self._record_change(list(statuses))
+
+    async def _record_change(self, service_ids: Sequence[uuid.UUID]) -> None:
+        # A dependency edit or effective status change alters what the API
+        # returns for the service, so it goes in the change feed.
+        await ChangeRepository(self.session).record(
+            ChangeEntity.service, ChangeOperation.updated, service_ids
+        )
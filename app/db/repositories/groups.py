@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    ScalarSelect,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+
+from app.core.exceptions import ConflictError, NotFoundError
+from app.db.repositories.base import BaseRepository
+from app.models.enums import ServiceStatus
+from app.models.orm.service import Service
+from app.models.orm.service_group import (
+    ServiceGroup,
+    service_group_closure,
+    service_group_members,
+)
+
+closure = service_group_closure.c
+members = service_group_members.c
+
+
+def status_counts(status: ServiceStatus) -> tuple[int, int]:
+    # A single service's contribution to (degraded_count, outage_count).
+    return (
+        int(status == ServiceStatus.degraded),
+        int(status == ServiceStatus.outage),
+    )
+
+
+class GroupRepository(BaseRepository):
+    async def get_by_id(self, group_id: uuid.UUID) -> ServiceGroup:
+        group = await self.session.get(ServiceGroup, group_id)
+        if group is None:
+            raise NotFoundError(f"Group with id '{group_id}' does not exist.")
+        return group
+
+    async def get_all(self) -> list[ServiceGroup]:
+        result = await self.session.execute(
+            select(ServiceGroup).order_by(ServiceGroup.name)
+        )
+        return list(result.scalars().all())
+
+    async def create(
+        self,
+        name: str,
+        description: str | None = None,
+        parent_id: uuid.UUID | None = None,
+    ) -> ServiceGroup:
+        group = ServiceGroup(
+            name=name.strip(), description=description, parent_id=parent_id
+        )
+        self.session.add(group)
+        try:
+            await self.session.flush()
+        except IntegrityError:
+            await self.session.rollback()
+            raise ConflictError(f"A group with name '{name}' already exists.")
+        # The new group's paths: itself, plus one below each of its parent's
+        # ancestors (the parent included).
+        await self.session.execute(
+            insert(service_group_closure).values(
+                ancestor_id=group.id, descendant_id=group.id, depth=0
+            )
+        )
+        if parent_id is not None:
+            await self.session.execute(
+                insert(service_group_closure).from_select(
+                    ["ancestor_id", "descendant_id", "depth"],
+                    select(
+                        closure.ancestor_id, literal(group.id), closure.depth + 1
+                    ).where(closure.descendant_id == parent_id),
+                )
+            )
+        await self.session.commit()
+        await self.session.refresh(group)
+        return group
+
+    async def update(
+        self,
+        group: ServiceGroup,
+        name: str | None = None,
+        description: str | None = None,
+    ) -> ServiceGroup:
+        if name is not None:
+            group.name = name.strip()
+        if description is not None:
+            group.description = description
+        try:
+            await self.session.commit()
+            await self.session.refresh(group)
+        except IntegrityError:
+            await self.session.rollback()
+            raise ConflictError(f"A group with name '{name}' already exists.")
+        return group
+
+    async def is_within(self, group_id: uuid.UUID, ancestor_id: uuid.UUID) -> bool:
+        # True when group_id is ancestor_id or any group below it.
+        result = await self.session.scalar(
+            select(
+                exists().where(
+                    closure.ancestor_id == ancestor_id,
+                    closure.descendant_id == group_id,
+                )
+            )
+        )
+        return bool(result)
+
+    async def has_children(self, group_id: uuid.UUID) -> bool:
+        result = await self.session.scalar(
+            select(exists().where(ServiceGroup.parent_id == group_id))
+        )
+        return bool(result)
+
+    async def move(self, group: ServiceGroup, parent_id: uuid.UUID | None) -> None:
+        # Re-parents the whole subtree. Its services leave the counters of the
+        # old ancestors and join the new ones', then the subtree's paths to the
+        # old ancestors are swapped for paths to the new ones.
+        services, degraded, outage = (
+            group.service_count,
+            group.degraded_count,
+            group.outage_count,
+        )
+        await self._adjust_ancestors(
+            group.id, -services, -degraded, -outage, strict=True
+        )
+        subtree = select(closure.descendant_id).where(closure.ancestor_id == group.id)
+        old_ancestors = select(closure.ancestor_id).where(
+            closure.descendant_id == group.id, closure.depth > 0
+        )
+        await self.session.execute(
+            delete(service_group_closure).where(
+                closure.descendant_id.in_(subtree),
+                closure.ancestor_id.in_(old_ancestors),
+            )
+        )
+        if parent_id is not None:
+            above = service_group_closure.alias("above")
+            below = service_group_closure.alias("below")
+            await self.session.execute(
+                insert(service_group_closure).from_select(
+                    ["ancestor_id", "descendant_id", "depth"],
+                    # Every new ancestor paired with every group in the
+                    # subtree: a deliberate cross join.
+                    select(
+                        above.c.ancestor_id,
+                        below.c.descendant_id,
+                        above.c.depth + below.c.depth + 1,
+                    )
+                    .select_from(above)
+                    .join(below, true())
+                    .where(
+                        above.c.descendant_id == parent_id,
+                        below.c.ancestor_id == group.id,
+                    ),
+                )
+            )
+        group.parent_id = parent_id
+        await self._adjust_ancestors(group.id, services, degraded, outage, strict=True)
+        await self.session.commit()
+        await self.session.refresh(group)
+
+    async def delete(self, group: ServiceGroup) -> None:
+        # Only empty leaf groups are deleted, so the closure rows to remove are
+        # the group's paths from its ancestors. Explicit, as SQLite does not
+        # enforce ON DELETE CASCADE.
+        await self.session.execute(
+            delete(service_group_closure).where(closure.descendant_id == group.id)
+        )
+        await self.session.delete(group)
+        await self.session.commit()
+
+    async def get_services(self, group_id: uuid.UUID) -> list[Service]:
+        # Every service in the group or any group below it: one range scan of
+        # the closure table's primary key, joined to the membership index.
+        result = await self.session.execute(
+            select(Service)
+            .join(service_group_members, members.service_id == Service.id)
+            .join(service_group_closure, closure.descendant_id == members.group_id)
+            .where(closure.ancestor_id == group_id)
+            .order_by(Service.name)
+        )
+        return list(result.scalars().all())
+
+    async def get_groups_of(
+        self, service_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, uuid.UUID]:
+        if not service_ids:
+            return {}
+        result = await self.session.execute(
+            select(members.service_id, members.group_id).where(
+                members.service_id.in_(service_ids)
+            )
+        )
+        return {service_id: group_id for service_id, group_id in result}
+
+    async def set_member(
+        self, service_id: uuid.UUID, group_id: uuid.UUID | None
+    ) -> None:
+        # Membership and counter changes made before this call commit together.
+        await self.session.execute(
+            delete(service_group_members).where(members.service_id == service_id)
+        )
+        if group_id is not None:
+            await self.session.execute(
+                insert(service_group_members).values(
+                    service_id=service_id, group_id=group_id
+                )
+            )
+        await self.session.commit()
+
+    async def remove_member(self, service_id: uuid.UUID, status: ServiceStatus) -> None:
+        # Takes a service out of its group, if any, and its contribution out of
+        # the counters. Runs in the caller's transaction (service deletion).
+        group_id = await self.session.scalar(
+            select(members.group_id).where(members.service_id == service_id)
+        )
+        if group_id is None:
+            return
+        degraded, outage = status_counts(status)
+        await self.adjust_counts(group_id, -1, -degraded, -outage)
+        await self.session.execute(
+            delete(service_group_members).where(members.service_id == service_id)
+        )
+
+    async def adjust_counts(
+        self, group_id: uuid.UUID, services: int, degraded: int, outage: int
+    ) -> None:
+        # Applies a change in the group's own services to it and every ancestor.
+        # Runs in the caller's transaction, so counters move atomically with
+        # the membership or status change they reflect.
+        await self._adjust_ancestors(group_id, services, degraded, outage)
+
+    async def _adjust_ancestors(
+        self,
+        group_id: uuid.UUID,
+        services: int,
+        degraded: int,
+        outage: int,
+        strict: bool = False,
+    ) -> None:
+        if not (services or degraded or outage):
+            return
+        ancestors = select(closure.ancestor_id).where(closure.descendant_id == group_id)
+        if strict:
+            ancestors = ancestors.where(closure.depth > 0)
+        # updated_at is assigned to itself so its onupdate hook does not fire:
+        # a member's status change is not an edit to the group.
+        await self.session.execute(
+            update(ServiceGroup)
+            .where(ServiceGroup.id.in_(ancestors))
+            .values(
+                service_count=ServiceGroup.service_count + services,
+                degraded_count=ServiceGroup.degraded_count + degraded,
+                outage_count=ServiceGroup.outage_count + outage,
+                updated_at=ServiceGroup.updated_at,
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+
+    async def rebuild_counts(self) -> None:
+        # Recomputes every group's counters from membership and the services'
+        # stored effective statuses, for repairing drift.
+        def count(*criteria: ColumnElement[bool]) -> ScalarSelect[int]:
+            return (
+                select(func.count())
+                .select_from(service_group_closure)
+                .join(service_group_members, members.group_id == closure.descendant_id)
+                .join(Service, Service.id == members.service_id)
+                .where(closure.ancestor_id == ServiceGroup.id, *criteria)
+                .scalar_subquery()
+            )
+
+        await self.session.execute(
+            update(ServiceGroup)
+            .values(
+                service_count=count(),
+                degraded_count=count(
+                    Service.effective_status == ServiceStatus.degraded
+                ),
+                outage_count=count(Service.effective_status == ServiceStatus.outage),
+                updated_at=ServiceGroup.updated_at,
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        await self.session.commit()
+
+    async def has_services(self, group_id: uuid.UUID) -> bool:
+        result = await self.session.scalar(
+            select(exists().where(members.group_id == group_id))
+        )
+        return bool(result)
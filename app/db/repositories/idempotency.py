@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.repositories.base import BaseRepository
+from app.models.orm.idempotency import IdempotencyKey
+
+
+class IdempotencyRepository(BaseRepository):
+    async def claim(self, key: str, fingerprint: str, now: datetime) -> bool:
+        # False if another request holds the key. ON CONFLICT DO NOTHING rather
+        # than catching the IntegrityError, whose rollback would expire
+        # everything else in the session.
+        dialect = postgresql if self.dialect_name == "postgresql" else sqlite
+        result = await self.session.execute(
+            dialect.insert(IdempotencyKey)
+            .values(key=key, fingerprint=fingerprint, created_at=now)
+            .on_conflict_do_nothing(index_elements=["key"])
+        )
+        await self.session.commit()
+        return bool(result.rowcount == 1)  # type: ignore[attr-defined]
+
+    async def get(self, key: str) -> IdempotencyKey | None:
+        # Read afresh each time: a waiting request polls the same row.
+        result: IdempotencyKey | None = await self.session.scalar(
+            select(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .execution_options(populate_existing=True)
+        )
+        return result
+
+    async def complete(
+        self, key: str, response: dict[str, Any], completed_at: datetime
+    ) -> None:
+        # Runs in the caller's transaction, to commit with the write it
+        # answers for.
+        await self.session.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .values(response=response, completed_at=completed_at)
+        )
+
+    async def release(self, key: str, created_at: datetime) -> None:
+        # Deletes the claim made at created_at only: if it has already been
+        # released and claimed again, the new claim is left alone.
+        if not self.session.is_active:
+            await self.session.rollback()
+        await self.session.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.key == key, IdempotencyKey.created_at == created_at
+            )
+        )
+        await self.session.commit()
+
+    async def delete_expired(self, before: datetime, limit: int) -> int:
+        keys = list(
+            (
+                await self.session.execute(
+                    select(IdempotencyKey.key)
+                    .where(IdempotencyKey.created_at < before)
+                    .order_by(IdempotencyKey.created_at)
+                    .limit(limit)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if keys:
+            await self.session.execute(
+                delete(IdempotencyKey).where(IdempotencyKey.key.in_(keys))
+            )
+        await self.session.commit()
+        return len(keys)
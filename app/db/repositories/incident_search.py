@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import html
+import re
+import uuid
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy import DateTime, Enum, Float, String, Uuid, text
+from sqlalchemy.types import TypeEngine
+
+from app.db.repositories.base import BaseRepository
+from app.models.enums import IncidentSeverity, IncidentStatus
+
+# Markers wrapped around matched terms in snippets. Both dialects use the same
+# markers so clients can render highlights without knowing the backend.
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+# What the database wraps matches in instead. The snippet is HTML-escaped
+# before these become the markers above, so incident text can never inject
+# markup into a page that renders it; one typed into the text itself only
+# yields a stray marker.
+_MATCH_START = "\x02"
+_MATCH_END = "\x03"
+
+
+class IncidentSearchHit(NamedTuple):
+    id: uuid.UUID
+    title: str
+    severity: IncidentSeverity
+    status: IncidentStatus
+    created_at: datetime
+    resolved_at: datetime | None
+    rank: float
+    snippet: str
+
+
+# Column types for the raw hit rows, so UUIDs, enums and timestamps come back as
+# Python objects on both dialects.
+_HIT_COLUMNS: dict[str, TypeEngine[Any]] = {
+    "id": Uuid(),
+    "title": String(),
+    "severity": Enum(IncidentSeverity),
+    "status": Enum(IncidentStatus),
+    "created_at": DateTime(timezone=True),
+    "resolved_at": DateTime(timezone=True),
+    "rank": Float(),
+    "snippet": String(),
+}
+
+# bm25() weights for the title, body and messages columns of the FTS5 table.
+# Title matches count most, then the description, then timeline messages.
+_SQLITE_SEARCH = text(
+    """
+    SELECT i.id, i.title, i.severity, i.status, i.created_at, i.resolved_at,
+           -bm25(incident_search, 10.0, 4.0, 1.0) AS rank,
+           snippet(incident_search, -1, :start, :end, '…', 16) AS snippet
+    FROM incident_search
+    JOIN incident_rowids AS k ON k.id = incident_search.rowid
+    JOIN incidents AS i ON i.id = k.incident_id
+    WHERE incident_search MATCH :query
+    ORDER BY bm25(incident_search, 10.0, 4.0, 1.0), i.created_at DESC
+    LIMIT :limit OFFSET :offset
+    """
+).columns(**_HIT_COLUMNS)
+
+_SQLITE_COUNT = text(
+    "SELECT count(*) FROM incident_search WHERE incident_search MATCH :query"
+)
+
+# Ranking and pagination happen in the hits CTE; ts_headline is comparatively
+# expensive, so it only runs for the rows of the requested page.
+_POSTGRES_SEARCH = text(
+    """
+    WITH query AS (SELECT websearch_to_tsquery('english', :query) AS q),
+    hits AS (
+        SELECT s.incident_id, ts_rank_cd(s.document, query.q) AS rank, i.created_at
+        FROM incident_search AS s
+        JOIN incidents AS i ON i.id = s.incident_id
+        CROSS JOIN query
+        WHERE s.document @@ query.q
+        ORDER BY rank DESC, i.created_at DESC
+        LIMIT :limit OFFSET :offset
+    )
+    SELECT i.id, i.title, i.severity, i.status, i.created_at, i.resolved_at,
+           hits.rank,
+           ts_headline(
+               'english',
+               concat_ws(
+                   ' ',
+                   i.title,
+                   i.body,
+                   (
+                       SELECT string_agg(u.message, ' ' ORDER BY u.sequence)
+                       FROM incident_updates AS u
+                       WHERE u.incident_id = i.id
+                   )
+               ),
+               query.q,
+               'StartSel=' || :start || ', StopSel=' || :end
+                   || ', MaxFragments=2, MinWords=5, MaxWords=20'
+           ) AS snippet
+    FROM hits
+    JOIN incidents AS i ON i.id = hits.incident_id
+    CROSS JOIN query
+    ORDER BY hits.rank DESC, i.created_at DESC
+    """
+).columns(**_HIT_COLUMNS)
+
+_POSTGRES_COUNT = text(
+    """
+    SELECT count(*) FROM incident_search
+    WHERE document @@ websearch_to_tsquery('english', :query)
+    """
+)
+
+_SQLITE_REBUILD = [
+    "DELETE FROM incident_search",
+    "DELETE FROM incident_rowids WHERE incident_id NOT IN (SELECT id FROM incidents)",
+    "INSERT OR IGNORE INTO incident_rowids (incident_id) SELECT id FROM incidents",
+    """
+    INSERT INTO incident_search (rowid, title, body, messages)
+    SELECT k.id, i.title, coalesce(i.body, ''), coalesce(
+        (
+            SELECT group_concat(message, char(10)) FROM (
+                SELECT u.message FROM incident_updates AS u
+                WHERE u.incident_id = i.id ORDER BY u.sequence
+            )
+        ),
+        ''
+    )
+    FROM incidents AS i
+    JOIN incident_rowids AS k ON k.incident_id = i.id
+    """,
+]
+
+_POSTGRES_REBUILD = [
+    """
+    INSERT INTO incident_search (incident_id, header, messages, document)
+    SELECT i.id, h.header, m.messages, h.header || m.messages
+    FROM incidents AS i
+    CROSS JOIN LATERAL (
+        SELECT setweight(to_tsvector('english', i.title), 'A')
+            || setweight(to_tsvector('english', coalesce(i.body, '')), 'B') AS header
+    ) AS h
+    CROSS JOIN LATERAL (
+        SELECT coalesce(
+            setweight(
+                to_tsvector('english', string_agg(u.message, ' ' ORDER BY u.sequence)),
+                'C'
+            ),
+            ''::tsvector
+        ) AS messages
+        FROM incident_updates AS u
+        WHERE u.incident_id = i.id
+    ) AS m
+    ON CONFLICT (incident_id) DO UPDATE
+        SET header = EXCLUDED.header,
+            messages = EXCLUDED.messages,
+            document = EXCLUDED.document
+    """,
+]
+
+
+def _to_fts5_query(query: str) -> str:
+    # User input is never passed to MATCH verbatim: FTS5 treats characters such
+    # as '-', ':' and '"' as query syntax. Each word is quoted as a literal term
+    # and the terms are implicitly ANDed, mirroring websearch_to_tsquery.
+    return " ".join(f'"{term}"' for term in re.findall(r"\w+", query))
+
+
+def _highlight(snippet: str) -> str:
+    return (
+        html.escape(snippet)
+        .replace(_MATCH_START, HIGHLIGHT_START)
+        .replace(_MATCH_END, HIGHLIGHT_END)
+    )
+
+
+class IncidentSearchRepository(BaseRepository):
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[IncidentSearchHit], int]:
+        if self.dialect_name == "postgresql":
+            search_stmt, count_stmt, match = _POSTGRES_SEARCH, _POSTGRES_COUNT, query
+        else:
+            search_stmt, count_stmt = _SQLITE_SEARCH, _SQLITE_COUNT
+            match = _to_fts5_query(query)
+            if not match:
+                return [], 0
+
+        total = await self.session.scalar(count_stmt, {"query": match})
+        result = await self.session.execute(
+            search_stmt,
+            {
+                "query": match,
+                "limit": limit,
+                "offset": offset,
+                "start": _MATCH_START,
+                "end": _MATCH_END,
+            },
+        )
+        hits = [
+            IncidentSearchHit(*row)._replace(snippet=_highlight(row.snippet))
+            for row in result.all()
+        ]
+        return hits, total or 0
+
+    async def rebuild(self) -> int:
+        # Backfill for incidents written before the index existed. Triggers keep
+        # the index current from then on, so this only needs to run once after
+        # the migration (or to repair an index that drifted).
+        statements = (
+            _POSTGRES_REBUILD if self.dialect_name == "postgresql" else _SQLITE_REBUILD
+        )
+        for statement in statements:
+            await self.session.execute(text(statement))
+        await self.session.commit()
+        count = await self.session.scalar(text("SELECT count(*) FROM incident_search"))
+        return count or 0
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import UTC
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from app.core.exceptions import ConflictError, NotFoundError
 from app.db.repositories.base import BaseRepository
@@ -17,10 +17,49 @@ class IncidentUpdateRepository(BaseRepository):
         result = await self.session.execute(
             select(IncidentUpdate)
             .where(IncidentUpdate.incident_id == incident_id)
-            .order_by(IncidentUpdate.created_at.asc())
+            .order_by(IncidentUpdate.sequence.asc())
         )
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        incident_id: uuid.UUID,
+        since: int | None = None,
+        limit: int = 50,
+    ) -> tuple[list[IncidentUpdate], int]:
+        # Selecting only the counter avoids Incident's selectin relationships,
+        # which would otherwise load the whole timeline we are trying to page.
+        latest_sequence = await self.session.scalar(
+            select(Incident.last_update_sequence).where(Incident.id == incident_id)
+        )
+        if latest_sequence is None:
+            raise NotFoundError(f"Incident with id '{incident_id}' does not exist.")
+
+        # Keyset pagination on (incident_id, sequence): served directly by the
+        # (incident_id, sequence) index, so the cost is independent of how deep
+        # the cursor is. No created_at bound: timestamps come from the clock of
+        # whichever node wrote the row, so an update can predate its incident,
+        # and a bound would drop it from every page.
+        query = select(IncidentUpdate).where(IncidentUpdate.incident_id == incident_id)
+        if since is not None:
+            query = query.where(IncidentUpdate.sequence > since)
+        result = await self.session.execute(
+            query.order_by(IncidentUpdate.sequence.asc()).limit(limit)
+        )
+        return list(result.scalars().all()), latest_sequence
+
+    async def next_sequence(self, incident_id: uuid.UUID) -> int:
+        # Increment-and-return in a single statement so concurrent appends to the
+        # same incident serialise on the row lock and never share a sequence.
+        result = await self.session.execute(
+            update(Incident)
+            .where(Incident.id == incident_id)
+            .values(last_update_sequence=Incident.last_update_sequence + 1)
+            .returning(Incident.last_update_sequence)
+        )
+        return result.scalar_one()
+
+    # Flushed, not committed, like IncidentRepository's writes.
     async def create(
         self,
         incident_id: uuid.UUID,
@@ -35,12 +74,13 @@ class IncidentUpdateRepository(BaseRepository):
                 f"Incident '{incident_id}' is already resolved and cannot be updated."
             )
 
-        update = IncidentUpdate(
+        incident_update = IncidentUpdate(
             incident_id=incident_id,
+            sequence=await self.next_sequence(incident_id),
             message=message,
             status=status,
         )
-        self.session.add(update)
+        self.session.add(incident_update)
 
         # Touch the parent incident's updated_at so callers can tell at a glance
         # when activity last occurred, even without fetching the updates list.
@@ -50,6 +90,6 @@ class IncidentUpdateRepository(BaseRepository):
 
         incident.updated_at = datetime.now(UTC)
 
-        await self.session.commit()
-        await self.session.refresh(update)
-        return update
+        await self.session.flush()
+        await self.session.refresh(incident_update)
+        return incident_update
@@ -1,15 +1,247 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, NamedTuple
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    BindParameter,
+    ColumnElement,
+    DateTime,
+    Integer,
+    Row,
+    Select,
+    Table,
+    Uuid,
+    and_,
+    bindparam,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.orm import QueryableAttribute, selectinload
 
 from app.core.exceptions import NotFoundError
-from app.db.repositories.base import BaseRepository
-from app.models.enums import IncidentSeverity, IncidentStatus
+from app.db.repositories.base import BaseRepository, as_utc
+from app.models.enums import (
+    IncidentSeverity,
+    IncidentSort,
+    IncidentStatus,
+    ServiceMatch,
+)
+from app.models.orm.associations import service_incidents
 from app.models.orm.incident import Incident
+from app.models.orm.incident_update import IncidentUpdate
+from app.models.orm.intervals import OPEN_INTERVAL_END
+
+ACTIVE_STATUSES = [s for s in IncidentStatus if s != IncidentStatus.resolved]
+
+_SORT_ORDERS: dict[IncidentSort, tuple[ColumnElement[Any], ...]] = {
+    IncidentSort.recent: (Incident.created_at.desc(),),
+    IncidentSort.oldest: (Incident.created_at.asc(),),
+    IncidentSort.severity: (
+        Incident.severity_rank.asc(),
+        Incident.created_at.desc(),
+    ),
+}
+
+
+def _bind(
+    name: str, values: Mapping[str, Any] | None, **kwargs: Any
+) -> BindParameter[Any]:
+    # With values, the parameter carries its own; without, it is left for the
+    # caller to supply at execution, so the statement can be built once.
+    if values is None:
+        return bindparam(name, required=True, **kwargs)
+    return bindparam(name, values[name], **kwargs)
+
+
+def service_params(service_ids: Sequence[uuid.UUID]) -> dict[str, Any]:
+    distinct_ids = set(service_ids)
+    return {"service_ids": list(distinct_ids), "service_count": len(distinct_ids)}
+
+
+def service_clause(
+    match: ServiceMatch,
+    incident_id: QueryableAttribute[uuid.UUID] = Incident.id,
+    link_table: Table = service_incidents,
+    values: Mapping[str, Any] | None = None,
+) -> ColumnElement[bool]:
+    # Both forms probe service_incidents directly instead of going through the
+    # Incident.services relationship, whose .any() compiles to a correlated
+    # subquery joined to services and evaluated once per incident row. An
+    # uncorrelated IN (SELECT ...) is planned as a semi-join driven by the
+    # (service_id, incident_id) primary key on both SQLite and PostgreSQL.
+    # "all" keeps only incidents whose link rows cover every requested service.
+    # The archive passes its own id column and link table. `values` come from
+    # service_params().
+    links = link_table.c
+    linked = select(links.incident_id).where(
+        links.service_id.in_(_bind("service_ids", values, expanding=True))
+    )
+    if match == ServiceMatch.all:
+        linked = linked.group_by(links.incident_id).having(
+            func.count() == _bind("service_count", values)
+        )
+    return incident_id.in_(linked)
+
+
+def service_filter(
+    service_ids: Sequence[uuid.UUID],
+    match: ServiceMatch,
+    incident_id: QueryableAttribute[uuid.UUID] = Incident.id,
+    link_table: Table = service_incidents,
+) -> ColumnElement[bool]:
+    return service_clause(match, incident_id, link_table, service_params(service_ids))
+
+
+# Candidate incidents whose minute-granularity interval in the R*Tree overlaps
+# the requested window. See app/models/orm/intervals.py. CROSS JOIN pins the
+# join order in SQLite: left to itself the planner scans incident_rowids and
+# probes the R*Tree by id, never using its range search.
+_SQLITE_INTERVAL_CANDIDATES = text(
+    """
+    SELECT k.incident_id
+    FROM incident_intervals AS r
+    CROSS JOIN incident_rowids AS k ON k.id = r.id
+    WHERE r.start_minute <= :end_minute AND r.end_minute >= :start_minute
+    """
+).columns(incident_id=Uuid())
+
+
+def active_during_params(start: datetime, end: datetime) -> dict[str, Any]:
+    start, end = as_utc(start), as_utc(end)
+    return {
+        "during_start": start,
+        "during_end": end,
+        # Only used by the SQLite form.
+        "start_minute": int(start.timestamp()) // 60,
+        "end_minute": min(int(end.timestamp()) // 60, OPEN_INTERVAL_END),
+    }
+
+
+def active_during_clause(
+    dialect_name: str, values: Mapping[str, Any] | None = None
+) -> ColumnElement[bool]:
+    # An incident overlaps the closed window [start, end] if it was opened no
+    # later than end and was still open at start. Unresolved incidents count as
+    # active through the end of any window. `values` come from
+    # active_during_params().
+    start = _bind("during_start", values, type_=DateTime(timezone=True))
+    end = _bind("during_end", values, type_=DateTime(timezone=True))
+    if dialect_name == "postgresql":
+        # Must render exactly as the ix_incidents_active_range expression, with
+        # the bounds spec inlined rather than bound, for the GiST index to apply.
+        bounds: ColumnElement[str] = literal_column("'[]'")
+        active_range = func.tstzrange(
+            Incident.created_at,
+            func.coalesce(
+                Incident.resolved_at, literal_column("'infinity'::timestamptz")
+            ),
+            bounds,
+        )
+        return active_range.bool_op("&&")(func.tstzrange(start, end, bounds))
+
+    # SQLite: the R*Tree narrows the search to a superset of candidates at
+    # minute granularity, then the exact predicate runs on just those rows.
+    candidates = _SQLITE_INTERVAL_CANDIDATES.bindparams(
+        _bind("start_minute", values, type_=Integer()),
+        _bind("end_minute", values, type_=Integer()),
+    )
+    return and_(
+        Incident.id.in_(candidates),
+        Incident.created_at <= end,
+        or_(Incident.resolved_at.is_(None), Incident.resolved_at >= start),
+    )
+
+
+def active_during_filter(
+    dialect_name: str, start: datetime, end: datetime
+) -> ColumnElement[bool]:
+    return active_during_clause(dialect_name, active_during_params(start, end))
+
+
+# The hot statements are built once and reused with bound parameters. Besides
+# skipping construction, this lets SQLAlchemy find their compiled form without
+# walking them again: a statement's cache key is memoized on the statement.
+_GET_BY_ID = (
+    select(Incident)
+    .options(selectinload(Incident.updates), selectinload(Incident.services))
+    .where(Incident.id == bindparam("incident_id"))
+)
+
+_ACTIVE_BY_SEVERITY = (
+    select(Incident.severity, func.count())
+    .where(Incident.status.in_(ACTIVE_STATUSES))
+    .group_by(Incident.severity)
+)
+
+
+class _ListStatements(NamedTuple):
+    # Plain rows, for get_all_rows(): the incidents, then the service links and
+    # updates of the same incidents, selected by repeating the filters in a
+    # subquery rather than by passing their IDs back.
+    rows: Select[Any]
+    links: Select[Any]
+    updates: Select[Any]
+
+
+@lru_cache(maxsize=256)
+def _list_statements(
+    dialect_name: str,
+    sort: IncidentSort,
+    filters: frozenset[str],
+    service_match: ServiceMatch,
+) -> _ListStatements:
+    # One set of statements per combination of filters in use; the filter
+    # values are bound under the filter's name.
+    conditions: list[ColumnElement[bool]] = []
+    if "statuses" in filters:
+        conditions.append(Incident.status.in_(bindparam("statuses", expanding=True)))
+    if "severities" in filters:
+        conditions.append(
+            Incident.severity.in_(bindparam("severities", expanding=True))
+        )
+    if "active" in filters:
+        # Expressed as an IN list rather than != so the status index applies.
+        conditions.append(Incident.status.in_(ACTIVE_STATUSES))
+    if "resolved" in filters:
+        conditions.append(Incident.status == IncidentStatus.resolved)
+    if "created_after" in filters:
+        conditions.append(Incident.created_at >= bindparam("created_after"))
+    if "created_before" in filters:
+        conditions.append(Incident.created_at < bindparam("created_before"))
+    if "resolved_after" in filters:
+        conditions.append(Incident.resolved_at >= bindparam("resolved_after"))
+    if "active_during" in filters:
+        conditions.append(active_during_clause(dialect_name))
+    if "service_ids" in filters:
+        conditions.append(service_clause(service_match))
+
+    order = _SORT_ORDERS[sort]
+    matching = select(Incident.id).where(*conditions)
+    links = service_incidents.c
+    updates = IncidentUpdate.__table__.c
+    return _ListStatements(
+        rows=select(Incident.__table__).where(*conditions).order_by(*order),
+        links=select(links.incident_id, links.service_id).where(
+            links.incident_id.in_(matching)
+        ),
+        updates=select(IncidentUpdate.__table__)
+        .where(updates.incident_id.in_(matching))
+        .order_by(updates.incident_id, updates.sequence),
+    )
+
+
+class IncidentRows(NamedTuple):
+    incidents: Sequence[Row[Any]]
+    # Keyed by incident ID. Updates are in sequence order.
+    service_ids: dict[uuid.UUID, list[uuid.UUID]]
+    updates: dict[uuid.UUID, list[Row[Any]]]
 
 
 class IncidentRepository(BaseRepository):
@@ -18,42 +250,122 @@ class IncidentRepository(BaseRepository):
         # Without this, stale in-memory data can be returned after a mutation
         # performed earlier in the same session (e.g. resolve then get_by_id).
         self.session.expire_all()
-        result = await self.session.execute(
-            select(Incident)
-            .options(selectinload(Incident.updates), selectinload(Incident.services))
-            .where(Incident.id == incident_id)
-        )
+        result = await self.session.execute(_GET_BY_ID, {"incident_id": incident_id})
         incident = result.scalar_one_or_none()
         if incident is None:
             raise NotFoundError(f"Incident with id '{incident_id}' does not exist.")
         return incident
 
-    async def get_all(
+    async def get_many(
+        self, incident_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, Incident]:
+        # One IN query plus one per relationship, however many IDs. Instead of
+        # get_by_id's expire_all(), populate_existing refreshes just these rows
+        # from the database.
+        result = await self.session.execute(
+            select(Incident)
+            .options(selectinload(Incident.updates), selectinload(Incident.services))
+            .where(Incident.id.in_(incident_ids))
+            .execution_options(populate_existing=True)
+        )
+        return {i.id: i for i in result.scalars().all()}
+
+    def _list_query(
         self,
-        status: IncidentStatus | None = None,
-        severity: IncidentSeverity | None = None,
-        service_id: uuid.UUID | None = None,
-    ) -> list[Incident]:
-        query = select(Incident).order_by(Incident.created_at.desc())
+        statuses: Sequence[IncidentStatus] | None,
+        severities: Sequence[IncidentSeverity] | None,
+        service_ids: Sequence[uuid.UUID] | None,
+        service_match: ServiceMatch,
+        created_after: datetime | None,
+        created_before: datetime | None,
+        resolved_after: datetime | None,
+        active: bool | None,
+        active_during: tuple[datetime, datetime] | None,
+        sort: IncidentSort,
+    ) -> tuple[_ListStatements, dict[str, Any]]:
+        filters: set[str] = set()
+        params: dict[str, Any] = {}
+        if statuses:
+            filters.add("statuses")
+            params["statuses"] = list(statuses)
+        if severities:
+            filters.add("severities")
+            params["severities"] = list(severities)
+        if created_after is not None:
+            filters.add("created_after")
+            params["created_after"] = created_after
+        if created_before is not None:
+            filters.add("created_before")
+            params["created_before"] = created_before
+        if resolved_after is not None:
+            filters.add("resolved_after")
+            params["resolved_after"] = resolved_after
+        if active is not None:
+            filters.add("active" if active else "resolved")
+        if active_during is not None:
+            filters.add("active_during")
+            params.update(active_during_params(*active_during))
+        if service_ids:
+            filters.add("service_ids")
+            params.update(service_params(service_ids))
+        statements = _list_statements(
+            self.dialect_name, sort, frozenset(filters), service_match
+        )
+        return statements, params
 
-        if status is not None:
-            query = query.where(Incident.status == status)
-        if severity is not None:
-            query = query.where(Incident.severity == severity)
-        if service_id is not None:
-            query = query.where(Incident.services.any(id=service_id))
+    async def get_all_rows(
+        self,
+        statuses: Sequence[IncidentStatus] | None = None,
+        severities: Sequence[IncidentSeverity] | None = None,
+        service_ids: Sequence[uuid.UUID] | None = None,
+        service_match: ServiceMatch = ServiceMatch.any,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        resolved_after: datetime | None = None,
+        active: bool | None = None,
+        active_during: tuple[datetime, datetime] | None = None,
+        sort: IncidentSort = IncidentSort.recent,
+    ) -> IncidentRows:
+        # The filtered list as plain rows, for read-only lists: no ORM objects,
+        # identity map entries or relationship collections are built, which for
+        # long lists is most of the cost. Three queries however many incidents.
+        statements, params = self._list_query(
+            statuses,
+            severities,
+            service_ids,
+            service_match,
+            created_after,
+            created_before,
+            resolved_after,
+            active,
+            active_during,
+            sort,
+        )
+        incidents = (await self.session.execute(statements.rows, params)).all()
+        linked: dict[uuid.UUID, list[uuid.UUID]] = {}
+        for incident_id, service_id in await self.session.execute(
+            statements.links, params
+        ):
+            linked.setdefault(incident_id, []).append(service_id)
+        updates: dict[uuid.UUID, list[Row[Any]]] = {}
+        for update in await self.session.execute(statements.updates, params):
+            updates.setdefault(update.incident_id, []).append(update)
+        return IncidentRows(incidents, linked, updates)
 
-        result = await self.session.execute(query)
-        # .unique() deduplicates rows that can be multiplied by selectinload joins
-        # when an incident is linked to multiple services.
-        return list(result.scalars().unique().all())
+    async def count_active_by_severity(self) -> dict[IncidentSeverity, int]:
+        result = await self.session.execute(_ACTIVE_BY_SEVERITY)
+        return {severity: count for severity, count in result.all()}
 
+    # create, update and resolve flush without committing: the caller adds the
+    # rows derived from the write (webhook deliveries, rollups, status log) and
+    # commits them together with it; see app/services/incidents.py.
     async def create(
         self,
         title: str,
         severity: IncidentSeverity,
         service_ids: list[uuid.UUID],
         body: str | None = None,
+        incident_id: uuid.UUID | None = None,
     ) -> Incident:
         # Local import breaks the circular dependency between IncidentRepository
         # and ServiceRepository (both extend BaseRepository in the same package).
@@ -63,6 +375,7 @@ class IncidentRepository(BaseRepository):
         services = [await service_repo.get_by_id(sid) for sid in service_ids]
 
         incident = Incident(
+            id=incident_id or uuid.uuid4(),
             title=title,
             severity=severity,
             body=body,
@@ -70,7 +383,7 @@ class IncidentRepository(BaseRepository):
         )
         incident.services = services
         self.session.add(incident)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(incident)
         return incident
 
@@ -93,7 +406,7 @@ class IncidentRepository(BaseRepository):
         if status is not None:
             incident.status = status
 
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(incident)
         return incident
 
@@ -101,6 +414,6 @@ class IncidentRepository(BaseRepository):
         incident = await self.get_by_id(incident_id)
         incident.status = IncidentStatus.resolved
         incident.resolved_at = datetime.now(UTC)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(incident)
         return incident
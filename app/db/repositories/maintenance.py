@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select
+
+from app.core.exceptions import NotFoundError
+from app.db.repositories.base import BaseRepository, as_utc
+from app.db.repositories.cache_versions import CacheVersionRepository
+from app.models.orm.maintenance import MaintenanceWindow, maintenance_window_services
+from app.models.orm.service import Service
+
+# The cache_versions row of the maintenance schedule.
+CACHE_NAME = "maintenance_schedule"
+
+
+class MaintenanceRepository(BaseRepository):
+    async def get_version(self) -> uuid.UUID | None:
+        # Changes whenever a window is created or cancelled; one primary key
+        # lookup, so cheap enough to check on every use of the cached schedule.
+        return await CacheVersionRepository(self.session).get(CACHE_NAME)
+
+    async def get_intervals(self) -> list[tuple[uuid.UUID, datetime, datetime]]:
+        link = maintenance_window_services.c
+        result = await self.session.execute(
+            select(
+                link.service_id, MaintenanceWindow.starts_at, MaintenanceWindow.ends_at
+            ).join(MaintenanceWindow, MaintenanceWindow.id == link.window_id)
+        )
+        return [
+            (service_id, as_utc(starts_at), as_utc(ends_at))
+            for service_id, starts_at, ends_at in result
+        ]
+
+    async def get_by_id(self, window_id: uuid.UUID) -> MaintenanceWindow:
+        window = await self.session.get(MaintenanceWindow, window_id)
+        if window is None:
+            raise NotFoundError(
+                f"Maintenance window with id '{window_id}' does not exist."
+            )
+        return window
+
+    async def get_all(
+        self,
+        service_id: uuid.UUID | None = None,
+        ends_after: datetime | None = None,
+    ) -> list[MaintenanceWindow]:
+        query = select(MaintenanceWindow).order_by(
+            MaintenanceWindow.starts_at, MaintenanceWindow.id
+        )
+        if service_id is not None:
+            link = maintenance_window_services.c
+            query = query.where(
+                MaintenanceWindow.id.in_(
+                    select(link.window_id).where(link.service_id == service_id)
+                )
+            )
+        if ends_after is not None:
+            query = query.where(MaintenanceWindow.ends_at > ends_after)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_service_ids(
+        self, window_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, list[uuid.UUID]]:
+        link = maintenance_window_services.c
+        result = await self.session.execute(
+            select(link.window_id, link.service_id)
+            .where(link.window_id.in_(window_ids))
+            .order_by(link.window_id, link.service_id)
+        )
+        service_ids: dict[uuid.UUID, list[uuid.UUID]] = {}
+        for window_id, service_id in result:
+            service_ids.setdefault(window_id, []).append(service_id)
+        return service_ids
+
+    async def create(
+        self,
+        title: str,
+        starts_at: datetime,
+        ends_at: datetime,
+        service_ids: Sequence[uuid.UUID],
+        description: str | None = None,
+    ) -> MaintenanceWindow:
+        # Left uncommitted, like the caller's follow-up writes, so the window
+        # and everything it invalidates commit together.
+        found = set(
+            (
+                await self.session.execute(
+                    select(Service.id).where(Service.id.in_(service_ids))
+                )
+            )
+            .scalars()
+            .all()
+        )
+        for service_id in service_ids:
+            if service_id not in found:
+                raise NotFoundError(f"Service with id '{service_id}' does not exist.")
+        window = MaintenanceWindow(
+            title=title,
+            description=description,
+            starts_at=as_utc(starts_at),
+            ends_at=as_utc(ends_at),
+        )
+        self.session.add(window)
+        await self.session.flush()
+        await self.session.execute(
+            insert(maintenance_window_services),
+            [{"window_id": window.id, "service_id": s} for s in service_ids],
+        )
+        await CacheVersionRepository(self.session).bump(CACHE_NAME)
+        return window
+
+    async def delete(self, window: MaintenanceWindow) -> None:
+        # Links go explicitly: SQLite does not enforce ON DELETE CASCADE. Left
+        # uncommitted, as with create().
+        link = maintenance_window_services.c
+        await self.session.execute(
+            delete(maintenance_window_services).where(link.window_id == window.id)
+        )
+        await self.session.delete(window)
+        await CacheVersionRepository(self.session).bump(CACHE_NAME)
+        await self.session.flush()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import re
+from datetime import UTC, date, datetime
+
+from sqlalchemy import text
+
+from app.db.repositories.base import BaseRepository
+
+# Monthly range partitions of incident_updates on PostgreSQL, created by the
+# opt-in a7d4e2f9c315 migration. Each covers one UTC month and is named
+# incident_updates_pYYYYMM; rows outside every partition land in
+# incident_updates_default. Partition DDL cannot take bound parameters, so
+# names and bounds are rendered from dates only, never from user input.
+PARENT = "incident_updates"
+DEFAULT_PARTITION = "incident_updates_default"
+_PARTITION_NAME = re.compile(r"^incident_updates_p(\d{4})(\d{2})$")
+
+# Serialises partition DDL across processes, e.g. two maintenance runs.
+_LOCK = text("SELECT pg_advisory_xact_lock(hashtext('incident_updates_partitions'))")
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month:%Y%m}"
+
+
+def _bound(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=UTC).isoformat()
+
+
+class PartitionRepository(BaseRepository):
+    async def is_partitioned(self) -> bool:
+        if self.dialect_name != "postgresql":
+            return False
+        result = await self.session.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:parent))"
+            ).bindparams(parent=PARENT)
+        )
+        return bool(result)
+
+    async def get_months(self) -> list[date]:
+        result = await self.session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(:parent)"
+            ).bindparams(parent=PARENT)
+        )
+        months = []
+        for (name,) in result.all():
+            if match := _PARTITION_NAME.match(name):
+                months.append(date(int(match[1]), int(match[2]), 1))
+        return sorted(months)
+
+    async def create(self, month: date) -> bool:
+        # Builds the partition as a standalone table and attaches it, rather than
+        # CREATE TABLE ... PARTITION OF: ATTACH only takes a SHARE UPDATE
+        # EXCLUSIVE lock on the parent, so reads and appends carry on meanwhile.
+        # Any rows of that month already in the default partition are moved
+        # first, as ATTACH refuses ranges the default partition still holds.
+        name = partition_name(month)
+        await self.session.execute(_LOCK)
+        if month in await self.get_months():
+            await self.session.rollback()
+            return False
+        lower, upper = (
+            _bound(month),
+            _bound(date(month.year + month.month // 12, month.month % 12 + 1, 1)),
+        )
+        await self.session.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {PARENT} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        await self.session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                f"WHERE created_at >= '{lower}' AND created_at < '{upper}' "
+                f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+            )
+        )
+        await self.session.execute(
+            text(
+                f"ALTER TABLE {PARENT} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        )
+        await self.session.commit()
+        return True
+
+    async def has_rows(self, month: date) -> bool:
+        result = await self.session.scalar(
+            text(f"SELECT EXISTS (SELECT 1 FROM {partition_name(month)})")
+        )
+        return bool(result)
+
+    async def drop(self, month: date) -> None:
+        # DETACH then DROP: the whole month's rows, dead tuples and index
+        # entries go at once, with no per-row delete and nothing left to vacuum.
+        name = partition_name(month)
+        await self.session.execute(_LOCK)
+        await self.session.execute(
+            text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}")
+        )
+        await self.session.execute(text(f"DROP TABLE {name}"))
+        await self.session.commit()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import delete, exists, select
+
+from app.db.repositories.base import BaseRepository
+from app.models.enums import IncidentSeverity, IncidentStatus, ServiceStatus
+from app.models.orm.associations import service_incidents
+from app.models.orm.incident import Incident
+from app.models.orm.service import Service
+from app.models.orm.service_status_change import ServiceStatusChange
+
+
+class ServiceStatusRepository(BaseRepository):
+    async def service_exists(self, service_id: uuid.UUID) -> bool:
+        # An EXISTS probe rather than session.get(), which would also load every
+        # linked incident through the selectin relationship.
+        result = await self.session.scalar(
+            select(exists().where(Service.id == service_id))
+        )
+        return bool(result)
+
+    async def get_active_severities(
+        self, service_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, list[IncidentSeverity]]:
+        link = service_incidents.c
+        result = await self.session.execute(
+            select(link.service_id, Incident.severity)
+            .join(service_incidents, link.incident_id == Incident.id)
+            .where(
+                link.service_id.in_(service_ids),
+                Incident.status != IncidentStatus.resolved,
+            )
+        )
+        severities: dict[uuid.UUID, list[IncidentSeverity]] = {
+            sid: [] for sid in service_ids
+        }
+        for service_id, severity in result.all():
+            severities[service_id].append(severity)
+        return severities
+
+    async def get_at(
+        self, service_id: uuid.UUID, at: datetime
+    ) -> ServiceStatusChange | None:
+        # The latest change at or before `at`: one backward seek on the
+        # (service_id, changed_at, id) index, however long the history is.
+        return await self.session.scalar(
+            select(ServiceStatusChange)
+            .where(
+                ServiceStatusChange.service_id == service_id,
+                ServiceStatusChange.changed_at <= at,
+            )
+            .order_by(
+                ServiceStatusChange.changed_at.desc(), ServiceStatusChange.id.desc()
+            )
+            .limit(1)
+        )
+
+    async def get_latest(
+        self, service_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, ServiceStatus]:
+        # One seek per service; writes touch a handful of services at most.
+        latest = {}
+        for service_id in service_ids:
+            change = await self.session.scalar(
+                select(ServiceStatusChange)
+                .where(ServiceStatusChange.service_id == service_id)
+                .order_by(
+                    ServiceStatusChange.changed_at.desc(),
+                    ServiceStatusChange.id.desc(),
+                )
+                .limit(1)
+            )
+            if change is not None:
+                latest[service_id] = change.status
+        return latest
+
+    async def get_history(
+        self,
+        service_id: uuid.UUID,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 100,
+    ) -> list[ServiceStatusChange]:
+        query = select(ServiceStatusChange).where(
+            ServiceStatusChange.service_id == service_id
+        )
+        if start is not None:
+            query = query.where(ServiceStatusChange.changed_at >= start)
+        if end is not None:
+            query = query.where(ServiceStatusChange.changed_at <= end)
+        result = await self.session.execute(
+            query.order_by(
+                ServiceStatusChange.changed_at, ServiceStatusChange.id
+            ).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def add(self, changes: Sequence[ServiceStatusChange]) -> None:
+        # Runs in the caller's transaction, with the write that moved the status.
+        self.session.add_all(changes)
+
+    async def replace_all(self, changes: Sequence[ServiceStatusChange]) -> None:
+        # Swaps the whole log in one transaction, so readers never observe a
+        # partially rebuilt history.
+        await self.session.execute(delete(ServiceStatusChange))
+        self.session.add_all(changes)
+        await self.session.commit()
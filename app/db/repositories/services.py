@@ -1,25 +1,83 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Sequence
+from typing import Any, NamedTuple
 
-from sqlalchemy import select
+from sqlalchemy import Row, bindparam, delete, inspect, or_, select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.util import identity_key
 
 from app.core.exceptions import ConflictError, NotFoundError
+from app.db.repositories import dependencies, maintenance
 from app.db.repositories.base import BaseRepository
+from app.db.repositories.cache_versions import CacheVersionRepository
+from app.db.repositories.groups import GroupRepository
+from app.db.repositories.incidents import ACTIVE_STATUSES
+from app.models.enums import IncidentSeverity
+from app.models.orm.associations import service_dependencies, service_incidents
+from app.models.orm.incident import Incident
+from app.models.orm.maintenance import maintenance_window_services
 from app.models.orm.service import Service
 
+# Built once and reused with a bound ID; see IncidentRepository.get_by_id.
+_GET_BY_ID = select(Service).where(Service.id == bindparam("service_id"))
+
+_ALL_ROWS = select(Service.__table__)
+_ACTIVE_SEVERITIES = (
+    select(service_incidents.c.service_id, Incident.severity)
+    .join(service_incidents, service_incidents.c.incident_id == Incident.id)
+    .where(Incident.status.in_(ACTIVE_STATUSES))
+)
+
+
+class ServiceRows(NamedTuple):
+    services: Sequence[Row[Any]]
+    # Keyed by service ID; services without active incidents are left out.
+    active_severities: dict[uuid.UUID, list[IncidentSeverity]]
+
 
 class ServiceRepository(BaseRepository):
     async def get_by_id(self, service_id: uuid.UUID) -> Service:
-        result = await self.session.get(Service, service_id)
+        # As with session.get(), a service already loaded in this session is
+        # returned without a query unless it has been expired; otherwise the
+        # prebuilt statement loads it, where session.get() would build its own.
+        result: Service | None = self.session.identity_map.get(
+            identity_key(Service, service_id)
+        )
+        if result is None or inspect(result).expired_attributes:
+            result = await self.session.scalar(_GET_BY_ID, {"service_id": service_id})
         if result is None:
             raise NotFoundError(f"Service with id '{service_id}' does not exist.")
         return result
 
-    async def get_all(self) -> list[Service]:
-        result = await self.session.execute(select(Service))
-        return list(result.scalars().all())
+    async def get_many(
+        self, service_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, Service]:
+        result = await self.session.execute(
+            select(Service)
+            .where(Service.id.in_(service_ids))
+            .execution_options(populate_existing=True)
+        )
+        return {s.id: s for s in result.scalars().all()}
+
+    async def get_ids_by_name(self, names: Sequence[str]) -> dict[str, uuid.UUID]:
+        # Names are unique, so this is a single lookup on their index.
+        result = await self.session.execute(
+            select(Service.name, Service.id).where(Service.name.in_(names))
+        )
+        return {name: service_id for name, service_id in result}
+
+    async def get_all_rows(self) -> ServiceRows:
+        # Every service as plain rows, with just what a service's status is
+        # derived from. Service.incidents would load every incident each
+        # service ever had, with their updates and services in turn; only the
+        # severities of active ones matter.
+        services = (await self.session.execute(_ALL_ROWS)).all()
+        severities: dict[uuid.UUID, list[IncidentSeverity]] = {}
+        for service_id, severity in await self.session.execute(_ACTIVE_SEVERITIES):
+            severities.setdefault(service_id, []).append(severity)
+        return ServiceRows(services, severities)
 
     async def create(self, name: str, description: str | None = None) -> Service:
         # Strip leading/trailing whitespace so "  Payments  " and "Payments" resolve
@@ -62,5 +120,29 @@ class ServiceRepository(BaseRepository):
             raise ConflictError(
                 f"Service '{service.name}' has active incidents and cannot be deleted."
             )
+        # Group membership, maintenance windows and dependency edges in both
+        # directions go explicitly: SQLite does not enforce their ON DELETE
+        # CASCADE. Leaving the group also takes the service out of its
+        # counters, in this transaction. Both cached graphs it leaves are
+        # reloaded.
+        await GroupRepository(self.session).remove_member(
+            service_id, service.effective_status
+        )
+        link = service_dependencies.c
+        await self.session.execute(
+            delete(service_dependencies).where(
+                or_(link.service_id == service_id, link.depends_on_id == service_id)
+            )
+        )
+        await self.session.execute(
+            delete(maintenance_window_services).where(
+                maintenance_window_services.c.service_id == service_id
+            )
+        )
+        versions = CacheVersionRepository(self.session)
+        await versions.bump(dependencies.CACHE_NAME)
+        await versions.bump(maintenance.CACHE_NAME)
+        # Flushed, not committed: the caller recomputes the effective status of
+        # the service's dependents in the same transaction.
         await self.session.delete(service)
-        await self.session.commit()
+        await self.session.flush()
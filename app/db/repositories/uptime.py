@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import date, datetime
+from typing import NamedTuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.repositories.base import BaseRepository, as_utc
+from app.db.repositories.incidents import active_during_filter
+from app.models.enums import IncidentSeverity
+from app.models.orm.associations import service_incidents
+from app.models.orm.availability import service_daily_availability
+from app.models.orm.incident import Incident
+from app.models.orm.service import Service
+
+
+class ImpactRow(NamedTuple):
+    service_id: uuid.UUID
+    severity: IncidentSeverity
+    created_at: datetime
+    resolved_at: datetime | None
+    incident_id: uuid.UUID | None = None
+
+
+class DailyAvailabilityRow(NamedTuple):
+    service_id: uuid.UUID
+    day: date
+    outage_seconds: float
+    degraded_seconds: float
+
+
+# Every method takes an optional list of service IDs; None means all services,
+# which is how the bulk report fetches everything in one query per table.
+class UptimeRepository(BaseRepository):
+    async def get_service_starts(
+        self, service_ids: Sequence[uuid.UUID] | None = None
+    ) -> dict[uuid.UUID, datetime]:
+        # Only the columns the engine needs; loading Service entities would pull
+        # in every linked incident through the selectin relationship.
+        query = select(Service.id, Service.created_at)
+        if service_ids is not None:
+            query = query.where(Service.id.in_(service_ids))
+        result = await self.session.execute(query)
+        return {row.id: as_utc(row.created_at) for row in result.all()}
+
+    async def get_impact_rows(
+        self,
+        service_ids: Sequence[uuid.UUID] | None,
+        since: datetime,
+        until: datetime,
+    ) -> list[ImpactRow]:
+        # One row per (service, incident) pair for incidents open at any point in
+        # [since, until], found through the active_during range index.
+        link = service_incidents.c
+        query = (
+            select(
+                link.service_id,
+                Incident.severity,
+                Incident.created_at,
+                Incident.resolved_at,
+                Incident.id,
+            )
+            .join(service_incidents, link.incident_id == Incident.id)
+            .where(active_during_filter(self.dialect_name, since, until))
+        )
+        if service_ids is not None:
+            query = query.where(link.service_id.in_(service_ids))
+        result = await self.session.execute(query)
+        return [
+            ImpactRow(
+                service_id=row.service_id,
+                severity=row.severity,
+                created_at=as_utc(row.created_at),
+                resolved_at=as_utc(row.resolved_at) if row.resolved_at else None,
+                incident_id=row.id,
+            )
+            for row in result.all()
+        ]
+
+    async def get_daily(
+        self,
+        service_ids: Sequence[uuid.UUID] | None,
+        start: date,
+        end: date,
+    ) -> list[DailyAvailabilityRow]:
+        table = service_daily_availability.c
+        query = select(
+            table.service_id, table.day, table.outage_seconds, table.degraded_seconds
+        ).where(table.day >= start, table.day <= end)
+        if service_ids is not None:
+            query = query.where(table.service_id.in_(service_ids))
+        result = await self.session.execute(query)
+        return [DailyAvailabilityRow(*row) for row in result.all()]
+
+    async def save_daily(self, rows: Sequence[DailyAvailabilityRow]) -> None:
+        # Concurrent reports may compute the same closed day; both arrive at the
+        # same figures, so whichever insert lands first is kept.
+        dialect = postgresql if self.dialect_name == "postgresql" else sqlite
+        await self.session.execute(
+            dialect.insert(service_daily_availability).on_conflict_do_nothing(),
+            [row._asdict() for row in rows],
+        )
+        await self.session.commit()
+
+    async def delete_daily(
+        self, service_ids: Sequence[uuid.UUID], start: date, end: date
+    ) -> None:
+        # Stored days are final for incidents, but a maintenance window created
+        # or cancelled over them changes their figures; deleted rows are
+        # recomputed by the next report that covers them. Runs in the caller's
+        # transaction.
+        table = service_daily_availability.c
+        await self.session.execute(
+            delete(service_daily_availability).where(
+                table.service_id.in_(service_ids), table.day >= start, table.day <= end
+            )
+        )
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy import delete, func, insert, select, update
+
+from app.core.exceptions import NotFoundError
+from app.db.repositories.base import BaseRepository
+from app.models.orm.webhook import (
+    WebhookDeadLetter,
+    WebhookDelivery,
+    WebhookSubscription,
+)
+
+
+class Retry(NamedTuple):
+    delivery_id: int
+    attempts: int
+    next_attempt_at: datetime
+    error: str
+
+
+class WebhookRepository(BaseRepository):
+    async def get_by_id(self, subscription_id: uuid.UUID) -> WebhookSubscription:
+        subscription = await self.session.get(WebhookSubscription, subscription_id)
+        if subscription is None:
+            raise NotFoundError(
+                f"Webhook subscription with id '{subscription_id}' does not exist."
+            )
+        return subscription
+
+    async def get_all(self) -> list[WebhookSubscription]:
+        result = await self.session.execute(
+            select(WebhookSubscription).order_by(WebhookSubscription.created_at)
+        )
+        return list(result.scalars().all())
+
+    async def get_many(
+        self, subscription_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, WebhookSubscription]:
+        result = await self.session.execute(
+            select(WebhookSubscription).where(
+                WebhookSubscription.id.in_(subscription_ids)
+            )
+        )
+        return {s.id: s for s in result.scalars().all()}
+
+    async def get_subscribed(self, event_type: str) -> list[uuid.UUID]:
+        # Subscriptions are few, so they are filtered in Python rather than
+        # with a dialect-specific JSON containment query.
+        result = await self.session.execute(
+            select(WebhookSubscription.id, WebhookSubscription.events)
+        )
+        return [
+            subscription_id
+            for subscription_id, events in result.all()
+            if event_type in events
+        ]
+
+    async def create(
+        self,
+        url: str,
+        events: Sequence[str],
+        max_concurrency: int,
+        secret: str | None = None,
+    ) -> WebhookSubscription:
+        subscription = WebhookSubscription(
+            url=url,
+            events=list(events),
+            max_concurrency=max_concurrency,
+            secret=secret,
+        )
+        self.session.add(subscription)
+        await self.session.commit()
+        await self.session.refresh(subscription)
+        return subscription
+
+    async def delete(self, subscription: WebhookSubscription) -> None:
+        # Pending deliveries and dead letters go with the subscription. Explicit,
+        # as SQLite does not enforce ON DELETE CASCADE.
+        for model in (WebhookDelivery, WebhookDeadLetter):
+            await self.session.execute(
+                delete(model).where(model.subscription_id == subscription.id)
+            )
+        await self.session.delete(subscription)
+        await self.session.commit()
+
+    async def enqueue(self, deliveries: Sequence[WebhookDelivery]) -> None:
+        # Runs in the caller's transaction, so deliveries commit with the change
+        # they announce, or not at all.
+        self.session.add_all(deliveries)
+
+    async def claim_due(
+        self, now: datetime, limit: int, lease_until: datetime
+    ) -> list[WebhookDelivery]:
+        # The oldest due deliveries, leased by moving next_attempt_at to
+        # lease_until: if the worker dies mid-send they become due again then.
+        # On PostgreSQL, SKIP LOCKED lets several workers claim disjoint rows
+        # concurrently; SQLite ignores it, and runs a single worker.
+        result = await self.session.execute(
+            select(WebhookDelivery)
+            .where(WebhookDelivery.next_attempt_at <= now)
+            .order_by(WebhookDelivery.next_attempt_at, WebhookDelivery.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .execution_options(populate_existing=True)
+        )
+        deliveries = list(result.scalars().all())
+        if deliveries:
+            await self.session.execute(
+                update(WebhookDelivery)
+                .where(WebhookDelivery.id.in_([d.id for d in deliveries]))
+                .values(next_attempt_at=lease_until)
+            )
+        await self.session.commit()
+        return deliveries
+
+    async def record_outcomes(
+        self,
+        delivered: Sequence[int],
+        retries: Sequence[Retry],
+        failed: Sequence[tuple[WebhookDelivery, str]],
+        failed_at: datetime,
+    ) -> None:
+        # Applies one worker pass's results in a single transaction: delivered
+        # rows are removed, retries rescheduled with one executemany, and
+        # deliveries out of attempts moved to the dead-letter table.
+        if retries:
+            await self.session.execute(
+                update(WebhookDelivery),
+                [
+                    {
+                        "id": retry.delivery_id,
+                        "attempts": retry.attempts,
+                        "next_attempt_at": retry.next_attempt_at,
+                        "last_error": retry.error,
+                    }
+                    for retry in retries
+                ],
+            )
+        if failed:
+            await self.session.execute(
+                insert(WebhookDeadLetter),
+                [
+                    {
+                        "subscription_id": delivery.subscription_id,
+                        "event_id": delivery.event_id,
+                        "event_type": delivery.event_type,
+                        "payload": delivery.payload,
+                        "created_at": delivery.created_at,
+                        "attempts": delivery.attempts + 1,
+                        "last_error": error,
+                        "failed_at": failed_at,
+                    }
+                    for delivery, error in failed
+                ],
+            )
+        removed = [*delivered, *(delivery.id for delivery, _ in failed)]
+        if removed:
+            await self.session.execute(
+                delete(WebhookDelivery).where(WebhookDelivery.id.in_(removed))
+            )
+        await self.session.commit()
+
+    async def get_dead_letters(
+        self, subscription_id: uuid.UUID, limit: int = 100
+    ) -> list[WebhookDeadLetter]:
+        result = await self.session.execute(
+            select(WebhookDeadLetter)
+            .where(WebhookDeadLetter.subscription_id == subscription_id)
+            .order_by(WebhookDeadLetter.failed_at.desc(), WebhookDeadLetter.id.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_pending_counts(
+        self, subscription_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, int]:
+        result = await self.session.execute(
+            select(WebhookDelivery.subscription_id, func.count())
+            .where(WebhookDelivery.subscription_id.in_(subscription_ids))
+            .group_by(WebhookDelivery.subscription_id)
+        )
+        return {subscription_id: count for subscription_id, count in result.all()}
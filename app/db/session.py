@@ -1,5 +1,9 @@
+import time
+import uuid
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import make_url
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -7,13 +11,36 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from app.core.config import settings
+from app.core.admission import pressure
+from app.core.config import Settings, settings
 from app.core.exceptions import ServiceUnavailableError
 
+
+def connect_args(settings: Settings) -> dict[str, Any]:
+    if make_url(settings.database_url).get_driver_name() != "asyncpg":
+        return {}
+    if settings.db_pgbouncer_transaction_mode:
+        # PgBouncer may hand the next statement to a server connection that
+        # never saw the PREPARE; with neither cache, asyncpg prepares every
+        # statement afresh, under a name no other client can collide with.
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    # SQLAlchemy prepares statements itself, holding them in its own per
+    # connection cache; asyncpg's cache serves any it runs directly.
+    return {
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    }
+
+
 engine = create_async_engine(
     settings.database_url,
     # Log all SQL statements in development to aid debugging.
     echo=settings.app_env == "development",
+    connect_args=connect_args(settings),
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -28,6 +55,12 @@ AsyncSessionLocal = async_sessionmaker(
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     try:
         async with AsyncSessionLocal() as session:
+            # Check out the connection up front, rather than at the first query,
+            # to time the wait for the pool; admission control sheds reads
+            # while it is long.
+            start = time.perf_counter()
+            await session.connection()
+            pressure.record_checkout_wait(time.perf_counter() - start)
             yield session
     except SQLAlchemyError as e:
         raise ServiceUnavailableError(f"Database connection error: {str(e)}") from e
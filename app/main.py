@@ -1,11 +1,20 @@
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import structlog
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 
 from app.api.router import api_router
+from app.core.admission import (
+    LOOP_LAG_INTERVAL,
+    AdmissionController,
+    AdmissionMiddleware,
+    monitor_loop_lag,
+    pressure,
+)
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
 from app.core.error_handlers import (
     conflict_handler,
@@ -17,7 +26,20 @@ from app.core.error_handlers import (
 from app.core.exceptions import ConflictError, NotFoundError, ServiceUnavailableError
 from app.core.logging import configure_logging
 from app.core.middleware import RequestMiddleware
+from app.core.rate_limit import RateLimiter, RateLimitMiddleware
+from app.core.single_flight import SingleFlight, SingleFlightMiddleware
 from app.db.session import engine
+from app.warmup import build_schemas, warm_up
+
+
+async def run_in_background(app: FastAPI) -> None:
+    # The server only accepts connections once the lifespan has yielded, so
+    # warm-up runs here, with /health/ready reporting it pending meanwhile.
+    await warm_up(engine, settings.warmup_connections)
+    app.state.warmed_up = True
+    # Started after warm-up, whose synchronous steps would read as loop lag
+    # and have the first reads shed.
+    await monitor_loop_lag(pressure, LOOP_LAG_INTERVAL)
 
 
 @asynccontextmanager
@@ -25,8 +47,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     configure_logging()
     logger: structlog.BoundLogger = structlog.get_logger()
     await logger.ainfo("Application starting up", env=settings.app_env)
+    build_schemas(app)
+    background = asyncio.create_task(run_in_background(app))
     yield
     await logger.ainfo("Shutdown signal received, draining requests")
+    background.cancel()
+    with suppress(asyncio.CancelledError):
+        await background
     # Gracefully close all database connections in the pool before the process exits.
     await engine.dispose()
     await logger.ainfo("Database connection pool closed")
@@ -43,7 +70,38 @@ app = FastAPI(
     redoc_url="/redoc" if settings.app_env != "production" else None,
 )
 
+# Readiness fails until the background warm-up has finished.
+app.state.warmed_up = False
+app.state.rate_limiter = (
+    RateLimiter.from_settings(settings) if settings.rate_limit_enabled else None
+)
+app.state.admission = (
+    AdmissionController.from_settings(settings, pressure)
+    if settings.admission_enabled
+    else None
+)
+app.state.single_flight = (
+    SingleFlight(
+        settings.single_flight_ttl_seconds,
+        settings.single_flight_early_refresh_beta,
+        settings.single_flight_max_entries,
+    )
+    if settings.single_flight_enabled
+    else None
+)
+
+# Middleware added first runs innermost. Throttled and shed requests are still
+# logged, counted and given a request ID, throttled ones never take an
+# admission slot, and only the one request computing a coalesced response does.
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(SingleFlightMiddleware)
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(RequestMiddleware)
+# Outermost, so error responses and /metrics are compressed too.
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=settings.compression_minimum_size
+    )
 
 app.add_exception_handler(NotFoundError, not_found_handler)
 app.add_exception_handler(ConflictError, conflict_handler)
@@ -4,13 +4,20 @@ import enum
 # used directly in SQLAlchemy queries and JSON responses without extra conversion.
 
 
-# Derived at read time from active incident severity; never stored in the database.
+# Derived at read time from active incident severity. Changes are also logged to
+# service_status_changes for point-in-time queries, but the live value is never
+# read back from there. Service.effective_status also folds in dependencies.
+# "maintenance" is only ever read: it replaces the derived status while a
+# maintenance window is open, and is never logged or stored.
 class ServiceStatus(enum.StrEnum):
     operational = "operational"
     degraded = "degraded"
     outage = "outage"
+    maintenance = "maintenance"
 
 
+# Members are declared from most to least severe; their position is the
+# severity rank used for sorting (see Incident.severity_rank).
 class IncidentSeverity(enum.StrEnum):
     critical = "critical"
     high = "high"
@@ -27,3 +34,53 @@ class IncidentStatus(enum.StrEnum):
     identified = "identified"
     monitoring = "monitoring"
     resolved = "resolved"
+
+
+# Sort orders accepted by the incident list endpoint.
+class IncidentSort(enum.StrEnum):
+    recent = "recent"
+    oldest = "oldest"
+    severity = "severity"
+
+
+# How a multi-value service filter is applied: incidents affecting any of the
+# given services, or only incidents affecting all of them.
+class ServiceMatch(enum.StrEnum):
+    any = "any"
+    all = "all"
+
+
+# Bucket width for the analytics report. Weeks start on Monday; all buckets
+# are in UTC.
+class TimeBucket(enum.StrEnum):
+    day = "day"
+    week = "week"
+    month = "month"
+
+
+# Events a webhook subscription can ask to be notified of.
+class WebhookEventType(enum.StrEnum):
+    incident_opened = "incident.opened"
+    incident_updated = "incident.updated"
+    incident_resolved = "incident.resolved"
+    service_status_changed = "service.status_changed"
+
+
+# Kinds of record in the change feed, and what happened to them. "archived"
+# incidents stay readable by ID; "deleted" entities are gone.
+class ChangeEntity(enum.StrEnum):
+    service = "service"
+    incident = "incident"
+
+
+class ChangeOperation(enum.StrEnum):
+    created = "created"
+    updated = "updated"
+    deleted = "deleted"
+    archived = "archived"
+
+
+# State of an alert as sent by Alertmanager or Grafana.
+class AlertStatus(enum.StrEnum):
+    firing = "firing"
+    resolved = "resolved"
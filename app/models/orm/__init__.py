@@ -1,7 +1,63 @@
-from app.models.orm.associations import service_incidents
+# search and intervals are imported for their side effect of registering
+# dialect-specific index DDL on Base.metadata, so create_all() builds the indexes
+# alongside the tables.
+from app.models.orm import intervals, search  # noqa: F401
+from app.models.orm.alert import AlertFingerprint
+from app.models.orm.analytics import (
+    incident_daily_rollups,
+    service_incident_daily_rollups,
+)
+from app.models.orm.archive import (
+    ArchivedIncident,
+    ArchivedIncidentUpdate,
+    archived_service_incidents,
+)
+from app.models.orm.associations import service_dependencies, service_incidents
+from app.models.orm.availability import service_daily_availability
 from app.models.orm.base import Base
+from app.models.orm.cache_version import cache_versions
+from app.models.orm.change import Change
+from app.models.orm.idempotency import IdempotencyKey
 from app.models.orm.incident import Incident
 from app.models.orm.incident_update import IncidentUpdate
+from app.models.orm.maintenance import MaintenanceWindow, maintenance_window_services
 from app.models.orm.service import Service
+from app.models.orm.service_group import (
+    ServiceGroup,
+    service_group_closure,
+    service_group_members,
+)
+from app.models.orm.service_status_change import ServiceStatusChange
+from app.models.orm.webhook import (
+    WebhookDeadLetter,
+    WebhookDelivery,
+    WebhookSubscription,
+)
 
-__all__ = ["Base", "Incident", "IncidentUpdate", "Service", "service_incidents"]
+__all__ = [
+    "AlertFingerprint",
+    "ArchivedIncident",
+    "ArchivedIncidentUpdate",
+    "Base",
+    "Change",
+    "IdempotencyKey",
+    "Incident",
+    "IncidentUpdate",
+    "MaintenanceWindow",
+    "Service",
+    "ServiceGroup",
+    "ServiceStatusChange",
+    "WebhookDeadLetter",
+    "WebhookDelivery",
+    "WebhookSubscription",
+    "archived_service_incidents",
+    "cache_versions",
+    "incident_daily_rollups",
+    "maintenance_window_services",
+    "service_daily_availability",
+    "service_dependencies",
+    "service_group_closure",
+    "service_group_members",
+    "service_incident_daily_rollups",
+    "service_incidents",
+]
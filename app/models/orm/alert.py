@@ -0,0 +1,27 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.orm.base import Base
+
+
+# One row per alert fingerprint ever received: the incident it last opened,
+# whether or not that incident is still active. A firing alert whose incident
+# is active is a repeat; otherwise it opens a new incident and the row is
+# pointed at that one.
+class AlertFingerprint(Base):
+    __tablename__ = "alert_fingerprints"
+
+    # The primary key is the fingerprint index: of two processes receiving the
+    # same new alert, only one can insert the row and open its incident.
+    fingerprint: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # Not a foreign key: the incident may since have been archived, and the row
+    # is written, with a fresh ID, just before the incident it names.
+    incident_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
+    # When the incident was opened or last given a timeline update for the
+    # alert; repeats within the debounce window after it add nothing.
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
@@ -0,0 +1,56 @@
+from typing import Any
+
+from sqlalchemy import Column, Date, Enum, Float, ForeignKey, Integer, Table
+
+from app.models.enums import IncidentSeverity, IncidentStatus
+from app.models.orm.base import Base
+
+# Statuses whose dwell time is tracked. "resolved" is terminal, so there is no
+# time spent in it to measure.
+TIMED_STATUSES = [s for s in IncidentStatus if s != IncidentStatus.resolved]
+
+# Additive counters shared by both rollup tables. Every column is a plain sum,
+# so rows can be incremented in place as incidents open and resolve, and any
+# report range is answered by summing rows: MTTR = resolve_seconds / resolved.
+ROLLUP_COUNTERS = [
+    "opened",
+    "resolved",
+    "resolve_seconds",
+    *(f"{status}_seconds" for status in TIMED_STATUSES),
+]
+
+
+def _counter_columns() -> list[Column[Any]]:
+    return [
+        Column(name, Float if name.endswith("_seconds") else Integer, nullable=False)
+        for name in ROLLUP_COUNTERS
+    ]
+
+
+# Daily incident statistics per severity, bucketed by UTC day. "opened" counts
+# against the day an incident was created; everything else against the day it
+# was resolved, since durations are only known once the incident is closed.
+incident_daily_rollups = Table(
+    "incident_daily_rollups",
+    Base.metadata,
+    Column("day", Date, primary_key=True),
+    Column("severity", Enum(IncidentSeverity), primary_key=True),
+    *_counter_columns(),
+)
+
+# The same statistics per affected service. An incident affecting several
+# services counts once towards each of them, so these rows are not summed
+# across services; global figures come from incident_daily_rollups.
+# service_id leads the key because per-service reports scan one service's days.
+service_incident_daily_rollups = Table(
+    "service_incident_daily_rollups",
+    Base.metadata,
+    Column(
+        "service_id",
+        ForeignKey("services.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("day", Date, primary_key=True),
+    Column("severity", Enum(IncidentSeverity), primary_key=True),
+    *_counter_columns(),
+)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.enums import IncidentSeverity, IncidentStatus
+from app.models.orm.base import Base
+from app.models.orm.service import Service
+
+# Cold storage for incidents resolved longer ago than the retention period (see
+# app/services/archive.py). Each table mirrors its live counterpart column for
+# column, so rows are moved with INSERT ... SELECT; the live tables, their
+# indexes and every list query stay sized by active and recent incidents.
+# Archived incidents are read-only and are not in the full-text search index.
+
+archived_service_incidents = Table(
+    "archived_service_incidents",
+    Base.metadata,
+    Column(
+        "service_id",
+        ForeignKey("services.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "incident_id",
+        ForeignKey("archived_incidents.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+)
+
+Index(
+    "ix_archived_service_incidents_incident_id",
+    archived_service_incidents.c.incident_id,
+)
+
+
+class ArchivedIncident(Base):
+    __tablename__ = "archived_incidents"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    body: Mapped[str | None] = mapped_column(Text, nullable=True)
+    severity: Mapped[IncidentSeverity] = mapped_column(
+        Enum(IncidentSeverity),
+        nullable=False,
+    )
+    severity_rank: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    status: Mapped[IncidentStatus] = mapped_column(
+        Enum(IncidentStatus),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    resolved_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    last_update_sequence: Mapped[int] = mapped_column(Integer, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    # viewonly: links are only ever written by the archival INSERT ... SELECT,
+    # and Service.incidents keeps pointing at live incidents only.
+    services: Mapped[list[Service]] = relationship(
+        Service,
+        secondary=archived_service_incidents,
+        lazy="selectin",
+        viewonly=True,
+    )
+    updates: Mapped[list[ArchivedIncidentUpdate]] = relationship(
+        "ArchivedIncidentUpdate",
+        lazy="selectin",
+        order_by="ArchivedIncidentUpdate.sequence",
+        viewonly=True,
+    )
+
+
+Index("ix_archived_incidents_created_at", ArchivedIncident.created_at)
+
+
+class ArchivedIncidentUpdate(Base):
+    __tablename__ = "archived_incident_updates"
+    __table_args__ = (
+        UniqueConstraint(
+            "incident_id",
+            "sequence",
+            name="uq_archived_incident_updates_incident_id_sequence",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    incident_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("archived_incidents.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[IncidentStatus] = mapped_column(
+        Enum(IncidentStatus),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
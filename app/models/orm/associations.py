@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, Table
 
 from app.models.orm.base import Base
 
@@ -19,3 +19,34 @@ service_incidents = Table(
         primary_key=True,
     ),
 )
+
+# The composite primary key leads with service_id, which serves the service →
+# incidents direction. This index covers the reverse lookups (loading an
+# incident's services, and the EXISTS probes of the incident list filters).
+Index("ix_service_incidents_incident_id", service_incidents.c.incident_id)
+
+# Directed service-to-service edges: service_id depends on depends_on_id, so an
+# impaired depends_on_id service impairs service_id's effective status (see
+# app/services/dependencies.py). The graph is kept acyclic by the service layer.
+# created_at doubles as a change marker for the in-process graph cache.
+service_dependencies = Table(
+    "service_dependencies",
+    Base.metadata,
+    Column(
+        "service_id",
+        ForeignKey("services.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "depends_on_id",
+        ForeignKey("services.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    CheckConstraint(
+        "service_id != depends_on_id", name="ck_service_dependencies_not_self"
+    ),
+)
+
+# Reverse direction: the services that depend on a given one.
+Index("ix_service_dependencies_depends_on_id", service_dependencies.c.depends_on_id)
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Date, Float, ForeignKey, Table
+
+from app.models.orm.base import Base
+
+# Outage and degraded seconds per service and closed UTC day, as computed by the
+# uptime engine (app/services/uptime.py). A row is written once, the first time
+# a report covers that day after it has ended, and never updated: a closed day's
+# incident activity cannot change, so only the current day is computed live.
+# Creating or cancelling a maintenance window over closed days deletes their
+# rows, which the next report recomputes.
+service_daily_availability = Table(
+    "service_daily_availability",
+    Base.metadata,
+    Column(
+        "service_id",
+        ForeignKey("services.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("day", Date, primary_key=True),
+    Column("outage_seconds", Float, nullable=False),
+    Column("degraded_seconds", Float, nullable=False),
+)
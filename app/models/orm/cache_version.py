@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, Table, Uuid
+
+from app.models.orm.base import Base
+
+# A version per in-process cache of a whole table: the maintenance schedule and
+# the dependency graph. Every write to the table sets a new random version in
+# the same transaction, so a cache holding the version it was loaded at is
+# current exactly while the row still reads the same, however much history the
+# table holds. Random rather than counted, so no two databases share a version
+# and a cache never outlives a switch of database. A missing row reads as None.
+cache_versions = Table(
+    "cache_versions",
+    Base.metadata,
+    Column("name", String(64), primary_key=True),
+    Column("version", Uuid, nullable=False),
+)
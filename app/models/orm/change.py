@@ -0,0 +1,108 @@
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    Uuid,
+    event,
+    insert,
+    text,
+)
+from sqlalchemy.orm import Mapped, Session, UOWTransaction, mapped_column
+
+from app.models.enums import ChangeEntity, ChangeOperation
+from app.models.orm.base import Base
+from app.models.orm.incident import Incident
+from app.models.orm.incident_update import IncidentUpdate
+from app.models.orm.service import Service, utc_now
+
+
+# The change feed (transactional outbox): one row each time a service or an
+# incident is created, edited, deleted or archived, written in the same
+# transaction as the change itself, so a committed change always has its row
+# and a rolled-back one never does. Consumers read it in seq order through
+# GET /api/v1/changes and re-fetch the entities named; rows carry no payload.
+class Change(Base):
+    __tablename__ = "changes"
+    __table_args__ = (
+        # Serves compaction's "is there a later row for this entity" probe.
+        Index(
+            "ix_changes_entity_type_entity_id_seq", "entity_type", "entity_id", "seq"
+        ),
+        # Without AUTOINCREMENT SQLite reuses the highest rowid once its row is
+        # deleted, and a consumer past it would never see the new row.
+        {"sqlite_autoincrement": True},
+    )
+
+    # The primary key is the index consumers read: "after seq N" is a range
+    # scan starting at N, and an empty one when nothing has changed.
+    seq: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    entity_type: Mapped[ChangeEntity] = mapped_column(
+        Enum(ChangeEntity), nullable=False
+    )
+    entity_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
+    operation: Mapped[ChangeOperation] = mapped_column(
+        Enum(ChangeOperation), nullable=False
+    )
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        nullable=False,
+    )
+
+
+# On PostgreSQL, transactions that write change rows are serialised from the
+# first row to commit, so seq order is commit order: a consumer that has read
+# up to N can never later find a smaller seq committed behind it. SQLite
+# already serialises writers.
+CHANGE_LOCK = text("SELECT pg_advisory_xact_lock(hashtext('changes'))")
+
+_ENTITIES: dict[type[Any], ChangeEntity] = {
+    Service: ChangeEntity.service,
+    Incident: ChangeEntity.incident,
+}
+
+
+@event.listens_for(Session, "after_flush")
+def record_changes(session: Session, flush_context: UOWTransaction) -> None:
+    # Every ORM write to a service or incident passes through a flush, so the
+    # feed is kept here rather than at each call site. Only column changes
+    # count: a service whose incident list grew has not itself been edited.
+    # Bulk UPDATE/DELETE statements bypass the flush and record their own rows
+    # (ChangeRepository.record).
+    changes: dict[tuple[ChangeEntity, uuid.UUID], ChangeOperation] = {}
+    for obj in session.new:
+        if isinstance(obj, IncidentUpdate):
+            changes.setdefault(
+                (ChangeEntity.incident, obj.incident_id), ChangeOperation.updated
+            )
+        elif (entity := _ENTITIES.get(type(obj))) is not None:
+            changes[(entity, obj.id)] = ChangeOperation.created
+    for obj in session.dirty:
+        entity = _ENTITIES.get(type(obj))
+        if entity is not None and session.is_modified(obj, include_collections=False):
+            changes.setdefault((entity, obj.id), ChangeOperation.updated)
+    for obj in session.deleted:
+        if (entity := _ENTITIES.get(type(obj))) is not None:
+            changes[(entity, obj.id)] = ChangeOperation.deleted
+    if not changes:
+        return
+    connection = session.connection()
+    if connection.dialect.name == "postgresql":
+        connection.execute(CHANGE_LOCK)
+    connection.execute(
+        insert(Change),
+        [
+            {"entity_type": entity, "entity_id": entity_id, "operation": operation}
+            for (entity, entity_id), operation in changes.items()
+        ],
+    )
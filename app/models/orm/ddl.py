@@ -0,0 +1,26 @@
+from typing import Any
+
+from sqlalchemy import Connection, MetaData, event
+
+from app.models.orm.base import Base
+
+
+def register_dialect_ddl(
+    dialect: str,
+    create: list[str],
+    drop: list[str],
+) -> None:
+    # Runs raw DDL alongside Base.metadata.create_all()/drop_all() for one
+    # dialect, for schema objects the ORM cannot describe portably (virtual
+    # tables, triggers, expression indexes). Deployed databases get the same
+    # objects from the corresponding Alembic migration.
+    def run(statements: list[str]) -> Any:
+        def listener(target: MetaData, connection: Connection, **kw: Any) -> None:
+            if connection.dialect.name == dialect:
+                for statement in statements:
+                    connection.exec_driver_sql(statement)
+
+        return listener
+
+    event.listen(Base.metadata, "after_create", run(create))
+    event.listen(Base.metadata, "before_drop", run(drop))
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.orm.base import Base
+from app.models.orm.service import utc_now
+
+
+# One row per Idempotency-Key sent with a write. The row is claimed, with no
+# response, before the write runs; the response is stored once it succeeds and
+# replayed to repeats of the request until the key expires. Claims whose
+# request failed are deleted, so the client's retry runs afresh.
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        # Serves expiry, which deletes the oldest keys first.
+        Index("ix_idempotency_keys_created_at", "created_at"),
+    )
+
+    # The primary key is the unique index: of two concurrent requests with the
+    # same key, only one can insert its claim.
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # SHA-256 of the endpoint and request body, so a key reused for a
+    # different request is rejected rather than answered with another's
+    # response.
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    response: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        nullable=False,
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -9,8 +9,8 @@ if TYPE_CHECKING:
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Enum, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import DateTime, Enum, Index, Integer, SmallInteger, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.models.enums import IncidentSeverity, IncidentStatus
 from app.models.orm.base import Base
@@ -23,6 +23,12 @@ def utc_now() -> datetime:
     return datetime.now(UTC)
 
 
+# Sort key for severity: 0 = critical … 3 = low.
+SEVERITY_RANK: dict[IncidentSeverity, int] = {
+    severity: rank for rank, severity in enumerate(IncidentSeverity)
+}
+
+
 class Incident(Base):
     __tablename__ = "incidents"
 
@@ -36,6 +42,10 @@ class Incident(Base):
         Enum(IncidentSeverity),
         nullable=False,
     )
+    # Denormalised from severity so "most severe first" ordering can be served by
+    # an index instead of a CASE expression evaluated per row. Kept in step with
+    # severity by _set_severity_rank below.
+    severity_rank: Mapped[int] = mapped_column(SmallInteger, nullable=False)
     status: Mapped[IncidentStatus] = mapped_column(
         Enum(IncidentStatus),
         nullable=False,
@@ -58,9 +68,17 @@ class Incident(Base):
         DateTime(timezone=True),
         nullable=True,
     )
+    # Highest IncidentUpdate.sequence handed out for this incident. Incremented
+    # atomically in the database whenever an update is appended.
+    last_update_sequence: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
 
     # selectin loading for both relationships avoids N+1 queries when fetching
-    # incidents. Updates are ordered ascending so the timeline reads chronologically.
+    # incidents. Updates are ordered by sequence so the timeline reads chronologically.
     services: Mapped[list[Service]] = relationship(  # noqa: F821
         "Service",
         secondary="service_incidents",
@@ -71,5 +89,25 @@ class Incident(Base):
         "IncidentUpdate",
         back_populates="incident",
         lazy="selectin",
-        order_by="IncidentUpdate.created_at",
+        order_by="IncidentUpdate.sequence",
     )
+
+    @validates("severity")
+    def _set_severity_rank(
+        self, key: str, severity: IncidentSeverity
+    ) -> IncidentSeverity:
+        self.severity_rank = SEVERITY_RANK[IncidentSeverity(severity)]
+        return severity
+
+
+# Each index backs one of the documented list filters/sort orders; see the
+# "Incident list filters" table in the README.
+Index("ix_incidents_created_at", Incident.created_at)
+Index("ix_incidents_status_created_at", Incident.status, Incident.created_at)
+Index("ix_incidents_severity_created_at", Incident.severity, Incident.created_at)
+Index(
+    "ix_incidents_severity_rank_created_at",
+    Incident.severity_rank,
+    Incident.created_at.desc(),
+)
+Index("ix_incidents_resolved_at", Incident.resolved_at)
@@ -8,7 +8,15 @@ if TYPE_CHECKING:
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Text
+from sqlalchemy import (
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.enums import IncidentStatus
@@ -25,6 +33,21 @@ def utc_now() -> datetime:
 # This preserves an accurate audit trail of the incident response timeline.
 class IncidentUpdate(Base):
     __tablename__ = "incident_updates"
+    __table_args__ = (
+        # The per-incident sequence is the pagination cursor for the timeline
+        # endpoint; the unique constraint doubles as its index.
+        UniqueConstraint(
+            "incident_id",
+            "sequence",
+            name="uq_incident_updates_incident_id_sequence",
+        ),
+        Index(
+            "ix_incident_updates_incident_id_created_at_id",
+            "incident_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
@@ -35,6 +58,10 @@ class IncidentUpdate(Base):
         ForeignKey("incidents.id", ondelete="CASCADE"),
         nullable=False,
     )
+    # Monotonic position within the incident's timeline, starting at 1. Assigned
+    # from Incident.last_update_sequence so ordering stays stable even when two
+    # updates share a created_at timestamp.
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False)
     status: Mapped[IncidentStatus] = mapped_column(
         Enum(IncidentStatus),
@@ -0,0 +1,69 @@
+from app.models.orm.ddl import register_dialect_ddl
+
+# Range index for "which incidents were active during [start, end]" queries. An
+# incident is active from created_at until resolved_at, or indefinitely while it
+# is still open. A B-tree on either column alone can only bound one side of the
+# overlap test, so each dialect gets a structure that indexes the interval.
+
+# PostgreSQL: a GiST expression index over the incident's tstzrange. Queries must
+# repeat the expression verbatim for the planner to match it to the index.
+ACTIVE_RANGE_EXPRESSION = (
+    "tstzrange(created_at, coalesce(resolved_at, 'infinity'::timestamptz), '[]')"
+)
+
+POSTGRES_INTERVAL_DDL = [
+    f"""
+    CREATE INDEX ix_incidents_active_range ON incidents
+    USING gist (({ACTIVE_RANGE_EXPRESSION}))
+    """,
+]
+
+# SQLite: a one-dimensional R*Tree keyed by the stable integer from
+# incident_rowids (see search.py). rtree_i32 stores integer coordinates, so
+# intervals are widened to whole minutes (start floored, end ceiled) and open
+# incidents extend to the largest coordinate. The index is therefore a superset
+# prefilter; the repository rechecks the exact timestamps on the matched rows.
+OPEN_INTERVAL_END = 2147483647
+
+_START_MINUTE = "CAST(strftime('%s', new.created_at) AS INTEGER) / 60"
+_END_MINUTE = (
+    f"CASE WHEN new.resolved_at IS NULL THEN {OPEN_INTERVAL_END} "
+    f"ELSE max({_START_MINUTE}, "
+    "(CAST(strftime('%s', new.resolved_at) AS INTEGER) + 59) / 60) END"
+)
+
+SQLITE_INTERVAL_DDL = [
+    """
+    CREATE VIRTUAL TABLE incident_intervals
+    USING rtree_i32(id, start_minute, end_minute)
+    """,
+    f"""
+    CREATE TRIGGER incident_intervals_ai AFTER INSERT ON incidents BEGIN
+        INSERT INTO incident_intervals (id, start_minute, end_minute)
+        SELECT id, {_START_MINUTE}, {_END_MINUTE}
+        FROM incident_rowids WHERE incident_id = new.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER incident_intervals_au
+    AFTER UPDATE OF created_at, resolved_at ON incidents BEGIN
+        UPDATE incident_intervals
+        SET start_minute = {_START_MINUTE}, end_minute = {_END_MINUTE}
+        WHERE id = (SELECT id FROM incident_rowids WHERE incident_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER incident_intervals_bd BEFORE DELETE ON incidents BEGIN
+        DELETE FROM incident_intervals
+        WHERE id = (SELECT id FROM incident_rowids WHERE incident_id = old.id);
+    END
+    """,
+]
+
+SQLITE_INTERVAL_DROP_DDL = ["DROP TABLE IF EXISTS incident_intervals"]
+
+POSTGRES_INTERVAL_DROP_DDL = ["DROP INDEX IF EXISTS ix_incidents_active_range"]
+
+
+register_dialect_ddl("sqlite", SQLITE_INTERVAL_DDL, SQLITE_INTERVAL_DROP_DDL)
+register_dialect_ddl("postgresql", POSTGRES_INTERVAL_DDL, POSTGRES_INTERVAL_DROP_DDL)
@@ -0,0 +1,67 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Table,
+    Text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.orm.base import Base
+from app.models.orm.service import utc_now
+
+
+# Planned work on one or more services, over [starts_at, ends_at). While a
+# window is open its services read as "maintenance" whatever their incidents,
+# and their outage and degraded time is left out of uptime. Windows are never
+# edited, only created and cancelled, so created_at doubles as a change marker
+# for the in-process schedule (app/services/maintenance.py).
+class MaintenanceWindow(Base):
+    __tablename__ = "maintenance_windows"
+    __table_args__ = (
+        CheckConstraint("starts_at < ends_at", name="ck_maintenance_windows_order"),
+        # Serves the list of current and upcoming windows.
+        Index("ix_maintenance_windows_ends_at", "ends_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    starts_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    ends_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        nullable=False,
+    )
+
+
+maintenance_window_services = Table(
+    "maintenance_window_services",
+    Base.metadata,
+    Column(
+        "window_id",
+        ForeignKey("maintenance_windows.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "service_id",
+        ForeignKey("services.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+)
+
+# The service → windows direction, for a service's schedule.
+Index(
+    "ix_maintenance_window_services_service_id",
+    maintenance_window_services.c.service_id,
+)
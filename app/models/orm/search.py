@@ -0,0 +1,134 @@
+from app.models.orm.ddl import register_dialect_ddl
+
+# The full-text index is not mapped by the ORM: each dialect needs a structure the
+# other cannot express (an FTS5 virtual table on SQLite, a tsvector column with a
+# GIN index on PostgreSQL). Both are kept in sync by database triggers so every
+# write path, including bulk SQL, updates the index in the same transaction.
+# The Alembic migration creates the same objects for deployed databases.
+
+# SQLite virtual tables address rows by integer rowid, while incidents use UUID
+# keys. incident_rowids hands out a stable integer per incident; the implicit
+# rowid of the incidents table itself is not stable across VACUUM.
+# Virtual-table cleanup runs in BEFORE DELETE triggers and the key row is removed
+# AFTER DELETE, so every index can still resolve the key while it is cleaned up.
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE TABLE incident_rowids (
+        id INTEGER PRIMARY KEY,
+        incident_id CHAR(32) NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE TRIGGER incident_rowids_bi BEFORE INSERT ON incidents BEGIN
+        INSERT OR IGNORE INTO incident_rowids (incident_id) VALUES (new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER incident_rowids_ad AFTER DELETE ON incidents BEGIN
+        DELETE FROM incident_rowids WHERE incident_id = old.id;
+    END
+    """,
+    """
+    CREATE VIRTUAL TABLE incident_search USING fts5(
+        title, body, messages, tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER incident_search_ai AFTER INSERT ON incidents BEGIN
+        INSERT INTO incident_search (rowid, title, body, messages)
+        SELECT id, new.title, coalesce(new.body, ''), ''
+        FROM incident_rowids WHERE incident_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER incident_search_au AFTER UPDATE OF title, body ON incidents BEGIN
+        UPDATE incident_search SET title = new.title, body = coalesce(new.body, '')
+        WHERE rowid = (SELECT id FROM incident_rowids WHERE incident_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER incident_search_bd BEFORE DELETE ON incidents BEGIN
+        DELETE FROM incident_search
+        WHERE rowid = (SELECT id FROM incident_rowids WHERE incident_id = old.id);
+    END
+    """,
+    """
+    CREATE TRIGGER incident_search_updates_ai AFTER INSERT ON incident_updates BEGIN
+        UPDATE incident_search SET messages = messages || char(10) || new.message
+        WHERE rowid = (
+            SELECT id FROM incident_rowids WHERE incident_id = new.incident_id
+        );
+    END
+    """,
+]
+
+# header holds the weighted title/body vector and messages the accumulated
+# timeline vector, so an appended update only concatenates one new message
+# instead of re-tokenising the whole timeline. document = header || messages is
+# the column the GIN index covers.
+POSTGRES_SEARCH_DDL = [
+    """
+    CREATE TABLE incident_search (
+        incident_id UUID PRIMARY KEY REFERENCES incidents (id) ON DELETE CASCADE,
+        header TSVECTOR NOT NULL DEFAULT ''::tsvector,
+        messages TSVECTOR NOT NULL DEFAULT ''::tsvector,
+        document TSVECTOR NOT NULL DEFAULT ''::tsvector
+    )
+    """,
+    "CREATE INDEX ix_incident_search_document ON incident_search USING gin (document)",
+    """
+    CREATE FUNCTION incident_search_index_incident() RETURNS trigger AS $$
+    DECLARE
+        new_header tsvector := setweight(to_tsvector('english', NEW.title), 'A')
+            || setweight(to_tsvector('english', coalesce(NEW.body, '')), 'B');
+    BEGIN
+        INSERT INTO incident_search (incident_id, header, document)
+        VALUES (NEW.id, new_header, new_header)
+        ON CONFLICT (incident_id) DO UPDATE
+            SET header = EXCLUDED.header,
+                document = EXCLUDED.header || incident_search.messages;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER incident_search_incident
+        AFTER INSERT OR UPDATE OF title, body ON incidents
+        FOR EACH ROW EXECUTE FUNCTION incident_search_index_incident()
+    """,
+    """
+    CREATE FUNCTION incident_search_index_update() RETURNS trigger AS $$
+    DECLARE
+        message_vector tsvector := setweight(
+            to_tsvector('english', NEW.message), 'C'
+        );
+    BEGIN
+        UPDATE incident_search
+        SET messages = messages || message_vector,
+            document = header || messages || message_vector
+        WHERE incident_id = NEW.incident_id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER incident_search_update
+        AFTER INSERT ON incident_updates
+        FOR EACH ROW EXECUTE FUNCTION incident_search_index_update()
+    """,
+]
+
+SQLITE_SEARCH_DROP_DDL = [
+    "DROP TABLE IF EXISTS incident_search",
+    "DROP TABLE IF EXISTS incident_rowids",
+]
+
+POSTGRES_SEARCH_DROP_DDL = [
+    "DROP TABLE IF EXISTS incident_search",
+    "DROP FUNCTION IF EXISTS incident_search_index_update() CASCADE",
+    "DROP FUNCTION IF EXISTS incident_search_index_incident() CASCADE",
+]
+
+
+register_dialect_ddl("sqlite", SQLITE_SEARCH_DDL, SQLITE_SEARCH_DROP_DDL)
+register_dialect_ddl("postgresql", POSTGRES_SEARCH_DDL, POSTGRES_SEARCH_DROP_DDL)
@@ -8,9 +8,10 @@ if TYPE_CHECKING:
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import DateTime, Enum, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.models.enums import ServiceStatus
 from app.models.orm.base import Base
 
 
@@ -40,6 +41,15 @@ class Service(Base):
         onupdate=utc_now,
         nullable=False,
     )
+    # The derived status combined with that of every service this one depends
+    # on, transitively. Unlike the direct status it is stored, and recomputed
+    # only for the services downstream of a change.
+    effective_status: Mapped[ServiceStatus] = mapped_column(
+        Enum(ServiceStatus),
+        default=ServiceStatus.operational,
+        server_default=ServiceStatus.operational.value,
+        nullable=False,
+    )
 
     # selectin loading issues a single IN query to load all related incidents
     # alongside the parent service, avoiding N+1 queries when listing services.
@@ -0,0 +1,97 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.orm.base import Base
+from app.models.orm.service import utc_now
+
+
+# Status-page components: groups nest under a parent group and hold services.
+# The counters cover every service in the group and all of its descendants, by
+# effective status, and are adjusted in place whenever one of those services
+# changes status or moves, so a group's rollup status is read, never computed
+# by walking the tree.
+class ServiceGroup(Base):
+    __tablename__ = "service_groups"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    parent_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("service_groups.id"),
+        nullable=True,
+    )
+    service_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    degraded_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    outage_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        onupdate=utc_now,
+        nullable=False,
+    )
+
+
+# Closure table: one row per (ancestor, descendant) pair, including each group
+# paired with itself at depth 0. "Every group under X" is a range scan on the
+# primary key, and "every group above X" one on the descendant index.
+service_group_closure = Table(
+    "service_group_closure",
+    Base.metadata,
+    Column(
+        "ancestor_id",
+        ForeignKey("service_groups.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "descendant_id",
+        ForeignKey("service_groups.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("depth", Integer, nullable=False),
+)
+
+Index("ix_service_group_closure_descendant_id", service_group_closure.c.descendant_id)
+
+# A service belongs to at most one group, hence service_id alone as the key.
+service_group_members = Table(
+    "service_group_members",
+    Base.metadata,
+    Column(
+        "service_id",
+        ForeignKey("services.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "group_id",
+        ForeignKey("service_groups.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+)
+
+Index("ix_service_group_members_group_id", service_group_members.c.group_id)
@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Index, Integer, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.enums import ServiceStatus
+from app.models.orm.base import Base
+
+
+# Append-only log of a service's derived status: one row each time a write
+# moves the service to a different status, plus its initial "operational" row.
+# The status at any instant is the latest row at or before it, which the
+# (service_id, changed_at, id) index answers with a single seek.
+class ServiceStatusChange(Base):
+    __tablename__ = "service_status_changes"
+    __table_args__ = (
+        Index(
+            "ix_service_status_changes_service_id_changed_at_id",
+            "service_id",
+            "changed_at",
+            "id",
+        ),
+    )
+
+    # An increasing integer rather than a UUID, so that changes recorded with
+    # the same changed_at still have a well-defined order.
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    service_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("services.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status: Mapped[ServiceStatus] = mapped_column(
+        Enum(ServiceStatus),
+        nullable=False,
+    )
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    # The incident whose write caused the change; None for a service's initial
+    # row. Not a foreign key: the incident may since have moved to the archive
+    # tables, and the change still refers to it.
+    incident_id: Mapped[uuid.UUID | None] = mapped_column(Uuid, nullable=True)
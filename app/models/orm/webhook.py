@@ -0,0 +1,121 @@
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Uuid,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.orm.base import Base
+from app.models.orm.service import utc_now
+
+
+# An endpoint to notify, and the event types it wants. Deliveries to one
+# endpoint never run more than max_concurrency requests at a time, so a slow
+# receiver is not flooded by the worker catching up on its backlog.
+class WebhookSubscription(Base):
+    __tablename__ = "webhook_subscriptions"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    # Shared secret for the X-Opstatus-Signature header; never returned by the
+    # API once set.
+    secret: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    events: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    max_concurrency: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        nullable=False,
+    )
+
+
+# The delivery queue: one row per event and subscription. The API's write path
+# only inserts here; the HTTP requests are made by the webhook worker. Rows are
+# deleted once delivered, moved to webhook_dead_letters once out of attempts,
+# and otherwise wait for next_attempt_at, which the worker also pushes forward
+# while it holds a row so that other workers leave it alone.
+class WebhookDelivery(Base):
+    __tablename__ = "webhook_deliveries"
+    __table_args__ = (
+        Index("ix_webhook_deliveries_next_attempt_at_id", "next_attempt_at", "id"),
+        Index("ix_webhook_deliveries_subscription_id", "subscription_id"),
+    )
+
+    # Increasing, so each endpoint receives its events in the order they
+    # happened.
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    subscription_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("webhook_subscriptions.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Shared by every subscription's copy of the event, so receivers can
+    # discard the duplicates that at-least-once delivery implies.
+    event_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+# Deliveries that failed every attempt, kept for inspection.
+class WebhookDeadLetter(Base):
+    __tablename__ = "webhook_dead_letters"
+    __table_args__ = (
+        Index(
+            "ix_webhook_dead_letters_subscription_id_failed_at",
+            "subscription_id",
+            "failed_at",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    subscription_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("webhook_subscriptions.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    event_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    failed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        nullable=False,
+    )
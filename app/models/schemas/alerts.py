@@ -0,0 +1,36 @@
+from pydantic import BaseModel, Field
+
+from app.models.enums import AlertStatus
+
+# Most alerts a single request may carry.
+MAX_ALERTS_PER_REQUEST = 1000
+
+
+# The parts of an Alertmanager (or Grafana) webhook alert that are used; the
+# rest of the payload, such as startsAt or generatorURL, is ignored.
+class Alert(BaseModel):
+    status: AlertStatus
+    labels: dict[str, str] = Field(default_factory=dict)
+    annotations: dict[str, str] = Field(default_factory=dict)
+    # Sent by Alertmanager and Grafana; derived from the labels when absent.
+    fingerprint: str | None = Field(None, min_length=1, max_length=255)
+
+
+class AlertBatch(BaseModel):
+    alerts: list[Alert] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_ALERTS_PER_REQUEST,
+        description="Alerts in Alertmanager webhook format",
+    )
+
+
+# What the alerts of a request did. Repeats of one fingerprint in a request
+# count once, with its last status.
+class AlertBatchResponse(BaseModel):
+    received: int
+    opened: int
+    updated: int
+    resolved: int
+    suppressed: int
+    unmatched: int
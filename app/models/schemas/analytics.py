@@ -0,0 +1,31 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+from app.models.enums import IncidentSeverity
+
+
+class TimeInState(BaseModel):
+    investigating: float
+    identified: float
+    monitoring: float
+
+
+class AnalyticsPoint(BaseModel):
+    # First day (UTC) of the bucket: the day itself, the Monday of the week, or
+    # the first of the month.
+    bucket_start: date
+    severity: IncidentSeverity
+    # Incidents created in the bucket.
+    opened: int
+    # Incidents resolved in the bucket. MTTR and time in state describe these
+    # incidents, and are None when there are none.
+    resolved: int
+    mttr_seconds: float | None
+    mean_time_in_state_seconds: TimeInState | None
+
+
+class AnalyticsResponse(BaseModel):
+    data: list[AnalyticsPoint]
+    # The resolved report window (start, end as ISO dates) and bucket width.
+    meta: dict[str, str]
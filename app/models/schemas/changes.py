@@ -0,0 +1,19 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.models.enums import ChangeEntity, ChangeOperation
+
+
+class ChangeResponse(BaseModel):
+    seq: int
+    entity_type: ChangeEntity
+    entity_id: uuid.UUID
+    operation: ChangeOperation
+    changed_at: datetime
+
+
+class ChangeListResponse(BaseModel):
+    data: list[ChangeResponse]
+    meta: dict[str, int]
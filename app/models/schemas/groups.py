@@ -0,0 +1,58 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.models.enums import ServiceStatus
+
+
+class ServiceGroupCreate(BaseModel):
+    name: str = Field(
+        ..., min_length=1, max_length=100, description="Human-readable group name"
+    )
+    description: str | None = Field(
+        None, max_length=500, description="Optional description of the group"
+    )
+    parent_id: uuid.UUID | None = Field(
+        None, description="Group to nest this group under; omit for a top-level one"
+    )
+
+
+class ServiceGroupUpdate(BaseModel):
+    name: str | None = Field(
+        None, min_length=1, max_length=100, description="Human-readable group name"
+    )
+    description: str | None = Field(
+        None, max_length=500, description="Optional description of the group"
+    )
+    # Unlike the other fields, an explicit null is meaningful here: it moves the
+    # group to the top level. Leaving the field out keeps the current parent.
+    parent_id: uuid.UUID | None = Field(
+        None, description="New parent group; null moves the group to the top level"
+    )
+
+
+class ServiceGroupMemberCreate(BaseModel):
+    service_id: uuid.UUID = Field(
+        ..., description="Service to add; it leaves any group it was in"
+    )
+
+
+class ServiceGroupResponse(BaseModel):
+    id: uuid.UUID
+    name: str
+    description: str | None
+    parent_id: uuid.UUID | None
+    # The worst effective status among every service in the group and the
+    # groups below it; operational when there are none.
+    status: ServiceStatus
+    service_count: int
+    degraded_count: int
+    outage_count: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class ServiceGroupListResponse(BaseModel):
+    data: list[ServiceGroupResponse]
+    meta: dict[str, int]
@@ -9,6 +9,7 @@ from app.models.enums import IncidentSeverity, IncidentStatus
 class IncidentUpdateResponse(BaseModel):
     id: uuid.UUID
     incident_id: uuid.UUID
+    sequence: int
     message: str
     status: IncidentStatus
     created_at: datetime
@@ -68,3 +69,31 @@ class IncidentAppendUpdate(BaseModel):
 class IncidentListResponse(BaseModel):
     data: list[IncidentResponse]
     meta: dict[str, int]
+    # Requested IDs that matched no incident, for lookups by ID; otherwise empty.
+    missing: list[uuid.UUID] = Field(default_factory=list)
+
+
+class IncidentUpdateListResponse(BaseModel):
+    data: list[IncidentUpdateResponse]
+    # next_cursor is the sequence to pass as ?since= for the following page, or
+    # None once the client has caught up with latest_sequence.
+    meta: dict[str, int | None]
+
+
+class IncidentSearchResult(BaseModel):
+    id: uuid.UUID
+    title: str
+    severity: IncidentSeverity
+    status: IncidentStatus
+    created_at: datetime
+    resolved_at: datetime | None
+    # Higher is more relevant. Scores are only comparable within one response.
+    rank: float
+    # Excerpt around the matched terms, HTML-escaped, with matches wrapped in
+    # <mark> tags.
+    snippet: str
+
+
+class IncidentSearchResponse(BaseModel):
+    data: list[IncidentSearchResult]
+    meta: dict[str, int]
@@ -0,0 +1,16 @@
+import uuid
+
+from pydantic import BaseModel, Field
+
+# Most IDs one lookup may ask for; keeps each IN list well inside the bound
+# parameter limits of SQLite and PostgreSQL.
+MAX_LOOKUP_IDS = 1000
+
+
+class IdLookup(BaseModel):
+    ids: list[uuid.UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_LOOKUP_IDS,
+        description="IDs to fetch; duplicates are ignored",
+    )
@@ -0,0 +1,41 @@
+import uuid
+from datetime import datetime
+from typing import Self
+
+from pydantic import AwareDatetime, BaseModel, Field, model_validator
+
+
+class MaintenanceWindowCreate(BaseModel):
+    title: str = Field(
+        ..., min_length=1, max_length=200, description="Short summary of the work"
+    )
+    description: str | None = Field(
+        None, max_length=2000, description="Optional details shown with the window"
+    )
+    # Offsets are required so a window is never scheduled in the wrong zone.
+    starts_at: AwareDatetime = Field(..., description="When the window opens")
+    ends_at: AwareDatetime = Field(..., description="When the window closes")
+    service_ids: list[uuid.UUID] = Field(
+        ..., min_length=1, description="Services under maintenance during the window"
+    )
+
+    @model_validator(mode="after")
+    def check_order(self) -> Self:
+        if self.starts_at >= self.ends_at:
+            raise ValueError("starts_at must be before ends_at")
+        return self
+
+
+class MaintenanceWindowResponse(BaseModel):
+    id: uuid.UUID
+    title: str
+    description: str | None
+    starts_at: datetime
+    ends_at: datetime
+    service_ids: list[uuid.UUID]
+    created_at: datetime
+
+
+class MaintenanceWindowListResponse(BaseModel):
+    data: list[MaintenanceWindowResponse]
+    meta: dict[str, int]
@@ -1,5 +1,5 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, Field
 
@@ -33,6 +33,9 @@ class ServiceResponse(BaseModel):
     name: str
     description: str | None
     status: ServiceStatus
+    # `status` combined with the services this one depends on: degraded while
+    # any of them, directly or transitively, is degraded or in outage.
+    effective_status: ServiceStatus
     created_at: datetime
     updated_at: datetime
 
@@ -41,6 +44,60 @@ class ServiceResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ServiceDependencyCreate(BaseModel):
+    depends_on_id: uuid.UUID = Field(
+        ..., description="ID of the service this service depends on"
+    )
+
+
 class ServiceListResponse(BaseModel):
     data: list[ServiceResponse]
     meta: dict[str, int]
+    # Requested IDs that matched no service, for lookups by ID; otherwise empty.
+    missing: list[uuid.UUID] = Field(default_factory=list)
+
+
+class DailyUptime(BaseModel):
+    day: date
+    outage_seconds: float
+    # Time degraded but not in outage; the two never overlap.
+    degraded_seconds: float
+    # Share of the observed part of the day (the service's first day starts at
+    # its creation, today ends now) without an outage. Degraded time counts as up.
+    uptime_percent: float
+
+
+class ServiceUptimeResponse(BaseModel):
+    service_id: uuid.UUID
+    uptime_percent: float
+    outage_seconds: float
+    degraded_seconds: float
+    # Oldest first, ending with today. Days before the service existed are omitted.
+    days: list[DailyUptime]
+
+
+class ServiceUptimeListResponse(BaseModel):
+    data: list[ServiceUptimeResponse]
+    meta: dict[str, int]
+
+
+class ServiceStatusChangeResponse(BaseModel):
+    status: ServiceStatus
+    changed_at: datetime
+    # The incident whose create, edit or resolution caused the change; null for
+    # the service's initial entry.
+    incident_id: uuid.UUID | None
+
+
+class ServiceStatusAtResponse(BaseModel):
+    service_id: uuid.UUID
+    at: datetime
+    status: ServiceStatus
+    # When the service entered this status, and the incident that moved it there.
+    since: datetime
+    incident_id: uuid.UUID | None
+
+
+class ServiceStatusHistoryResponse(BaseModel):
+    data: list[ServiceStatusChangeResponse]
+    meta: dict[str, int]
@@ -0,0 +1,66 @@
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pydantic import AnyHttpUrl, BaseModel, Field
+
+from app.models.enums import ServiceStatus, WebhookEventType
+
+
+class WebhookSubscriptionCreate(BaseModel):
+    url: AnyHttpUrl = Field(..., description="Endpoint the events are POSTed to")
+    events: list[WebhookEventType] = Field(
+        ..., min_length=1, description="Event types to deliver to this endpoint"
+    )
+    secret: str | None = Field(
+        None,
+        min_length=1,
+        max_length=200,
+        description="Key for the HMAC-SHA256 X-Opstatus-Signature header",
+    )
+    max_concurrency: int = Field(
+        2, ge=1, le=50, description="Most requests in flight to this endpoint at once"
+    )
+
+
+class WebhookSubscriptionResponse(BaseModel):
+    id: uuid.UUID
+    url: str
+    events: list[WebhookEventType]
+    max_concurrency: int
+    # Whether deliveries are signed; the secret itself is never returned.
+    signed: bool
+    # Deliveries queued or awaiting a retry.
+    pending: int
+    created_at: datetime
+
+
+class WebhookSubscriptionListResponse(BaseModel):
+    data: list[WebhookSubscriptionResponse]
+    meta: dict[str, int]
+
+
+class WebhookDeadLetterResponse(BaseModel):
+    id: int
+    event_id: uuid.UUID
+    event_type: WebhookEventType
+    # The event exactly as it would have been delivered.
+    payload: dict[str, Any]
+    attempts: int
+    last_error: str | None
+    created_at: datetime
+    failed_at: datetime
+
+
+class WebhookDeadLetterListResponse(BaseModel):
+    data: list[WebhookDeadLetterResponse]
+    meta: dict[str, int]
+
+
+# The `data` of a service.status_changed event.
+class ServiceStatusChangedEvent(BaseModel):
+    service_id: uuid.UUID
+    status: ServiceStatus
+    previous_status: ServiceStatus | None
+    changed_at: datetime
+    incident_id: uuid.UUID | None
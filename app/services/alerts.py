@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+import uuid
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import ConflictError, NotFoundError
+from app.core.metrics import alerts_received_total
+from app.db.repositories.alerts import AlertRepository
+from app.db.repositories.services import ServiceRepository
+from app.models.enums import AlertStatus, IncidentSeverity, IncidentStatus
+from app.models.schemas.alerts import Alert, AlertBatchResponse
+from app.services.incidents import (
+    append_incident_update,
+    create_incident,
+    resolve_incident,
+)
+
+# Values of the alert's "severity" label, as Alertmanager and Grafana rules
+# commonly set it. Anything else, or no label, opens a medium incident.
+ALERT_SEVERITIES = {
+    "critical": IncidentSeverity.critical,
+    "high": IncidentSeverity.high,
+    "error": IncidentSeverity.high,
+    "medium": IncidentSeverity.medium,
+    "warning": IncidentSeverity.medium,
+    "low": IncidentSeverity.low,
+    "info": IncidentSeverity.low,
+}
+DEFAULT_SEVERITY = IncidentSeverity.medium
+
+STILL_FIRING_MESSAGE = "Alert is still firing."
+
+# Longest incident title; see Incident.title.
+MAX_TITLE_LENGTH = 200
+
+
+class _Seen(NamedTuple):
+    # Whether the fingerprint had an active incident, as of the last time this
+    # process read or changed it, and until when (time.monotonic()) a repeat
+    # of that state needs no database access: a firing alert's next update is
+    # not due yet, or a resolved alert's incident was just resolved.
+    active: bool
+    quiet_until: float
+
+
+# Recently seen fingerprints, least recently written first. A flapping alert
+# resent many times a minute is then answered from here until its next update
+# is due. An incident resolved through the API meanwhile is noticed, and a new
+# one opened, once the entry goes quiet, at most alert_debounce_seconds later.
+_recent: OrderedDict[str, _Seen] = OrderedDict()
+
+
+def alert_fingerprint(alert: Alert) -> str:
+    if alert.fingerprint is not None:
+        return alert.fingerprint
+    return hashlib.sha256(json.dumps(alert.labels, sort_keys=True).encode()).hexdigest()
+
+
+def _remember(fingerprint: str, active: bool, quiet_until: datetime) -> None:
+    remaining = (quiet_until - datetime.now(UTC)).total_seconds()
+    _recent[fingerprint] = _Seen(active, time.monotonic() + remaining)
+    _recent.move_to_end(fingerprint)
+    while len(_recent) > settings.alert_cache_size:
+        _recent.popitem(last=False)
+
+
+async def ingest_alerts(
+    session: AsyncSession, alerts: Sequence[Alert]
+) -> AlertBatchResponse:
+    # Each alert ends up with one outcome. Repeats of a fingerprint within the
+    # request are suppressed and its last alert is the one applied; repeats
+    # already known in this process are suppressed without a query. The rest
+    # cost one query for their fingerprint rows, plus writes for the incidents
+    # they actually open, update or resolve. Every write commits on its own,
+    # so a request that fails part way can simply be sent again.
+    outcomes: Counter[str] = Counter()
+    latest: dict[str, Alert] = {}
+    for alert in alerts:
+        fingerprint = alert_fingerprint(alert)
+        if fingerprint in latest:
+            outcomes["suppressed"] += 1
+        latest[fingerprint] = alert
+
+    clock = time.monotonic()
+    pending: dict[str, Alert] = {}
+    for fingerprint, alert in latest.items():
+        seen = _recent.get(fingerprint)
+        if (
+            seen is not None
+            and clock < seen.quiet_until
+            and seen.active == (alert.status == AlertStatus.firing)
+        ):
+            outcomes["suppressed"] += 1
+        else:
+            pending[fingerprint] = alert
+    if pending:
+        await _apply(session, pending, outcomes)
+
+    for outcome, count in outcomes.items():
+        alerts_received_total.labels(outcome=outcome).inc(count)
+    return AlertBatchResponse(
+        received=len(alerts),
+        opened=outcomes["opened"],
+        updated=outcomes["updated"],
+        resolved=outcomes["resolved"],
+        suppressed=outcomes["suppressed"],
+        unmatched=outcomes["unmatched"],
+    )
+
+
+async def _apply(
+    session: AsyncSession, pending: dict[str, Alert], outcomes: Counter[str]
+) -> None:
+    repo = AlertRepository(session)
+    now = datetime.now(UTC)
+    debounce = timedelta(seconds=settings.alert_debounce_seconds)
+    states = await repo.get_states(list(pending))
+
+    to_open: dict[str, tuple[Alert, uuid.UUID | None]] = {}
+    to_update: dict[str, tuple[uuid.UUID, IncidentStatus]] = {}
+    to_resolve: dict[str, uuid.UUID] = {}
+    for fingerprint, alert in pending.items():
+        state = states.get(fingerprint)
+        active_status = state.active_status if state is not None else None
+        if alert.status == AlertStatus.resolved:
+            if state is not None and active_status is not None:
+                to_resolve[fingerprint] = state.incident_id
+            else:
+                outcomes["suppressed"] += 1
+                _remember(fingerprint, False, now + debounce)
+        elif state is not None and active_status is not None:
+            if state.updated_at + debounce <= now:
+                to_update[fingerprint] = (state.incident_id, active_status)
+            else:
+                outcomes["suppressed"] += 1
+                _remember(fingerprint, True, state.updated_at + debounce)
+        elif (
+            state is not None
+            and state.incident_status is None
+            and state.updated_at + debounce > now
+        ):
+            # Claimed by a request that is still opening its incident.
+            outcomes["suppressed"] += 1
+        else:
+            to_open[fingerprint] = (alert, state.incident_id if state else None)
+
+    if to_update:
+        due = await repo.touch_due(list(to_update), now, now - debounce)
+        for fingerprint, (incident_id, status) in to_update.items():
+            # Not due: another request has just made this update.
+            if fingerprint not in due:
+                outcomes["suppressed"] += 1
+                continue
+            try:
+                await append_incident_update(
+                    session, incident_id, STILL_FIRING_MESSAGE, status
+                )
+            except (ConflictError, NotFoundError):
+                # Resolved, or archived, since it was read.
+                outcomes["suppressed"] += 1
+                continue
+            outcomes["updated"] += 1
+            _remember(fingerprint, True, now + debounce)
+
+    if to_open:
+        await _open(session, repo, to_open, now, outcomes)
+
+    for fingerprint, incident_id in to_resolve.items():
+        try:
+            await resolve_incident(session, incident_id)
+        except (ConflictError, NotFoundError):
+            # Resolved, or archived, since it was read.
+            outcomes["suppressed"] += 1
+            continue
+        outcomes["resolved"] += 1
+        _remember(fingerprint, False, now + debounce)
+
+
+async def _open(
+    session: AsyncSession,
+    repo: AlertRepository,
+    to_open: dict[str, tuple[Alert, uuid.UUID | None]],
+    now: datetime,
+    outcomes: Counter[str],
+) -> None:
+    label = settings.alert_service_label
+    service_ids = await ServiceRepository(session).get_ids_by_name(
+        sorted({a.labels[label] for a, _ in to_open.values() if label in a.labels})
+    )
+    debounce = timedelta(seconds=settings.alert_debounce_seconds)
+    for fingerprint, (alert, previous_id) in to_open.items():
+        service_id = service_ids.get(alert.labels.get(label, ""))
+        if service_id is None:
+            outcomes["unmatched"] += 1
+            continue
+        # Claimed before the incident is created, so of two requests opening
+        # one for this fingerprint, only one does.
+        incident_id = uuid.uuid4()
+        if not await repo.claim(fingerprint, incident_id, now, previous_id):
+            outcomes["suppressed"] += 1
+            continue
+        title = (
+            alert.annotations.get("summary")
+            or alert.labels.get("alertname")
+            or f"Alert {fingerprint}"
+        )
+        try:
+            await create_incident(
+                session,
+                title=title[:MAX_TITLE_LENGTH],
+                severity=ALERT_SEVERITIES.get(
+                    alert.labels.get("severity", "").lower(), DEFAULT_SEVERITY
+                ),
+                service_ids=[service_id],
+                body=alert.annotations.get("description"),
+                incident_id=incident_id,
+            )
+        except NotFoundError:
+            # The service was deleted since it was looked up. The claim names
+            # an incident that never existed, and lapses like any other.
+            outcomes["unmatched"] += 1
+            continue
+        outcomes["opened"] += 1
+        _remember(fingerprint, True, now + debounce)
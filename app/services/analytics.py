@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.analytics import AnalyticsRepository, AnalyticsRow
+from app.db.repositories.services import ServiceRepository
+from app.models.enums import IncidentSeverity, TimeBucket
+from app.models.orm.incident import SEVERITY_RANK
+from app.models.schemas.analytics import AnalyticsPoint, AnalyticsResponse, TimeInState
+
+
+def build_analytics_point(row: AnalyticsRow) -> AnalyticsPoint:
+    # Rollups store sums so buckets of any width can be added up; means are only
+    # taken here, over the incidents resolved in the bucket.
+    if not row.resolved:
+        return AnalyticsPoint(
+            bucket_start=row.bucket_start,
+            severity=row.severity,
+            opened=row.opened,
+            resolved=0,
+            mttr_seconds=None,
+            mean_time_in_state_seconds=None,
+        )
+    return AnalyticsPoint(
+        bucket_start=row.bucket_start,
+        severity=row.severity,
+        opened=row.opened,
+        resolved=row.resolved,
+        mttr_seconds=row.resolve_seconds / row.resolved,
+        mean_time_in_state_seconds=TimeInState(
+            **{
+                status.value: seconds / row.resolved
+                for status, seconds in row.status_seconds.items()
+            }
+        ),
+    )
+
+
+async def get_analytics(
+    session: AsyncSession,
+    start: date,
+    end: date,
+    bucket: TimeBucket = TimeBucket.day,
+    service_id: uuid.UUID | None = None,
+    severities: Sequence[IncidentSeverity] | None = None,
+) -> AnalyticsResponse:
+    if service_id is not None:
+        # Raises NotFoundError so an unknown service is a 404, not an empty report.
+        await ServiceRepository(session).get_by_id(service_id)
+
+    rows = await AnalyticsRepository(session).get_report(
+        start=start,
+        end=end,
+        bucket=bucket,
+        service_id=service_id,
+        severities=severities,
+    )
+    rows.sort(key=lambda row: (row.bucket_start, SEVERITY_RANK[row.severity]))
+    return AnalyticsResponse(
+        data=[build_analytics_point(row) for row in rows],
+        meta={"start": start.isoformat(), "end": end.isoformat(), "bucket": bucket},
+    )
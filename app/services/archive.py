@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.archive import ArchiveRepository
+
+
+async def archive_resolved_incidents(
+    session: AsyncSession, older_than_days: int, batch_size: int
+) -> int:
+    # Retention policy: incidents resolved more than `older_than_days` ago move
+    # to the archive tables. Each batch commits on its own, so locks are held
+    # for one batch at a time and an interrupted run keeps its progress; the
+    # next run simply continues with what is left.
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(days=older_than_days)
+    repo = ArchiveRepository(session)
+    total = 0
+    while True:
+        moved = await repo.archive_batch(cutoff, batch_size, archived_at=now)
+        total += moved
+        if moved < batch_size:
+            return total
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.base import as_utc
+from app.db.repositories.changes import ChangeRepository
+from app.models.schemas.changes import ChangeListResponse, ChangeResponse
+
+
+class ChangeCompaction(NamedTuple):
+    superseded: int
+    tombstones: int
+
+
+async def list_changes(
+    session: AsyncSession, after: int = 0, limit: int = 100
+) -> ChangeListResponse:
+    # Seqs only increase but are not contiguous: compaction and rolled-back
+    # transactions leave gaps. Consumers pass meta.next_after back as `after`.
+    repo = ChangeRepository(session)
+    changes = await repo.get_page(after, limit)
+    return ChangeListResponse(
+        data=[
+            ChangeResponse(
+                seq=c.seq,
+                entity_type=c.entity_type,
+                entity_id=c.entity_id,
+                operation=c.operation,
+                changed_at=as_utc(c.changed_at),
+            )
+            for c in changes
+        ],
+        meta={
+            "count": len(changes),
+            "limit": limit,
+            "next_after": changes[-1].seq if changes else after,
+            "latest_seq": await repo.get_latest_seq(),
+        },
+    )
+
+
+async def compact_changes(
+    session: AsyncSession, tombstone_retention_days: int, batch_size: int
+) -> ChangeCompaction:
+    # Keeps the feed at one row per live entity plus recent deletions: rows
+    # superseded by a later row for the same entity are removed, and deletion
+    # rows once they are older than the retention period. A consumer that has
+    # been away for longer than that must re-list everything, as it may have
+    # missed deletions. Batches commit separately, like incident archival.
+    repo = ChangeRepository(session)
+    cutoff = datetime.now(UTC) - timedelta(days=tombstone_retention_days)
+    superseded = tombstones = 0
+    while (removed := await repo.delete_superseded(batch_size)) > 0:
+        superseded += removed
+    while (removed := await repo.delete_tombstones(cutoff, batch_size)) > 0:
+        tombstones += removed
+    return ChangeCompaction(superseded, tombstones)
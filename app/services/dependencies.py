@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict, deque
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ConflictError, NotFoundError
+from app.db.repositories.changes import ChangeRepository
+from app.db.repositories.dependencies import DependencyRepository
+from app.db.repositories.service_status import ServiceStatusRepository
+from app.models.enums import ServiceStatus
+from app.models.schemas.services import ServiceListResponse
+from app.services.groups import apply_member_status_changes
+from app.services.services import build_service_responses, status_for_severities
+
+
+class DependencyGraph:
+    # Immutable adjacency of the service dependency edges, in both directions,
+    # with each service's downstream closure (everything that depends on it,
+    # transitively) computed on first use and kept for the graph's lifetime.
+    # Edits build a new graph, so cached closures never go stale.
+    def __init__(self, edges: Iterable[tuple[uuid.UUID, uuid.UUID]]) -> None:
+        self.dependencies: dict[uuid.UUID, set[uuid.UUID]] = defaultdict(set)
+        self.dependents: dict[uuid.UUID, set[uuid.UUID]] = defaultdict(set)
+        for service_id, depends_on_id in edges:
+            self.dependencies[service_id].add(depends_on_id)
+            self.dependents[depends_on_id].add(service_id)
+        self._downstream: dict[uuid.UUID, frozenset[uuid.UUID]] = {}
+
+    def downstream(self, service_id: uuid.UUID) -> frozenset[uuid.UUID]:
+        closure = self._downstream.get(service_id)
+        if closure is None:
+            seen: set[uuid.UUID] = set()
+            queue = deque([service_id])
+            while queue:
+                for dependent in self.dependents.get(queue.popleft(), ()):
+                    if dependent not in seen:
+                        seen.add(dependent)
+                        queue.append(dependent)
+            closure = self._downstream[service_id] = frozenset(seen)
+        return closure
+
+    def creates_cycle(self, service_id: uuid.UUID, depends_on_id: uuid.UUID) -> bool:
+        # The new edge closes a cycle exactly when depends_on_id already depends,
+        # directly or not, on service_id (or is service_id itself).
+        return depends_on_id == service_id or depends_on_id in self.downstream(
+            service_id
+        )
+
+    def propagation_order(self, service_ids: Iterable[uuid.UUID]) -> list[uuid.UUID]:
+        # The given services and everything downstream of them, each after all
+        # of its own dependencies within that set (Kahn's algorithm restricted
+        # to the affected subgraph), so one pass computes every effective status
+        # from already-updated inputs. The rest of the graph is not visited.
+        affected: set[uuid.UUID] = set()
+        for service_id in service_ids:
+            affected.add(service_id)
+            affected |= self.downstream(service_id)
+        pending = {
+            service_id: len(self.dependencies.get(service_id, set()) & affected)
+            for service_id in affected
+        }
+        ready = deque(sorted(s for s, count in pending.items() if count == 0))
+        order = []
+        while ready:
+            service_id = ready.popleft()
+            order.append(service_id)
+            for dependent in sorted(self.dependents.get(service_id, ())):
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+        return order
+
+
+def effective_status(
+    direct: ServiceStatus, dependency_statuses: Iterable[ServiceStatus]
+) -> ServiceStatus:
+    # A service's own incidents decide its status when it has any. Otherwise an
+    # impaired dependency leaves it degraded: it is up, but relying on something
+    # that is not. Dependency outages do not become outages downstream, since
+    # the dependent's own incidents are what say it is actually down.
+    if direct != ServiceStatus.operational:
+        return direct
+    if any(status != ServiceStatus.operational for status in dependency_statuses):
+        return ServiceStatus.degraded
+    return ServiceStatus.operational
+
+
+# The graph of the last database it was loaded from, with the version of the
+# graph it was loaded at. Reloaded only when the version changes, so each
+# status change costs one primary key lookup instead of reading every edge.
+_graph_cache: tuple[uuid.UUID | None, DependencyGraph] | None = None
+
+
+async def load_dependency_graph(session: AsyncSession) -> DependencyGraph:
+    global _graph_cache
+    repo = DependencyRepository(session)
+    # Read before the edges, as for the maintenance schedule.
+    version = await repo.get_version()
+    if _graph_cache is None or _graph_cache[0] != version:
+        _graph_cache = (version, DependencyGraph(await repo.get_edges()))
+    return _graph_cache[1]
+
+
+async def propagate_effective_status(
+    session: AsyncSession, service_ids: Sequence[uuid.UUID]
+) -> None:
+    # Called when the direct status of these services may have changed, or when
+    # their dependencies were edited. Recomputes effective statuses for them and
+    # their downstream closure only, reading the stored effective status of any
+    # dependency outside it, and writes the ones that changed. The caller
+    # commits them.
+    if not service_ids:
+        return
+    # Every write that propagates records changes, so on PostgreSQL it holds the
+    # change feed lock until commit anyway. Taken before the stored statuses
+    # are read, it also stops two propagations computing from the same reads
+    # and overwriting each other's result.
+    await ChangeRepository(session).lock()
+    graph = await load_dependency_graph(session)
+    order = graph.propagation_order(service_ids)
+    repo = DependencyRepository(session)
+    severities = await ServiceStatusRepository(session).get_active_severities(order)
+    inputs = {
+        depends_on_id
+        for service_id in order
+        for depends_on_id in graph.dependencies.get(service_id, ())
+    }
+    stored = await repo.get_effective_statuses(list(inputs | set(order)))
+    effective = dict(stored)
+    for service_id in order:
+        # A service deleted since the graph was loaded has nothing to update.
+        if service_id not in stored:
+            continue
+        effective[service_id] = effective_status(
+            status_for_severities(severities[service_id]),
+            (
+                effective[d]
+                for d in graph.dependencies.get(service_id, ())
+                if d in effective
+            ),
+        )
+    changed = [s for s in order if s in stored and effective[s] != stored[s]]
+    await apply_member_status_changes(
+        session, {s: (stored[s], effective[s]) for s in changed}
+    )
+    await repo.set_effective_statuses({s: effective[s] for s in changed})
+
+
+async def _ensure_services_exist(
+    repo: DependencyRepository, service_ids: Sequence[uuid.UUID]
+) -> None:
+    found = await repo.get_effective_statuses(service_ids)
+    for service_id in service_ids:
+        if service_id not in found:
+            raise NotFoundError(f"Service with id '{service_id}' does not exist.")
+
+
+async def list_dependencies(
+    session: AsyncSession, service_id: uuid.UUID
+) -> ServiceListResponse:
+    repo = DependencyRepository(session)
+    await _ensure_services_exist(repo, [service_id])
+    graph = await load_dependency_graph(session)
+    services = await repo.get_services(list(graph.dependencies.get(service_id, ())))
+    return ServiceListResponse(
+        data=await build_service_responses(session, services),
+        meta={"total": len(services)},
+    )
+
+
+async def add_dependency(
+    session: AsyncSession, service_id: uuid.UUID, depends_on_id: uuid.UUID
+) -> ServiceListResponse:
+    repo = DependencyRepository(session)
+    await _ensure_services_exist(repo, [service_id, depends_on_id])
+    # The lock is held until the commit below, so the graph checked here is
+    # the one the edge is added to. The edge commits with the effective
+    # statuses it changes: a failed propagation leaves neither behind.
+    await repo.lock()
+    if await repo.exists(service_id, depends_on_id):
+        await session.rollback()
+        raise ConflictError(
+            f"Service '{service_id}' already depends on service '{depends_on_id}'."
+        )
+    if (await load_dependency_graph(session)).creates_cycle(service_id, depends_on_id):
+        await session.rollback()
+        raise ConflictError(
+            f"Service '{service_id}' cannot depend on service '{depends_on_id}': "
+            "it would create a dependency cycle."
+        )
+    await repo.add(service_id, depends_on_id, datetime.now(UTC))
+    await propagate_effective_status(session, [service_id])
+    await session.commit()
+    return await list_dependencies(session, service_id)
+
+
+async def remove_dependency(
+    session: AsyncSession, service_id: uuid.UUID, depends_on_id: uuid.UUID
+) -> None:
+    repo = DependencyRepository(session)
+    if not await repo.exists(service_id, depends_on_id):
+        raise NotFoundError(
+            f"Service '{service_id}' does not depend on service '{depends_on_id}'."
+        )
+    await repo.remove(service_id, depends_on_id)
+    await propagate_effective_status(session, [service_id])
+    await session.commit()
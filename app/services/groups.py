@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import uuid
+from collections import Counter
+from collections.abc import Mapping
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ConflictError, NotFoundError
+from app.db.repositories.dependencies import DependencyRepository
+from app.db.repositories.groups import GroupRepository, status_counts
+from app.models.enums import ServiceStatus
+from app.models.orm.service_group import ServiceGroup
+from app.models.schemas.groups import ServiceGroupListResponse, ServiceGroupResponse
+from app.models.schemas.services import ServiceListResponse
+from app.services.services import build_service_responses
+
+
+def rollup_status(degraded_count: int, outage_count: int) -> ServiceStatus:
+    # The worst status among a group's services, from its stored counters.
+    if outage_count > 0:
+        return ServiceStatus.outage
+    if degraded_count > 0:
+        return ServiceStatus.degraded
+    return ServiceStatus.operational
+
+
+def build_group_response(group: ServiceGroup) -> ServiceGroupResponse:
+    return ServiceGroupResponse(
+        id=group.id,
+        name=group.name,
+        description=group.description,
+        parent_id=group.parent_id,
+        status=rollup_status(group.degraded_count, group.outage_count),
+        service_count=group.service_count,
+        degraded_count=group.degraded_count,
+        outage_count=group.outage_count,
+        created_at=group.created_at,
+        updated_at=group.updated_at,
+    )
+
+
+async def apply_member_status_changes(
+    session: AsyncSession,
+    changes: Mapping[uuid.UUID, tuple[ServiceStatus, ServiceStatus]],
+) -> None:
+    # Called with each service whose effective status moves from the first to
+    # the second status, before that change is committed. Adjusts the counters
+    # of the service's group and its ancestors in the same transaction, one
+    # UPDATE per affected group however deep the tree is.
+    repo = GroupRepository(session)
+    groups = await repo.get_groups_of(list(changes))
+    deltas: dict[uuid.UUID, Counter[str]] = {}
+    for service_id, group_id in groups.items():
+        old, new = changes[service_id]
+        (old_degraded, old_outage), (new_degraded, new_outage) = (
+            status_counts(old),
+            status_counts(new),
+        )
+        delta = deltas.setdefault(group_id, Counter())
+        delta["degraded"] += new_degraded - old_degraded
+        delta["outage"] += new_outage - old_outage
+    for group_id, delta in deltas.items():
+        await repo.adjust_counts(group_id, 0, delta["degraded"], delta["outage"])
+
+
+async def list_groups(session: AsyncSession) -> ServiceGroupListResponse:
+    groups = await GroupRepository(session).get_all()
+    return ServiceGroupListResponse(
+        data=[build_group_response(g) for g in groups],
+        meta={"total": len(groups)},
+    )
+
+
+async def get_group(session: AsyncSession, group_id: uuid.UUID) -> ServiceGroupResponse:
+    group = await GroupRepository(session).get_by_id(group_id)
+    return build_group_response(group)
+
+
+async def create_group(
+    session: AsyncSession,
+    name: str,
+    description: str | None = None,
+    parent_id: uuid.UUID | None = None,
+) -> ServiceGroupResponse:
+    repo = GroupRepository(session)
+    if parent_id is not None:
+        await repo.get_by_id(parent_id)
+    group = await repo.create(name=name, description=description, parent_id=parent_id)
+    return build_group_response(group)
+
+
+async def update_group(
+    session: AsyncSession,
+    group_id: uuid.UUID,
+    name: str | None = None,
+    description: str | None = None,
+    parent_id: uuid.UUID | None = None,
+    move: bool = False,
+) -> ServiceGroupResponse:
+    # `move` distinguishes "parent_id: null" (move to the top level) from
+    # parent_id being left out of the request.
+    repo = GroupRepository(session)
+    group = await repo.get_by_id(group_id)
+    if move and parent_id != group.parent_id:
+        if parent_id is not None:
+            await repo.get_by_id(parent_id)
+            if await repo.is_within(parent_id, group_id):
+                raise ConflictError(
+                    f"Group '{group.name}' cannot be moved under itself or one "
+                    "of its own subgroups."
+                )
+        await repo.move(group, parent_id)
+    group = await repo.update(group, name=name, description=description)
+    return build_group_response(group)
+
+
+async def delete_group(session: AsyncSession, group_id: uuid.UUID) -> None:
+    repo = GroupRepository(session)
+    group = await repo.get_by_id(group_id)
+    # Only empty groups are deleted, so no service is silently ungrouped and no
+    # subgroup is left without its parent.
+    if await repo.has_children(group_id) or await repo.has_services(group_id):
+        raise ConflictError(
+            f"Group '{group.name}' still has subgroups or services and cannot be "
+            "deleted."
+        )
+    await repo.delete(group)
+
+
+async def list_group_services(
+    session: AsyncSession, group_id: uuid.UUID
+) -> ServiceListResponse:
+    repo = GroupRepository(session)
+    await repo.get_by_id(group_id)
+    services = await repo.get_services(group_id)
+    return ServiceListResponse(
+        data=await build_service_responses(session, services),
+        meta={"total": len(services)},
+    )
+
+
+async def _set_service_group(
+    session: AsyncSession, service_id: uuid.UUID, group_id: uuid.UUID | None
+) -> None:
+    # Moves the service's contribution from its current group's counters (if
+    # any) to the new group's (if any), committed with the membership change.
+    repo = GroupRepository(session)
+    statuses = await DependencyRepository(session).get_effective_statuses([service_id])
+    if service_id not in statuses:
+        raise NotFoundError(f"Service with id '{service_id}' does not exist.")
+    degraded, outage = status_counts(statuses[service_id])
+    current = (await repo.get_groups_of([service_id])).get(service_id)
+    if current == group_id:
+        return
+    if current is not None:
+        await repo.adjust_counts(current, -1, -degraded, -outage)
+    if group_id is not None:
+        await repo.adjust_counts(group_id, 1, degraded, outage)
+    await repo.set_member(service_id, group_id)
+
+
+async def add_group_service(
+    session: AsyncSession, group_id: uuid.UUID, service_id: uuid.UUID
+) -> ServiceGroupResponse:
+    repo = GroupRepository(session)
+    await repo.get_by_id(group_id)
+    await _set_service_group(session, service_id, group_id)
+    return build_group_response(await repo.get_by_id(group_id))
+
+
+async def remove_group_service(
+    session: AsyncSession, group_id: uuid.UUID, service_id: uuid.UUID
+) -> None:
+    repo = GroupRepository(session)
+    await repo.get_by_id(group_id)
+    if (await repo.get_groups_of([service_id])).get(service_id) != group_id:
+        raise NotFoundError(
+            f"Service '{service_id}' is not a member of group '{group_id}'."
+        )
+    await _set_service_group(session, service_id, None)
+
+
+async def rebuild_group_counts(session: AsyncSession) -> None:
+    await GroupRepository(session).rebuild_counts()
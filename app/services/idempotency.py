@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import ConflictError
+from app.core.metrics import idempotent_replays_total
+from app.db.repositories.base import as_utc
+from app.db.repositories.idempotency import IdempotencyRepository
+
+# Set on responses replayed from an earlier request.
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# How often a repeat polls for the response of a first attempt running in
+# another process.
+POLL_INTERVAL = 0.05
+
+# session.info entry naming the key claimed for the write running in the
+# session, until store_response() has stored its response.
+_CLAIMED_KEY = "idempotency_key"
+
+# Requests running in this process, by key, with their fingerprint. Repeats
+# arriving meanwhile wait on the future, which holds the response as stored,
+# or None if the request failed.
+_flights: dict[str, tuple[str, asyncio.Future[dict[str, Any] | None]]] = {}
+
+
+def request_fingerprint(endpoint: str, payload: BaseModel) -> str:
+    return hashlib.sha256(
+        f"{endpoint}\n{payload.model_dump_json()}".encode()
+    ).hexdigest()
+
+
+def _mismatch(key: str) -> ConflictError:
+    return ConflictError(
+        f"Idempotency-Key '{key}' was already used for a different request."
+    )
+
+
+async def run_idempotent(
+    session: AsyncSession,
+    key: str | None,
+    fingerprint: str,
+    write: Callable[[], Awaitable[BaseModel]],
+) -> tuple[dict[str, Any], bool]:
+    # Runs write() once per key: repeats of the request get the first one's
+    # response back instead, and the flag returned is True for them. Only
+    # successes are stored; a write that failed without committing frees the
+    # key for a retry. The response is returned as stored, so the first one
+    # and its replays are built alike.
+    if key is None:
+        return (await write()).model_dump(mode="json"), False
+    running = _flights.get(key)
+    if running is not None:
+        if running[0] != fingerprint:
+            raise _mismatch(key)
+        # Shielded: a repeat that goes away must not cancel the first request.
+        shared = await asyncio.shield(running[1])
+        if shared is None:
+            return await run_idempotent(session, key, fingerprint, write)
+        idempotent_replays_total.labels(source="flight").inc()
+        return shared, True
+
+    flight: asyncio.Future[dict[str, Any] | None] = (
+        asyncio.get_running_loop().create_future()
+    )
+    _flights[key] = (fingerprint, flight)
+    try:
+        response, replayed = await _run_once(session, key, fingerprint, write)
+    except BaseException:
+        del _flights[key]
+        flight.set_result(None)
+        raise
+    del _flights[key]
+    flight.set_result(response)
+    return response, replayed
+
+
+async def _run_once(
+    session: AsyncSession,
+    key: str,
+    fingerprint: str,
+    write: Callable[[], Awaitable[BaseModel]],
+) -> tuple[dict[str, Any], bool]:
+    repo = IdempotencyRepository(session)
+    ttl = timedelta(hours=settings.idempotency_key_ttl_hours)
+    lease = timedelta(seconds=settings.idempotency_lease_seconds)
+    give_up = time.monotonic() + settings.idempotency_wait_seconds
+    while True:
+        claimed_at = datetime.now(UTC)
+        if await repo.claim(key, fingerprint, claimed_at):
+            break
+        record = await repo.get(key)
+        if record is None:
+            continue
+        age = claimed_at - as_utc(record.created_at)
+        # Expired keys, and claims left behind by a process that died
+        # mid-request, are cleared for this request to claim.
+        if age >= ttl or (record.response is None and age >= lease):
+            await repo.release(key, record.created_at)
+            continue
+        if record.fingerprint != fingerprint:
+            raise _mismatch(key)
+        if record.response is not None:
+            idempotent_replays_total.labels(source="stored").inc()
+            return record.response, True
+        if time.monotonic() >= give_up:
+            raise ConflictError(
+                f"A request with Idempotency-Key '{key}' is still in progress."
+            )
+        await asyncio.sleep(POLL_INTERVAL)
+
+    session.info[_CLAIMED_KEY] = key
+    try:
+        response = (await write()).model_dump(mode="json")
+    except Exception:
+        # A write that calls store_response() commits its response with its
+        # rows, so a stored response means only a step after the commit
+        # failed: the key is kept for retries to replay. A cancelled request
+        # keeps its claim until the lease runs out, as its write may have
+        # committed.
+        await session.rollback()
+        record = await repo.get(key)
+        if record is not None and record.response is None:
+            await repo.release(key, claimed_at)
+        raise
+    finally:
+        stored = session.info.pop(_CLAIMED_KEY, None) is None
+    if not stored:
+        # For writes that do not call store_response(): stored afterwards.
+        await repo.complete(key, response, datetime.now(UTC))
+        await session.commit()
+    return response, False
+
+
+async def store_response(session: AsyncSession, response: BaseModel) -> None:
+    # Called by idempotent writes just before their commit, so the response
+    # commits with the rows it describes. A no-op outside run_idempotent().
+    key = session.info.pop(_CLAIMED_KEY, None)
+    if key is not None:
+        await IdempotencyRepository(session).complete(
+            key, response.model_dump(mode="json"), datetime.now(UTC)
+        )
+
+
+async def expire_idempotency_keys(session: AsyncSession, batch_size: int) -> int:
+    # Keys past their TTL are never replayed again. Batches commit separately,
+    # like change feed compaction, so locks are held briefly.
+    repo = IdempotencyRepository(session)
+    cutoff = datetime.now(UTC) - timedelta(hours=settings.idempotency_key_ttl_hours)
+    expired = 0
+    while (removed := await repo.delete_expired(cutoff, batch_size)) > 0:
+        expired += removed
+    return expired
@@ -1,29 +1,66 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.exceptions import ConflictError
+from app.core.exceptions import ConflictError, NotFoundError
 from app.core.metrics import active_incidents_total
+from app.db.repositories.analytics import AnalyticsRepository
+from app.db.repositories.archive import ArchiveRepository
+from app.db.repositories.base import as_utc
+from app.db.repositories.incident_search import IncidentSearchRepository
 from app.db.repositories.incident_updates import IncidentUpdateRepository
 from app.db.repositories.incidents import IncidentRepository
-from app.models.enums import IncidentSeverity, IncidentStatus
-from app.models.orm.incident import Incident
-from app.models.schemas.incidents import IncidentResponse, IncidentUpdateResponse
+from app.models.enums import (
+    IncidentSeverity,
+    IncidentSort,
+    IncidentStatus,
+    ServiceMatch,
+    WebhookEventType,
+)
+from app.models.orm.archive import ArchivedIncident
+from app.models.orm.incident import SEVERITY_RANK, Incident
+from app.models.schemas.incidents import (
+    IncidentListResponse,
+    IncidentResponse,
+    IncidentSearchResponse,
+    IncidentSearchResult,
+    IncidentUpdateListResponse,
+    IncidentUpdateResponse,
+)
+from app.services.idempotency import store_response
+from app.services.service_status import record_status_changes
+from app.services.webhooks import enqueue_event, has_subscribers
+
+if TYPE_CHECKING:
+    from app.models.orm.archive import ArchivedIncidentUpdate
+    from app.models.orm.incident_update import IncidentUpdate
 
 
 async def _sync_incident_metrics(session: AsyncSession) -> None:
-    # Re-query the full incident list and recompute gauges from scratch.
-    # This is simpler than tracking incremental changes and guarantees the
-    # gauges can never drift out of sync after any create/update/resolve operation.
-    repo = IncidentRepository(session)
-    all_incidents = await repo.get_all()
-    active = [i for i in all_incidents if i.status != IncidentStatus.resolved]
-
+    # Recompute the gauges from the database after every write rather than
+    # tracking increments, so they can never drift. One grouped count, whose
+    # cost does not grow with the incident history.
+    counts = await IncidentRepository(session).count_active_by_severity()
     for severity in IncidentSeverity:
-        count = sum(1 for i in active if i.severity == severity)
-        active_incidents_total.labels(severity=severity.value).set(count)
+        active_incidents_total.labels(severity=severity.value).set(
+            counts.get(severity, 0)
+        )
+
+
+async def _record_resolution(session: AsyncSession, incident: Incident) -> None:
+    # resolve() stamps resolved_at and updated_at in the same flush.
+    await record_status_changes(
+        session,
+        [s.id for s in incident.services],
+        incident.resolved_at or incident.updated_at,
+        incident.id,
+    )
 
 
 # Maps each status to the set of statuses it can legally transition to.
@@ -49,7 +86,22 @@ def validate_status_transition(
         )
 
 
-def build_incident_response(incident: Incident) -> IncidentResponse:
+def build_incident_update_response(
+    update: IncidentUpdate | ArchivedIncidentUpdate | Row[Any],
+) -> IncidentUpdateResponse:
+    return IncidentUpdateResponse(
+        id=update.id,
+        incident_id=update.incident_id,
+        sequence=update.sequence,
+        message=update.message,
+        status=update.status,
+        created_at=update.created_at,
+    )
+
+
+def build_incident_response(
+    incident: Incident | ArchivedIncident,
+) -> IncidentResponse:
     return IncidentResponse(
         id=incident.id,
         title=incident.title,
@@ -60,32 +112,116 @@ def build_incident_response(incident: Incident) -> IncidentResponse:
         created_at=incident.created_at,
         updated_at=incident.updated_at,
         resolved_at=incident.resolved_at,
-        updates=[
-            IncidentUpdateResponse(
-                id=u.id,
-                incident_id=u.incident_id,
-                message=u.message,
-                status=u.status,
-                created_at=u.created_at,
-            )
-            for u in incident.updates
-        ],
+        updates=[build_incident_update_response(u) for u in incident.updates],
     )
 
 
 async def list_incidents(
     session: AsyncSession,
-    status: IncidentStatus | None = None,
-    severity: IncidentSeverity | None = None,
-    service_id: uuid.UUID | None = None,
+    statuses: Sequence[IncidentStatus] | None = None,
+    severities: Sequence[IncidentSeverity] | None = None,
+    service_ids: Sequence[uuid.UUID] | None = None,
+    service_match: ServiceMatch = ServiceMatch.any,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    resolved_after: datetime | None = None,
+    active: bool | None = None,
+    active_during: tuple[datetime, datetime] | None = None,
+    sort: IncidentSort = IncidentSort.recent,
+    include_archived: bool = False,
 ) -> list[IncidentResponse]:
-    repo = IncidentRepository(session)
-    incidents = await repo.get_all(
-        status=status,
-        severity=severity,
-        service_id=service_id,
+    rows = await IncidentRepository(session).get_all_rows(
+        statuses=statuses,
+        severities=severities,
+        service_ids=service_ids,
+        service_match=service_match,
+        created_after=created_after,
+        created_before=created_before,
+        resolved_after=resolved_after,
+        active=active,
+        active_during=active_during,
+        sort=sort,
+    )
+    incidents = [
+        IncidentResponse(
+            id=row.id,
+            title=row.title,
+            body=row.body,
+            severity=row.severity,
+            status=row.status,
+            service_ids=rows.service_ids.get(row.id, []),
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            resolved_at=row.resolved_at,
+            updates=[
+                build_incident_update_response(u) for u in rows.updates.get(row.id, [])
+            ],
+        )
+        for row in rows.incidents
+    ]
+    # Every archived incident is resolved, so the archive is skipped entirely
+    # when the status filters exclude resolved incidents.
+    wants_resolved = active is not True and (
+        not statuses or IncidentStatus.resolved in statuses
+    )
+    if include_archived and wants_resolved:
+        archived = await ArchiveRepository(session).get_all(
+            severities=severities,
+            service_ids=service_ids,
+            service_match=service_match,
+            created_after=created_after,
+            created_before=created_before,
+            resolved_after=resolved_after,
+            active_during=active_during,
+        )
+        incidents += [build_incident_response(i) for i in archived]
+        _sort_incidents(incidents, sort)
+    return incidents
+
+
+def _sort_incidents(incidents: list[IncidentResponse], sort: IncidentSort) -> None:
+    # Applies the list sort orders in Python to live and archived incidents
+    # merged together; Python's sort is stable, so secondary keys sort first.
+    incidents.sort(
+        key=lambda i: as_utc(i.created_at), reverse=sort != IncidentSort.oldest
+    )
+    if sort == IncidentSort.severity:
+        incidents.sort(key=lambda i: SEVERITY_RANK[i.severity])
+
+
+async def lookup_incidents(
+    session: AsyncSession, incident_ids: Sequence[uuid.UUID]
+) -> IncidentListResponse:
+    # A fixed number of IN queries however many IDs are asked for: live
+    # incidents first, then the archive for any not found there, as with
+    # get_incident. Results follow the order of the request.
+    requested = list(dict.fromkeys(incident_ids))
+    incidents: dict[uuid.UUID, Incident | ArchivedIncident] = {}
+    incidents.update(await IncidentRepository(session).get_many(requested))
+    remaining = [i for i in requested if i not in incidents]
+    if remaining:
+        incidents.update(await ArchiveRepository(session).get_many(remaining))
+    return IncidentListResponse(
+        data=[
+            build_incident_response(incidents[i]) for i in requested if i in incidents
+        ],
+        meta={"total": len(incidents), "missing": len(requested) - len(incidents)},
+        missing=[i for i in requested if i not in incidents],
+    )
+
+
+async def search_incidents(
+    session: AsyncSession,
+    query: str,
+    limit: int = 20,
+    offset: int = 0,
+) -> IncidentSearchResponse:
+    repo = IncidentSearchRepository(session)
+    hits, total = await repo.search(query=query, limit=limit, offset=offset)
+    return IncidentSearchResponse(
+        data=[IncidentSearchResult(**hit._asdict()) for hit in hits],
+        meta={"total": total, "limit": limit, "offset": offset},
     )
-    return [build_incident_response(i) for i in incidents]
 
 
 async def create_incident(
@@ -94,16 +230,31 @@ async def create_incident(
     severity: IncidentSeverity,
     service_ids: list[uuid.UUID],
     body: str | None = None,
+    incident_id: uuid.UUID | None = None,
 ) -> IncidentResponse:
+    # incident_id is for callers that must record the ID before the incident
+    # exists, as alert ingestion does; it is generated otherwise.
     repo = IncidentRepository(session)
     incident = await repo.create(
         title=title,
         severity=severity,
         service_ids=service_ids,
         body=body,
+        incident_id=incident_id,
+    )
+    # Queued first, so receivers get incident.opened before the service status
+    # changes it causes. The event, rollups and status log commit with the
+    # incident: a failure anywhere leaves none of them behind.
+    response = build_incident_response(incident)
+    await enqueue_event(session, WebhookEventType.incident_opened, response)
+    await AnalyticsRepository(session).record_opened(incident.id)
+    await record_status_changes(
+        session, [s.id for s in incident.services], incident.created_at, incident.id
     )
+    await store_response(session, response)
+    await session.commit()
     await _sync_incident_metrics(session)
-    return build_incident_response(incident)
+    return response
 
 
 async def get_incident(
@@ -111,7 +262,15 @@ async def get_incident(
     incident_id: uuid.UUID,
 ) -> IncidentResponse:
     repo = IncidentRepository(session)
-    incident = await repo.get_by_id(incident_id)
+    try:
+        incident = await repo.get_by_id(incident_id)
+    except NotFoundError:
+        # Archived incidents stay readable by ID; they are read-only, so every
+        # other endpoint keeps answering 404 for them.
+        archived = await ArchiveRepository(session).get_by_id(incident_id)
+        if archived is None:
+            raise
+        return build_incident_response(archived)
     return build_incident_response(incident)
 
 
@@ -132,7 +291,13 @@ async def update_incident(
         # resolved_at is stamped correctly, even without calling /resolve directly.
         if status == IncidentStatus.resolved:
             incident = await repo.resolve(incident_id)
-            return build_incident_response(incident)
+            await AnalyticsRepository(session).record_resolved(incident_id)
+            await _record_resolution(session, incident)
+            response = build_incident_response(incident)
+            await enqueue_event(session, WebhookEventType.incident_resolved, response)
+            await session.commit()
+            await _sync_incident_metrics(session)
+            return response
 
     incident = await repo.update(
         incident_id=incident_id,
@@ -141,8 +306,20 @@ async def update_incident(
         severity=severity,
         status=status,
     )
+    # Only a severity change can move the services' status; other statuses
+    # than "resolved" all count as active.
+    if severity is not None:
+        await record_status_changes(
+            session,
+            [s.id for s in incident.services],
+            incident.updated_at,
+            incident.id,
+        )
+    response = build_incident_response(incident)
+    await enqueue_event(session, WebhookEventType.incident_updated, response)
+    await session.commit()
     await _sync_incident_metrics(session)
-    return build_incident_response(incident)
+    return response
 
 
 async def append_incident_update(
@@ -157,12 +334,45 @@ async def append_incident_update(
         message=message,
         status=status,
     )
-    return IncidentUpdateResponse(
-        id=update.id,
-        incident_id=update.incident_id,
-        message=update.message,
-        status=update.status,
-        created_at=update.created_at,
+    # The event carries the whole incident, which costs a reload, so it is
+    # only built when some endpoint is subscribed.
+    if await has_subscribers(session, WebhookEventType.incident_updated):
+        incident = await IncidentRepository(session).get_by_id(incident_id)
+        await enqueue_event(
+            session,
+            WebhookEventType.incident_updated,
+            build_incident_response(incident),
+        )
+    response = build_incident_update_response(update)
+    await store_response(session, response)
+    await session.commit()
+    return response
+
+
+async def list_incident_updates(
+    session: AsyncSession,
+    incident_id: uuid.UUID,
+    since: int | None = None,
+    limit: int = 50,
+) -> IncidentUpdateListResponse:
+    repo = IncidentUpdateRepository(session)
+    updates, latest_sequence = await repo.get_page(
+        incident_id=incident_id,
+        since=since,
+        limit=limit,
+    )
+    last_seen = updates[-1].sequence if updates else since
+    return IncidentUpdateListResponse(
+        data=[build_incident_update_response(u) for u in updates],
+        meta={
+            "count": len(updates),
+            "latest_sequence": latest_sequence,
+            "next_cursor": (
+                last_seen
+                if last_seen is not None and last_seen < latest_sequence
+                else None
+            ),
+        },
     )
 
 
@@ -184,13 +394,20 @@ async def resolve_incident(
 
     final_update = IncidentUpdateORM(
         incident_id=incident_id,
+        sequence=await IncidentUpdateRepository(session).next_sequence(incident_id),
         message="Incident resolved.",
         status=IncidentStatus.resolved,
     )
     session.add(final_update)
-    await session.commit()
+    await session.flush()
 
-    await _sync_incident_metrics(session)
+    # Fold the finished timeline into the analytics rollups while it is hot.
+    await AnalyticsRepository(session).record_resolved(incident_id)
+    await _record_resolution(session, incident)
 
     incident = await repo.get_by_id(incident_id)
-    return build_incident_response(incident)
+    response = build_incident_response(incident)
+    await enqueue_event(session, WebhookEventType.incident_resolved, response)
+    await session.commit()
+    await _sync_incident_metrics(session)
+    return response
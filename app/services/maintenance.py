@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import uuid
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.base import as_utc
+from app.db.repositories.maintenance import MaintenanceRepository
+from app.db.repositories.uptime import UptimeRepository
+from app.models.orm.maintenance import MaintenanceWindow
+from app.models.schemas.maintenance import (
+    MaintenanceWindowListResponse,
+    MaintenanceWindowResponse,
+)
+
+
+class MaintenanceSchedule:
+    # Immutable per-service maintenance intervals, as POSIX seconds, merged
+    # where windows overlap or touch and sorted by start. Answering "is this
+    # service under maintenance at T?" is then one bisect over the service's
+    # starts. Creating or cancelling a window builds a new schedule.
+    def __init__(
+        self, intervals: Iterable[tuple[uuid.UUID, datetime, datetime]]
+    ) -> None:
+        spans: dict[uuid.UUID, list[tuple[float, float]]] = defaultdict(list)
+        for service_id, starts_at, ends_at in intervals:
+            spans[service_id].append((starts_at.timestamp(), ends_at.timestamp()))
+        self._intervals: dict[uuid.UUID, list[tuple[float, float]]] = {}
+        self._starts: dict[uuid.UUID, list[float]] = {}
+        for service_id, service_spans in spans.items():
+            merged: list[tuple[float, float]] = []
+            for start, end in sorted(service_spans):
+                if merged and start <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+                else:
+                    merged.append((start, end))
+            self._intervals[service_id] = merged
+            self._starts[service_id] = [start for start, _ in merged]
+
+    def covers(self, service_id: uuid.UUID, at: datetime) -> bool:
+        starts = self._starts.get(service_id)
+        if starts is None:
+            return False
+        moment = at.timestamp()
+        index = bisect_right(starts, moment) - 1
+        return index >= 0 and moment < self._intervals[service_id][index][1]
+
+    def by_service(self) -> dict[uuid.UUID, list[tuple[float, float]]]:
+        return self._intervals
+
+
+# The schedule of the last database it was loaded from, with the version of
+# the schedule it was loaded at, as for the dependency graph: status
+# derivation runs on every read, and costs one primary key lookup here instead
+# of reading every window.
+_schedule_cache: tuple[uuid.UUID | None, MaintenanceSchedule] | None = None
+
+
+async def load_maintenance_schedule(session: AsyncSession) -> MaintenanceSchedule:
+    global _schedule_cache
+    repo = MaintenanceRepository(session)
+    # Read before the windows: a write landing in between leaves a newer
+    # schedule under the older version, which is only reloaded once more.
+    version = await repo.get_version()
+    if _schedule_cache is None or _schedule_cache[0] != version:
+        _schedule_cache = (version, MaintenanceSchedule(await repo.get_intervals()))
+    return _schedule_cache[1]
+
+
+async def services_in_maintenance(
+    session: AsyncSession, service_ids: Iterable[uuid.UUID]
+) -> set[uuid.UUID]:
+    # Those of the given services under maintenance right now.
+    schedule = await load_maintenance_schedule(session)
+    now = datetime.now(UTC)
+    return {s for s in service_ids if schedule.covers(s, now)}
+
+
+def _build_response(
+    window: MaintenanceWindow, service_ids: list[uuid.UUID]
+) -> MaintenanceWindowResponse:
+    return MaintenanceWindowResponse(
+        id=window.id,
+        title=window.title,
+        description=window.description,
+        starts_at=as_utc(window.starts_at),
+        ends_at=as_utc(window.ends_at),
+        service_ids=service_ids,
+        created_at=window.created_at,
+    )
+
+
+async def _invalidate_closed_days(
+    session: AsyncSession,
+    service_ids: Sequence[uuid.UUID],
+    starts_at: datetime,
+    ends_at: datetime,
+) -> None:
+    # Stored daily availability the window overlaps is recomputed on the next
+    # report; today is never stored, so only closed days are cleared.
+    starts_at, ends_at = as_utc(starts_at), as_utc(ends_at)
+    yesterday = datetime.now(UTC).date() - timedelta(days=1)
+    last_day = min(ends_at.date(), yesterday)
+    if starts_at.date() <= last_day:
+        await UptimeRepository(session).delete_daily(
+            service_ids, starts_at.date(), last_day
+        )
+
+
+async def list_maintenance_windows(
+    session: AsyncSession,
+    service_id: uuid.UUID | None = None,
+    include_past: bool = False,
+) -> MaintenanceWindowListResponse:
+    ends_after = None if include_past else datetime.now(UTC)
+    repo = MaintenanceRepository(session)
+    windows = await repo.get_all(service_id=service_id, ends_after=ends_after)
+    service_ids = await repo.get_service_ids([w.id for w in windows])
+    return MaintenanceWindowListResponse(
+        data=[_build_response(w, service_ids.get(w.id, [])) for w in windows],
+        meta={"total": len(windows)},
+    )
+
+
+async def get_maintenance_window(
+    session: AsyncSession, window_id: uuid.UUID
+) -> MaintenanceWindowResponse:
+    repo = MaintenanceRepository(session)
+    window = await repo.get_by_id(window_id)
+    service_ids = await repo.get_service_ids([window.id])
+    return _build_response(window, service_ids.get(window.id, []))
+
+
+async def create_maintenance_window(
+    session: AsyncSession,
+    title: str,
+    starts_at: datetime,
+    ends_at: datetime,
+    service_ids: Sequence[uuid.UUID],
+    description: str | None = None,
+) -> MaintenanceWindowResponse:
+    service_ids = list(dict.fromkeys(service_ids))
+    window = await MaintenanceRepository(session).create(
+        title=title,
+        starts_at=starts_at,
+        ends_at=ends_at,
+        service_ids=service_ids,
+        description=description,
+    )
+    await _invalidate_closed_days(session, service_ids, starts_at, ends_at)
+    await session.commit()
+    await session.refresh(window)
+    return _build_response(window, sorted(service_ids))
+
+
+async def delete_maintenance_window(
+    session: AsyncSession, window_id: uuid.UUID
+) -> None:
+    repo = MaintenanceRepository(session)
+    window = await repo.get_by_id(window_id)
+    service_ids = (await repo.get_service_ids([window_id])).get(window_id, [])
+    await _invalidate_closed_days(
+        session, service_ids, window.starts_at, window.ends_at
+    )
+    await repo.delete(window)
+    await session.commit()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import UTC, date, datetime, timedelta
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.partitions import PartitionRepository
+
+
+class PartitionPlan(NamedTuple):
+    create: list[date]
+    expired: list[date]
+
+
+class PartitionMaintenance(NamedTuple):
+    created: list[date]
+    dropped: list[date]
+    # Expired partitions still holding updates of incidents not yet archived.
+    retained: list[date]
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def plan_partitions(
+    existing: Collection[date], today: date, months_ahead: int, retention_days: int
+) -> PartitionPlan:
+    # Partitions are wanted for the current month and `months_ahead` after it.
+    # A partition has expired once its whole month is older than the retention
+    # period, i.e. its exclusive upper bound is on or before the cutoff.
+    current = today.replace(day=1)
+    wanted = [add_months(current, n) for n in range(months_ahead + 1)]
+    cutoff = today - timedelta(days=retention_days)
+    return PartitionPlan(
+        create=[month for month in wanted if month not in existing],
+        expired=[month for month in sorted(existing) if add_months(month, 1) <= cutoff],
+    )
+
+
+async def maintain_incident_update_partitions(
+    session: AsyncSession, months_ahead: int, retention_days: int
+) -> PartitionMaintenance | None:
+    # Returns None when incident_updates is not partitioned (SQLite, or a
+    # PostgreSQL database migrated without the opt-in flag).
+    repo = PartitionRepository(session)
+    if not await repo.is_partitioned():
+        return None
+    plan = plan_partitions(
+        await repo.get_months(),
+        datetime.now(UTC).date(),
+        months_ahead,
+        retention_days,
+    )
+    created = [month for month in plan.create if await repo.create(month)]
+
+    # Retention uses the same period as incident archival: archiving removes an
+    # old incident's updates, after which its months' partitions are empty and
+    # are dropped whole instead of vacuumed. A partition is never dropped while
+    # it still holds updates, which belong to incidents that are still live.
+    dropped, retained = [], []
+    for month in plan.expired:
+        if await repo.has_rows(month):
+            retained.append(month)
+        else:
+            await repo.drop(month)
+            dropped.append(month)
+    return PartitionMaintenance(created, dropped, retained)
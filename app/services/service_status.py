@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from itertools import groupby
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import NotFoundError
+from app.db.repositories.archive import ArchiveRepository
+from app.db.repositories.base import as_utc
+from app.db.repositories.service_status import ServiceStatusRepository
+from app.db.repositories.uptime import ImpactRow, UptimeRepository
+from app.models.enums import IncidentSeverity, ServiceStatus, WebhookEventType
+from app.models.orm.service_status_change import ServiceStatusChange
+from app.models.schemas.services import (
+    ServiceStatusAtResponse,
+    ServiceStatusChangeResponse,
+    ServiceStatusHistoryResponse,
+)
+from app.models.schemas.webhooks import ServiceStatusChangedEvent
+from app.services.dependencies import propagate_effective_status
+from app.services.groups import rebuild_group_counts
+from app.services.services import status_for_severities
+from app.services.webhooks import enqueue_events
+
+
+async def record_status_changes(
+    session: AsyncSession,
+    service_ids: Sequence[uuid.UUID],
+    at: datetime,
+    incident_id: uuid.UUID | None = None,
+) -> None:
+    # Called after every incident write that can move a service's derived status
+    # (create, severity change, resolve). The status is recomputed from the
+    # currently active incidents and logged only when it differs from the last
+    # logged one, so the log holds actual transitions and nothing else.
+    if not service_ids:
+        return
+    repo = ServiceStatusRepository(session)
+    active = await repo.get_active_severities(service_ids)
+    latest = await repo.get_latest(service_ids)
+    changes = [
+        ServiceStatusChange(
+            service_id=service_id,
+            status=status,
+            changed_at=as_utc(at),
+            incident_id=incident_id,
+        )
+        for service_id, severities in active.items()
+        if (status := status_for_severities(severities)) != latest.get(service_id)
+    ]
+    if changes:
+        await repo.add(changes)
+        await propagate_effective_status(session, [c.service_id for c in changes])
+        await enqueue_events(
+            session,
+            WebhookEventType.service_status_changed,
+            [
+                ServiceStatusChangedEvent(
+                    service_id=c.service_id,
+                    status=c.status,
+                    previous_status=latest.get(c.service_id),
+                    changed_at=c.changed_at,
+                    incident_id=c.incident_id,
+                )
+                for c in changes
+            ],
+        )
+
+
+def status_transitions(
+    created_at: datetime, rows: Iterable[ImpactRow]
+) -> list[tuple[datetime, ServiceStatus, uuid.UUID | None]]:
+    # Replays one service's incidents into the transitions the live path would
+    # have logged: an initial operational entry, then one entry per instant at
+    # which the derived status differs from the previous entry. Every incident
+    # opens at created_at and closes at resolved_at; the severity considered is
+    # the current one, as past severity edits are not kept anywhere.
+    events: list[tuple[datetime, int, IncidentSeverity, uuid.UUID | None]] = []
+    for row in rows:
+        events.append((row.created_at, 1, row.severity, row.incident_id))
+        if row.resolved_at is not None:
+            events.append((row.resolved_at, -1, row.severity, row.incident_id))
+    events.sort(key=lambda event: event[0])
+
+    transitions: list[tuple[datetime, ServiceStatus, uuid.UUID | None]] = [
+        (created_at, ServiceStatus.operational, None)
+    ]
+    open_severities: list[IncidentSeverity] = []
+    for at, group in groupby(events, key=lambda event: event[0]):
+        incident_id: uuid.UUID | None = None
+        # All events at one instant are applied before the status is compared,
+        # so an incident resolved as another opens yields a single entry.
+        for _, delta, severity, incident_id in group:
+            if delta > 0:
+                open_severities.append(severity)
+            else:
+                open_severities.remove(severity)
+        status = status_for_severities(open_severities)
+        if status != transitions[-1][1]:
+            transitions.append((max(at, created_at), status, incident_id))
+    return transitions
+
+
+async def rebuild_status_history(session: AsyncSession) -> int:
+    # Recreates the whole log from incident history, for databases that predate
+    # it or to repair drift. Archived incidents are history too; leaving them
+    # out would erase every transition they caused.
+    uptime = UptimeRepository(session)
+    now = datetime.now(UTC)
+    starts = await uptime.get_service_starts()
+    since = min(starts.values(), default=now)
+    rows = sorted(
+        [
+            *await uptime.get_impact_rows(None, since, now),
+            *await ArchiveRepository(session).get_impact_rows(),
+        ],
+        key=lambda r: r.service_id,
+    )
+    by_service = {
+        service_id: list(group)
+        for service_id, group in groupby(rows, key=lambda r: r.service_id)
+    }
+    changes = [
+        ServiceStatusChange(
+            service_id=service_id,
+            status=status,
+            changed_at=at,
+            incident_id=incident_id,
+        )
+        for service_id, created_at in starts.items()
+        for at, status, incident_id in status_transitions(
+            created_at, by_service.get(service_id, [])
+        )
+    ]
+    await ServiceStatusRepository(session).replace_all(changes)
+    # Effective statuses and group counters are brought in line with the
+    # rebuilt log as well.
+    await propagate_effective_status(session, list(starts))
+    await rebuild_group_counts(session)
+    return len(changes)
+
+
+def build_status_change_response(
+    change: ServiceStatusChange,
+) -> ServiceStatusChangeResponse:
+    return ServiceStatusChangeResponse(
+        status=change.status,
+        changed_at=as_utc(change.changed_at),
+        incident_id=change.incident_id,
+    )
+
+
+async def _ensure_service_exists(
+    repo: ServiceStatusRepository, service_id: uuid.UUID
+) -> None:
+    if not await repo.service_exists(service_id):
+        raise NotFoundError(f"Service with id '{service_id}' does not exist.")
+
+
+async def get_status_at(
+    session: AsyncSession,
+    service_id: uuid.UUID,
+    at: datetime | None = None,
+) -> ServiceStatusAtResponse:
+    repo = ServiceStatusRepository(session)
+    await _ensure_service_exists(repo, service_id)
+    # Naive timestamps are taken as UTC, the zone the log is stored in.
+    at = as_utc(at) if at is not None else datetime.now(UTC)
+    change = await repo.get_at(service_id, at)
+    if change is None:
+        raise NotFoundError(
+            f"No status recorded for service '{service_id}' at {at.isoformat()}."
+        )
+    return ServiceStatusAtResponse(
+        service_id=service_id,
+        at=at,
+        status=change.status,
+        since=as_utc(change.changed_at),
+        incident_id=change.incident_id,
+    )
+
+
+async def get_status_history(
+    session: AsyncSession,
+    service_id: uuid.UUID,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int = 100,
+) -> ServiceStatusHistoryResponse:
+    repo = ServiceStatusRepository(session)
+    await _ensure_service_exists(repo, service_id)
+    changes = await repo.get_history(
+        service_id,
+        start=as_utc(start) if start is not None else None,
+        end=as_utc(end) if end is not None else None,
+        limit=limit,
+    )
+    return ServiceStatusHistoryResponse(
+        data=[build_status_change_response(c) for c in changes],
+        meta={"count": len(changes), "limit": limit},
+    )
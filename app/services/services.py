@@ -1,47 +1,122 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.metrics import services_total
+from app.db.repositories.service_status import ServiceStatusRepository
 from app.db.repositories.services import ServiceRepository
 from app.models.enums import IncidentSeverity, IncidentStatus, ServiceStatus
 from app.models.orm.incident import Incident
 from app.models.orm.service import Service
-from app.models.schemas.services import ServiceResponse
+from app.models.orm.service_status_change import ServiceStatusChange
+from app.models.schemas.services import ServiceListResponse, ServiceResponse
+from app.services.maintenance import services_in_maintenance
 
 
-def derive_service_status(incidents: list[Incident]) -> ServiceStatus:
-    # Only non-resolved incidents affect service health.
-    active = [i for i in incidents if i.status != IncidentStatus.resolved]
-    if not active:
+def severity_impact(severity: IncidentSeverity) -> ServiceStatus:
+    # The status a single active incident of this severity imposes on each of
+    # its services. Shared by live status derivation and the uptime engine.
+    if severity in (IncidentSeverity.critical, IncidentSeverity.high):
+        return ServiceStatus.outage
+    return ServiceStatus.degraded
+
+
+def status_for_severities(severities: Iterable[IncidentSeverity]) -> ServiceStatus:
+    # The status imposed by a set of active incidents, given their severities.
+    impacts = {severity_impact(severity) for severity in severities}
+    if not impacts:
         return ServiceStatus.operational
     # Outage takes precedence: a single critical or high incident drives the service
     # to "outage" regardless of any lower-severity incidents also being active.
-    if any(
-        i.severity in (IncidentSeverity.critical, IncidentSeverity.high) for i in active
-    ):
+    if ServiceStatus.outage in impacts:
         return ServiceStatus.outage
-    # Only medium/low incidents remain active at this point.
+    # Only medium/low incidents are active at this point.
     return ServiceStatus.degraded
 
 
-def build_service_response(service: Service) -> ServiceResponse:
+def derive_service_status(
+    incidents: list[Incident], in_maintenance: bool = False
+) -> ServiceStatus:
+    # An open maintenance window overrides whatever the incidents say: the work
+    # is planned, so the status page should not show it as a failure.
+    if in_maintenance:
+        return ServiceStatus.maintenance
+    # Only non-resolved incidents affect service health.
+    return status_for_severities(
+        i.severity for i in incidents if i.status != IncidentStatus.resolved
+    )
+
+
+def build_service_response(
+    service: Service, in_maintenance: bool = False
+) -> ServiceResponse:
     return ServiceResponse(
         id=service.id,
         name=service.name,
         description=service.description,
-        status=derive_service_status(service.incidents),
+        status=derive_service_status(service.incidents, in_maintenance),
+        effective_status=(
+            ServiceStatus.maintenance if in_maintenance else service.effective_status
+        ),
         created_at=service.created_at,
         updated_at=service.updated_at,
     )
 
 
+async def build_service_responses(
+    session: AsyncSession, services: Iterable[Service]
+) -> list[ServiceResponse]:
+    # For services loaded with their incidents, checked against the cached
+    # maintenance schedule.
+    services = list(services)
+    in_maintenance = await services_in_maintenance(session, (s.id for s in services))
+    return [build_service_response(s, s.id in in_maintenance) for s in services]
+
+
 async def list_services(session: AsyncSession) -> list[ServiceResponse]:
-    repo = ServiceRepository(session)
-    services = await repo.get_all()
-    return [build_service_response(s) for s in services]
+    rows = await ServiceRepository(session).get_all_rows()
+    in_maintenance = await services_in_maintenance(
+        session, (row.id for row in rows.services)
+    )
+    return [
+        ServiceResponse(
+            id=row.id,
+            name=row.name,
+            description=row.description,
+            status=(
+                ServiceStatus.maintenance
+                if row.id in in_maintenance
+                else status_for_severities(rows.active_severities.get(row.id, ()))
+            ),
+            effective_status=(
+                ServiceStatus.maintenance
+                if row.id in in_maintenance
+                else row.effective_status
+            ),
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        for row in rows.services
+    ]
+
+
+async def lookup_services(
+    session: AsyncSession, service_ids: Sequence[uuid.UUID]
+) -> ServiceListResponse:
+    # One IN query for the services and one for their incidents, however many
+    # IDs are asked for. Results follow the order of the request.
+    requested = list(dict.fromkeys(service_ids))
+    services = await ServiceRepository(session).get_many(requested)
+    return ServiceListResponse(
+        data=await build_service_responses(
+            session, (services[i] for i in requested if i in services)
+        ),
+        meta={"total": len(services), "missing": len(requested) - len(services)},
+        missing=[i for i in requested if i not in services],
+    )
 
 
 async def create_service(
@@ -51,6 +126,17 @@ async def create_service(
 ) -> ServiceResponse:
     repo = ServiceRepository(session)
     service = await repo.create(name=name, description=description)
+    # A new service has no incidents, so its status history opens as operational.
+    await ServiceStatusRepository(session).add(
+        [
+            ServiceStatusChange(
+                service_id=service.id,
+                status=ServiceStatus.operational,
+                changed_at=service.created_at,
+            )
+        ]
+    )
+    await session.commit()
     services_total.inc()
     return build_service_response(service)
 
@@ -61,7 +147,7 @@ async def get_service(
 ) -> ServiceResponse:
     repo = ServiceRepository(session)
     service = await repo.get_by_id(service_id)
-    return build_service_response(service)
+    return (await build_service_responses(session, [service]))[0]
 
 
 async def update_service(
@@ -76,13 +162,24 @@ async def update_service(
         name=name,
         description=description,
     )
-    return build_service_response(service)
+    return (await build_service_responses(session, [service]))[0]
 
 
 async def delete_service(
     session: AsyncSession,
     service_id: uuid.UUID,
 ) -> None:
+    # Imported here: the dependency module builds on this one's status helpers.
+    from app.services.dependencies import (
+        load_dependency_graph,
+        propagate_effective_status,
+    )
+
     repo = ServiceRepository(session)
+    # Read before the delete removes the service's edges. Its own status is
+    # operational (no active incidents), but it may pass on a dependency's.
+    dependents = (await load_dependency_graph(session)).dependents.get(service_id)
     await repo.delete(service_id=service_id)
+    await propagate_effective_status(session, sorted(dependents or ()))
+    await session.commit()
     services_total.dec()
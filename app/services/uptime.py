@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import UTC, date, datetime, time, timedelta
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import NotFoundError
+from app.db.repositories.uptime import (
+    DailyAvailabilityRow,
+    ImpactRow,
+    UptimeRepository,
+)
+from app.models.enums import IncidentSeverity, ServiceStatus
+from app.models.schemas.services import (
+    DailyUptime,
+    ServiceUptimeListResponse,
+    ServiceUptimeResponse,
+)
+from app.services.maintenance import load_maintenance_schedule
+from app.services.services import severity_impact
+
+ONE_DAY = timedelta(days=1)
+
+
+class DayImpact(NamedTuple):
+    outage_seconds: float
+    degraded_seconds: float
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, time(), tzinfo=UTC)
+
+
+def _days(first: date, last: date) -> list[date]:
+    return [first + timedelta(days=n) for n in range((last - first).days + 1)]
+
+
+SECONDS_PER_DAY = 86400
+EPOCH = date(1970, 1, 1)
+
+
+def sweep_daily_impact(
+    rows: Iterable[ImpactRow],
+    since: datetime,
+    until: datetime,
+    maintenance: Mapping[uuid.UUID, Sequence[tuple[float, float]]] | None = None,
+) -> dict[tuple[uuid.UUID, date], DayImpact]:
+    # Interval sweep over every service at once. Each incident contributes a +1
+    # event when it opens and a -1 when it resolves, on the outage or degraded
+    # counter per severity_impact(). Events for all services are sorted once by
+    # (service, time) and walked in a single pass; between consecutive events a
+    # service is in outage if any outage incident is open, otherwise degraded if
+    # any degraded one is, which is exactly derive_service_status() evaluated at
+    # every instant. Overlapping incidents are therefore never double counted.
+    #
+    # The hot loop works on plain numbers: services are replaced by their index
+    # and timestamps by POSIX seconds, whose multiples of 86400 are exactly the
+    # UTC midnights, so day boundaries need no datetime arithmetic.
+    #
+    # Maintenance intervals (POSIX seconds per service, as kept by
+    # MaintenanceSchedule) are a third counter: while one is open nothing is
+    # credited, so planned work never counts against uptime.
+    is_outage = {
+        severity: int(severity_impact(severity) == ServiceStatus.outage)
+        for severity in IncidentSeverity
+    }
+    window_start, window_end = since.timestamp(), until.timestamp()
+    service_index: dict[uuid.UUID, int] = {}
+    events: list[tuple[int, float, int, int, int]] = []
+    for row in rows:
+        start = max(row.created_at.timestamp(), window_start)
+        end = (
+            min(row.resolved_at.timestamp(), window_end)
+            if row.resolved_at is not None
+            else window_end
+        )
+        if start >= end:
+            continue
+        service = service_index.setdefault(row.service_id, len(service_index))
+        outage = is_outage[row.severity]
+        events.append((service, start, outage, 1 - outage, 0))
+        events.append((service, end, -outage, outage - 1, 0))
+    # Only services with incidents have anything to take maintenance out of.
+    for service_id, service in service_index.items():
+        for start, end in (maintenance or {}).get(service_id, ()):
+            start, end = max(start, window_start), min(end, window_end)
+            if start < end:
+                events.append((service, start, 0, 0, 1))
+                events.append((service, end, 0, 0, -1))
+    # Plain tuple ordering: by service, then time. Ties between events at the
+    # same instant do not matter, as the span between them is empty.
+    events.sort()
+
+    totals: dict[tuple[int, int], list[float]] = {}
+    current = -1
+    open_outages = open_degraded = open_maintenance = 0
+    previous = window_start
+    for service, at, outage_delta, degraded_delta, maintenance_delta in events:
+        if service != current:
+            # Counters always return to zero at the end of a service's events.
+            current, previous = service, at
+        if at > previous and (open_outages or open_degraded) and not open_maintenance:
+            slot = 0 if open_outages else 1
+            # Split the span at UTC midnights and credit each piece to its day.
+            while previous < at:
+                day = int(previous // SECONDS_PER_DAY)
+                piece_end = min(at, (day + 1) * SECONDS_PER_DAY)
+                totals.setdefault((service, day), [0.0, 0.0])[slot] += (
+                    piece_end - previous
+                )
+                previous = piece_end
+        open_outages += outage_delta
+        open_degraded += degraded_delta
+        open_maintenance += maintenance_delta
+        previous = at
+
+    service_ids = list(service_index)
+    return {
+        (service_ids[service], EPOCH + timedelta(days=day)): DayImpact(*seconds)
+        for (service, day), seconds in totals.items()
+    }
+
+
+def _build_day(day: date, impact: DayImpact, observed_seconds: float) -> DailyUptime:
+    return DailyUptime(
+        day=day,
+        outage_seconds=impact.outage_seconds,
+        degraded_seconds=impact.degraded_seconds,
+        uptime_percent=_uptime_percent(impact.outage_seconds, observed_seconds),
+    )
+
+
+def _uptime_percent(outage_seconds: float, observed_seconds: float) -> float:
+    if observed_seconds <= 0:
+        return 100.0
+    return round(100 * (1 - outage_seconds / observed_seconds), 4)
+
+
+async def _compute_uptime(
+    session: AsyncSession,
+    service_ids: Sequence[uuid.UUID] | None,
+    days: int,
+    now: datetime,
+) -> list[ServiceUptimeResponse]:
+    repo = UptimeRepository(session)
+    today = now.date()
+    yesterday = today - ONE_DAY
+    first_day = today - timedelta(days=days - 1)
+
+    starts = await repo.get_service_starts(service_ids)
+    stored = {
+        (row.service_id, row.day): DayImpact(row.outage_seconds, row.degraded_seconds)
+        for row in await repo.get_daily(service_ids, first_day, yesterday)
+    }
+    covered = {
+        service_id: _days(max(first_day, created_at.date()), today)
+        for service_id, created_at in starts.items()
+    }
+    missing = [
+        (service_id, day)
+        for service_id, service_days in covered.items()
+        for day in service_days
+        if day < today and (service_id, day) not in stored
+    ]
+
+    # One incident query and one sweep cover today plus every closed day not yet
+    # stored (normally just yesterday), for all requested services together.
+    since = _midnight(min((day for _, day in missing), default=today))
+    schedule = await load_maintenance_schedule(session)
+    swept = sweep_daily_impact(
+        await repo.get_impact_rows(service_ids, since, now),
+        since,
+        now,
+        schedule.by_service(),
+    )
+    no_impact = DayImpact(0.0, 0.0)
+    if missing:
+        fresh = {key: swept.get(key, no_impact) for key in missing}
+        await repo.save_daily(
+            [
+                DailyAvailabilityRow(sid, day, *impact)
+                for (sid, day), impact in fresh.items()
+            ]
+        )
+        stored.update(fresh)
+
+    responses = []
+    for service_id, service_days in covered.items():
+        created_at = starts[service_id]
+        daily = []
+        for day in service_days:
+            key = (service_id, day)
+            impact = swept.get(key, no_impact) if day == today else stored[key]
+            observed = min(_midnight(day + ONE_DAY), now) - max(
+                _midnight(day), created_at
+            )
+            daily.append(_build_day(day, impact, observed.total_seconds()))
+        outage = sum(d.outage_seconds for d in daily)
+        observed_total = (now - max(_midnight(first_day), created_at)).total_seconds()
+        responses.append(
+            ServiceUptimeResponse(
+                service_id=service_id,
+                uptime_percent=_uptime_percent(outage, observed_total),
+                outage_seconds=outage,
+                degraded_seconds=sum(d.degraded_seconds for d in daily),
+                days=daily,
+            )
+        )
+    return responses
+
+
+async def get_services_uptime(
+    session: AsyncSession, days: int = 90
+) -> ServiceUptimeListResponse:
+    items = await _compute_uptime(session, None, days, datetime.now(UTC))
+    return ServiceUptimeListResponse(
+        data=items,
+        meta={"total": len(items), "days": days},
+    )
+
+
+async def get_service_uptime(
+    session: AsyncSession, service_id: uuid.UUID, days: int = 90
+) -> ServiceUptimeResponse:
+    items = await _compute_uptime(session, [service_id], days, datetime.now(UTC))
+    if not items:
+        raise NotFoundError(f"Service with id '{service_id}' does not exist.")
+    return items[0]
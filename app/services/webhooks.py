@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import random
+import uuid
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime, timedelta
+from itertools import groupby
+from time import perf_counter
+from typing import NamedTuple
+
+import httpx
+import structlog
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import (
+    webhook_deliveries_total,
+    webhook_delivery_latency_seconds,
+    webhook_request_duration_seconds,
+)
+from app.db.repositories.base import as_utc
+from app.db.repositories.webhooks import Retry, WebhookRepository
+from app.models.enums import WebhookEventType
+from app.models.orm.webhook import WebhookDelivery, WebhookSubscription
+from app.models.schemas.webhooks import (
+    WebhookDeadLetterListResponse,
+    WebhookDeadLetterResponse,
+    WebhookSubscriptionListResponse,
+    WebhookSubscriptionResponse,
+)
+
+logger: structlog.BoundLogger = structlog.get_logger()
+
+SIGNATURE_HEADER = "X-Opstatus-Signature"
+
+
+def build_subscription_response(
+    subscription: WebhookSubscription, pending: int = 0
+) -> WebhookSubscriptionResponse:
+    return WebhookSubscriptionResponse(
+        id=subscription.id,
+        url=subscription.url,
+        events=[WebhookEventType(e) for e in subscription.events],
+        max_concurrency=subscription.max_concurrency,
+        signed=subscription.secret is not None,
+        pending=pending,
+        created_at=subscription.created_at,
+    )
+
+
+async def list_subscriptions(session: AsyncSession) -> WebhookSubscriptionListResponse:
+    repo = WebhookRepository(session)
+    subscriptions = await repo.get_all()
+    pending = await repo.get_pending_counts([s.id for s in subscriptions])
+    return WebhookSubscriptionListResponse(
+        data=[
+            build_subscription_response(s, pending.get(s.id, 0)) for s in subscriptions
+        ],
+        meta={"total": len(subscriptions)},
+    )
+
+
+async def get_subscription(
+    session: AsyncSession, subscription_id: uuid.UUID
+) -> WebhookSubscriptionResponse:
+    repo = WebhookRepository(session)
+    subscription = await repo.get_by_id(subscription_id)
+    pending = await repo.get_pending_counts([subscription_id])
+    return build_subscription_response(subscription, pending.get(subscription_id, 0))
+
+
+async def create_subscription(
+    session: AsyncSession,
+    url: str,
+    events: Sequence[WebhookEventType],
+    max_concurrency: int,
+    secret: str | None = None,
+) -> WebhookSubscriptionResponse:
+    # Duplicates are dropped but the requested order is kept.
+    subscription = await WebhookRepository(session).create(
+        url=url,
+        events=[e.value for e in dict.fromkeys(events)],
+        max_concurrency=max_concurrency,
+        secret=secret,
+    )
+    return build_subscription_response(subscription)
+
+
+async def delete_subscription(
+    session: AsyncSession, subscription_id: uuid.UUID
+) -> None:
+    repo = WebhookRepository(session)
+    await repo.delete(await repo.get_by_id(subscription_id))
+
+
+async def list_dead_letters(
+    session: AsyncSession, subscription_id: uuid.UUID, limit: int = 100
+) -> WebhookDeadLetterListResponse:
+    repo = WebhookRepository(session)
+    await repo.get_by_id(subscription_id)
+    letters = await repo.get_dead_letters(subscription_id, limit)
+    return WebhookDeadLetterListResponse(
+        data=[
+            WebhookDeadLetterResponse(
+                id=letter.id,
+                event_id=letter.event_id,
+                event_type=WebhookEventType(letter.event_type),
+                payload=letter.payload,
+                attempts=letter.attempts,
+                last_error=letter.last_error,
+                created_at=as_utc(letter.created_at),
+                failed_at=as_utc(letter.failed_at),
+            )
+            for letter in letters
+        ],
+        meta={"count": len(letters), "limit": limit},
+    )
+
+
+async def has_subscribers(session: AsyncSession, event_type: WebhookEventType) -> bool:
+    # For events whose payload costs extra queries to build: build it only when
+    # someone will receive it.
+    return bool(await WebhookRepository(session).get_subscribed(event_type))
+
+
+async def enqueue_events(
+    session: AsyncSession, event_type: WebhookEventType, data: Sequence[BaseModel]
+) -> None:
+    # Called from the write path. Only queues one row per event and subscribed
+    # endpoint; nothing is sent from the request, so a slow or unreachable
+    # receiver never adds latency to an API call.
+    if not data:
+        return
+    repo = WebhookRepository(session)
+    subscription_ids = await repo.get_subscribed(event_type)
+    if not subscription_ids:
+        return
+    now = datetime.now(UTC)
+    deliveries = []
+    for item in data:
+        event_id = uuid.uuid4()
+        payload = {
+            "id": str(event_id),
+            "type": event_type.value,
+            "occurred_at": now.isoformat(),
+            "data": item.model_dump(mode="json"),
+        }
+        deliveries += [
+            WebhookDelivery(
+                subscription_id=subscription_id,
+                event_id=event_id,
+                event_type=event_type.value,
+                payload=payload,
+                created_at=now,
+                next_attempt_at=now,
+            )
+            for subscription_id in subscription_ids
+        ]
+    await repo.enqueue(deliveries)
+
+
+async def enqueue_event(
+    session: AsyncSession, event_type: WebhookEventType, data: BaseModel
+) -> None:
+    await enqueue_events(session, event_type, [data])
+
+
+def backoff_delay(
+    attempts: int,
+    base: float,
+    cap: float,
+    rng: random.Random = random.SystemRandom(),
+) -> float:
+    # Seconds to wait after the attempts-th failure: base doubled per failure,
+    # capped, then with up to half of it taken off at random so endpoints
+    # that failed together (e.g. after a receiver outage) do not all retry in
+    # the same instant.
+    delay = min(cap, base * 2.0 ** (attempts - 1))
+    return delay - rng.uniform(0, delay / 2)
+
+
+def sign(secret: str, body: bytes) -> str:
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def create_http_client() -> httpx.AsyncClient:
+    # One client, and so one connection pool, for every endpoint: repeated
+    # deliveries to an endpoint reuse its kept-alive connections.
+    return httpx.AsyncClient(
+        timeout=settings.webhook_timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=settings.webhook_max_connections,
+            max_keepalive_connections=settings.webhook_max_connections,
+        ),
+        headers={"User-Agent": "opstatus-webhooks"},
+    )
+
+
+class BatchOutcome(NamedTuple):
+    deliveries: Sequence[WebhookDelivery]
+    # None when the endpoint accepted the batch.
+    error: str | None
+
+
+class WebhookWorker:
+    # Delivers queued events. Each pass claims the due deliveries, groups them
+    # by endpoint into batches of up to batch_size events, sends the batches
+    # concurrently (at most max_concurrency at a time per endpoint, over one
+    # shared connection pool), then records every outcome in one transaction.
+    # Delivery is at least once: a batch is retried whole if it fails, and
+    # re-sent if the worker stops before recording that it succeeded.
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        client: httpx.AsyncClient,
+        batch_size: int = settings.webhook_batch_size,
+        max_attempts: int = settings.webhook_max_attempts,
+        backoff_base: float = settings.webhook_backoff_base_seconds,
+        backoff_max: float = settings.webhook_backoff_max_seconds,
+        claim_limit: int = settings.webhook_claim_limit,
+        lease_seconds: int = settings.webhook_lease_seconds,
+    ) -> None:
+        self.session_factory = session_factory
+        self.client = client
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.claim_limit = claim_limit
+        self.lease_seconds = lease_seconds
+        # Per endpoint, with the limit it was created for, so an edited limit
+        # takes effect on the next pass.
+        self._limits: dict[uuid.UUID, tuple[int, asyncio.Semaphore]] = {}
+
+    def _limit(self, subscription: WebhookSubscription) -> asyncio.Semaphore:
+        current = self._limits.get(subscription.id)
+        if current is None or current[0] != subscription.max_concurrency:
+            current = (
+                subscription.max_concurrency,
+                asyncio.Semaphore(subscription.max_concurrency),
+            )
+            self._limits[subscription.id] = current
+        return current[1]
+
+    async def run_once(self) -> int:
+        # Returns the number of deliveries processed.
+        now = datetime.now(UTC)
+        async with self.session_factory() as session:
+            repo = WebhookRepository(session)
+            claimed = await repo.claim_due(
+                now, self.claim_limit, now + timedelta(seconds=self.lease_seconds)
+            )
+            if not claimed:
+                return 0
+            subscriptions = await repo.get_many(
+                list({d.subscription_id for d in claimed})
+            )
+
+        sends = []
+        # Subscriptions deleted since their events were queued have had those
+        # deliveries deleted with them; any claimed in between are dropped.
+        orphaned = [d for d in claimed if d.subscription_id not in subscriptions]
+        claimed.sort(key=lambda d: (str(d.subscription_id), d.id))
+        for subscription_id, group in groupby(claimed, key=lambda d: d.subscription_id):
+            subscription = subscriptions.get(subscription_id)
+            if subscription is None:
+                continue
+            queued = list(group)
+            for start in range(0, len(queued), self.batch_size):
+                batch = queued[start : start + self.batch_size]
+                sends.append(self._send(subscription, batch))
+        outcomes: list[BatchOutcome] = await asyncio.gather(*sends)
+        await self._record(outcomes, orphaned)
+        return len(claimed)
+
+    async def _send(
+        self, subscription: WebhookSubscription, batch: Sequence[WebhookDelivery]
+    ) -> BatchOutcome:
+        body = json.dumps({"events": [d.payload for d in batch]}).encode()
+        headers = {"Content-Type": "application/json"}
+        if subscription.secret is not None:
+            headers[SIGNATURE_HEADER] = sign(subscription.secret, body)
+        async with self._limit(subscription):
+            started = perf_counter()
+            try:
+                response = await self.client.post(
+                    subscription.url, content=body, headers=headers
+                )
+            except httpx.HTTPError as exc:
+                return BatchOutcome(batch, f"{type(exc).__name__}: {exc}")
+            finally:
+                webhook_request_duration_seconds.observe(perf_counter() - started)
+        if response.is_success:
+            return BatchOutcome(batch, None)
+        return BatchOutcome(batch, f"HTTP {response.status_code}")
+
+    async def _record(
+        self, outcomes: Sequence[BatchOutcome], orphaned: Sequence[WebhookDelivery]
+    ) -> None:
+        now = datetime.now(UTC)
+        delivered = [d.id for d in orphaned]
+        retries: list[Retry] = []
+        failed: list[tuple[WebhookDelivery, str]] = []
+        for outcome in outcomes:
+            for delivery in outcome.deliveries:
+                if outcome.error is None:
+                    delivered.append(delivery.id)
+                    webhook_delivery_latency_seconds.observe(
+                        (now - as_utc(delivery.created_at)).total_seconds()
+                    )
+                    webhook_deliveries_total.labels(outcome="delivered").inc()
+                elif delivery.attempts + 1 >= self.max_attempts:
+                    failed.append((delivery, outcome.error))
+                    webhook_deliveries_total.labels(outcome="dead_lettered").inc()
+                else:
+                    attempts = delivery.attempts + 1
+                    delay = backoff_delay(attempts, self.backoff_base, self.backoff_max)
+                    retries.append(
+                        Retry(
+                            delivery.id,
+                            attempts,
+                            now + timedelta(seconds=delay),
+                            outcome.error,
+                        )
+                    )
+                    webhook_deliveries_total.labels(outcome="retried").inc()
+            if outcome.error is not None:
+                await logger.awarning(
+                    "Webhook delivery failed",
+                    subscription_id=str(outcome.deliveries[0].subscription_id),
+                    events=len(outcome.deliveries),
+                    error=outcome.error,
+                )
+        async with self.session_factory() as session:
+            await WebhookRepository(session).record_outcomes(
+                delivered, retries, failed, now
+            )
+
+    async def run(
+        self,
+        stop: asyncio.Event,
+        poll_interval: float = settings.webhook_poll_interval_seconds,
+    ) -> None:
+        # Passes run back to back while there is a backlog; once a pass finds
+        # less than a full claim, the worker sleeps poll_interval (or until
+        # stopped) before looking again.
+        while not stop.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception:
+                await logger.aexception("Webhook worker pass failed")
+                processed = 0
+            if processed < self.claim_limit:
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=poll_interval)
+                except TimeoutError:
+                    pass
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+
+import structlog
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import QueuePool
+
+from app.models.schemas.incidents import IncidentListResponse
+from app.models.schemas.services import ServiceListResponse
+from app.services import groups as group_service
+from app.services import incidents as incident_service
+from app.services import services as service_layer
+from app.services.dependencies import load_dependency_graph
+
+logger: structlog.BoundLogger = structlog.get_logger()
+
+
+def build_schemas(app: FastAPI) -> None:
+    # Mappers are otherwise configured by the first query, and the OpenAPI
+    # schema, which walks every route's models, by the first /openapi.json.
+    # Run before serving, so a broken mapper or schema fails start-up.
+    configure_mappers()
+    app.openapi()
+
+
+async def open_connections(engine: AsyncEngine, count: int) -> int:
+    # Connections are held together, so each is a new one, and then all go
+    # back to the pool for the first requests to reuse.
+    if isinstance(engine.pool, QueuePool):
+        count = min(count, engine.pool.size())
+    async with AsyncExitStack() as stack:
+        connections = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(count))
+        )
+        for connection in connections:
+            await connection.execute(text("SELECT 1"))
+    return count
+
+
+async def prime_read_paths(session: AsyncSession) -> None:
+    # The hot reads, run once: SQLAlchemy compiles and caches their statements,
+    # the dependency graph and maintenance schedule (through list_services)
+    # caches are filled and the responses are serialized.
+    # Incidents are limited to active ones to keep this quick on a long history.
+    await load_dependency_graph(session)
+    services = await service_layer.list_services(session)
+    ServiceListResponse(data=services, meta={"total": len(services)}).model_dump_json()
+    incidents = await incident_service.list_incidents(session, active=True)
+    IncidentListResponse(
+        data=incidents, meta={"total": len(incidents)}
+    ).model_dump_json()
+    (await group_service.list_groups(session)).model_dump_json()
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    # The database half of warm-up, run in the background once the server
+    # accepts connections (see app.main). The steps only read, so any failure,
+    # such as a refused connection, which asyncpg raises unwrapped, is logged
+    # and the step skipped: an outage never stops warm-up from finishing, and
+    # readiness reports the database instead.
+    timings: dict[str, float] = {}
+
+    async def timed(name: str, run: Callable[[], Awaitable[object]]) -> None:
+        start = time.perf_counter()
+        try:
+            await run()
+        except Exception:
+            await logger.awarning("Warm-up step skipped", step=name, exc_info=True)
+        timings[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    async def read_paths() -> None:
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            await prime_read_paths(session)
+            await session.rollback()
+
+    start = time.perf_counter()
+    await timed("connections", lambda: open_connections(engine, connections))
+    await timed("read_paths", read_paths)
+    await logger.ainfo(
+        "Warm-up complete",
+        duration_ms=round((time.perf_counter() - start) * 1000, 2),
+        steps_ms=timings,
+    )
@@ -0,0 +1,86 @@
+import random
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from app.db.repositories.uptime import ImpactRow
+from app.models.enums import IncidentSeverity, IncidentStatus, ServiceStatus
+from app.models.orm.incident import Incident
+from app.models.orm.incident_update import IncidentUpdate
+from app.models.orm.service import Service
+
+# Benchmarks build transient ORM objects without a database session, the same way
+# the unit tests do, so they measure only the Python-side cost of the hot paths.
+BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def make_incident(
+    severity: IncidentSeverity = IncidentSeverity.medium,
+    status: IncidentStatus = IncidentStatus.resolved,
+    update_count: int = 0,
+) -> Incident:
+    incident = Incident(
+        id=uuid.uuid4(),
+        title="Elevated error rate on checkout",
+        body="Requests to the payment provider are timing out.",
+        severity=severity,
+        status=status,
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME,
+        resolved_at=BASE_TIME if status == IncidentStatus.resolved else None,
+    )
+    incident.updates = [
+        IncidentUpdate(
+            id=uuid.uuid4(),
+            incident_id=incident.id,
+            sequence=n + 1,
+            message=f"Update {n}: still investigating.",
+            status=IncidentStatus.investigating,
+            created_at=BASE_TIME + timedelta(minutes=n),
+        )
+        for n in range(update_count)
+    ]
+    return incident
+
+
+def make_incident_history(count: int) -> list[Incident]:
+    # Worst case for status derivation: every incident but the last is resolved,
+    # so the whole list has to be scanned before the active one is found.
+    incidents = [make_incident() for _ in range(max(count - 1, 0))]
+    if count:
+        incidents.append(make_incident(status=IncidentStatus.investigating))
+    return incidents
+
+
+def make_service(incident_count: int) -> Service:
+    service = Service(
+        id=uuid.uuid4(),
+        name=f"service-{incident_count}",
+        description="Synthetic benchmark service",
+        effective_status=ServiceStatus.operational,
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME,
+    )
+    service.incidents = make_incident_history(incident_count)
+    return service
+
+
+def make_impact_rows(
+    service_count: int, days: int, incidents_per_day: int
+) -> list[ImpactRow]:
+    # Incident intervals of mixed severity spread over `days` days before
+    # BASE_TIME, with random start times so many of them overlap.
+    rng = random.Random(7)
+    service_ids = [uuid.UUID(int=n) for n in range(service_count)]
+    rows = []
+    for service_id in service_ids:
+        for _ in range(days * incidents_per_day):
+            start = BASE_TIME - timedelta(minutes=rng.uniform(0, days * 24 * 60))
+            rows.append(
+                ImpactRow(
+                    service_id=service_id,
+                    severity=rng.choice(list(IncidentSeverity)),
+                    created_at=start,
+                    resolved_at=start + timedelta(minutes=rng.expovariate(1 / 90)),
+                )
+            )
+    return rows
@@ -0,0 +1,88 @@
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.repositories.services import ServiceRepository
+from app.models.enums import AlertStatus
+from app.models.orm import Base
+from app.models.schemas.alerts import MAX_ALERTS_PER_REQUEST, Alert
+from app.services import alerts as alert_service
+
+# A full batch of repeats of alerts that already have open incidents, the
+# load a flapping or noisy rule puts on the endpoint. "cached" repeats are
+# answered from the recent-fingerprint cache; "database" ones, as seen by a
+# process that has not met them yet, with one query for the batch.
+# Throughput is recorded in each result's extra_info.
+SERVICE_COUNT = 20
+FINGERPRINTS = 200
+
+BATCH = [
+    Alert(
+        status=AlertStatus.firing,
+        fingerprint=f"{n % FINGERPRINTS:016x}",
+        labels={
+            "alertname": "HighErrorRate",
+            "service": f"svc-{n % SERVICE_COUNT}",
+            "severity": "critical",
+        },
+    )
+    for n in range(MAX_ALERTS_PER_REQUEST)
+]
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def seeded(
+    loop: asyncio.AbstractEventLoop,
+) -> Iterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def seed() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_factory() as session:
+            for n in range(SERVICE_COUNT):
+                await ServiceRepository(session).create(f"svc-{n}")
+            response = await alert_service.ingest_alerts(session, BATCH)
+            assert response.opened == FINGERPRINTS
+
+    loop.run_until_complete(seed())
+    yield session_factory
+    loop.run_until_complete(engine.dispose())
+
+
+@pytest.mark.parametrize("path", ["cached", "database"])
+def test_repeated_alerts(
+    benchmark: BenchmarkFixture,
+    loop: asyncio.AbstractEventLoop,
+    seeded: async_sessionmaker[AsyncSession],
+    path: str,
+) -> None:
+    async def ingest() -> None:
+        async with seeded() as session:
+            response = await alert_service.ingest_alerts(session, BATCH)
+        assert response.suppressed == len(BATCH)
+
+    def setup() -> None:
+        if path == "database":
+            alert_service._recent.clear()
+
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(ingest()),
+        setup=setup,
+        rounds=50,
+        warmup_rounds=1,
+    )
+    benchmark.extra_info["alerts_per_second"] = round(
+        len(BATCH) / benchmark.stats.stats.mean
+    )
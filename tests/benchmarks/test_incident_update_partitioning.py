@@ -0,0 +1,209 @@
+import asyncio
+import os
+import random
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from hashlib import md5
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from tests.benchmarks.factories import BASE_TIME
+
+# Timeline reads and appends against incident_updates as a plain table and as
+# the monthly range-partitioned table built by the opt-in a7d4e2f9c315
+# migration. Partitioning is PostgreSQL only, so these run against the database
+# in OPSTATUS_BENCH_POSTGRES_URL (an asyncpg URL; both tables live in scratch
+# schemas that are dropped afterwards) and are skipped without it.
+POSTGRES_URL = os.environ.get("OPSTATUS_BENCH_POSTGRES_URL")
+UPDATE_COUNT = int(os.environ.get("OPSTATUS_BENCH_UPDATES", "2000000"))
+
+pytestmark = pytest.mark.skipif(
+    POSTGRES_URL is None, reason="OPSTATUS_BENCH_POSTGRES_URL is not set"
+)
+
+UPDATES_PER_INCIDENT = 20
+INCIDENT_COUNT = UPDATE_COUNT // UPDATES_PER_INCIDENT
+# Roughly three years of history, i.e. about 36 monthly partitions.
+HISTORY = timedelta(days=3 * 365)
+HISTORY_START = BASE_TIME - HISTORY
+INCIDENT_STEP = HISTORY / INCIDENT_COUNT
+SCHEMAS = ("bench_plain", "bench_partitioned")
+PAGE_SIZE = 50
+
+COLUMNS = """
+    id UUID NOT NULL,
+    incident_id UUID NOT NULL,
+    sequence INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL
+"""
+
+SETUP = {
+    "bench_plain": [
+        f"""
+        CREATE TABLE bench_plain.incident_updates ({COLUMNS},
+            PRIMARY KEY (id),
+            UNIQUE (incident_id, sequence)
+        )
+        """,
+    ],
+    "bench_partitioned": [
+        f"""
+        CREATE TABLE bench_partitioned.incident_updates ({COLUMNS},
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """,
+        "CREATE INDEX ON bench_partitioned.incident_updates (incident_id, sequence)",
+        "CREATE TABLE bench_partitioned.incident_updates_default "
+        "PARTITION OF bench_partitioned.incident_updates DEFAULT",
+        f"""
+        DO $$
+        DECLARE
+            partition_month timestamp;
+        BEGIN
+            FOR partition_month IN SELECT generate_series(
+                date_trunc('month', '{HISTORY_START.isoformat()}'::timestamptz
+                    AT TIME ZONE 'UTC'),
+                date_trunc('month', now() AT TIME ZONE 'UTC')
+                    + interval '1 month',
+                interval '1 month'
+            ) LOOP
+                EXECUTE format(
+                    'CREATE TABLE bench_partitioned.%I '
+                    'PARTITION OF bench_partitioned.incident_updates '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'incident_updates_p' || to_char(partition_month, 'YYYYMM'),
+                    partition_month AT TIME ZONE 'UTC',
+                    (partition_month + interval '1 month') AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END
+        $$
+        """,
+    ],
+}
+
+# Incident n gets UPDATES_PER_INCIDENT updates a minute apart, starting at
+# HISTORY_START + n * INCIDENT_STEP, so appends are spread evenly over time.
+SEED = """
+    INSERT INTO {schema}.incident_updates
+    SELECT
+        gen_random_uuid(),
+        md5('incident' || n / :per_incident)::uuid,
+        n % :per_incident + 1,
+        'Update ' || n,
+        'investigating',
+        CAST(:start AS TIMESTAMP WITH TIME ZONE)
+            + n / :per_incident * CAST(:step AS INTERVAL)
+            + n % :per_incident * interval '1 minute'
+    FROM generate_series(0, CAST(:count AS INTEGER) - 1) AS n
+"""
+
+
+def _incident(n: int) -> tuple[uuid.UUID, datetime]:
+    # The incident id and creation time the seed gives incident n.
+    incident_id = uuid.UUID(md5(f"incident{n}".encode()).hexdigest())
+    return incident_id, HISTORY_START + INCIDENT_STEP * n
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def engine(loop: asyncio.AbstractEventLoop) -> Iterator[AsyncEngine]:
+    assert POSTGRES_URL is not None
+    engine = create_async_engine(POSTGRES_URL)
+
+    async def setup() -> None:
+        async with engine.begin() as conn:
+            for schema in SCHEMAS:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+                await conn.execute(text(f"CREATE SCHEMA {schema}"))
+                for statement in SETUP[schema]:
+                    await conn.execute(text(statement))
+                await conn.execute(
+                    text(SEED.format(schema=schema)).bindparams(
+                        per_incident=UPDATES_PER_INCIDENT,
+                        start=HISTORY_START,
+                        step=INCIDENT_STEP,
+                        count=UPDATE_COUNT,
+                    )
+                )
+                await conn.execute(text(f"ANALYZE {schema}.incident_updates"))
+
+    async def teardown() -> None:
+        async with engine.begin() as conn:
+            for schema in SCHEMAS:
+                await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await engine.dispose()
+
+    loop.run_until_complete(setup())
+    yield engine
+    loop.run_until_complete(teardown())
+
+
+def _read_page(
+    loop: asyncio.AbstractEventLoop, engine: AsyncEngine, schema: str, n: int
+) -> int:
+    # The query IncidentUpdateRepository.get_page issues for a first page.
+    incident_id, _ = _incident(n)
+
+    async def read() -> int:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    f"SELECT * FROM {schema}.incident_updates "
+                    "WHERE incident_id = :incident_id "
+                    "ORDER BY sequence LIMIT :limit"
+                ).bindparams(incident_id=incident_id, limit=PAGE_SIZE)
+            )
+            return len(result.all())
+
+    return loop.run_until_complete(read())
+
+
+def _append(loop: asyncio.AbstractEventLoop, engine: AsyncEngine, schema: str) -> None:
+    async def append() -> None:
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    f"INSERT INTO {schema}.incident_updates "
+                    "VALUES (gen_random_uuid(), gen_random_uuid(), 1, "
+                    "'Appended', 'investigating', now())"
+                )
+            )
+
+    loop.run_until_complete(append())
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_timeline_read(
+    benchmark: BenchmarkFixture,
+    loop: asyncio.AbstractEventLoop,
+    engine: AsyncEngine,
+    schema: str,
+) -> None:
+    rng = random.Random(42)
+    count = benchmark(
+        lambda: _read_page(loop, engine, schema, rng.randrange(INCIDENT_COUNT))
+    )
+    assert count == UPDATES_PER_INCIDENT
+
+
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_timeline_append(
+    benchmark: BenchmarkFixture,
+    loop: asyncio.AbstractEventLoop,
+    engine: AsyncEngine,
+    schema: str,
+) -> None:
+    benchmark(_append, loop, engine, schema)
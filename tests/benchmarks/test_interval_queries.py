@@ -0,0 +1,129 @@
+import os
+import random
+import sqlite3
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    and_,
+    create_engine,
+    func,
+    or_,
+    select,
+)
+
+from app.db.repositories.incidents import active_during_filter
+from app.models.enums import IncidentSeverity, IncidentStatus
+from app.models.orm import Base, Incident
+from app.models.orm.incident import SEVERITY_RANK
+from tests.benchmarks.factories import BASE_TIME
+
+# Unlike the service-layer benchmarks, these need a real database: the point is
+# the query plan. The table is seeded once per session through the same
+# triggers the API relies on, which takes a while at full size; set
+# OPSTATUS_BENCH_INCIDENTS to a smaller count for a quick local run.
+INCIDENT_COUNT = int(os.environ.get("OPSTATUS_BENCH_INCIDENTS", "1000000"))
+
+# Roughly five years of history with incidents lasting minutes to days, and a
+# small tail left open.
+HISTORY = timedelta(days=5 * 365)
+OPEN_FRACTION = 0.001
+
+WINDOWS = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+
+
+def _rows(count: int) -> Iterator[tuple[Any, ...]]:
+    rng = random.Random(42)
+    start = BASE_TIME.replace(tzinfo=None) - HISTORY
+    step = HISTORY / count
+    for n in range(count):
+        created = start + step * n
+        severity = rng.choice(list(IncidentSeverity))
+        if rng.random() < OPEN_FRACTION:
+            status, resolved = IncidentStatus.investigating, None
+        else:
+            duration = timedelta(minutes=rng.expovariate(1 / 120))
+            status, resolved = IncidentStatus.resolved, created + duration
+        yield (
+            uuid.UUID(int=rng.getrandbits(128)).hex,
+            f"Incident {n}",
+            severity.name,
+            SEVERITY_RANK[severity],
+            status.name,
+            str(created),
+            str(resolved or created),
+            str(resolved) if resolved else None,
+        )
+
+
+@pytest.fixture(scope="module")
+def connection(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Connection]:
+    path: Path = tmp_path_factory.mktemp("intervals") / "incidents.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+
+    raw = sqlite3.connect(path)
+    with raw:
+        raw.executemany(
+            """
+            INSERT INTO incidents (
+                id, title, severity, severity_rank, status,
+                created_at, updated_at, resolved_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            _rows(INCIDENT_COUNT),
+        )
+        raw.execute("ANALYZE")
+    raw.close()
+
+    with engine.connect() as conn:
+        yield conn
+    engine.dispose()
+
+
+def _naive_filter(start: datetime, end: datetime) -> ColumnElement[bool]:
+    # The same overlap test on the plain columns, bounded on created_at only.
+    return and_(
+        Incident.created_at <= end,
+        or_(Incident.resolved_at.is_(None), Incident.resolved_at >= start),
+    )
+
+
+def _window(length: timedelta) -> tuple[datetime, datetime]:
+    # Midway through the history, so neither end of the table is a shortcut.
+    start = BASE_TIME - HISTORY / 2
+    return start, start + length
+
+
+def _count(connection: Connection, condition: ColumnElement[bool]) -> int:
+    query = select(func.count()).select_from(Incident).where(condition)
+    return connection.scalar(query) or 0
+
+
+@pytest.mark.parametrize("window", WINDOWS)
+def test_active_during_range_index(
+    benchmark: BenchmarkFixture, connection: Connection, window: str
+) -> None:
+    start, end = _window(WINDOWS[window])
+    condition = active_during_filter("sqlite", start, end)
+    count = benchmark(_count, connection, condition)
+    assert count == _count(connection, _naive_filter(start, end))
+
+
+@pytest.mark.parametrize("window", WINDOWS)
+def test_active_during_column_scan(
+    benchmark: BenchmarkFixture, connection: Connection, window: str
+) -> None:
+    start, end = _window(WINDOWS[window])
+    benchmark(_count, connection, _naive_filter(start, end))
@@ -0,0 +1,157 @@
+import asyncio
+import os
+import random
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.repositories.incidents import _SORT_ORDERS
+from app.models.enums import IncidentSeverity, IncidentSort, IncidentStatus
+from app.models.orm import Base, Incident, IncidentUpdate, Service, service_incidents
+from app.models.orm.incident import SEVERITY_RANK
+from app.services.incidents import build_incident_response, list_incidents
+from app.services.services import build_service_response, list_services
+from tests.benchmarks.factories import BASE_TIME
+
+# The list endpoints read as plain rows against the same lists built from ORM
+# objects, as they were before. Each round runs in a fresh session, as each
+# request does. Peak memory allocated during one call is recorded in each
+# result's extra_info. Set OPSTATUS_BENCH_LIST_INCIDENTS for a different size.
+INCIDENT_COUNT = int(os.environ.get("OPSTATUS_BENCH_LIST_INCIDENTS", "5000"))
+SERVICE_COUNT = 200
+UPDATES_PER_INCIDENT = 4
+ACTIVE_FRACTION = 0.05
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def _seed_rows() -> tuple[list[dict[str, Any]], ...]:
+    rng = random.Random(42)
+    services = [
+        {
+            "id": uuid.UUID(int=rng.getrandbits(128)),
+            "name": f"svc-{n}",
+            "created_at": BASE_TIME,
+            "updated_at": BASE_TIME,
+        }
+        for n in range(SERVICE_COUNT)
+    ]
+    incidents, updates, links = [], [], []
+    for n in range(INCIDENT_COUNT):
+        incident_id = uuid.UUID(int=rng.getrandbits(128))
+        created = BASE_TIME + timedelta(minutes=n)
+        severity = rng.choice(list(IncidentSeverity))
+        active = rng.random() < ACTIVE_FRACTION
+        incidents.append(
+            {
+                "id": incident_id,
+                "title": f"Incident {n}",
+                "body": "Requests to the payment provider are timing out.",
+                "severity": severity,
+                "severity_rank": SEVERITY_RANK[severity],
+                "status": (
+                    IncidentStatus.investigating if active else IncidentStatus.resolved
+                ),
+                "created_at": created,
+                "updated_at": created,
+                "resolved_at": None if active else created + timedelta(hours=1),
+                "last_update_sequence": UPDATES_PER_INCIDENT,
+            }
+        )
+        updates += [
+            {
+                "id": uuid.UUID(int=rng.getrandbits(128)),
+                "incident_id": incident_id,
+                "sequence": seq,
+                "message": f"Update {seq}: still investigating.",
+                "status": IncidentStatus.investigating,
+                "created_at": created + timedelta(minutes=seq),
+            }
+            for seq in range(1, UPDATES_PER_INCIDENT + 1)
+        ]
+        links += [
+            {"service_id": service["id"], "incident_id": incident_id}
+            for service in rng.sample(services, rng.randint(1, 2))
+        ]
+    return services, incidents, updates, links
+
+
+@pytest.fixture(scope="module")
+def session_factory(
+    loop: asyncio.AbstractEventLoop,
+) -> Iterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    services, incidents, updates, links = _seed_rows()
+
+    async def seed() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(insert(Service), services)
+            await conn.execute(insert(Incident), incidents)
+            await conn.execute(insert(IncidentUpdate), updates)
+            await conn.execute(insert(service_incidents), links)
+
+    loop.run_until_complete(seed())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    loop.run_until_complete(engine.dispose())
+
+
+# The ORM reads the list endpoints used to make: entities, with their
+# selectin-loaded relationships.
+async def _orm_incidents(session: AsyncSession) -> list[Any]:
+    result = await session.execute(
+        select(Incident).order_by(*_SORT_ORDERS[IncidentSort.recent])
+    )
+    return [build_incident_response(i) for i in result.scalars().unique().all()]
+
+
+async def _orm_services(session: AsyncSession) -> list[Any]:
+    result = await session.execute(select(Service))
+    return [build_service_response(s) for s in result.scalars().all()]
+
+
+PATHS: dict[str, dict[str, Callable[[AsyncSession], Awaitable[list[Any]]]]] = {
+    "incidents": {"orm": _orm_incidents, "rows": list_incidents},
+    "services": {"orm": _orm_services, "rows": list_services},
+}
+
+
+@pytest.mark.parametrize("path", ["orm", "rows"])
+@pytest.mark.parametrize("endpoint", list(PATHS))
+def test_list(
+    benchmark: BenchmarkFixture,
+    loop: asyncio.AbstractEventLoop,
+    session_factory: async_sessionmaker[AsyncSession],
+    endpoint: str,
+    path: str,
+) -> None:
+    read = PATHS[endpoint][path]
+
+    async def run() -> list[Any]:
+        async with session_factory() as session:
+            return await read(session)
+
+    tracemalloc.start()
+    loop.run_until_complete(run())
+    benchmark.extra_info["peak_mib"] = round(
+        tracemalloc.get_traced_memory()[1] / 2**20, 1
+    )
+    tracemalloc.stop()
+
+    result = benchmark.pedantic(
+        lambda: loop.run_until_complete(run()), rounds=5, warmup_rounds=1
+    )
+    expected = INCIDENT_COUNT if endpoint == "incidents" else SERVICE_COUNT
+    assert len(result) == expected
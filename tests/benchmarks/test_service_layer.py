@@ -0,0 +1,104 @@
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from app.core.error_handlers import _make_error_response, format_validation_errors
+from app.models.enums import IncidentStatus
+from app.services.incidents import build_incident_response, validate_status_transition
+from app.services.services import build_service_response, derive_service_status
+from app.services.uptime import sweep_daily_impact
+from tests.benchmarks.factories import (
+    BASE_TIME,
+    make_impact_rows,
+    make_incident,
+    make_incident_history,
+    make_service,
+)
+
+INCIDENT_COUNTS = [0, 10, 10_000]
+UPDATE_COUNTS = [1, 5_000]
+
+# --- service status derivation ---
+
+
+@pytest.mark.parametrize("incident_count", INCIDENT_COUNTS)
+def test_derive_service_status(
+    benchmark: BenchmarkFixture, incident_count: int
+) -> None:
+    incidents = make_incident_history(incident_count)
+    benchmark(derive_service_status, incidents)
+
+
+@pytest.mark.parametrize("incident_count", INCIDENT_COUNTS)
+def test_build_service_response(
+    benchmark: BenchmarkFixture, incident_count: int
+) -> None:
+    service = make_service(incident_count)
+    response = benchmark(build_service_response, service)
+    assert response.id == service.id
+
+
+# --- incident lifecycle ---
+
+
+def test_validate_status_transition(benchmark: BenchmarkFixture) -> None:
+    benchmark(
+        validate_status_transition,
+        IncidentStatus.identified,
+        IncidentStatus.monitoring,
+    )
+
+
+@pytest.mark.parametrize("update_count", UPDATE_COUNTS)
+def test_build_incident_response(
+    benchmark: BenchmarkFixture, update_count: int
+) -> None:
+    incident = make_incident(
+        status=IncidentStatus.investigating, update_count=update_count
+    )
+    response = benchmark(build_incident_response, incident)
+    assert len(response.updates) == update_count
+
+
+# --- uptime ---
+
+
+# The bulk uptime report: every service over a 90-day window in one sweep.
+@pytest.mark.parametrize("service_count", [1, 100])
+def test_sweep_daily_impact(benchmark: BenchmarkFixture, service_count: int) -> None:
+    rows = make_impact_rows(service_count, days=90, incidents_per_day=2)
+    since = BASE_TIME - timedelta(days=90)
+    result = benchmark(sweep_daily_impact, rows, since, BASE_TIME)
+    assert {service_id for service_id, _ in result} == {r.service_id for r in rows}
+
+
+# --- error handling ---
+
+
+def _validation_errors(count: int) -> list[dict[str, Any]]:
+    return [
+        {"loc": ("body", "service_ids", n), "msg": "Input should be a valid UUID"}
+        for n in range(count)
+    ]
+
+
+@pytest.mark.parametrize("error_count", [1, 100])
+def test_format_validation_errors(
+    benchmark: BenchmarkFixture, error_count: int
+) -> None:
+    errors = _validation_errors(error_count)
+    message = benchmark(format_validation_errors, errors)
+    assert message.count("valid UUID") == error_count
+
+
+def test_make_error_response(benchmark: BenchmarkFixture) -> None:
+    response = benchmark(
+        _make_error_response,
+        status_code=404,
+        code="NOT_FOUND",
+        message="Incident with id 'abc' does not exist.",
+        request_id="bench",
+    )
+    assert response.status_code == 404
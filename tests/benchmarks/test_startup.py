@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import create_engine
+
+from app.models.orm import Base
+
+# Cold start only happens once per process, so each round runs in a fresh
+# interpreter. That includes the interpreter's own start-up, which
+# test_interpreter measures alone as a baseline.
+ROOT = Path(__file__).resolve().parents[2]
+
+IMPORT = "import app.main"
+
+# The whole lifespan, up to the end of the background warm-up, with no
+# requests in between.
+STARTUP = """
+import asyncio
+
+from app.main import app, lifespan
+
+
+async def main():
+    async with lifespan(app):
+        while not app.state.warmed_up:
+            await asyncio.sleep(0.001)
+
+
+asyncio.run(main())
+"""
+
+
+@pytest.fixture(scope="module")
+def env(tmp_path_factory: pytest.TempPathFactory) -> dict[str, str]:
+    path = tmp_path_factory.mktemp("startup") / "opstatus.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{path}",
+        "APP_ENV": "production",
+        "LOG_LEVEL": "WARNING",
+        "PYTHONPATH": str(ROOT),
+    }
+
+
+def _run(code: str, env: dict[str, str]) -> None:
+    subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT, check=True)
+
+
+def test_interpreter(benchmark: BenchmarkFixture, env: dict[str, str]) -> None:
+    benchmark.pedantic(_run, args=("pass", env), rounds=10)
+
+
+def test_import_app(benchmark: BenchmarkFixture, env: dict[str, str]) -> None:
+    benchmark.pedantic(_run, args=(IMPORT, env), rounds=10)
+
+
+def test_startup(benchmark: BenchmarkFixture, env: dict[str, str]) -> None:
+    benchmark.pedantic(_run, args=(STARTUP, env), rounds=10)
@@ -0,0 +1,157 @@
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from app.db.repositories.incidents import (
+    _GET_BY_ID,
+    _SORT_ORDERS,
+    IncidentRepository,
+    _list_statements,
+    service_filter,
+)
+from app.db.repositories.services import ServiceRepository
+from app.models.enums import (
+    IncidentSeverity,
+    IncidentSort,
+    IncidentStatus,
+    ServiceMatch,
+)
+from app.models.orm import Base, Incident
+from tests.benchmarks.factories import BASE_TIME
+
+# The Python-side cost of the repository hot queries. Building a statement and
+# computing its cache key happens on every execution unless the statement is
+# built once and reused; the "inline" variants build them per call, as the
+# repositories did before, for comparison with the prebuilt "cached" ones.
+SERVICE_COUNT = 10
+INCIDENT_COUNT = 50
+
+FILTERS = {
+    "statuses": [IncidentStatus.investigating, IncidentStatus.identified],
+    "severities": [IncidentSeverity.critical],
+}
+
+
+def _inline_get() -> Select[Any]:
+    return (
+        select(Incident)
+        .options(selectinload(Incident.updates), selectinload(Incident.services))
+        .where(Incident.id == uuid.uuid4())
+    )
+
+
+def _inline_list(service_ids: list[uuid.UUID]) -> Select[Any]:
+    return (
+        select(Incident.__table__)
+        .order_by(*_SORT_ORDERS[IncidentSort.recent])
+        .where(Incident.status.in_(FILTERS["statuses"]))
+        .where(Incident.severity.in_(FILTERS["severities"]))
+        .where(service_filter(service_ids, ServiceMatch.any))
+    )
+
+
+def _cached_list(service_ids: list[uuid.UUID]) -> Select[Any]:
+    return _list_statements(
+        "sqlite",
+        IncidentSort.recent,
+        frozenset({"statuses", "severities", "service_ids"}),
+        ServiceMatch.any,
+    ).rows
+
+
+PREPARE: dict[str, dict[str, Callable[[list[uuid.UUID]], Select[Any]]]] = {
+    "get_incident": {
+        "inline": lambda _: _inline_get(),
+        "cached": lambda _: _GET_BY_ID,
+    },
+    "list_filtered": {"inline": _inline_list, "cached": _cached_list},
+}
+
+
+@pytest.mark.parametrize("construct", ["inline", "cached"])
+@pytest.mark.parametrize("query", list(PREPARE))
+def test_statement_preparation(
+    benchmark: BenchmarkFixture, query: str, construct: str
+) -> None:
+    prepare = PREPARE[query][construct]
+    service_ids = [uuid.uuid4() for _ in range(3)]
+    benchmark(lambda: prepare(service_ids)._generate_cache_key())
+
+
+# --- end to end, against in-memory SQLite ---
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def seeded(
+    loop: asyncio.AbstractEventLoop,
+) -> Iterator[tuple[async_sessionmaker[AsyncSession], list[uuid.UUID], uuid.UUID]]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def seed() -> tuple[list[uuid.UUID], uuid.UUID]:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_factory() as session:
+            services = [
+                await ServiceRepository(session).create(f"svc-{n}")
+                for n in range(SERVICE_COUNT)
+            ]
+            incidents = IncidentRepository(session)
+            for n in range(INCIDENT_COUNT):
+                incident = await incidents.create(
+                    f"Incident {n}",
+                    list(IncidentSeverity)[n % len(IncidentSeverity)],
+                    [services[n % SERVICE_COUNT].id],
+                )
+                incident.created_at = BASE_TIME + timedelta(minutes=n)
+            await session.commit()
+            return [s.id for s in services], incident.id
+
+    service_ids, incident_id = loop.run_until_complete(seed())
+    yield session_factory, service_ids, incident_id
+    loop.run_until_complete(engine.dispose())
+
+
+QUERIES: dict[
+    str, Callable[[AsyncSession, list[uuid.UUID], uuid.UUID], Awaitable[Any]]
+] = {
+    "get_incident": lambda s, _, i: IncidentRepository(s).get_by_id(i),
+    "get_service": lambda s, services, _: ServiceRepository(s).get_by_id(services[0]),
+    "list_incidents": lambda s, *_: IncidentRepository(s).get_all_rows(),
+    "list_filtered": lambda s, services, _: IncidentRepository(s).get_all_rows(
+        **FILTERS, service_ids=services[:3]
+    ),
+}
+
+
+@pytest.mark.parametrize("query", list(QUERIES))
+def test_repository_query(
+    benchmark: BenchmarkFixture,
+    loop: asyncio.AbstractEventLoop,
+    seeded: tuple[async_sessionmaker[AsyncSession], list[uuid.UUID], uuid.UUID],
+    query: str,
+) -> None:
+    session_factory, service_ids, incident_id = seeded
+
+    async def run() -> None:
+        # A fresh session each time, as each request gets, so nothing is
+        # served from the identity map.
+        async with session_factory() as session:
+            await QUERIES[query](session, service_ids, incident_id)
+
+    benchmark(lambda: loop.run_until_complete(run()))
@@ -42,6 +42,13 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_session] = override_get_session
+    # Tests send requests far faster than any real client, and write through
+    # db_session behind the API's back; rate limiting and response reuse are
+    # tested on their own in test_rate_limit_api.py and test_single_flight_api.py.
+    rate_limiter, single_flight = app.state.rate_limiter, app.state.single_flight
+    app.state.rate_limiter = app.state.single_flight = None
+    # ASGITransport does not run the lifespan, so warm-up is never run here.
+    app.state.warmed_up = True
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -50,6 +57,8 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
+    app.state.rate_limiter, app.state.single_flight = rate_limiter, single_flight
+    app.state.warmed_up = False
 
 
 @pytest_asyncio.fixture
@@ -68,6 +77,7 @@ async def broken_db_client() -> AsyncGenerator[AsyncClient, None]:
         yield mock_session
 
     app.dependency_overrides[get_session] = override_broken_session
+    app.state.warmed_up = True
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -76,3 +86,4 @@ async def broken_db_client() -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
+    app.state.warmed_up = False
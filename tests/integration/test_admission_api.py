@@ -0,0 +1,73 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+
+from app.core.admission import AdmissionController, Lane, LaneGate, PressureMonitor
+from app.main import app
+
+
+@pytest_asyncio.fixture
+async def controller(
+    client: AsyncClient,
+) -> AsyncGenerator[AdmissionController, None]:
+    # One slot per lane and no time to queue for it.
+    admission = AdmissionController(
+        {lane: LaneGate(lane, limit=1, queue_seconds=0.01) for lane in Lane},
+        PressureMonitor(),
+        shed_checkout_wait=0.1,
+        shed_loop_lag=0.1,
+        retry_after=3,
+    )
+    previous = app.state.admission
+    app.state.admission = admission
+    yield admission
+    app.state.admission = previous
+
+
+@pytest.mark.asyncio
+async def test_request_without_a_slot_gets_503(
+    client: AsyncClient, controller: AdmissionController
+) -> None:
+    assert await controller.gates[Lane.read].acquire()
+
+    response = await client.get("/api/v1/services")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "3"
+    assert response.json()["error"]["code"] == "OVERLOADED"
+
+    # Other lanes are unaffected.
+    response = await client.post("/api/v1/services", json={"name": "api"})
+    assert response.status_code == 201
+    assert (await client.get("/health/ready")).status_code == 200
+
+    controller.release(Lane.read)
+    assert (await client.get("/api/v1/services")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_reads_are_shed_under_pool_pressure(
+    client: AsyncClient, controller: AdmissionController
+) -> None:
+    controller.gates[Lane.read].limit = 4
+    controller.gates[Lane.read].queue_seconds = 5
+    controller.monitor.record_checkout_wait(0.5)
+    # Half the read slots are still open, but reads no longer queue for them.
+    assert await controller.gates[Lane.read].acquire()
+    assert await controller.gates[Lane.read].acquire()
+    assert (await client.get("/api/v1/services")).status_code == 503
+
+    assert (
+        await client.post("/api/v1/services", json={"name": "a"})
+    ).status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_outcomes_are_exported(
+    client: AsyncClient, controller: AdmissionController
+) -> None:
+    await client.get("/api/v1/services")
+    body = (await client.get("/metrics")).text
+    assert 'admission_requests_total{lane="read",outcome="admitted"}' in body
+    assert 'admission_queue_depth{lane="read"}' in body
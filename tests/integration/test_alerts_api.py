@@ -0,0 +1,296 @@
+import uuid
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.orm import AlertFingerprint, Incident
+from app.services import alerts as alert_service
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The recent-fingerprint cache outlives each test's database.
+    monkeypatch.setattr(alert_service, "_recent", OrderedDict())
+
+
+async def create_service(client: AsyncClient, name: str = "payments") -> str:
+    response = await client.post("/api/v1/services", json={"name": name})
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+def alert(
+    status: str = "firing",
+    fingerprint: str | None = "a1b2c3d4e5f60718",
+    service: str | None = "payments",
+    **labels: str,
+) -> dict[str, object]:
+    if service is not None:
+        labels["service"] = service
+    payload: dict[str, object] = {
+        "status": status,
+        "labels": {"alertname": "HighErrorRate", "severity": "critical", **labels},
+        "annotations": {
+            "summary": "Checkout error rate above 5%",
+            "description": "5xx responses from checkout exceed the threshold.",
+        },
+        "startsAt": "2026-10-19T08:00:00Z",
+        "generatorURL": "http://prometheus/graph",
+    }
+    if fingerprint is not None:
+        payload["fingerprint"] = fingerprint
+    return payload
+
+
+async def send(client: AsyncClient, *alerts: dict[str, object]) -> dict[str, int]:
+    response = await client.post(
+        "/api/v1/alerts",
+        json={"receiver": "opstatus", "status": "firing", "alerts": list(alerts)},
+    )
+    assert response.status_code == 200
+    body: dict[str, int] = response.json()
+    return body
+
+
+async def incidents(db_session: AsyncSession) -> list[Incident]:
+    db_session.expire_all()
+    result = await db_session.scalars(select(Incident).order_by(Incident.created_at))
+    return list(result.all())
+
+
+@pytest.mark.asyncio
+async def test_firing_alert_opens_an_incident(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client)
+
+    body = await send(client, alert())
+
+    assert body["opened"] == 1
+    service = (await client.get(f"/api/v1/services/{service_id}")).json()
+    assert service["status"] == "outage"
+    [incident] = await incidents(db_session)
+    assert incident.title == "Checkout error rate above 5%"
+    assert incident.severity == "critical"
+    assert incident.body == "5xx responses from checkout exceed the threshold."
+    assert [str(s.id) for s in incident.services] == [service_id]
+
+
+@pytest.mark.asyncio
+async def test_repeats_are_suppressed(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await create_service(client)
+
+    first = await send(client, alert(), alert(), alert())
+    second = await send(client, alert())
+
+    assert first == {
+        "received": 3,
+        "opened": 1,
+        "updated": 0,
+        "resolved": 0,
+        "suppressed": 2,
+        "unmatched": 0,
+    }
+    assert second["suppressed"] == 1
+    [incident] = await incidents(db_session)
+    assert incident.updates == []
+
+
+@pytest.mark.asyncio
+async def test_repeats_in_another_process_are_debounced_by_the_database(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await create_service(client)
+    await send(client, alert())
+    alert_service._recent.clear()
+
+    body = await send(client, alert())
+
+    assert body["suppressed"] == 1
+    [incident] = await incidents(db_session)
+    assert incident.updates == []
+
+
+@pytest.mark.asyncio
+async def test_repeat_after_the_debounce_window_adds_an_update(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "alert_debounce_seconds", 0.0)
+    await create_service(client)
+    await send(client, alert())
+
+    body = await send(client, alert())
+
+    assert body["updated"] == 1
+    [incident] = await incidents(db_session)
+    assert [u.message for u in incident.updates] == ["Alert is still firing."]
+
+
+@pytest.mark.asyncio
+async def test_resolved_alert_resolves_its_incident(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await create_service(client)
+    await send(client, alert())
+
+    body = await send(client, alert("resolved"))
+    again = await send(client, alert("resolved"))
+
+    assert body["resolved"] == 1
+    assert again["suppressed"] == 1
+    [incident] = await incidents(db_session)
+    assert incident.status == "resolved"
+
+
+@pytest.mark.asyncio
+async def test_alert_firing_again_after_resolving_opens_a_new_incident(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await create_service(client)
+    await send(client, alert())
+    await send(client, alert("resolved"))
+
+    body = await send(client, alert())
+
+    assert body["opened"] == 1
+    assert [i.status for i in await incidents(db_session)] == [
+        "resolved",
+        "investigating",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incident_resolved_through_the_api_is_reopened(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await create_service(client)
+    await send(client, alert())
+    [incident] = await incidents(db_session)
+    await client.post(f"/api/v1/incidents/{incident.id}/resolve")
+    alert_service._recent.clear()
+
+    body = await send(client, alert())
+
+    assert body["opened"] == 1
+    assert len(await incidents(db_session)) == 2
+
+
+@pytest.mark.asyncio
+async def test_alerts_for_unknown_services_are_unmatched(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await create_service(client)
+
+    body = await send(
+        client,
+        alert(fingerprint="1", service="inventory"),
+        alert(fingerprint="2", service=None),
+    )
+
+    assert body["unmatched"] == 2
+    assert await incidents(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_fingerprint_defaults_to_the_labels(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await create_service(client)
+
+    body = await send(
+        client,
+        alert(fingerprint=None),
+        alert(fingerprint=None),
+        alert(fingerprint=None, instance="web-2"),
+    )
+
+    assert body["opened"] == 2
+    assert body["suppressed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_severity_label_is_mapped(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await create_service(client)
+
+    await send(
+        client,
+        alert(fingerprint="1", severity="warning"),
+        alert(fingerprint="2", severity="info"),
+        alert(fingerprint="3", severity="page"),
+    )
+
+    assert [i.severity for i in await incidents(db_session)] == [
+        "medium",
+        "low",
+        "medium",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incident_being_opened_elsewhere_is_left_alone(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    # A claim naming an incident that does not exist yet, as left by a request
+    # in another process that is still creating it.
+    await create_service(client)
+    db_session.add(
+        AlertFingerprint(
+            fingerprint="a1b2c3d4e5f60718",
+            incident_id=uuid.uuid4(),
+            updated_at=datetime.now(UTC),
+        )
+    )
+    await db_session.commit()
+
+    body = await send(client, alert())
+
+    assert body["suppressed"] == 1
+    assert await incidents(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_abandoned_claim_is_taken_over(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await create_service(client)
+    stale = uuid.uuid4()
+    db_session.add(
+        AlertFingerprint(
+            fingerprint="a1b2c3d4e5f60718",
+            incident_id=stale,
+            updated_at=datetime.now(UTC)
+            - timedelta(seconds=settings.alert_debounce_seconds + 1),
+        )
+    )
+    await db_session.commit()
+
+    body = await send(client, alert())
+
+    assert body["opened"] == 1
+    [incident] = await incidents(db_session)
+    row = await db_session.get(AlertFingerprint, "a1b2c3d4e5f60718")
+    assert row is not None
+    await db_session.refresh(row)
+    assert row.incident_id == incident.id
+
+
+@pytest.mark.asyncio
+async def test_empty_batch_is_rejected(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    response = await client.post("/api/v1/alerts", json={"alerts": []})
+
+    assert response.status_code == 422
+    count = await db_session.scalar(select(func.count()).select_from(Incident))
+    assert count == 0
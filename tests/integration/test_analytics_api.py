@@ -0,0 +1,246 @@
+import uuid
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.analytics import AnalyticsRepository
+from app.models.enums import IncidentSeverity, IncidentStatus
+from app.models.orm.incident import Incident
+from app.models.orm.incident_update import IncidentUpdate
+from app.models.orm.service import Service
+
+# --- helpers ---
+
+
+async def create_service(client: AsyncClient, name: str) -> str:
+    response = await client.post("/api/v1/services", json={"name": name})
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def seed_incident(
+    db_session: AsyncSession,
+    service_ids: list[str],
+    created_at: datetime,
+    timeline: list[tuple[timedelta, IncidentStatus]] | None = None,
+    severity: IncidentSeverity = IncidentSeverity.high,
+) -> None:
+    # Writes an incident with a fixed history directly, bypassing the API so
+    # timestamps can be controlled. Rollups are then built with rebuild().
+    timeline = timeline or []
+    resolved = [offset for offset, status in timeline if status == "resolved"]
+    incident = Incident(
+        title="Seeded",
+        severity=severity,
+        status=IncidentStatus.resolved if resolved else IncidentStatus.investigating,
+        created_at=created_at,
+        updated_at=created_at,
+        resolved_at=created_at + resolved[0] if resolved else None,
+        last_update_sequence=len(timeline),
+    )
+    incident.services = [
+        service
+        for sid in service_ids
+        if (service := await db_session.get(Service, uuid.UUID(sid))) is not None
+    ]
+    incident.updates = [
+        IncidentUpdate(
+            sequence=n,
+            message=status.value,
+            status=status,
+            created_at=created_at + offset,
+        )
+        for n, (offset, status) in enumerate(timeline, start=1)
+    ]
+    db_session.add(incident)
+    await db_session.commit()
+
+
+async def get_report(client: AsyncClient, **params: Any) -> list[dict[str, Any]]:
+    response = await client.get("/api/v1/analytics", params=params)
+    assert response.status_code == 200
+    return list(response.json()["data"])
+
+
+JANUARY = {"start": "2026-01-01", "end": "2026-01-31"}
+
+# --- analytics ---
+
+
+@pytest.mark.asyncio
+async def test_analytics_empty_defaults_to_last_year(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/analytics")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["data"] == []
+    today = datetime.now(UTC).date()
+    assert body["meta"] == {
+        "start": (today - timedelta(days=364)).isoformat(),
+        "end": today.isoformat(),
+        "bucket": "day",
+    }
+
+
+@pytest.mark.asyncio
+async def test_analytics_tracks_incidents_as_they_open_and_resolve(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "Analytics Service")
+    for title in ("One", "Two"):
+        response = await client.post(
+            "/api/v1/incidents",
+            json={"title": title, "severity": "high", "service_ids": [service_id]},
+        )
+    await client.post(f"/api/v1/incidents/{response.json()['id']}/resolve")
+
+    [point] = await get_report(client)
+    assert point["bucket_start"] == datetime.now(UTC).date().isoformat()
+    assert point["severity"] == "high"
+    assert point["opened"] == 2
+    assert point["resolved"] == 1
+    assert point["mttr_seconds"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_analytics_time_in_state_follows_the_timeline(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Timeline Analytics Service")
+    await seed_incident(
+        db_session,
+        [service_id],
+        datetime(2026, 1, 5, tzinfo=UTC),
+        [
+            (timedelta(hours=1), IncidentStatus.identified),
+            (timedelta(hours=2), IncidentStatus.identified),
+            (timedelta(hours=3), IncidentStatus.monitoring),
+            (timedelta(hours=4), IncidentStatus.resolved),
+        ],
+    )
+    await AnalyticsRepository(db_session).rebuild()
+
+    [point] = await get_report(client, **JANUARY)
+    assert point["mttr_seconds"] == 4 * 3600
+    assert point["mean_time_in_state_seconds"] == {
+        "investigating": 3600,
+        "identified": 2 * 3600,
+        "monitoring": 3600,
+    }
+
+
+@pytest.mark.asyncio
+async def test_analytics_averages_over_resolved_incidents(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Mean Analytics Service")
+    for hours in (1, 3):
+        await seed_incident(
+            db_session,
+            [service_id],
+            datetime(2026, 1, 5, tzinfo=UTC),
+            [(timedelta(hours=hours), IncidentStatus.resolved)],
+        )
+    await seed_incident(db_session, [service_id], datetime(2026, 1, 5, tzinfo=UTC))
+    await AnalyticsRepository(db_session).rebuild()
+
+    [point] = await get_report(client, **JANUARY)
+    assert point["opened"] == 3
+    assert point["resolved"] == 2
+    assert point["mttr_seconds"] == 2 * 3600
+
+
+@pytest.mark.asyncio
+async def test_analytics_groups_by_week_and_month(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Bucket Analytics Service")
+    # 2026-01-05 and 2026-01-12 are Mondays.
+    for day in (date(2026, 1, 5), date(2026, 1, 11), date(2026, 1, 12)):
+        created = datetime(day.year, day.month, day.day, 12, tzinfo=UTC)
+        await seed_incident(db_session, [service_id], created)
+    await AnalyticsRepository(db_session).rebuild()
+
+    weekly = await get_report(client, bucket="week", **JANUARY)
+    assert [(p["bucket_start"], p["opened"]) for p in weekly] == [
+        ("2026-01-05", 2),
+        ("2026-01-12", 1),
+    ]
+    monthly = await get_report(client, bucket="month", **JANUARY)
+    assert [(p["bucket_start"], p["opened"]) for p in monthly] == [("2026-01-01", 3)]
+
+
+@pytest.mark.asyncio
+async def test_analytics_splits_by_severity_most_severe_first(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Severity Analytics Service")
+    created = datetime(2026, 1, 5, tzinfo=UTC)
+    for severity in (IncidentSeverity.low, IncidentSeverity.critical):
+        await seed_incident(db_session, [service_id], created, severity=severity)
+    await AnalyticsRepository(db_session).rebuild()
+
+    points = await get_report(client, **JANUARY)
+    assert [p["severity"] for p in points] == ["critical", "low"]
+    filtered = await get_report(client, severity="low", **JANUARY)
+    assert [p["severity"] for p in filtered] == ["low"]
+
+
+@pytest.mark.asyncio
+async def test_analytics_per_service(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    first = await create_service(client, "First Analytics Service")
+    second = await create_service(client, "Second Analytics Service")
+    created = datetime(2026, 1, 5, tzinfo=UTC)
+    await seed_incident(db_session, [first], created)
+    await seed_incident(db_session, [first, second], created)
+    await AnalyticsRepository(db_session).rebuild()
+
+    assert [p["opened"] for p in await get_report(client, **JANUARY)] == [2]
+    assert [
+        p["opened"] for p in await get_report(client, service_id=first, **JANUARY)
+    ] == [2]
+    assert [
+        p["opened"] for p in await get_report(client, service_id=second, **JANUARY)
+    ] == [1]
+
+
+@pytest.mark.asyncio
+async def test_analytics_incremental_rollups_match_rebuild(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Rebuild Analytics Service")
+    for severity in ("high", "low", "high"):
+        response = await client.post(
+            "/api/v1/incidents",
+            json={"title": "Live", "severity": severity, "service_ids": [service_id]},
+        )
+        incident_id = response.json()["id"]
+        await client.post(
+            f"/api/v1/incidents/{incident_id}/updates",
+            json={"message": "Found it", "status": "identified"},
+        )
+        await client.post(f"/api/v1/incidents/{incident_id}/resolve")
+
+    incremental = await get_report(client, service_id=service_id)
+    await AnalyticsRepository(db_session).rebuild()
+    assert await get_report(client, service_id=service_id) == incremental
+
+
+@pytest.mark.asyncio
+async def test_analytics_unknown_service_returns_404(client: AsyncClient) -> None:
+    response = await client.get(
+        "/api/v1/analytics", params={"service_id": str(uuid.uuid4())}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_analytics_start_after_end_returns_422(client: AsyncClient) -> None:
+    response = await client.get(
+        "/api/v1/analytics", params={"start": "2026-02-01", "end": "2026-01-01"}
+    )
+    assert response.status_code == 422
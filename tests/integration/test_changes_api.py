@@ -0,0 +1,203 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.orm import Incident
+from app.services.archive import archive_resolved_incidents
+from app.services.changes import compact_changes
+
+# --- helpers ---
+
+
+async def create_service(client: AsyncClient, name: str) -> str:
+    response = await client.post("/api/v1/services", json={"name": name})
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def create_incident(client: AsyncClient, service_id: str) -> str:
+    response = await client.post(
+        "/api/v1/incidents",
+        json={"title": "Down", "severity": "critical", "service_ids": [service_id]},
+    )
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def read_changes(
+    client: AsyncClient, after: int = 0, limit: int = 100
+) -> dict[str, Any]:
+    response = await client.get(
+        "/api/v1/changes", params={"after": after, "limit": limit}
+    )
+    assert response.status_code == 200
+    return dict(response.json())
+
+
+async def feed(client: AsyncClient, after: int = 0) -> list[tuple[str, str, str]]:
+    return [
+        (c["entity_type"], c["entity_id"], c["operation"])
+        for c in (await read_changes(client, after, 1000))["data"]
+    ]
+
+
+# --- tests ---
+
+
+@pytest.mark.asyncio
+async def test_service_writes_are_recorded_in_order(client: AsyncClient) -> None:
+    service_id = await create_service(client, "api")
+    await client.patch(f"/api/v1/services/{service_id}", json={"description": "x"})
+    await client.delete(f"/api/v1/services/{service_id}")
+
+    assert await feed(client) == [
+        ("service", service_id, "created"),
+        ("service", service_id, "updated"),
+        ("service", service_id, "deleted"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pages_follow_next_after_to_the_tip(client: AsyncClient) -> None:
+    ids = [await create_service(client, f"svc-{n}") for n in range(5)]
+
+    first = await read_changes(client, limit=2)
+    assert [c["entity_id"] for c in first["data"]] == ids[:2]
+    assert first["meta"]["count"] == 2
+    assert first["meta"]["next_after"] == first["data"][-1]["seq"]
+    assert first["meta"]["latest_seq"] == first["data"][0]["seq"] + 4
+
+    rest = await read_changes(client, after=first["meta"]["next_after"], limit=10)
+    assert [c["entity_id"] for c in rest["data"]] == ids[2:]
+
+    # Polling at the tip: nothing new, and the cursor stays put.
+    tip = rest["meta"]["next_after"]
+    idle = await read_changes(client, after=tip)
+    assert idle["data"] == []
+    assert idle["meta"]["next_after"] == tip
+
+
+@pytest.mark.asyncio
+async def test_incident_lifecycle_records_incident_and_service_changes(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "api")
+    start = (await read_changes(client))["meta"]["latest_seq"]
+
+    incident_id = await create_incident(client, service_id)
+    assert await feed(client, start) == [
+        ("incident", incident_id, "created"),
+        # The service's effective status went to outage.
+        ("service", service_id, "updated"),
+    ]
+
+    start = (await read_changes(client))["meta"]["latest_seq"]
+    await client.post(
+        f"/api/v1/incidents/{incident_id}/updates",
+        json={"message": "Found it", "status": "identified"},
+    )
+    assert await feed(client, start) == [("incident", incident_id, "updated")]
+
+    start = (await read_changes(client))["meta"]["latest_seq"]
+    await client.post(f"/api/v1/incidents/{incident_id}/resolve")
+    assert set(await feed(client, start)) == {
+        ("incident", incident_id, "updated"),
+        ("service", service_id, "updated"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_write_records_nothing(client: AsyncClient) -> None:
+    await create_service(client, "api")
+    before = await read_changes(client)
+    response = await client.post("/api/v1/services", json={"name": "api"})
+    assert response.status_code == 409
+    assert (await read_changes(client)) == before
+
+
+@pytest.mark.asyncio
+async def test_dependency_edits_are_recorded(client: AsyncClient) -> None:
+    api = await create_service(client, "api")
+    db = await create_service(client, "db")
+    start = (await read_changes(client))["meta"]["latest_seq"]
+
+    await client.post(
+        f"/api/v1/services/{api}/dependencies", json={"depends_on_id": db}
+    )
+    await client.delete(f"/api/v1/services/{api}/dependencies/{db}")
+    assert await feed(client, start) == [
+        ("service", api, "updated"),
+        ("service", api, "updated"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_archival_is_recorded(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    incident_id = await create_incident(client, await create_service(client, "api"))
+    await client.post(f"/api/v1/incidents/{incident_id}/resolve")
+    resolved_at = datetime.now(UTC) - timedelta(days=60)
+    await db_session.execute(
+        update(Incident)
+        .where(Incident.id == uuid.UUID(incident_id))
+        .values(created_at=resolved_at - timedelta(hours=1), resolved_at=resolved_at)
+    )
+    await db_session.commit()
+    start = (await read_changes(client))["meta"]["latest_seq"]
+
+    assert await archive_resolved_incidents(db_session, 30, 500) == 1
+    assert await feed(client, start) == [("incident", incident_id, "archived")]
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_latest_row_per_entity(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    kept = await create_service(client, "kept")
+    for description in ("a", "b", "c"):
+        await client.patch(
+            f"/api/v1/services/{kept}", json={"description": description}
+        )
+    gone = await create_service(client, "gone")
+    await client.delete(f"/api/v1/services/{gone}")
+    latest = (await read_changes(client))["meta"]["latest_seq"]
+
+    result = await compact_changes(
+        db_session, tombstone_retention_days=30, batch_size=2
+    )
+    assert (result.superseded, result.tombstones) == (4, 0)
+    assert await feed(client) == [
+        ("service", kept, "updated"),
+        ("service", gone, "deleted"),
+    ]
+    # Compaction never moves the tip, and new rows continue after it.
+    assert (await read_changes(client))["meta"]["latest_seq"] == latest
+    await client.patch(f"/api/v1/services/{kept}", json={"description": "d"})
+    assert (await read_changes(client, after=latest))["data"][0]["seq"] == latest + 1
+
+
+@pytest.mark.asyncio
+async def test_expired_tombstones_are_dropped(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    kept = await create_service(client, "kept")
+    gone = await create_service(client, "gone")
+    await client.delete(f"/api/v1/services/{gone}")
+
+    result = await compact_changes(
+        db_session, tombstone_retention_days=0, batch_size=10
+    )
+    assert (result.superseded, result.tombstones) == (1, 1)
+    assert await feed(client) == [("service", kept, "created")]
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(client: AsyncClient) -> None:
+    assert (await client.get("/api/v1/changes?after=-1")).status_code == 422
+    assert (await client.get("/api/v1/changes?limit=0")).status_code == 422
@@ -0,0 +1,101 @@
+import gzip
+import json
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from starlette.types import Receive, Scope, Send
+
+from app.core import single_flight as single_flight_module
+from app.core.compression import CompressionMiddleware
+from app.core.single_flight import SingleFlight
+from app.main import app
+
+
+async def create_services(client: AsyncClient, count: int) -> None:
+    for n in range(count):
+        response = await client.post(
+            "/api/v1/services",
+            json={"name": f"service-{n}", "description": "A fairly wordy description"},
+        )
+        assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_compressed(client: AsyncClient) -> None:
+    await create_services(client, 20)
+    response = await client.get("/api/v1/services", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert len(response.json()["data"]) == 20
+
+
+@pytest.mark.asyncio
+async def test_small_or_unwanted_responses_are_not(client: AsyncClient) -> None:
+    small = await client.get("/api/v1/services", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    await create_services(client, 20)
+    identity = await client.get(
+        "/api/v1/services", headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in identity.headers
+
+
+@pytest_asyncio.fixture
+async def single_flight(client: AsyncClient) -> AsyncGenerator[SingleFlight, None]:
+    app.state.single_flight = SingleFlight(ttl=60, beta=0, max_entries=100)
+    yield app.state.single_flight
+    app.state.single_flight = None
+
+
+@pytest.mark.asyncio
+async def test_reused_responses_are_compressed_once(
+    client: AsyncClient,
+    single_flight: SingleFlight,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await create_services(client, 20)
+    calls: list[str] = []
+
+    def counting_compress(body: bytes, encoding: str) -> bytes:
+        calls.append(encoding)
+        return gzip.compress(body)
+
+    monkeypatch.setattr(single_flight_module, "compress", counting_compress)
+    for _ in range(3):
+        response = await client.get(
+            "/api/v1/services", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["data"]) == 20
+    plain = await client.get("/api/v1/services", headers={"Accept-Encoding": ""})
+    assert "content-encoding" not in plain.headers
+    assert calls == ["gzip"]
+
+
+@pytest.mark.asyncio
+async def test_streams_pass_through_uncompressed() -> None:
+    sent: list[bytes] = []
+
+    async def ndjson(scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/x-ndjson")],
+            }
+        )
+        for n in range(3):
+            line = json.dumps({"n": n, "pad": "x" * 2000}).encode() + b"\n"
+            sent.append(line)
+            await send({"type": "http.response.body", "body": line, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    transport = ASGITransport(app=CompressionMiddleware(ndjson, minimum_size=1024))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.content == b"".join(sent)
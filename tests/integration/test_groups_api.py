@@ -0,0 +1,260 @@
+import uuid
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.orm import ServiceGroup
+from app.services.service_status import rebuild_status_history
+
+# --- helpers ---
+
+
+async def create_service(client: AsyncClient, name: str) -> str:
+    response = await client.post("/api/v1/services", json={"name": name})
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def create_group(
+    client: AsyncClient, name: str, parent_id: str | None = None
+) -> str:
+    response = await client.post(
+        "/api/v1/groups", json={"name": name, "parent_id": parent_id}
+    )
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def add_member(client: AsyncClient, group_id: str, service_id: str) -> None:
+    response = await client.post(
+        f"/api/v1/groups/{group_id}/services", json={"service_id": service_id}
+    )
+    assert response.status_code == 201
+
+
+async def create_incident(
+    client: AsyncClient, service_ids: list[str], severity: str = "critical"
+) -> str:
+    response = await client.post(
+        "/api/v1/incidents",
+        json={"title": "Down", "severity": severity, "service_ids": service_ids},
+    )
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def get_group(client: AsyncClient, group_id: str) -> dict[str, Any]:
+    response = await client.get(f"/api/v1/groups/{group_id}")
+    assert response.status_code == 200
+    return dict(response.json())
+
+
+async def build_api_tree(client: AsyncClient) -> dict[str, str]:
+    # Platform → API → {auth, payments}, and API → Edge → {search}.
+    ids = {"platform": await create_group(client, "Platform")}
+    ids["api"] = await create_group(client, "API", ids["platform"])
+    ids["edge"] = await create_group(client, "Edge", ids["api"])
+    for name, group in [("auth", "api"), ("payments", "api"), ("search", "edge")]:
+        ids[name] = await create_service(client, name)
+        await add_member(client, ids[group], ids[name])
+    return ids
+
+
+# --- groups ---
+
+
+@pytest.mark.asyncio
+async def test_list_groups_empty(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/groups")
+    assert response.status_code == 200
+    assert response.json() == {"data": [], "meta": {"total": 0}}
+
+
+@pytest.mark.asyncio
+async def test_groups_count_services_below_them(client: AsyncClient) -> None:
+    ids = await build_api_tree(client)
+
+    response = await client.get("/api/v1/groups")
+    body = response.json()
+    assert body["meta"]["total"] == 3
+    counts = {g["name"]: g["service_count"] for g in body["data"]}
+    assert counts == {"API": 3, "Edge": 1, "Platform": 3}
+    api = await get_group(client, ids["api"])
+    assert api["parent_id"] == ids["platform"]
+    assert api["status"] == "operational"
+
+
+@pytest.mark.asyncio
+async def test_group_services_include_descendants(client: AsyncClient) -> None:
+    ids = await build_api_tree(client)
+    response = await client.get(f"/api/v1/groups/{ids['api']}/services")
+    assert response.status_code == 200
+    assert [s["name"] for s in response.json()["data"]] == [
+        "auth",
+        "payments",
+        "search",
+    ]
+    response = await client.get(f"/api/v1/groups/{ids['edge']}/services")
+    assert [s["name"] for s in response.json()["data"]] == ["search"]
+
+
+@pytest.mark.asyncio
+async def test_rollup_is_worst_member_status(client: AsyncClient) -> None:
+    ids = await build_api_tree(client)
+    await create_incident(client, [ids["auth"]], "medium")
+    assert (await get_group(client, ids["api"]))["status"] == "degraded"
+    assert (await get_group(client, ids["edge"]))["status"] == "operational"
+
+    critical = await create_incident(client, [ids["search"]], "critical")
+    edge = await get_group(client, ids["edge"])
+    assert (edge["status"], edge["outage_count"]) == ("outage", 1)
+    for name in ("api", "platform"):
+        group = await get_group(client, ids[name])
+        assert (group["status"], group["degraded_count"], group["outage_count"]) == (
+            "outage",
+            1,
+            1,
+        )
+
+    await client.post(f"/api/v1/incidents/{critical}/resolve")
+    assert (await get_group(client, ids["edge"]))["status"] == "operational"
+    assert (await get_group(client, ids["platform"]))["status"] == "degraded"
+
+
+@pytest.mark.asyncio
+async def test_rollup_follows_dependency_status(client: AsyncClient) -> None:
+    ids = await build_api_tree(client)
+    db = await create_service(client, "postgres-primary")
+    await client.post(
+        f"/api/v1/services/{ids['payments']}/dependencies",
+        json={"depends_on_id": db},
+    )
+    await create_incident(client, [db], "critical")
+    # payments is degraded through its dependency; postgres-primary is ungrouped.
+    assert (await get_group(client, ids["api"]))["status"] == "degraded"
+
+
+@pytest.mark.asyncio
+async def test_moving_members_and_groups_moves_their_status(
+    client: AsyncClient,
+) -> None:
+    ids = await build_api_tree(client)
+    other = await create_group(client, "Internal")
+    await create_incident(client, [ids["search"]], "critical")
+
+    # search moves from Edge to Internal.
+    await add_member(client, other, ids["search"])
+    assert (await get_group(client, ids["api"]))["status"] == "operational"
+    assert (await get_group(client, other))["status"] == "outage"
+
+    # Internal, with search in it, moves under API.
+    response = await client.patch(
+        f"/api/v1/groups/{other}", json={"parent_id": ids["api"]}
+    )
+    assert response.status_code == 200
+    assert (await get_group(client, ids["platform"]))["status"] == "outage"
+    response = await client.get(f"/api/v1/groups/{ids['platform']}/services")
+    assert response.json()["meta"]["total"] == 3
+
+    # And back to the top level.
+    response = await client.patch(f"/api/v1/groups/{other}", json={"parent_id": None})
+    assert response.json()["parent_id"] is None
+    platform = await get_group(client, ids["platform"])
+    assert (platform["status"], platform["service_count"]) == ("operational", 2)
+
+
+@pytest.mark.asyncio
+async def test_group_cannot_move_under_itself(client: AsyncClient) -> None:
+    ids = await build_api_tree(client)
+    for target in ("api", "edge"):
+        response = await client.patch(
+            f"/api/v1/groups/{ids['api']}", json={"parent_id": ids[target]}
+        )
+        assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_patch_without_parent_keeps_it(client: AsyncClient) -> None:
+    ids = await build_api_tree(client)
+    response = await client.patch(
+        f"/api/v1/groups/{ids['edge']}", json={"description": "CDN and search"}
+    )
+    assert response.json()["parent_id"] == ids["api"]
+    assert response.json()["description"] == "CDN and search"
+
+
+@pytest.mark.asyncio
+async def test_remove_member(client: AsyncClient) -> None:
+    ids = await build_api_tree(client)
+    await create_incident(client, [ids["auth"]])
+    response = await client.delete(
+        f"/api/v1/groups/{ids['api']}/services/{ids['auth']}"
+    )
+    assert response.status_code == 204
+    api = await get_group(client, ids["api"])
+    assert (api["status"], api["service_count"]) == ("operational", 2)
+    response = await client.delete(
+        f"/api/v1/groups/{ids['api']}/services/{ids['auth']}"
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_service_leaves_its_group(client: AsyncClient) -> None:
+    ids = await build_api_tree(client)
+    response = await client.delete(f"/api/v1/services/{ids['search']}")
+    assert response.status_code == 204
+    assert (await get_group(client, ids["platform"]))["service_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_only_empty_groups_can_be_deleted(client: AsyncClient) -> None:
+    ids = await build_api_tree(client)
+    assert (await client.delete(f"/api/v1/groups/{ids['api']}")).status_code == 409
+    assert (await client.delete(f"/api/v1/groups/{ids['edge']}")).status_code == 409
+
+    await client.delete(f"/api/v1/groups/{ids['edge']}/services/{ids['search']}")
+    assert (await client.delete(f"/api/v1/groups/{ids['edge']}")).status_code == 204
+    response = await client.get(f"/api/v1/groups/{ids['api']}/services")
+    assert response.json()["meta"]["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_group_validation(client: AsyncClient) -> None:
+    await create_group(client, "API")
+    response = await client.post("/api/v1/groups", json={"name": "API"})
+    assert response.status_code == 409
+    missing = str(uuid.uuid4())
+    response = await client.post(
+        "/api/v1/groups", json={"name": "Orphan", "parent_id": missing}
+    )
+    assert response.status_code == 404
+    assert (await client.get(f"/api/v1/groups/{missing}")).status_code == 404
+    group = await create_group(client, "Edge")
+    response = await client.post(
+        f"/api/v1/groups/{group}/services", json={"service_id": missing}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_rebuild_repairs_drifted_counters(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    ids = await build_api_tree(client)
+    await create_incident(client, [ids["auth"]])
+    await db_session.execute(
+        update(ServiceGroup).values(service_count=0, outage_count=0)
+    )
+    await db_session.commit()
+
+    await rebuild_status_history(db_session)
+    api = await get_group(client, ids["api"])
+    assert (api["status"], api["service_count"], api["outage_count"]) == (
+        "outage",
+        3,
+        1,
+    )
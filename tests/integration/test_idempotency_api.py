@@ -0,0 +1,269 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.orm import IdempotencyKey, Incident
+from app.models.schemas.incidents import IncidentCreate
+from app.services import incidents as incident_service
+from app.services.idempotency import expire_idempotency_keys, request_fingerprint
+
+KEY = "3f1c9a52-6a0e-4d7c-9f65-0b7f4c2e8d11"
+
+
+async def create_service(client: AsyncClient, name: str = "Payments") -> str:
+    response = await client.post("/api/v1/services", json={"name": name})
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+def incident_payload(
+    service_id: str, title: str = "Checkout errors"
+) -> dict[str, object]:
+    return {"title": title, "severity": "high", "service_ids": [service_id]}
+
+
+async def post_incident(
+    client: AsyncClient, payload: dict[str, object], key: str | None = KEY
+) -> Response:
+    headers = {"Idempotency-Key": key} if key is not None else {}
+    return await client.post("/api/v1/incidents", json=payload, headers=headers)
+
+
+async def incident_count(db_session: AsyncSession) -> int:
+    return await db_session.scalar(select(func.count()).select_from(Incident)) or 0
+
+
+@pytest.mark.asyncio
+async def test_repeated_create_replays_first_response(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    payload = incident_payload(await create_service(client))
+
+    first = await post_incident(client, payload)
+    second = await post_incident(client, payload)
+
+    assert first.status_code == second.status_code == 201
+    assert second.json() == first.json()
+    assert "idempotent-replayed" not in first.headers
+    assert second.headers["idempotent-replayed"] == "true"
+    assert await incident_count(db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_without_a_key_are_not_deduplicated(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    payload = incident_payload(await create_service(client))
+
+    await post_incident(client, payload, key=None)
+    await post_incident(client, payload, key=None)
+
+    assert await incident_count(db_session) == 2
+
+
+@pytest.mark.asyncio
+async def test_repeated_update_is_appended_once(client: AsyncClient) -> None:
+    incident = await post_incident(
+        client, incident_payload(await create_service(client))
+    )
+    url = f"/api/v1/incidents/{incident.json()['id']}/updates"
+    payload = {"message": "Rolled back the deploy.", "status": "identified"}
+
+    first = await client.post(url, json=payload, headers={"Idempotency-Key": "u-1"})
+    second = await client.post(url, json=payload, headers={"Idempotency-Key": "u-1"})
+
+    assert second.json() == first.json()
+    assert second.headers["idempotent-replayed"] == "true"
+    timeline = await client.get(url)
+    assert [u["message"] for u in timeline.json()["data"]] == [
+        "Rolled back the deploy."
+    ]
+
+
+@pytest.mark.asyncio
+async def test_key_reused_for_a_different_request_conflicts(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client)
+    await post_incident(client, incident_payload(service_id))
+
+    response = await post_incident(client, incident_payload(service_id, "Other"))
+
+    assert response.status_code == 409
+    assert "different request" in response.json()["error"]["message"]
+
+
+@pytest.mark.asyncio
+async def test_failed_request_frees_its_key(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    payload = incident_payload("00000000-0000-0000-0000-000000000000")
+
+    first = await post_incident(client, payload)
+    second = await post_incident(client, payload)
+
+    assert first.status_code == second.status_code == 404
+    assert "idempotent-replayed" not in second.headers
+    assert await db_session.get(IdempotencyKey, KEY) is None
+
+
+async def fail(*args: object) -> None:
+    raise RuntimeError("boom")
+
+
+@pytest.mark.asyncio
+async def test_write_failing_before_its_commit_frees_its_key(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = incident_payload(await create_service(client))
+    monkeypatch.setattr(incident_service, "record_status_changes", fail)
+    with pytest.raises(RuntimeError):
+        await post_incident(client, payload)
+    monkeypatch.undo()
+
+    retry = await post_incident(client, payload)
+
+    assert retry.status_code == 201
+    assert "idempotent-replayed" not in retry.headers
+    assert await incident_count(db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_failing_after_its_commit_keeps_its_key(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # The incident is committed; only the gauge refresh that follows fails.
+    payload = incident_payload(await create_service(client))
+    monkeypatch.setattr(incident_service, "_sync_incident_metrics", fail)
+    with pytest.raises(RuntimeError):
+        await post_incident(client, payload)
+    monkeypatch.undo()
+
+    retry = await post_incident(client, payload)
+
+    assert retry.status_code == 201
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert await incident_count(db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_repeats_wait_for_the_first_request(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    payload = incident_payload(await create_service(client))
+
+    responses = await asyncio.gather(
+        *(post_incident(client, payload) for _ in range(3))
+    )
+
+    assert {r.status_code for r in responses} == {201}
+    assert len({r.json()["id"] for r in responses}) == 1
+    assert sum("idempotent-replayed" in r.headers for r in responses) == 2
+    assert await incident_count(db_session) == 1
+
+
+async def add_key(
+    db_session: AsyncSession,
+    payload: dict[str, object],
+    age: timedelta,
+    response: dict[str, object] | None,
+) -> None:
+    db_session.add(
+        IdempotencyKey(
+            key=KEY,
+            fingerprint=request_fingerprint(
+                "POST /incidents", IncidentCreate.model_validate(payload)
+            ),
+            response=response,
+            created_at=datetime.now(UTC) - age,
+        )
+    )
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_expired_key_runs_the_request_again(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    payload = incident_payload(await create_service(client))
+    first = await post_incident(client, payload)
+    await db_session.delete(await db_session.get(IdempotencyKey, KEY))
+    await add_key(
+        db_session,
+        payload,
+        timedelta(hours=settings.idempotency_key_ttl_hours + 1),
+        first.json(),
+    )
+
+    second = await post_incident(client, payload)
+
+    assert second.status_code == 201
+    assert second.json()["id"] != first.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_request_in_progress_elsewhere_conflicts_after_waiting(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # A claim with no response, as left by a request still running in another
+    # process.
+    monkeypatch.setattr(settings, "idempotency_wait_seconds", 0.1)
+    payload = incident_payload(await create_service(client))
+    await add_key(db_session, payload, timedelta(seconds=1), None)
+
+    response = await post_incident(client, payload)
+
+    assert response.status_code == 409
+    assert "still in progress" in response.json()["error"]["message"]
+    assert await incident_count(db_session) == 0
+
+
+@pytest.mark.asyncio
+async def test_abandoned_claim_is_taken_over(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    payload = incident_payload(await create_service(client))
+    await add_key(
+        db_session,
+        payload,
+        timedelta(seconds=settings.idempotency_lease_seconds + 1),
+        None,
+    )
+
+    response = await post_incident(client, payload)
+
+    assert response.status_code == 201
+    assert await incident_count(db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_expire_idempotency_keys_deletes_only_expired_keys(
+    db_session: AsyncSession,
+) -> None:
+    now = datetime.now(UTC)
+    ttl = timedelta(hours=settings.idempotency_key_ttl_hours)
+    db_session.add_all(
+        [
+            IdempotencyKey(key=f"old-{n}", fingerprint="x", created_at=now - 2 * ttl)
+            for n in range(5)
+        ]
+        + [IdempotencyKey(key="fresh", fingerprint="x", created_at=now)]
+    )
+    await db_session.commit()
+
+    expired = await expire_idempotency_keys(db_session, batch_size=2)
+
+    assert expired == 5
+    remaining = await db_session.scalars(select(IdempotencyKey.key))
+    assert list(remaining) == ["fresh"]
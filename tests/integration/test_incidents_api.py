@@ -1,5 +1,16 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.incident_search import IncidentSearchRepository
+from app.models.orm.incident import Incident
+from app.models.orm.incident_update import IncidentUpdate
+from app.services.archive import archive_resolved_incidents
 
 # --- helpers ---
 
@@ -113,6 +124,333 @@ async def test_list_incidents_combined_filters(client: AsyncClient) -> None:
     assert data[0]["title"] == "High Active"
 
 
+@pytest.mark.asyncio
+async def test_list_incidents_filter_by_multiple_statuses(client: AsyncClient) -> None:
+    service_id = await create_service(client, "Multi Status Service")
+    await create_incident(client, service_id, title="Investigating")
+    identified = await create_incident(client, service_id, title="Identified")
+    await client.patch(f"/api/v1/incidents/{identified}", json={"status": "identified"})
+    resolved = await create_incident(client, service_id, title="Resolved")
+    await client.post(f"/api/v1/incidents/{resolved}/resolve")
+
+    response = await client.get("/api/v1/incidents?status=investigating,identified")
+    titles = {i["title"] for i in response.json()["data"]}
+    assert titles == {"Investigating", "Identified"}
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_filter_by_multiple_severities(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "Multi Severity Service")
+    for severity in ("critical", "high", "low"):
+        await create_incident(client, service_id, title=severity, severity=severity)
+
+    response = await client.get("/api/v1/incidents?severity=critical,low")
+    titles = {i["title"] for i in response.json()["data"]}
+    assert titles == {"critical", "low"}
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_invalid_status_value_returns_422(
+    client: AsyncClient,
+) -> None:
+    response = await client.get("/api/v1/incidents?status=investigating,bogus")
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+
+
+async def create_multi_service_incident(
+    client: AsyncClient, title: str, service_ids: list[str]
+) -> str:
+    response = await client.post(
+        "/api/v1/incidents",
+        json={"title": title, "severity": "low", "service_ids": service_ids},
+    )
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_filter_by_service_ids_any(client: AsyncClient) -> None:
+    service_a = await create_service(client, "Any A")
+    service_b = await create_service(client, "Any B")
+    service_c = await create_service(client, "Any C")
+    await create_multi_service_incident(client, "A only", [service_a])
+    await create_multi_service_incident(client, "A and B", [service_a, service_b])
+    await create_multi_service_incident(client, "C only", [service_c])
+
+    response = await client.get(
+        f"/api/v1/incidents?service_ids={service_a},{service_b}"
+    )
+    titles = sorted(i["title"] for i in response.json()["data"])
+    assert titles == ["A and B", "A only"]
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_filter_by_service_ids_all(client: AsyncClient) -> None:
+    service_a = await create_service(client, "All A")
+    service_b = await create_service(client, "All B")
+    await create_multi_service_incident(client, "A only", [service_a])
+    await create_multi_service_incident(client, "A and B", [service_a, service_b])
+
+    response = await client.get(
+        f"/api/v1/incidents?service_ids={service_a},{service_b}&service_match=all"
+    )
+    titles = [i["title"] for i in response.json()["data"]]
+    assert titles == ["A and B"]
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_active_shortcut(client: AsyncClient) -> None:
+    service_id = await create_service(client, "Active Filter Service")
+    await create_incident(client, service_id, title="Open")
+    resolved = await create_incident(client, service_id, title="Closed")
+    await client.post(f"/api/v1/incidents/{resolved}/resolve")
+
+    active = await client.get("/api/v1/incidents?active=true")
+    inactive = await client.get("/api/v1/incidents?active=false")
+    assert [i["title"] for i in active.json()["data"]] == ["Open"]
+    assert [i["title"] for i in inactive.json()["data"]] == ["Closed"]
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_filter_by_created_and_resolved_time(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "Time Filter Service")
+    first = await client.post(
+        "/api/v1/incidents",
+        json={"title": "First", "severity": "low", "service_ids": [service_id]},
+    )
+    second = await create_incident(client, service_id, title="Second")
+    resolved = await client.post(f"/api/v1/incidents/{second}/resolve")
+    first_created = first.json()["created_at"]
+    resolved_at = resolved.json()["resolved_at"]
+
+    before = await client.get(
+        "/api/v1/incidents", params={"created_before": first_created}
+    )
+    after = await client.get(
+        "/api/v1/incidents", params={"created_after": first_created}
+    )
+    resolved_since = await client.get(
+        "/api/v1/incidents", params={"resolved_after": resolved_at}
+    )
+    assert before.json()["data"] == []
+    assert {i["title"] for i in after.json()["data"]} == {"First", "Second"}
+    assert [i["title"] for i in resolved_since.json()["data"]] == ["Second"]
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_sort_by_severity(client: AsyncClient) -> None:
+    service_id = await create_service(client, "Sort Service")
+    for severity in ("low", "critical", "medium", "high"):
+        await create_incident(client, service_id, title=severity, severity=severity)
+
+    response = await client.get("/api/v1/incidents?sort=severity")
+    titles = [i["title"] for i in response.json()["data"]]
+    assert titles == ["critical", "high", "medium", "low"]
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_sort_by_severity_follows_severity_changes(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "Resort Service")
+    await create_incident(client, service_id, title="High", severity="high")
+    escalated = await create_incident(
+        client, service_id, title="Was Low", severity="low"
+    )
+    await client.patch(f"/api/v1/incidents/{escalated}", json={"severity": "critical"})
+
+    response = await client.get("/api/v1/incidents?sort=severity")
+    titles = [i["title"] for i in response.json()["data"]]
+    assert titles == ["Was Low", "High"]
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_sort_oldest_first(client: AsyncClient) -> None:
+    service_id = await create_service(client, "Oldest Sort Service")
+    await create_incident(client, service_id, title="First")
+    await create_incident(client, service_id, title="Second")
+
+    response = await client.get("/api/v1/incidents?sort=oldest")
+    titles = [i["title"] for i in response.json()["data"]]
+    assert titles == ["First", "Second"]
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_matches_detail(client: AsyncClient) -> None:
+    # The list is read as plain rows, the detail through the ORM.
+    services = [await create_service(client, name) for name in ("api", "db")]
+    created = await client.post(
+        "/api/v1/incidents",
+        json={"title": "Down", "severity": "high", "service_ids": services},
+    )
+    incident_id = created.json()["id"]
+    for status in ("identified", "monitoring"):
+        await client.post(
+            f"/api/v1/incidents/{incident_id}/updates",
+            json={"message": f"Now {status}", "status": status},
+        )
+    await create_incident(client, services[0], title="Other")
+
+    listed = (await client.get("/api/v1/incidents?sort=oldest")).json()["data"][0]
+    detail = (await client.get(f"/api/v1/incidents/{incident_id}")).json()
+    assert len(listed["updates"]) == 2
+    assert sorted(listed.pop("service_ids")) == sorted(detail.pop("service_ids"))
+    assert listed == detail
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_uses_fixed_number_of_queries(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "api")
+    await create_incident(client, service_id)
+    statements = count_queries(db_session)
+
+    await client.get(f"/api/v1/incidents?service_id={service_id}")
+    few = len(statements)
+    for _ in range(20):
+        await create_incident(client, service_id)
+    statements.clear()
+    response = await client.get(f"/api/v1/incidents?service_id={service_id}")
+    assert len(response.json()["data"]) == 21
+    assert len(statements) == few
+
+
+async def set_incident_interval(
+    db_session: AsyncSession,
+    incident_id: str,
+    created_at: str,
+    resolved_at: str | None = None,
+) -> None:
+    await db_session.execute(
+        update(Incident)
+        .where(Incident.id == uuid.UUID(incident_id))
+        .values(
+            created_at=datetime.fromisoformat(created_at),
+            resolved_at=datetime.fromisoformat(resolved_at) if resolved_at else None,
+        )
+    )
+    await db_session.commit()
+
+
+async def list_active_during(client: AsyncClient, window: str) -> set[str]:
+    response = await client.get("/api/v1/incidents", params={"active_during": window})
+    assert response.status_code == 200
+    return {i["title"] for i in response.json()["data"]}
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_active_during_returns_overlapping_incidents(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Interval Service")
+    early = await create_incident(client, service_id, title="Early")
+    open_ = await create_incident(client, service_id, title="Open")
+    late = await create_incident(client, service_id, title="Late")
+    await set_incident_interval(
+        db_session, early, "2026-01-01T00:00:00", "2026-01-01T02:00:00"
+    )
+    await set_incident_interval(db_session, open_, "2026-01-01T03:00:00")
+    await set_incident_interval(
+        db_session, late, "2026-01-01T05:00:00", "2026-01-01T06:00:00"
+    )
+
+    assert await list_active_during(
+        client, "2026-01-01T01:00:00Z,2026-01-01T04:00:00Z"
+    ) == {"Early", "Open"}
+    assert await list_active_during(
+        client, "2026-01-01T05:30:00Z,2026-01-01T05:45:00Z"
+    ) == {"Open", "Late"}
+    assert (
+        await list_active_during(client, "2025-12-31T00:00:00Z,2025-12-31T23:59:59Z")
+        == set()
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_active_during_is_exact_within_a_minute(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Interval Edge Service")
+    incident_id = await create_incident(client, service_id, title="Edge")
+    await set_incident_interval(
+        db_session, incident_id, "2026-01-01T00:00:00", "2026-01-01T02:00:00"
+    )
+
+    # Bounds are inclusive; a window starting 30s after resolution shares the
+    # indexed minute but must not match.
+    assert await list_active_during(
+        client, "2026-01-01T02:00:00Z,2026-01-01T03:00:00Z"
+    ) == {"Edge"}
+    assert (
+        await list_active_during(client, "2026-01-01T02:00:30Z,2026-01-01T03:00:00Z")
+        == set()
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_active_during_normalises_offsets(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Interval Offset Service")
+    incident_id = await create_incident(client, service_id, title="Offset")
+    await set_incident_interval(
+        db_session, incident_id, "2026-01-01T10:00:00", "2026-01-01T11:00:00"
+    )
+
+    # 11:30+02:00 is 09:30 UTC, before the incident opened.
+    assert (
+        await list_active_during(
+            client, "2026-01-01T10:30:00+02:00,2026-01-01T11:30:00+02:00"
+        )
+        == set()
+    )
+    assert await list_active_during(
+        client, "2026-01-01T12:30:00+02:00,2026-01-01T12:45:00+02:00"
+    ) == {"Offset"}
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_active_during_reads_naive_bounds_as_utc(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Interval Naive Service")
+    incident_id = await create_incident(client, service_id, title="Naive")
+    await set_incident_interval(
+        db_session, incident_id, "2026-01-01T10:00:00", "2026-01-01T11:00:00"
+    )
+
+    assert await list_active_during(
+        client, "2026-01-01T10:30:00,2026-01-01T13:00:00+02:00"
+    ) == {"Naive"}
+    assert (
+        await list_active_during(client, "2026-01-01T11:30:00,2026-01-01T12:00:00Z")
+        == set()
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "window",
+    [
+        "2026-01-01T00:00:00Z",
+        "2026-01-02T00:00:00Z,2026-01-01T00:00:00Z",
+        "2026-01-02T00:00:00,2026-01-01T00:00:00Z",
+        "a,b",
+    ],
+)
+async def test_list_incidents_active_during_invalid_window_returns_422(
+    client: AsyncClient, window: str
+) -> None:
+    response = await client.get("/api/v1/incidents", params={"active_during": window})
+    assert response.status_code == 422
+
+
 # --- create incident ---
 
 
@@ -263,6 +601,99 @@ async def test_get_incident_invalid_uuid_returns_422(client: AsyncClient) -> Non
     assert response.json()["error"]["code"] == "VALIDATION_ERROR"
 
 
+# --- lookup by IDs ---
+
+
+def count_queries(db_session: AsyncSession) -> list[str]:
+    statements: list[str] = []
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", record)
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_lookup_incidents_by_ids(client: AsyncClient) -> None:
+    service_id = await create_service(client, "api")
+    first = await create_incident(client, service_id, title="First")
+    second = await create_incident(client, service_id, title="Second")
+    await create_incident(client, service_id, title="Not asked for")
+    unknown = str(uuid.uuid4())
+
+    response = await client.get(
+        f"/api/v1/incidents?ids={second},{unknown},{first},{second}"
+    )
+    assert response.status_code == 200
+    body = response.json()
+    # Requested order, duplicates dropped.
+    assert [i["title"] for i in body["data"]] == ["Second", "First"]
+    assert body["data"][0]["service_ids"] == [service_id]
+    assert body["missing"] == [unknown]
+    assert body["meta"] == {"total": 2, "missing": 1}
+
+    # Unfiltered lists report nothing missing.
+    assert (await client.get("/api/v1/incidents")).json()["missing"] == []
+
+
+@pytest.mark.asyncio
+async def test_lookup_incidents_post_matches_get(client: AsyncClient) -> None:
+    service_id = await create_service(client, "api")
+    ids = [await create_incident(client, service_id) for _ in range(3)]
+    posted = await client.post("/api/v1/incidents/lookup", json={"ids": ids})
+    got = await client.get(f"/api/v1/incidents?ids={','.join(ids)}")
+    assert posted.status_code == 200
+    assert posted.json() == got.json()
+
+
+@pytest.mark.asyncio
+async def test_lookup_incidents_uses_fixed_number_of_queries(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "api")
+    ids = [await create_incident(client, service_id) for _ in range(30)]
+    statements = count_queries(db_session)
+
+    await client.post("/api/v1/incidents/lookup", json={"ids": ids[:2]})
+    few = len(statements)
+    statements.clear()
+    response = await client.post("/api/v1/incidents/lookup", json={"ids": ids})
+    assert len(response.json()["data"]) == 30
+    assert len(statements) == few
+
+
+@pytest.mark.asyncio
+async def test_lookup_incidents_includes_archived(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "api")
+    old_id = await create_incident(client, service_id, title="Old")
+    live_id = await create_incident(client, service_id, title="Live")
+    await resolve_long_ago(client, db_session, old_id, days=60)
+    assert await archive(db_session) == 1
+
+    response = await client.post(
+        "/api/v1/incidents/lookup", json={"ids": [old_id, live_id]}
+    )
+    assert [i["title"] for i in response.json()["data"]] == ["Old", "Live"]
+    assert response.json()["missing"] == []
+
+
+@pytest.mark.asyncio
+async def test_lookup_incidents_rejects_filters_and_bad_lists(
+    client: AsyncClient,
+) -> None:
+    some_id = uuid.uuid4()
+    response = await client.get(f"/api/v1/incidents?ids={some_id}&active=true")
+    assert response.status_code == 422
+    response = await client.post("/api/v1/incidents/lookup", json={"ids": []})
+    assert response.status_code == 422
+    too_many = [str(uuid.uuid4()) for _ in range(1001)]
+    response = await client.post("/api/v1/incidents/lookup", json={"ids": too_many})
+    assert response.status_code == 422
+
+
 # --- update incident ---
 
 
@@ -427,6 +858,231 @@ async def test_append_update_to_nonexistent_incident_returns_404(
     assert response.json()["error"]["code"] == "NOT_FOUND"
 
 
+# --- list incident updates ---
+
+
+async def append_updates(client: AsyncClient, incident_id: str, count: int) -> None:
+    for i in range(count):
+        response = await client.post(
+            f"/api/v1/incidents/{incident_id}/updates",
+            json={"message": f"Update {i}", "status": "investigating"},
+        )
+        assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_appended_updates_get_consecutive_sequences(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "Sequence Service")
+    incident_id = await create_incident(client, service_id)
+    await append_updates(client, incident_id, 3)
+
+    response = await client.get(f"/api/v1/incidents/{incident_id}")
+    sequences = [u["sequence"] for u in response.json()["updates"]]
+    assert sequences == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_list_incident_updates_paginates_with_cursor(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "Paging Service")
+    incident_id = await create_incident(client, service_id)
+    await append_updates(client, incident_id, 5)
+
+    first = await client.get(f"/api/v1/incidents/{incident_id}/updates?limit=2")
+    assert first.status_code == 200
+    body = first.json()
+    assert [u["message"] for u in body["data"]] == ["Update 0", "Update 1"]
+    assert body["meta"] == {"count": 2, "latest_sequence": 5, "next_cursor": 2}
+
+    second = await client.get(
+        f"/api/v1/incidents/{incident_id}/updates?limit=2&since=2"
+    )
+    assert [u["sequence"] for u in second.json()["data"]] == [3, 4]
+
+    last = await client.get(f"/api/v1/incidents/{incident_id}/updates?since=4")
+    assert [u["sequence"] for u in last.json()["data"]] == [5]
+    assert last.json()["meta"]["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_incident_updates_since_returns_only_newer_entries(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "Since Service")
+    incident_id = await create_incident(client, service_id)
+    await append_updates(client, incident_id, 2)
+    await client.post(f"/api/v1/incidents/{incident_id}/resolve")
+
+    response = await client.get(f"/api/v1/incidents/{incident_id}/updates?since=2")
+    data = response.json()["data"]
+    assert len(data) == 1
+    assert data[0]["sequence"] == 3
+    assert data[0]["status"] == "resolved"
+
+
+@pytest.mark.asyncio
+async def test_list_incident_updates_caught_up_returns_empty_page(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "Caught Up Service")
+    incident_id = await create_incident(client, service_id)
+    await append_updates(client, incident_id, 1)
+
+    response = await client.get(f"/api/v1/incidents/{incident_id}/updates?since=1")
+    assert response.json()["data"] == []
+    assert response.json()["meta"]["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_incident_updates_includes_updates_dated_before_the_incident(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    # As written by a node whose clock runs behind the one that opened it.
+    service_id = await create_service(client, "Skew Service")
+    incident_id = await create_incident(client, service_id)
+    await append_updates(client, incident_id, 1)
+    await db_session.execute(
+        update(IncidentUpdate)
+        .where(IncidentUpdate.incident_id == uuid.UUID(incident_id))
+        .values(created_at=datetime.now(UTC) - timedelta(minutes=5))
+    )
+    await db_session.commit()
+
+    response = await client.get(f"/api/v1/incidents/{incident_id}/updates")
+    assert [u["message"] for u in response.json()["data"]] == ["Update 0"]
+
+
+@pytest.mark.asyncio
+async def test_list_incident_updates_nonexistent_incident_returns_404(
+    client: AsyncClient,
+) -> None:
+    response = await client.get(
+        "/api/v1/incidents/00000000-0000-0000-0000-000000000000/updates"
+    )
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "NOT_FOUND"
+
+
+# --- search incidents ---
+
+
+@pytest.mark.asyncio
+async def test_search_incidents_matches_title_and_ranks_it_first(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "Search Rank Service")
+    await create_incident(client, service_id, title="Disk usage alert")
+    body_match = await client.post(
+        "/api/v1/incidents",
+        json={
+            "title": "Cache latency",
+            "body": "Redis failover triggered by a bad node.",
+            "severity": "medium",
+            "service_ids": [service_id],
+        },
+    )
+    title_match = await create_incident(client, service_id, title="Redis failover")
+
+    response = await client.get("/api/v1/incidents/search?q=redis failover")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["meta"]["total"] == 2
+    ids = [hit["id"] for hit in body["data"]]
+    assert ids == [title_match, body_match.json()["id"]]
+
+
+@pytest.mark.asyncio
+async def test_search_incidents_matches_timeline_messages(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client, "Search Timeline Service")
+    incident_id = await create_incident(client, service_id, title="Login errors")
+    await client.post(
+        f"/api/v1/incidents/{incident_id}/updates",
+        json={"message": "Root cause: certificate expiry.", "status": "identified"},
+    )
+
+    response = await client.get("/api/v1/incidents/search?q=certificate")
+    data = response.json()["data"]
+    assert [hit["id"] for hit in data] == [incident_id]
+    assert "<mark>certificate</mark>" in data[0]["snippet"]
+
+
+@pytest.mark.asyncio
+async def test_search_incidents_escapes_snippet_text(client: AsyncClient) -> None:
+    service_id = await create_service(client, "Search Escape Service")
+    await create_incident(
+        client, service_id, title="<script>alert(1)</script> certificate & keys"
+    )
+
+    response = await client.get("/api/v1/incidents/search?q=certificate")
+    snippet = response.json()["data"][0]["snippet"]
+    assert "<script>" not in snippet
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in snippet
+    assert "<mark>certificate</mark> &amp; keys" in snippet
+
+
+@pytest.mark.asyncio
+async def test_search_incidents_reflects_title_changes(client: AsyncClient) -> None:
+    service_id = await create_service(client, "Search Rename Service")
+    incident_id = await create_incident(client, service_id, title="Queue backlog")
+    await client.patch(
+        f"/api/v1/incidents/{incident_id}", json={"title": "Kafka consumer lag"}
+    )
+
+    old = await client.get("/api/v1/incidents/search?q=backlog")
+    new = await client.get("/api/v1/incidents/search?q=kafka")
+    assert old.json()["data"] == []
+    assert [hit["id"] for hit in new.json()["data"]] == [incident_id]
+
+
+@pytest.mark.asyncio
+async def test_search_incidents_paginates(client: AsyncClient) -> None:
+    service_id = await create_service(client, "Search Page Service")
+    for i in range(3):
+        await create_incident(client, service_id, title=f"Timeout {i}")
+
+    response = await client.get("/api/v1/incidents/search?q=timeout&limit=2&offset=2")
+    body = response.json()
+    assert len(body["data"]) == 1
+    assert body["meta"] == {"total": 3, "limit": 2, "offset": 2}
+
+
+@pytest.mark.asyncio
+async def test_search_incidents_ignores_query_syntax(client: AsyncClient) -> None:
+    service_id = await create_service(client, "Search Syntax Service")
+    await create_incident(client, service_id, title="Payments down")
+
+    response = await client.get('/api/v1/incidents/search?q="payments -:*')
+    assert response.status_code == 200
+    assert response.json()["meta"]["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_search_incidents_missing_query_returns_422(
+    client: AsyncClient,
+) -> None:
+    response = await client.get("/api/v1/incidents/search")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_index_rebuild_restores_missing_entries(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Search Backfill Service")
+    incident_id = await create_incident(client, service_id, title="Stale DNS")
+    await db_session.execute(text("DELETE FROM incident_search"))
+    await db_session.commit()
+
+    assert await IncidentSearchRepository(db_session).rebuild() == 1
+    response = await client.get("/api/v1/incidents/search?q=dns")
+    assert [hit["id"] for hit in response.json()["data"]] == [incident_id]
+
+
 # --- resolve incident ---
 
 
@@ -496,6 +1152,134 @@ async def test_resolve_nonexistent_incident_returns_404(
     assert response.json()["error"]["code"] == "NOT_FOUND"
 
 
+# --- archive ---
+
+
+async def resolve_long_ago(
+    client: AsyncClient, db_session: AsyncSession, incident_id: str, days: int
+) -> None:
+    await client.post(f"/api/v1/incidents/{incident_id}/resolve")
+    resolved_at = datetime.now(UTC) - timedelta(days=days)
+    await db_session.execute(
+        update(Incident)
+        .where(Incident.id == uuid.UUID(incident_id))
+        .values(created_at=resolved_at - timedelta(hours=1), resolved_at=resolved_at)
+    )
+    await db_session.commit()
+
+
+async def archive(db_session: AsyncSession, batch_size: int = 500) -> int:
+    return await archive_resolved_incidents(
+        db_session, older_than_days=30, batch_size=batch_size
+    )
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_only_incidents_resolved_before_retention(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Archive Service")
+    old_id = await create_incident(client, service_id, title="Old")
+    recent_id = await create_incident(client, service_id, title="Recent")
+    await create_incident(client, service_id, title="Open")
+    await resolve_long_ago(client, db_session, old_id, days=60)
+    await resolve_long_ago(client, db_session, recent_id, days=10)
+
+    assert await archive(db_session) == 1
+
+    response = await client.get("/api/v1/incidents")
+    assert {i["title"] for i in response.json()["data"]} == {"Recent", "Open"}
+    assert await db_session.get(Incident, uuid.UUID(old_id)) is None
+
+
+@pytest.mark.asyncio
+async def test_archived_incident_is_readable_by_id(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Archive Read Service")
+    incident_id = await create_incident(client, service_id, title="Archived")
+    await client.post(
+        f"/api/v1/incidents/{incident_id}/updates",
+        json={"message": "Root cause found", "status": "identified"},
+    )
+    before = (await client.get(f"/api/v1/incidents/{incident_id}")).json()
+    await resolve_long_ago(client, db_session, incident_id, days=60)
+    await archive(db_session)
+
+    response = await client.get(f"/api/v1/incidents/{incident_id}")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["title"] == "Archived"
+    assert body["status"] == "resolved"
+    assert body["service_ids"] == [service_id]
+    assert [u["message"] for u in body["updates"]] == [
+        "Root cause found",
+        "Incident resolved.",
+    ]
+    assert body["updates"][0] == before["updates"][0]
+
+
+@pytest.mark.asyncio
+async def test_archived_incident_is_read_only(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Archive Write Service")
+    incident_id = await create_incident(client, service_id)
+    await resolve_long_ago(client, db_session, incident_id, days=60)
+    await archive(db_session)
+
+    response = await client.patch(
+        f"/api/v1/incidents/{incident_id}", json={"title": "Changed"}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_include_archived(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Archive List Service")
+    other_id = await create_service(client, "Archive Other Service")
+    await create_incident(client, service_id, title="Live")
+    for title, days in (("Older", 90), ("Old", 60)):
+        incident_id = await create_incident(client, service_id, title=title)
+        await resolve_long_ago(client, db_session, incident_id, days=days)
+    await archive(db_session)
+
+    response = await client.get("/api/v1/incidents?include_archived=true")
+    assert [i["title"] for i in response.json()["data"]] == ["Live", "Old", "Older"]
+    response = await client.get(
+        "/api/v1/incidents", params={"include_archived": "true", "sort": "oldest"}
+    )
+    assert [i["title"] for i in response.json()["data"]] == ["Older", "Old", "Live"]
+
+    # Filters apply to the archive too.
+    response = await client.get(
+        "/api/v1/incidents", params={"include_archived": "true", "active": "true"}
+    )
+    assert [i["title"] for i in response.json()["data"]] == ["Live"]
+    response = await client.get(
+        "/api/v1/incidents",
+        params={"include_archived": "true", "service_ids": other_id},
+    )
+    assert response.json()["data"] == []
+
+
+@pytest.mark.asyncio
+async def test_archive_runs_in_batches(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client, "Archive Batch Service")
+    for n in range(3):
+        incident_id = await create_incident(client, service_id, title=f"Batch {n}")
+        await resolve_long_ago(client, db_session, incident_id, days=60)
+
+    assert await archive(db_session, batch_size=2) == 3
+    assert await archive(db_session, batch_size=2) == 0
+    response = await client.get("/api/v1/incidents?include_archived=true")
+    assert response.json()["meta"]["total"] == 3
+
+
 # --- service status derivation from incidents ---
 
 
@@ -0,0 +1,287 @@
+import uuid
+from datetime import UTC, datetime, time, timedelta
+
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import IncidentSeverity, IncidentStatus
+from app.models.orm import Incident, MaintenanceWindow, Service
+
+NOW = datetime.now(UTC)
+TODAY = datetime.combine(NOW.date(), time(), tzinfo=UTC)
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+async def create_service(client: AsyncClient, name: str = "Payments") -> str:
+    response = await client.post("/api/v1/services", json={"name": name})
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def create_window(
+    client: AsyncClient,
+    service_ids: list[str],
+    starts_at: datetime,
+    ends_at: datetime,
+) -> str:
+    response = await client.post(
+        "/api/v1/maintenance",
+        json={
+            "title": "Database upgrade",
+            "starts_at": starts_at.isoformat(),
+            "ends_at": ends_at.isoformat(),
+            "service_ids": service_ids,
+        },
+    )
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def open_incident(client: AsyncClient, service_id: str) -> None:
+    response = await client.post(
+        "/api/v1/incidents",
+        json={"title": "Down", "severity": "critical", "service_ids": [service_id]},
+    )
+    assert response.status_code == 201
+
+
+# --- scheduling ---
+
+
+@pytest.mark.asyncio
+async def test_create_window_returns_it_with_its_services(client: AsyncClient) -> None:
+    service_ids = sorted(
+        [await create_service(client), await create_service(client, "Auth")]
+    )
+    window_id = await create_window(
+        client, service_ids, NOW + timedelta(hours=1), NOW + timedelta(hours=2)
+    )
+
+    response = await client.get(f"/api/v1/maintenance/{window_id}")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["title"] == "Database upgrade"
+    assert body["service_ids"] == service_ids
+
+
+@pytest.mark.asyncio
+async def test_create_window_rejects_an_end_before_the_start(
+    client: AsyncClient,
+) -> None:
+    response = await client.post(
+        "/api/v1/maintenance",
+        json={
+            "title": "Backwards",
+            "starts_at": (NOW + timedelta(hours=2)).isoformat(),
+            "ends_at": (NOW + timedelta(hours=1)).isoformat(),
+            "service_ids": [await create_service(client)],
+        },
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_create_window_requires_a_timezone(client: AsyncClient) -> None:
+    response = await client.post(
+        "/api/v1/maintenance",
+        json={
+            "title": "Naive",
+            "starts_at": "2030-01-01T01:00:00",
+            "ends_at": "2030-01-01T02:00:00",
+            "service_ids": [await create_service(client)],
+        },
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_create_window_for_unknown_service_returns_404(
+    client: AsyncClient,
+) -> None:
+    response = await client.post(
+        "/api/v1/maintenance",
+        json={
+            "title": "Ghost",
+            "starts_at": NOW.isoformat(),
+            "ends_at": (NOW + timedelta(hours=1)).isoformat(),
+            "service_ids": [str(uuid.uuid4())],
+        },
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_windows_leaves_out_past_ones_by_default(
+    client: AsyncClient,
+) -> None:
+    payments, auth = await create_service(client), await create_service(client, "Auth")
+    past = await create_window(
+        client, [payments], NOW - timedelta(hours=3), NOW - timedelta(hours=2)
+    )
+    upcoming = await create_window(
+        client, [payments], NOW + timedelta(hours=1), NOW + timedelta(hours=2)
+    )
+    other = await create_window(
+        client, [auth], NOW - timedelta(hours=1), NOW + timedelta(hours=1)
+    )
+
+    def ids(response: Response) -> list[str]:
+        return [w["id"] for w in response.json()["data"]]
+
+    assert ids(await client.get("/api/v1/maintenance")) == [other, upcoming]
+    assert ids(await client.get("/api/v1/maintenance?include_past=true")) == [
+        past,
+        other,
+        upcoming,
+    ]
+    assert ids(await client.get(f"/api/v1/maintenance?service_id={payments}")) == [
+        upcoming
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_unknown_window_returns_404(client: AsyncClient) -> None:
+    response = await client.get(f"/api/v1/maintenance/{uuid.uuid4()}")
+    assert response.status_code == 404
+
+
+# --- status ---
+
+
+@pytest.mark.asyncio
+async def test_open_window_reports_maintenance_over_incidents(
+    client: AsyncClient,
+) -> None:
+    service_id = await create_service(client)
+    await open_incident(client, service_id)
+    await create_window(
+        client, [service_id], NOW - timedelta(hours=1), NOW + timedelta(hours=1)
+    )
+
+    single = (await client.get(f"/api/v1/services/{service_id}")).json()
+    listed = (await client.get("/api/v1/services")).json()["data"][0]
+    for service in (single, listed):
+        assert service["status"] == "maintenance"
+        assert service["effective_status"] == "maintenance"
+
+
+@pytest.mark.asyncio
+async def test_upcoming_window_does_not_change_status(client: AsyncClient) -> None:
+    service_id = await create_service(client)
+    await open_incident(client, service_id)
+    await create_window(
+        client, [service_id], NOW + timedelta(hours=1), NOW + timedelta(hours=2)
+    )
+
+    response = await client.get(f"/api/v1/services/{service_id}")
+    assert response.json()["status"] == "outage"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_window_restores_status(client: AsyncClient) -> None:
+    service_id = await create_service(client)
+    window_id = await create_window(
+        client, [service_id], NOW - timedelta(hours=1), NOW + timedelta(hours=1)
+    )
+
+    response = await client.delete(f"/api/v1/maintenance/{window_id}")
+    assert response.status_code == 204
+    assert (await client.get(f"/api/v1/maintenance/{window_id}")).status_code == 404
+    service = (await client.get(f"/api/v1/services/{service_id}")).json()
+    assert service["status"] == "operational"
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_service_removes_it_from_its_windows(
+    client: AsyncClient,
+) -> None:
+    payments, auth = await create_service(client), await create_service(client, "Auth")
+    window_id = await create_window(
+        client, [payments, auth], NOW + timedelta(hours=1), NOW + timedelta(hours=2)
+    )
+
+    await client.delete(f"/api/v1/services/{payments}")
+
+    response = await client.get(f"/api/v1/maintenance/{window_id}")
+    assert response.json()["service_ids"] == [auth]
+
+
+@pytest.mark.asyncio
+async def test_schedule_follows_a_cancel_and_create_at_the_same_instant(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    # The window count and latest created_at end up as they were, so only
+    # the schedule's version tells the cached schedule is out of date.
+    payments, auth = await create_service(client), await create_service(client, "Auth")
+    window_id = await create_window(
+        client, [payments], NOW - timedelta(hours=1), NOW + timedelta(hours=1)
+    )
+    service = (await client.get(f"/api/v1/services/{payments}")).json()
+    assert service["status"] == "maintenance"
+    window = await db_session.get(MaintenanceWindow, uuid.UUID(window_id))
+    assert window is not None
+    created_at = window.created_at
+
+    await client.delete(f"/api/v1/maintenance/{window_id}")
+    new_id = await create_window(
+        client, [auth], NOW - timedelta(hours=1), NOW + timedelta(hours=1)
+    )
+    await db_session.execute(
+        update(MaintenanceWindow)
+        .where(MaintenanceWindow.id == uuid.UUID(new_id))
+        .values(created_at=created_at)
+    )
+    await db_session.commit()
+
+    for service_id, status in ((payments, "operational"), (auth, "maintenance")):
+        service = (await client.get(f"/api/v1/services/{service_id}")).json()
+        assert service["status"] == status
+
+
+# --- uptime ---
+
+
+@pytest.mark.asyncio
+async def test_window_over_a_stored_day_is_left_out_of_its_uptime(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_service(client)
+    service = await db_session.get(Service, uuid.UUID(service_id))
+    assert service is not None
+    await db_session.execute(
+        update(Service)
+        .where(Service.id == service.id)
+        .values(created_at=TODAY - timedelta(days=2))
+    )
+    db_session.add(
+        Incident(
+            title="Seeded",
+            severity=IncidentSeverity.critical,
+            status=IncidentStatus.resolved,
+            created_at=YESTERDAY + timedelta(hours=1),
+            updated_at=YESTERDAY + timedelta(hours=5),
+            resolved_at=YESTERDAY + timedelta(hours=5),
+            services=[service],
+        )
+    )
+    await db_session.commit()
+    url = f"/api/v1/services/{service_id}/uptime?days=2"
+
+    async def outage_hours() -> float:
+        days = (await client.get(url)).json()["days"]
+        return float(days[0]["outage_seconds"]) / 3600
+
+    # The first report stores yesterday; the window then clears it.
+    assert await outage_hours() == 4
+    window_id = await create_window(
+        client,
+        [service_id],
+        YESTERDAY + timedelta(hours=2),
+        YESTERDAY + timedelta(hours=4),
+    )
+    assert await outage_hours() == 2
+
+    await client.delete(f"/api/v1/maintenance/{window_id}")
+    assert await outage_hours() == 4
@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.main import app
+
 # --- liveness probe ---
 
 
@@ -55,6 +57,18 @@ async def test_readiness_duration_ms_is_numeric(client: AsyncClient) -> None:
     assert isinstance(duration_ms, float | int)
 
 
+@pytest.mark.asyncio
+async def test_readiness_returns_503_until_warmed_up(client: AsyncClient) -> None:
+    app.state.warmed_up = False
+    response = await client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json() == {
+        "status": "unavailable",
+        "checks": {"warmup": {"status": "pending"}},
+    }
+
+
 @pytest.mark.asyncio
 async def test_readiness_returns_503_when_db_unavailable(
     broken_db_client: AsyncClient,
@@ -106,6 +120,30 @@ async def test_metrics_contains_active_incidents_total(
     assert "active_incidents_total" in response.text
 
 
+@pytest.mark.asyncio
+async def test_metrics_active_incidents_total_counts_by_severity(
+    client: AsyncClient,
+) -> None:
+    service = await client.post("/api/v1/services", json={"name": "Gauge Service"})
+    incident_ids = []
+    for severity in ("critical", "critical", "low"):
+        created = await client.post(
+            "/api/v1/incidents",
+            json={
+                "title": "Gauge",
+                "severity": severity,
+                "service_ids": [service.json()["id"]],
+            },
+        )
+        incident_ids.append(created.json()["id"])
+    await client.post(f"/api/v1/incidents/{incident_ids[0]}/resolve")
+
+    metrics = (await client.get("/metrics")).text.splitlines()
+    assert 'active_incidents_total{severity="critical"} 1.0' in metrics
+    assert 'active_incidents_total{severity="low"} 1.0' in metrics
+    assert 'active_incidents_total{severity="high"} 0.0' in metrics
+
+
 @pytest.mark.asyncio
 async def test_metrics_contains_services_total(client: AsyncClient) -> None:
     response = await client.get("/metrics")
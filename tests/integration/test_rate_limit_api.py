@@ -0,0 +1,92 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+
+from app.core.rate_limit import RateLimiter, RouteClass, TokenBucketLimiter
+from app.main import app
+
+
+def limiter(client_header: str = "") -> RateLimiter:
+    # Two requests per class and a refill far too slow to matter in a test.
+    return RateLimiter(
+        {
+            route_class: TokenBucketLimiter(rate=0.01, burst=2, max_clients=100)
+            for route_class in RouteClass
+        },
+        client_header=client_header,
+    )
+
+
+@pytest_asyncio.fixture
+async def limited_client(client: AsyncClient) -> AsyncGenerator[AsyncClient, None]:
+    app.state.rate_limiter = limiter()
+    yield client
+    app.state.rate_limiter = None
+
+
+@pytest.mark.asyncio
+async def test_requests_over_the_burst_get_429(limited_client: AsyncClient) -> None:
+    for _ in range(2):
+        assert (await limited_client.get("/api/v1/services")).status_code == 200
+
+    response = await limited_client.get("/api/v1/services")
+    assert response.status_code == 429
+    assert response.json()["error"]["code"] == "RATE_LIMITED"
+    assert response.json()["error"]["request_id"] == response.headers["x-request-id"]
+    # One token every 100 seconds.
+    assert response.headers["retry-after"] == "100"
+
+
+@pytest.mark.asyncio
+async def test_route_classes_have_separate_budgets(
+    limited_client: AsyncClient,
+) -> None:
+    for _ in range(2):
+        await limited_client.get("/api/v1/services")
+    assert (await limited_client.get("/api/v1/services")).status_code == 429
+
+    response = await limited_client.post("/api/v1/services", json={"name": "api"})
+    assert response.status_code == 201
+    assert (await limited_client.get("/api/v1/analytics")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_client_chosen_headers_do_not_reset_the_budget(
+    limited_client: AsyncClient,
+) -> None:
+    for n in range(2):
+        await limited_client.get("/api/v1/services", headers={"X-API-Key": str(n)})
+
+    response = await limited_client.get(
+        "/api/v1/services", headers={"X-API-Key": "fresh"}
+    )
+    assert response.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_clients_are_keyed_by_the_configured_header(
+    limited_client: AsyncClient,
+) -> None:
+    app.state.rate_limiter = limiter(client_header="X-API-Key")
+    for _ in range(2):
+        await limited_client.get("/api/v1/services", headers={"X-API-Key": "one"})
+    throttled = await limited_client.get(
+        "/api/v1/services", headers={"X-API-Key": "one"}
+    )
+    assert throttled.status_code == 429
+
+    other = await limited_client.get("/api/v1/services", headers={"X-API-Key": "two"})
+    assert other.status_code == 200
+    # Requests without a key fall back to the client address.
+    assert (await limited_client.get("/api/v1/services")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_health_and_metrics_are_not_limited(
+    limited_client: AsyncClient,
+) -> None:
+    for _ in range(5):
+        assert (await limited_client.get("/health/live")).status_code == 200
+        assert (await limited_client.get("/metrics")).status_code == 200
@@ -1,5 +1,23 @@
+import uuid
+from datetime import UTC, datetime, time, timedelta
+from typing import Any
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.dependencies import DependencyRepository
+from app.models.enums import IncidentSeverity, IncidentStatus
+from app.models.orm import (
+    Incident,
+    Service,
+    ServiceStatusChange,
+    service_daily_availability,
+    service_dependencies,
+)
+from app.services.archive import archive_resolved_incidents
+from app.services.service_status import rebuild_status_history
 
 # --- list services ---
 
@@ -51,6 +69,32 @@ async def test_list_services_new_service_is_operational(client: AsyncClient) ->
     assert service["status"] == "operational"
 
 
+@pytest.mark.asyncio
+async def test_list_services_matches_detail(client: AsyncClient) -> None:
+    # The list derives statuses from active incident severities read as rows,
+    # the detail from the ORM's incident collection.
+    ids = []
+    for name in ("api", "db", "cache"):
+        response = await client.post("/api/v1/services", json={"name": name})
+        ids.append(response.json()["id"])
+    resolved = await client.post(
+        "/api/v1/incidents",
+        json={"title": "Past", "severity": "critical", "service_ids": [ids[0]]},
+    )
+    await client.post(f"/api/v1/incidents/{resolved.json()['id']}/resolve")
+    for severity, service_ids in (("low", ids[:2]), ("high", ids[1:2])):
+        await client.post(
+            "/api/v1/incidents",
+            json={"title": "Now", "severity": severity, "service_ids": service_ids},
+        )
+
+    listed = {s["id"]: s for s in (await client.get("/api/v1/services")).json()["data"]}
+    assert [listed[i]["status"] for i in ids] == ["degraded", "outage", "operational"]
+    for service_id in ids:
+        detail = await client.get(f"/api/v1/services/{service_id}")
+        assert listed[service_id] == detail.json()
+
+
 # --- create service ---
 
 
@@ -147,6 +191,42 @@ async def test_get_service_invalid_uuid_returns_422(client: AsyncClient) -> None
     assert response.json()["error"]["code"] == "VALIDATION_ERROR"
 
 
+# --- lookup by IDs ---
+
+
+@pytest.mark.asyncio
+async def test_lookup_services_by_ids(client: AsyncClient) -> None:
+    ids = [await create_service(client, name) for name in ("a", "b", "c")]
+    unknown = str(uuid.uuid4())
+
+    response = await client.get(f"/api/v1/services?ids={ids[2]},{unknown},{ids[0]}")
+    assert response.status_code == 200
+    body = response.json()
+    assert [s["name"] for s in body["data"]] == ["c", "a"]
+    assert body["missing"] == [unknown]
+    assert body["meta"] == {"total": 2, "missing": 1}
+
+    posted = await client.post(
+        "/api/v1/services/lookup", json={"ids": [ids[2], unknown, ids[0]]}
+    )
+    assert posted.json() == body
+
+
+@pytest.mark.asyncio
+async def test_lookup_services_reflects_status(client: AsyncClient) -> None:
+    service_id = await create_service(client, "api")
+    await create_incident(client, [service_id], "critical")
+    response = await client.get(f"/api/v1/services?ids={service_id}")
+    assert response.json()["data"][0]["status"] == "outage"
+
+
+@pytest.mark.asyncio
+async def test_lookup_services_rejects_bad_ids(client: AsyncClient) -> None:
+    assert (await client.get("/api/v1/services?ids=nope")).status_code == 422
+    response = await client.post("/api/v1/services/lookup", json={"ids": []})
+    assert response.status_code == 422
+
+
 # --- update service ---
 
 
@@ -257,6 +337,517 @@ async def test_delete_service_with_active_incident_returns_409(
     assert response.json()["error"]["code"] == "CONFLICT"
 
 
+# --- uptime ---
+
+TODAY = datetime.combine(datetime.now(UTC).date(), time(), tzinfo=UTC)
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+async def create_backdated_service(
+    client: AsyncClient, db_session: AsyncSession, name: str, days: int
+) -> str:
+    response = await client.post("/api/v1/services", json={"name": name})
+    service_id = response.json()["id"]
+    await db_session.execute(
+        update(Service)
+        .where(Service.id == uuid.UUID(service_id))
+        .values(created_at=TODAY - timedelta(days=days))
+    )
+    await db_session.commit()
+    return str(service_id)
+
+
+async def seed_incident(
+    db_session: AsyncSession,
+    service_id: str,
+    severity: IncidentSeverity,
+    created_at: datetime,
+    resolved_at: datetime,
+) -> None:
+    incident = Incident(
+        title="Seeded",
+        severity=severity,
+        status=IncidentStatus.resolved,
+        created_at=created_at,
+        updated_at=resolved_at,
+        resolved_at=resolved_at,
+    )
+    service = await db_session.get(Service, uuid.UUID(service_id))
+    assert service is not None
+    incident.services = [service]
+    db_session.add(incident)
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_service_uptime_new_service_covers_only_today(
+    client: AsyncClient,
+) -> None:
+    response = await client.post("/api/v1/services", json={"name": "Fresh Uptime"})
+    service_id = response.json()["id"]
+
+    response = await client.get(f"/api/v1/services/{service_id}/uptime")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["service_id"] == service_id
+    assert [d["day"] for d in body["days"]] == [TODAY.date().isoformat()]
+    assert body["uptime_percent"] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_service_uptime_merges_overlapping_incidents(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_backdated_service(client, db_session, "Uptime", 5)
+    await seed_incident(
+        db_session,
+        service_id,
+        IncidentSeverity.critical,
+        YESTERDAY + timedelta(hours=10),
+        YESTERDAY + timedelta(hours=12),
+    )
+    await seed_incident(
+        db_session,
+        service_id,
+        IncidentSeverity.medium,
+        YESTERDAY + timedelta(hours=11),
+        YESTERDAY + timedelta(hours=14),
+    )
+
+    response = await client.get(f"/api/v1/services/{service_id}/uptime?days=3")
+    days = response.json()["days"]
+    assert len(days) == 3
+    assert days[1] == {
+        "day": YESTERDAY.date().isoformat(),
+        "outage_seconds": 2 * 3600,
+        "degraded_seconds": 2 * 3600,
+        "uptime_percent": round(100 * (1 - 2 / 24), 4),
+    }
+    assert days[0]["uptime_percent"] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_service_uptime_closed_days_are_stored_once(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_backdated_service(client, db_session, "Frozen", 3)
+    await seed_incident(
+        db_session,
+        service_id,
+        IncidentSeverity.high,
+        YESTERDAY + timedelta(hours=1),
+        YESTERDAY + timedelta(hours=2),
+    )
+    first = await client.get(f"/api/v1/services/{service_id}/uptime?days=3")
+    stored = await db_session.scalar(
+        select(func.count()).select_from(service_daily_availability)
+    )
+    assert stored == 2
+
+    # Closed days are served from the stored rows, not recomputed.
+    await db_session.execute(delete(Incident))
+    await db_session.commit()
+    second = await client.get(f"/api/v1/services/{service_id}/uptime?days=3")
+    assert second.json()["days"][:2] == first.json()["days"][:2]
+    assert second.json()["days"][1]["outage_seconds"] == 3600
+
+
+@pytest.mark.asyncio
+async def test_list_services_uptime_covers_every_service(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    first = await create_backdated_service(client, db_session, "Bulk One", 10)
+    second = await create_backdated_service(client, db_session, "Bulk Two", 1)
+    await seed_incident(
+        db_session,
+        second,
+        IncidentSeverity.low,
+        YESTERDAY,
+        YESTERDAY + timedelta(hours=6),
+    )
+
+    response = await client.get("/api/v1/services/uptime?days=7")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["meta"] == {"total": 2, "days": 7}
+    by_service = {item["service_id"]: item for item in body["data"]}
+    assert len(by_service[first]["days"]) == 7
+    assert len(by_service[second]["days"]) == 2
+    assert by_service[second]["degraded_seconds"] == 6 * 3600
+    assert by_service[second]["uptime_percent"] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_service_uptime_not_found_returns_404(client: AsyncClient) -> None:
+    response = await client.get(f"/api/v1/services/{uuid.uuid4()}/uptime")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_service_uptime_invalid_days_returns_422(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/services/uptime?days=0")
+    assert response.status_code == 422
+
+
+# --- status history ---
+
+
+async def create_incident(
+    client: AsyncClient, service_ids: list[str], severity: str = "high"
+) -> str:
+    response = await client.post(
+        "/api/v1/incidents",
+        json={"title": "Status", "severity": severity, "service_ids": service_ids},
+    )
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def get_history(
+    client: AsyncClient, service_id: str, **params: str | int
+) -> list[dict[str, str]]:
+    response = await client.get(
+        f"/api/v1/services/{service_id}/status-history", params=params
+    )
+    assert response.status_code == 200
+    return list(response.json()["data"])
+
+
+@pytest.mark.asyncio
+async def test_status_history_records_each_transition(client: AsyncClient) -> None:
+    response = await client.post("/api/v1/services", json={"name": "History"})
+    service_id = response.json()["id"]
+    medium = await create_incident(client, [service_id], "medium")
+    critical = await create_incident(client, [service_id], "critical")
+    # A second outage incident does not change the status, so is not logged.
+    await create_incident(client, [service_id], "high")
+
+    history = await get_history(client, service_id)
+    assert [(c["status"], c["incident_id"]) for c in history] == [
+        ("operational", None),
+        ("degraded", medium),
+        ("outage", critical),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_status_history_records_severity_changes_and_resolution(
+    client: AsyncClient,
+) -> None:
+    response = await client.post("/api/v1/services", json={"name": "Escalation"})
+    service_id = response.json()["id"]
+    incident_id = await create_incident(client, [service_id], "low")
+    await client.patch(f"/api/v1/incidents/{incident_id}", json={"severity": "high"})
+    await client.patch(f"/api/v1/incidents/{incident_id}", json={"title": "Renamed"})
+    await client.post(f"/api/v1/incidents/{incident_id}/resolve")
+
+    history = await get_history(client, service_id)
+    assert [c["status"] for c in history] == [
+        "operational",
+        "degraded",
+        "outage",
+        "operational",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_status_history_filters_by_time_and_limit(client: AsyncClient) -> None:
+    response = await client.post("/api/v1/services", json={"name": "Windowed"})
+    service_id = response.json()["id"]
+    await create_incident(client, [service_id], "low")
+    await create_incident(client, [service_id], "critical")
+    history = await get_history(client, service_id)
+
+    since_second = await get_history(client, service_id, start=history[1]["changed_at"])
+    assert [c["status"] for c in since_second] == ["degraded", "outage"]
+    until_second = await get_history(client, service_id, end=history[1]["changed_at"])
+    assert [c["status"] for c in until_second] == ["operational", "degraded"]
+    assert len(await get_history(client, service_id, limit=1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_service_status_at_returns_the_status_in_effect(
+    client: AsyncClient,
+) -> None:
+    response = await client.post("/api/v1/services", json={"name": "Point In Time"})
+    service_id = response.json()["id"]
+    first = await create_incident(client, [service_id], "medium")
+    second = await create_incident(client, [service_id], "critical")
+    history = await get_history(client, service_id)
+
+    response = await client.get(
+        f"/api/v1/services/{service_id}/status",
+        params={"at": history[1]["changed_at"]},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "degraded"
+    assert body["since"] == history[1]["changed_at"]
+    assert body["incident_id"] == first
+
+    current = (await client.get(f"/api/v1/services/{service_id}/status")).json()
+    assert current["status"] == "outage"
+    assert current["incident_id"] == second
+
+
+@pytest.mark.asyncio
+async def test_service_status_before_creation_returns_404(
+    client: AsyncClient,
+) -> None:
+    response = await client.post("/api/v1/services", json={"name": "Too Early"})
+    service_id = response.json()["id"]
+    response = await client.get(
+        f"/api/v1/services/{service_id}/status",
+        params={"at": "2000-01-01T00:00:00Z"},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_service_status_unknown_service_returns_404(client: AsyncClient) -> None:
+    for path in ("status", "status-history"):
+        response = await client.get(f"/api/v1/services/{uuid.uuid4()}/{path}")
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_status_history_rebuild_replays_incident_history(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    first = await create_backdated_service(client, db_session, "Rebuilt One", 2)
+    second = await create_backdated_service(client, db_session, "Rebuilt Two", 1)
+    await db_session.execute(delete(ServiceStatusChange))
+    await db_session.commit()
+    await seed_incident(
+        db_session,
+        first,
+        IncidentSeverity.critical,
+        YESTERDAY + timedelta(hours=1),
+        YESTERDAY + timedelta(hours=3),
+    )
+    open_incident = await create_incident(client, [first, second], "low")
+
+    await rebuild_status_history(db_session)
+    first_history = await get_history(client, first)
+    assert [c["status"] for c in first_history] == [
+        "operational",
+        "outage",
+        "operational",
+        "degraded",
+    ]
+    changed_at = [datetime.fromisoformat(c["changed_at"]) for c in first_history]
+    assert changed_at[:3] == [
+        TODAY - timedelta(days=2),
+        YESTERDAY + timedelta(hours=1),
+        YESTERDAY + timedelta(hours=3),
+    ]
+    second_history = await get_history(client, second)
+    assert [(c["status"], c["incident_id"]) for c in second_history] == [
+        ("operational", None),
+        ("degraded", open_incident),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_status_history_rebuild_includes_archived_incidents(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    service_id = await create_backdated_service(client, db_session, "Archived", 2)
+    await seed_incident(
+        db_session,
+        service_id,
+        IncidentSeverity.critical,
+        YESTERDAY + timedelta(hours=1),
+        YESTERDAY + timedelta(hours=3),
+    )
+    assert await archive_resolved_incidents(db_session, 0, 500) == 1
+
+    await rebuild_status_history(db_session)
+    history = await get_history(client, service_id)
+    assert [c["status"] for c in history] == ["operational", "outage", "operational"]
+
+
+# --- dependencies ---
+
+
+async def create_service(client: AsyncClient, name: str) -> str:
+    response = await client.post("/api/v1/services", json={"name": name})
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def add_dependency(
+    client: AsyncClient, service_id: str, depends_on_id: str
+) -> dict[str, Any]:
+    response = await client.post(
+        f"/api/v1/services/{service_id}/dependencies",
+        json={"depends_on_id": depends_on_id},
+    )
+    return {"status_code": response.status_code, **response.json()}
+
+
+async def effective(client: AsyncClient, service_id: str) -> str:
+    response = await client.get(f"/api/v1/services/{service_id}")
+    return str(response.json()["effective_status"])
+
+
+@pytest.mark.asyncio
+async def test_dependencies_are_listed(client: AsyncClient) -> None:
+    db = await create_service(client, "postgres-primary")
+    cache = await create_service(client, "redis")
+    payments = await create_service(client, "payments")
+
+    assert (await add_dependency(client, payments, db))["status_code"] == 201
+    body = await add_dependency(client, payments, cache)
+    assert body["status_code"] == 201
+    assert [s["name"] for s in body["data"]] == ["postgres-primary", "redis"]
+
+    response = await client.get(f"/api/v1/services/{payments}/dependencies")
+    assert response.status_code == 200
+    assert response.json()["meta"]["total"] == 2
+    response = await client.get(f"/api/v1/services/{db}/dependencies")
+    assert response.json()["data"] == []
+
+
+@pytest.mark.asyncio
+async def test_dependencies_follow_an_edge_swap_at_the_same_instant(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    # The edge count and latest created_at end up as they were, so only the
+    # graph's version tells the cached graph is out of date.
+    db = await create_service(client, "postgres-primary")
+    cache = await create_service(client, "redis")
+    payments = await create_service(client, "payments")
+    await add_dependency(client, payments, db)
+    created_at = await db_session.scalar(select(service_dependencies.c.created_at))
+    assert created_at is not None
+
+    repo = DependencyRepository(db_session)
+    await repo.remove(uuid.UUID(payments), uuid.UUID(db))
+    await repo.add(uuid.UUID(payments), uuid.UUID(cache), created_at)
+
+    response = await client.get(f"/api/v1/services/{payments}/dependencies")
+    assert [s["name"] for s in response.json()["data"]] == ["redis"]
+
+
+@pytest.mark.asyncio
+async def test_dependency_commits_with_its_propagation(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db = await create_service(client, "postgres-primary")
+    payments = await create_service(client, "payments")
+
+    async def fail(*args: object) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(DependencyRepository, "set_effective_statuses", fail)
+    with pytest.raises(RuntimeError):
+        await add_dependency(client, payments, db)
+    # As closing the request's session does.
+    await db_session.rollback()
+
+    edges = await db_session.scalar(
+        select(func.count()).select_from(service_dependencies)
+    )
+    assert edges == 0
+
+
+@pytest.mark.asyncio
+async def test_dependency_outage_degrades_downstream(client: AsyncClient) -> None:
+    db = await create_service(client, "postgres-primary")
+    payments = await create_service(client, "payments")
+    checkout = await create_service(client, "checkout")
+    unrelated = await create_service(client, "search")
+    await add_dependency(client, payments, db)
+    await add_dependency(client, checkout, payments)
+
+    incident_id = await create_incident(client, [db], "critical")
+    assert await effective(client, db) == "outage"
+    assert await effective(client, payments) == "degraded"
+    assert await effective(client, checkout) == "degraded"
+    assert await effective(client, unrelated) == "operational"
+    # The direct status still reflects only the service's own incidents.
+    response = await client.get(f"/api/v1/services/{checkout}")
+    assert response.json()["status"] == "operational"
+
+    await client.post(f"/api/v1/incidents/{incident_id}/resolve")
+    assert await effective(client, payments) == "operational"
+    assert await effective(client, checkout) == "operational"
+
+
+@pytest.mark.asyncio
+async def test_own_outage_is_not_masked_by_dependencies(client: AsyncClient) -> None:
+    db = await create_service(client, "postgres-primary")
+    payments = await create_service(client, "payments")
+    await add_dependency(client, payments, db)
+    await create_incident(client, [db], "medium")
+    await create_incident(client, [payments], "critical")
+    assert await effective(client, payments) == "outage"
+
+
+@pytest.mark.asyncio
+async def test_adding_and_removing_edges_recomputes(client: AsyncClient) -> None:
+    db = await create_service(client, "postgres-primary")
+    payments = await create_service(client, "payments")
+    checkout = await create_service(client, "checkout")
+    await add_dependency(client, checkout, payments)
+    await create_incident(client, [db], "high")
+
+    await add_dependency(client, payments, db)
+    assert await effective(client, checkout) == "degraded"
+
+    response = await client.delete(f"/api/v1/services/{payments}/dependencies/{db}")
+    assert response.status_code == 204
+    assert await effective(client, payments) == "operational"
+    assert await effective(client, checkout) == "operational"
+
+
+@pytest.mark.asyncio
+async def test_dependency_cycles_are_rejected(client: AsyncClient) -> None:
+    a = await create_service(client, "a")
+    b = await create_service(client, "b")
+    c = await create_service(client, "c")
+    await add_dependency(client, a, b)
+    await add_dependency(client, b, c)
+
+    assert (await add_dependency(client, c, a))["status_code"] == 409
+    assert (await add_dependency(client, a, a))["status_code"] == 409
+    assert (await add_dependency(client, a, b))["status_code"] == 409
+    assert (await add_dependency(client, a, c))["status_code"] == 201
+
+
+@pytest.mark.asyncio
+async def test_dependency_unknown_services_return_404(client: AsyncClient) -> None:
+    service_id = await create_service(client, "payments")
+    missing = str(uuid.uuid4())
+    assert (await add_dependency(client, service_id, missing))["status_code"] == 404
+    assert (await add_dependency(client, missing, service_id))["status_code"] == 404
+    response = await client.get(f"/api/v1/services/{missing}/dependencies")
+    assert response.status_code == 404
+    response = await client.delete(
+        f"/api/v1/services/{service_id}/dependencies/{missing}"
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_service_removes_its_edges(client: AsyncClient) -> None:
+    db = await create_service(client, "postgres-primary")
+    proxy = await create_service(client, "pgbouncer")
+    payments = await create_service(client, "payments")
+    await add_dependency(client, proxy, db)
+    await add_dependency(client, payments, proxy)
+    await create_incident(client, [db], "critical")
+    assert await effective(client, payments) == "degraded"
+
+    # pgbouncer has no incidents of its own, so it can be deleted; payments no
+    # longer reaches postgres-primary.
+    assert (await client.delete(f"/api/v1/services/{proxy}")).status_code == 204
+    assert await effective(client, payments) == "operational"
+    response = await client.get(f"/api/v1/services/{payments}/dependencies")
+    assert response.json()["data"] == []
+
+
 # --- request ID header ---
 
 
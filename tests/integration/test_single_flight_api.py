@@ -0,0 +1,90 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.single_flight import SingleFlight
+from app.main import app
+from app.models.orm import Service
+
+
+@pytest_asyncio.fixture
+async def single_flight(client: AsyncClient) -> AsyncGenerator[SingleFlight, None]:
+    # Long enough to outlast the test, with early refresh off.
+    app.state.single_flight = SingleFlight(ttl=60, beta=0, max_entries=100)
+    yield app.state.single_flight
+    app.state.single_flight = None
+
+
+async def add_behind_the_api(db_session: AsyncSession, name: str) -> None:
+    db_session.add(Service(name=name))
+    await db_session.commit()
+
+
+def service_names(body: dict[str, list[dict[str, str]]]) -> list[str]:
+    return [s["name"] for s in body["data"]]
+
+
+async def coalesced_total(client: AsyncClient, source: str) -> float:
+    metrics = (await client.get("/metrics")).text
+    line = f'http_requests_coalesced_total{{source="{source}"}}'
+    return next(
+        (
+            float(row.split()[-1])
+            for row in metrics.splitlines()
+            if row.startswith(line)
+        ),
+        0.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_response(
+    client: AsyncClient, single_flight: SingleFlight
+) -> None:
+    await client.post("/api/v1/services", json={"name": "api"})
+    before = await coalesced_total(client, "flight")
+
+    # All twenty would otherwise run on the test's single session at once.
+    responses = await asyncio.gather(
+        *(client.get("/api/v1/services") for _ in range(20))
+    )
+    assert {r.status_code for r in responses} == {200}
+    assert {r.content for r in responses} == {responses[0].content}
+    assert len({r.headers["x-request-id"] for r in responses}) == 20
+    assert await coalesced_total(client, "flight") - before == 19
+
+
+@pytest.mark.asyncio
+async def test_reads_are_reused_until_a_write(
+    client: AsyncClient, db_session: AsyncSession, single_flight: SingleFlight
+) -> None:
+    await client.post("/api/v1/services", json={"name": "api"})
+    assert service_names((await client.get("/api/v1/services")).json()) == ["api"]
+
+    await add_behind_the_api(db_session, "hidden")
+    assert service_names((await client.get("/api/v1/services")).json()) == ["api"]
+
+    await client.post("/api/v1/services", json={"name": "db"})
+    names = service_names((await client.get("/api/v1/services")).json())
+    assert sorted(names) == ["api", "db", "hidden"]
+
+
+@pytest.mark.asyncio
+async def test_key_ignores_query_order_but_not_api_key(
+    client: AsyncClient, db_session: AsyncSession, single_flight: SingleFlight
+) -> None:
+    await client.post("/api/v1/services", json={"name": "api"})
+    first = await client.get("/api/v1/changes?after=0&limit=5")
+    await add_behind_the_api(db_session, "hidden")
+
+    reordered = await client.get("/api/v1/changes?limit=5&after=0")
+    assert reordered.json() == first.json()
+
+    other_caller = await client.get(
+        "/api/v1/changes?after=0&limit=5", headers={"X-API-Key": "other"}
+    )
+    assert other_caller.json()["meta"]["count"] == 2
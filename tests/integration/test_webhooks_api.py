@@ -0,0 +1,421 @@
+import asyncio
+import json
+import socket
+from collections import Counter, deque
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import httpx
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.analytics import AnalyticsRepository
+from app.db.repositories.base import as_utc
+from app.models.orm import Incident, WebhookDelivery
+from app.services.webhooks import SIGNATURE_HEADER, WebhookWorker, sign
+
+# --- stand-in receiver ---
+
+
+class Receiver:
+    # A local webhook endpoint: a minimal HTTP/1.1 server on an ephemeral port,
+    # keeping connections alive between requests like a real receiver would.
+    # Records every request and answers with the next queued status code, or
+    # 200 once none are queued.
+    def __init__(self) -> None:
+        self.base_url = ""
+        self.requests: list[tuple[str, dict[str, str], bytes]] = []
+        self.statuses: deque[int] = deque()
+        self.delay = 0.0
+        self.connections = 0
+        self.in_flight: Counter[str] = Counter()
+        self.max_in_flight: Counter[str] = Counter()
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while head := await reader.readuntil(b"\r\n\r\n"):
+                request_line, *header_lines = head.decode().split("\r\n")[:-2]
+                path = request_line.split(" ")[1]
+                headers = {
+                    name.lower(): value.strip()
+                    for name, value in (h.split(":", 1) for h in header_lines)
+                }
+                body = await reader.readexactly(int(headers["content-length"]))
+                self.in_flight[path] += 1
+                self.max_in_flight[path] = max(
+                    self.max_in_flight[path], self.in_flight[path]
+                )
+                await asyncio.sleep(self.delay)
+                self.in_flight[path] -= 1
+                self.requests.append((path, headers, body))
+                status = self.statuses.popleft() if self.statuses else 200
+                writer.write(
+                    f"HTTP/1.1 {status} -\r\ncontent-length: 0\r\n\r\n".encode()
+                )
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    def events(self, path: str = "/hook") -> list[dict[str, Any]]:
+        return [
+            event
+            for request_path, _, body in self.requests
+            if request_path == path
+            for event in json.loads(body)["events"]
+        ]
+
+
+@pytest_asyncio.fixture
+async def receiver() -> AsyncGenerator[Receiver, None]:
+    app = Receiver()
+    server = await asyncio.start_server(app.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    app.base_url = f"http://127.0.0.1:{port}"
+    async with server:
+        yield app
+
+
+@pytest_asyncio.fixture
+async def http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    async with httpx.AsyncClient(timeout=5) as client:
+        yield client
+
+
+def shared(
+    session: AsyncSession,
+) -> Callable[[], AbstractAsyncContextManager[AsyncSession]]:
+    # The worker normally opens its own sessions; here it uses the test's, so
+    # it sees what the API wrote.
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[AsyncSession]:
+        yield session
+
+    return factory
+
+
+# --- helpers ---
+
+
+async def subscribe(
+    client: AsyncClient, url: str, events: list[str], **fields: Any
+) -> dict[str, Any]:
+    response = await client.post(
+        "/api/v1/webhooks", json={"url": url, "events": events, **fields}
+    )
+    assert response.status_code == 201
+    return dict(response.json())
+
+
+async def create_service(client: AsyncClient, name: str = "api") -> str:
+    response = await client.post("/api/v1/services", json={"name": name})
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def create_incident(client: AsyncClient, service_id: str) -> str:
+    response = await client.post(
+        "/api/v1/incidents",
+        json={"title": "Down", "severity": "critical", "service_ids": [service_id]},
+    )
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+async def pending(client: AsyncClient, subscription_id: str) -> int:
+    response = await client.get(f"/api/v1/webhooks/{subscription_id}")
+    assert response.status_code == 200
+    return int(response.json()["pending"])
+
+
+async def deliveries(session: AsyncSession) -> list[WebhookDelivery]:
+    result = await session.execute(
+        select(WebhookDelivery)
+        .order_by(WebhookDelivery.id)
+        .execution_options(populate_existing=True)
+    )
+    return list(result.scalars().all())
+
+
+# --- subscriptions ---
+
+
+@pytest.mark.asyncio
+async def test_subscription_lifecycle(client: AsyncClient) -> None:
+    created = await subscribe(
+        client,
+        "https://hooks.example.com/opstatus",
+        ["incident.opened", "incident.resolved", "incident.opened"],
+        secret="s3cret",
+        max_concurrency=4,
+    )
+    assert created["events"] == ["incident.opened", "incident.resolved"]
+    assert created["signed"] is True
+    assert created["max_concurrency"] == 4
+    assert "secret" not in created
+
+    listed = (await client.get("/api/v1/webhooks")).json()
+    assert listed["meta"]["total"] == 1
+    assert listed["data"][0]["id"] == created["id"]
+
+    await create_incident(client, await create_service(client))
+    assert await pending(client, created["id"]) == 1
+
+    response = await client.delete(f"/api/v1/webhooks/{created['id']}")
+    assert response.status_code == 204
+    response = await client.get(f"/api/v1/webhooks/{created['id']}")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"url": "https://example.com", "events": []},
+        {"url": "https://example.com", "events": ["incident.deleted"]},
+        {"url": "ftp://example.com", "events": ["incident.opened"]},
+        {
+            "url": "https://example.com",
+            "events": ["incident.opened"],
+            "max_concurrency": 0,
+        },
+    ],
+)
+async def test_invalid_subscriptions_are_rejected(
+    client: AsyncClient, payload: dict[str, Any]
+) -> None:
+    response = await client.post("/api/v1/webhooks", json=payload)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_unknown_subscription_returns_404(client: AsyncClient) -> None:
+    missing = "00000000-0000-0000-0000-000000000000"
+    assert (await client.get(f"/api/v1/webhooks/{missing}")).status_code == 404
+    assert (await client.delete(f"/api/v1/webhooks/{missing}")).status_code == 404
+    response = await client.get(f"/api/v1/webhooks/{missing}/dead-letters")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_events_commit_with_the_incident_write(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await subscribe(
+        client,
+        "https://hooks.example.com/opstatus",
+        ["incident.opened", "service.status_changed"],
+    )
+    service_id = await create_service(client)
+
+    async def fail(self: AnalyticsRepository, incident_id: object) -> None:
+        raise RuntimeError("rollup write failed")
+
+    monkeypatch.setattr(AnalyticsRepository, "record_opened", fail)
+    with pytest.raises(RuntimeError):
+        await create_incident(client, service_id)
+    # As closing the request's session does.
+    await db_session.rollback()
+
+    assert await deliveries(db_session) == []
+    assert await db_session.scalar(select(func.count()).select_from(Incident)) == 0
+
+
+# --- delivery ---
+
+
+@pytest.mark.asyncio
+async def test_incident_lifecycle_is_delivered_in_one_signed_batch(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    receiver: Receiver,
+    http_client: httpx.AsyncClient,
+) -> None:
+    subscription = await subscribe(
+        client,
+        f"{receiver.base_url}/hook",
+        [
+            "incident.opened",
+            "incident.updated",
+            "incident.resolved",
+            "service.status_changed",
+        ],
+        secret="s3cret",
+    )
+    service_id = await create_service(client)
+    incident_id = await create_incident(client, service_id)
+    await client.post(
+        f"/api/v1/incidents/{incident_id}/updates",
+        json={"message": "Found it", "status": "identified"},
+    )
+    await client.post(f"/api/v1/incidents/{incident_id}/resolve")
+    # Nothing has been sent by the API calls themselves.
+    assert receiver.requests == []
+
+    worker = WebhookWorker(shared(db_session), http_client)
+    assert await worker.run_once() == 5
+
+    assert len(receiver.requests) == 1
+    _, headers, body = receiver.requests[0]
+    assert headers[SIGNATURE_HEADER.lower()] == sign("s3cret", body)
+    events = receiver.events()
+    assert [e["type"] for e in events] == [
+        "incident.opened",
+        "service.status_changed",
+        "incident.updated",
+        "service.status_changed",
+        "incident.resolved",
+    ]
+    assert events[0]["data"]["id"] == incident_id
+    assert events[2]["data"]["updates"][0]["message"] == "Found it"
+    assert events[4]["data"]["status"] == "resolved"
+    outage, recovered = events[1]["data"], events[3]["data"]
+    assert outage["service_id"] == service_id
+    assert (outage["previous_status"], outage["status"]) == ("operational", "outage")
+    assert (recovered["previous_status"], recovered["status"]) == (
+        "outage",
+        "operational",
+    )
+    assert len({e["id"] for e in events}) == 5
+    assert await pending(client, subscription["id"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_only_subscribed_events_are_queued(
+    client: AsyncClient, db_session: AsyncSession, http_client: httpx.AsyncClient
+) -> None:
+    subscription = await subscribe(
+        client, "http://127.0.0.1:9/hook", ["incident.resolved"]
+    )
+    await create_incident(client, await create_service(client))
+    assert await pending(client, subscription["id"]) == 0
+    assert await WebhookWorker(shared(db_session), http_client).run_once() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_is_retried_after_backoff(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    receiver: Receiver,
+    http_client: httpx.AsyncClient,
+) -> None:
+    subscription = await subscribe(
+        client, f"{receiver.base_url}/hook", ["incident.opened"]
+    )
+    await create_incident(client, await create_service(client))
+    receiver.statuses.append(500)
+    worker = WebhookWorker(shared(db_session), http_client, backoff_base=60)
+
+    before = datetime.now(UTC)
+    assert await worker.run_once() == 1
+    [delivery] = await deliveries(db_session)
+    assert delivery.attempts == 1
+    assert delivery.last_error == "HTTP 500"
+    # 60 seconds less up to half of it in jitter.
+    assert as_utc(delivery.next_attempt_at) >= before + timedelta(seconds=30)
+    # Not due yet.
+    assert await worker.run_once() == 0
+
+    await db_session.execute(
+        update(WebhookDelivery).values(next_attempt_at=datetime.now(UTC))
+    )
+    await db_session.commit()
+    assert await worker.run_once() == 1
+    assert await pending(client, subscription["id"]) == 0
+    first, second = (json.loads(body) for _, _, body in receiver.requests)
+    assert first == second
+
+
+@pytest.mark.asyncio
+async def test_exhausted_delivery_is_dead_lettered(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    receiver: Receiver,
+    http_client: httpx.AsyncClient,
+) -> None:
+    subscription = await subscribe(
+        client, f"{receiver.base_url}/hook", ["incident.opened"]
+    )
+    incident_id = await create_incident(client, await create_service(client))
+    receiver.statuses.extend([500, 503])
+    worker = WebhookWorker(
+        shared(db_session), http_client, max_attempts=2, backoff_base=0
+    )
+
+    assert await worker.run_once() == 1
+    assert await worker.run_once() == 1
+    assert await worker.run_once() == 0
+    assert await pending(client, subscription["id"]) == 0
+
+    response = await client.get(f"/api/v1/webhooks/{subscription['id']}/dead-letters")
+    assert response.status_code == 200
+    [letter] = response.json()["data"]
+    assert letter["event_type"] == "incident.opened"
+    assert letter["attempts"] == 2
+    assert letter["last_error"] == "HTTP 503"
+    assert letter["payload"]["data"]["id"] == incident_id
+
+
+@pytest.mark.asyncio
+async def test_unreachable_endpoint_is_retried(
+    client: AsyncClient, db_session: AsyncSession, http_client: httpx.AsyncClient
+) -> None:
+    # A port nothing listens on: bound, then released.
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    await subscribe(client, f"http://127.0.0.1:{port}/hook", ["incident.opened"])
+    await create_incident(client, await create_service(client))
+
+    assert await WebhookWorker(shared(db_session), http_client).run_once() == 1
+    [delivery] = await deliveries(db_session)
+    assert delivery.attempts == 1
+    assert delivery.last_error is not None
+    assert delivery.last_error.startswith("ConnectError")
+
+
+@pytest.mark.asyncio
+async def test_events_are_batched_and_concurrency_limited_per_endpoint(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    receiver: Receiver,
+    http_client: httpx.AsyncClient,
+) -> None:
+    await subscribe(
+        client, f"{receiver.base_url}/serial", ["incident.opened"], max_concurrency=1
+    )
+    await subscribe(
+        client, f"{receiver.base_url}/parallel", ["incident.opened"], max_concurrency=3
+    )
+    service_id = await create_service(client)
+    incident_ids = [await create_incident(client, service_id) for _ in range(5)]
+    receiver.delay = 0.1
+
+    worker = WebhookWorker(shared(db_session), http_client, batch_size=2)
+    assert await worker.run_once() == 10
+
+    for path in ("/serial", "/parallel"):
+        sizes = [
+            len(json.loads(body)["events"])
+            for request_path, _, body in receiver.requests
+            if request_path == path
+        ]
+        assert sorted(sizes) == [1, 2, 2]
+        assert sorted(e["data"]["id"] for e in receiver.events(path)) == sorted(
+            incident_ids
+        )
+    assert receiver.max_in_flight["/serial"] == 1
+    assert receiver.max_in_flight["/parallel"] == 3
+    # Six requests over pooled connections: at most one per request in flight.
+    assert receiver.connections <= 4
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from app.core.admission import Lane, LaneGate, PressureMonitor, classify
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pressure_holds_peak_and_decays() -> None:
+    clock = FakeClock()
+    monitor = PressureMonitor(half_life=1.0, clock=clock)
+    monitor.record_checkout_wait(0.4)
+    monitor.record_checkout_wait(0.1)
+    assert monitor.checkout_wait == 0.4
+    clock.now += 2
+    assert monitor.checkout_wait == pytest.approx(0.1)
+    assert monitor.loop_lag == 0
+
+
+@pytest.mark.asyncio
+async def test_gate_admits_up_to_limit_then_queues_in_order() -> None:
+    gate = LaneGate(Lane.read, limit=1, queue_seconds=5)
+    assert await gate.acquire()
+    first = asyncio.create_task(gate.acquire())
+    second = asyncio.create_task(gate.acquire())
+    await asyncio.sleep(0)
+    assert gate.queued == 2
+
+    gate.release()
+    assert await first
+    assert not second.done()
+    gate.release()
+    assert await second
+    gate.release()
+    assert (gate.active, gate.queued) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_gate_sheds_after_queue_budget() -> None:
+    gate = LaneGate(Lane.read, limit=1, queue_seconds=0.01)
+    assert await gate.acquire()
+    assert not await gate.acquire()
+    # The timed-out waiter does not take the slot when it is released.
+    gate.release()
+    assert gate.active == 0
+
+
+@pytest.mark.asyncio
+async def test_gate_without_queueing_sheds_at_once() -> None:
+    gate = LaneGate(Lane.read, limit=2, queue_seconds=5)
+    assert await gate.acquire(limit=1, queue=False)
+    assert not await gate.acquire(limit=1, queue=False)
+    assert await gate.acquire()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_passes_on_its_slot() -> None:
+    gate = LaneGate(Lane.write, limit=1, queue_seconds=5)
+    assert await gate.acquire()
+    waiter = asyncio.create_task(gate.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    gate.release()
+    assert (gate.active, gate.queued) == (0, 0)
+
+
+def test_classify() -> None:
+    assert classify("GET", "/health/live") is None
+    assert classify("GET", "/metrics") is None
+    assert classify("GET", "/health/ready") is Lane.health
+    assert classify("POST", "/api/v1/incidents") is Lane.write
+    assert classify("GET", "/api/v1/incidents") is Lane.read
@@ -0,0 +1,30 @@
+from app.core.compression import CODECS, negotiate, should_compress
+
+
+def test_negotiate_takes_highest_weight() -> None:
+    assert negotiate("gzip") == "gzip"
+    assert negotiate("deflate, gzip;q=0.5") == "gzip"
+    assert negotiate("") is None
+    assert negotiate("identity") is None
+    assert negotiate("gzip;q=0") is None
+    # A wildcard covers the encodings not named.
+    others = next((name for name in ("zstd", "br") if name in CODECS), None)
+    assert negotiate("*;q=0.1, gzip;q=0") == others
+
+
+def test_negotiate_prefers_zstd_then_br_on_ties() -> None:
+    expected = next(name for name in ("zstd", "br", "gzip") if name in CODECS)
+    assert negotiate("gzip, br, zstd") == expected
+    assert negotiate("*") == expected
+
+
+def test_should_compress_policy() -> None:
+    json = {"content-type": "application/json", "content-length": "2048"}
+    assert should_compress(200, json, 1024)
+    assert not should_compress(200, {**json, "content-length": "100"}, 1024)
+    assert not should_compress(404, json, 1024)
+    assert not should_compress(200, {**json, "content-encoding": "br"}, 1024)
+    # Streams carry no length and are never held back.
+    assert not should_compress(200, {"content-type": "application/json"}, 1024)
+    sse = {"content-type": "text/event-stream", "content-length": "4096"}
+    assert not should_compress(200, sse, 1024)
@@ -0,0 +1,72 @@
+import uuid
+
+from app.models.enums import ServiceStatus
+from app.services.dependencies import DependencyGraph, effective_status
+
+# db ← cache ← api ← web, and db ← worker: each edge is (dependent, dependency).
+DB, CACHE, API, WEB, WORKER, OTHER = (uuid.UUID(int=n) for n in range(1, 7))
+EDGES = [(CACHE, DB), (API, CACHE), (WEB, API), (WORKER, DB)]
+
+
+def test_downstream_is_transitive() -> None:
+    graph = DependencyGraph(EDGES)
+    assert graph.downstream(DB) == {CACHE, API, WEB, WORKER}
+    assert graph.downstream(API) == {WEB}
+    assert graph.downstream(WEB) == frozenset()
+    assert graph.downstream(OTHER) == frozenset()
+
+
+def test_creates_cycle() -> None:
+    graph = DependencyGraph(EDGES)
+    assert graph.creates_cycle(DB, WEB)
+    assert graph.creates_cycle(CACHE, CACHE)
+    assert not graph.creates_cycle(WEB, DB)
+    assert not graph.creates_cycle(WORKER, CACHE)
+
+
+def test_propagation_order_covers_only_the_downstream_closure() -> None:
+    graph = DependencyGraph(EDGES)
+    assert graph.propagation_order([API]) == [API, WEB]
+    assert graph.propagation_order([OTHER]) == [OTHER]
+
+
+def test_propagation_order_puts_dependencies_first() -> None:
+    # web depends on db both directly and through cache and api.
+    graph = DependencyGraph([*EDGES, (WEB, DB)])
+    order = graph.propagation_order([DB])
+    assert set(order) == {DB, CACHE, API, WEB, WORKER}
+    for dependent, dependency in [*EDGES, (WEB, DB)]:
+        assert order.index(dependency) < order.index(dependent)
+
+
+def test_own_status_wins() -> None:
+    assert (
+        effective_status(ServiceStatus.outage, [ServiceStatus.operational])
+        == ServiceStatus.outage
+    )
+    assert (
+        effective_status(ServiceStatus.degraded, [ServiceStatus.outage])
+        == ServiceStatus.degraded
+    )
+
+
+def test_impaired_dependency_degrades() -> None:
+    assert (
+        effective_status(ServiceStatus.operational, [ServiceStatus.outage])
+        == ServiceStatus.degraded
+    )
+    assert (
+        effective_status(
+            ServiceStatus.operational,
+            [ServiceStatus.operational, ServiceStatus.degraded],
+        )
+        == ServiceStatus.degraded
+    )
+
+
+def test_operational_with_healthy_dependencies() -> None:
+    assert effective_status(ServiceStatus.operational, []) == ServiceStatus.operational
+    assert (
+        effective_status(ServiceStatus.operational, [ServiceStatus.operational])
+        == ServiceStatus.operational
+    )
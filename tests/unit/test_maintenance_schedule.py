@@ -0,0 +1,52 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from app.services.maintenance import MaintenanceSchedule
+
+SERVICE = uuid.UUID(int=1)
+OTHER_SERVICE = uuid.UUID(int=2)
+MIDNIGHT = datetime(2026, 3, 10, tzinfo=UTC)
+
+
+def at(hours: float) -> datetime:
+    return MIDNIGHT + timedelta(hours=hours)
+
+
+def window(
+    start: float, end: float, service_id: uuid.UUID = SERVICE
+) -> tuple[uuid.UUID, datetime, datetime]:
+    # A window in hours from midnight.
+    return service_id, at(start), at(end)
+
+
+def test_window_covers_its_start_but_not_its_end() -> None:
+    schedule = MaintenanceSchedule([window(2, 4)])
+    assert not schedule.covers(SERVICE, at(1.99))
+    assert schedule.covers(SERVICE, at(2))
+    assert schedule.covers(SERVICE, at(3.99))
+    assert not schedule.covers(SERVICE, at(4))
+
+
+def test_gaps_between_windows_are_not_covered() -> None:
+    schedule = MaintenanceSchedule([window(6, 8), window(1, 2)])
+    assert schedule.covers(SERVICE, at(1.5))
+    assert not schedule.covers(SERVICE, at(4))
+    assert schedule.covers(SERVICE, at(7))
+    assert not schedule.covers(SERVICE, at(9))
+
+
+def test_overlapping_and_touching_windows_are_merged() -> None:
+    schedule = MaintenanceSchedule([window(3, 5), window(1, 4), window(5, 6)])
+    start, end = at(1).timestamp(), at(6).timestamp()
+    assert schedule.by_service() == {SERVICE: [(start, end)]}
+
+
+def test_a_window_nested_in_another_does_not_shorten_it() -> None:
+    schedule = MaintenanceSchedule([window(1, 10), window(2, 3)])
+    assert schedule.covers(SERVICE, at(5))
+
+
+def test_windows_apply_only_to_their_services() -> None:
+    schedule = MaintenanceSchedule([window(1, 2, OTHER_SERVICE)])
+    assert schedule.covers(OTHER_SERVICE, at(1))
+    assert not schedule.covers(SERVICE, at(1))
@@ -0,0 +1,44 @@
+from datetime import date
+
+from app.db.repositories.partitions import partition_name
+from app.services.partitions import add_months, plan_partitions
+
+TODAY = date(2026, 10, 19)
+
+
+def months(*pairs: tuple[int, int]) -> list[date]:
+    return [date(year, month, 1) for year, month in pairs]
+
+
+def test_add_months_crosses_year_boundaries() -> None:
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_partition_name_is_year_and_month() -> None:
+    assert partition_name(date(2026, 3, 1)) == "incident_updates_p202603"
+
+
+def test_creates_current_and_upcoming_months() -> None:
+    plan = plan_partitions([], TODAY, 3, 400)
+    assert plan.create == months((2026, 10), (2026, 11), (2026, 12), (2027, 1))
+    assert plan.expired == []
+
+
+def test_skips_months_that_already_exist() -> None:
+    existing = months((2026, 10), (2026, 11))
+    plan = plan_partitions(existing, TODAY, 3, 400)
+    assert plan.create == months((2026, 12), (2027, 1))
+
+
+def test_month_expires_once_entirely_older_than_retention() -> None:
+    # Cutoff is 2025-09-14: August 2025 ended before it, September did not.
+    existing = months((2025, 7), (2025, 8), (2025, 9), (2026, 10))
+    plan = plan_partitions(existing, TODAY, 0, 400)
+    assert plan.expired == months((2025, 7), (2025, 8))
+    assert plan.create == []
+
+
+def test_month_ending_on_the_cutoff_has_expired() -> None:
+    plan = plan_partitions(months((2026, 9)), date(2026, 10, 11), 0, 10)
+    assert plan.expired == months((2026, 9))
@@ -0,0 +1,62 @@
+from app.core.rate_limit import RouteClass, TokenBucketLimiter, classify
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_burst_then_throttled() -> None:
+    limiter = TokenBucketLimiter(rate=2, burst=3, max_clients=10, clock=FakeClock())
+    assert [limiter.acquire("a") for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire("a") == 0.5
+
+
+def test_tokens_refill_at_rate() -> None:
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate=2, burst=3, max_clients=10, clock=clock)
+    for _ in range(3):
+        limiter.acquire("a")
+    clock.now += 0.5
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") > 0
+
+
+def test_clients_have_separate_buckets() -> None:
+    limiter = TokenBucketLimiter(rate=1, burst=1, max_clients=10, clock=FakeClock())
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") > 0
+    assert limiter.acquire("b") == 0
+
+
+def test_refilled_buckets_are_evicted() -> None:
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate=1, burst=2, max_clients=10, clock=clock)
+    limiter.acquire("a")
+    clock.now += 1
+    limiter.acquire("b")
+    assert len(limiter) == 2
+    # "a" has been idle for its full refill time; "b" has not.
+    clock.now += 1
+    limiter.acquire("c")
+    assert len(limiter) == 2
+
+
+def test_client_count_is_capped() -> None:
+    limiter = TokenBucketLimiter(rate=1, burst=1, max_clients=3, clock=FakeClock())
+    for client in "abcdef":
+        limiter.acquire(client)
+    assert len(limiter) == 3
+
+
+def test_classify() -> None:
+    assert classify("GET", "/api/v1/incidents") is RouteClass.read
+    assert classify("POST", "/api/v1/incidents") is RouteClass.write
+    assert classify("DELETE", "/api/v1/services/x") is RouteClass.write
+    assert classify("GET", "/api/v1/analytics") is RouteClass.export
+    assert classify("GET", "/api/v1/services/uptime") is RouteClass.export
+    assert classify("GET", "/api/v1/services/x/uptime") is RouteClass.export
+    assert classify("GET", "/api/v1/services/x/status") is RouteClass.read
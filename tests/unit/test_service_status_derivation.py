@@ -115,3 +115,15 @@ def test_high_takes_precedence_over_medium() -> None:
         make_incident(IncidentSeverity.high),
     ]
     assert derive_service_status(incidents) == "outage"
+
+
+# --- maintenance ---
+
+
+def test_maintenance_overrides_active_incidents() -> None:
+    incidents = [make_incident(IncidentSeverity.critical)]
+    assert derive_service_status(incidents, in_maintenance=True) == "maintenance"
+
+
+def test_maintenance_without_incidents() -> None:
+    assert derive_service_status([], in_maintenance=True) == "maintenance"
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from app.core.single_flight import CachedResponse, SingleFlight
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Handler:
+    def __init__(self, status_code: int = 200) -> None:
+        self.calls = 0
+        self.status_code = status_code
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> CachedResponse:
+        self.calls += 1
+        await self.release.wait()
+        return CachedResponse(self.status_code, [], str(self.calls).encode(), {})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_computation() -> None:
+    flight = SingleFlight(ttl=0, beta=1, max_entries=10)
+    handler = Handler()
+    handler.release.clear()
+    requests = [asyncio.create_task(flight.fetch("k", handler)) for _ in range(5)]
+    await asyncio.sleep(0)
+    handler.release.set()
+    responses = await asyncio.gather(*requests)
+    assert handler.calls == 1
+    assert {r.body for r in responses} == {b"1"}
+    # With no TTL, nothing outlives the flight.
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_result_is_reused_until_expiry() -> None:
+    clock = FakeClock()
+    # rng() == 0 disables early refresh.
+    flight = SingleFlight(ttl=1, beta=1, max_entries=10, clock=clock, rng=lambda: 0)
+    handler = Handler()
+    assert (await flight.fetch("k", handler)).body == b"1"
+    clock.now += 0.9
+    assert (await flight.fetch("k", handler)).body == b"1"
+    clock.now += 0.1
+    assert (await flight.fetch("k", handler)).body == b"2"
+
+
+@pytest.mark.asyncio
+async def test_slow_responses_refresh_early() -> None:
+    clock = FakeClock()
+    draws = iter([0.0, 0.9])
+    flight = SingleFlight(
+        ttl=10, beta=1, max_entries=10, clock=clock, rng=lambda: next(draws)
+    )
+
+    async def slow() -> CachedResponse:
+        clock.now += 2
+        return CachedResponse(200, [], b"slow", {})
+
+    await flight.fetch("k", slow)
+    clock.now += 8
+    # 2 s from expiry: a draw of 0 keeps the entry...
+    assert (await flight.fetch("k", Handler())).body == b"slow"
+    # ...while -log(0.1) * 2 s of cost reaches past expiry.
+    assert (await flight.fetch("k", Handler())).body == b"1"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_results() -> None:
+    flight = SingleFlight(ttl=60, beta=1, max_entries=10)
+    handler = Handler()
+    await flight.fetch("k", handler)
+    flight.invalidate()
+    assert (await flight.fetch("k", handler)).body == b"2"
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached() -> None:
+    flight = SingleFlight(ttl=60, beta=1, max_entries=10)
+    handler = Handler(status_code=404)
+    await flight.fetch("k", handler)
+    await flight.fetch("k", handler)
+    assert handler.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_followers_compute_for_themselves_when_the_leader_fails() -> None:
+    flight = SingleFlight(ttl=0, beta=1, max_entries=10)
+    started = asyncio.Event()
+
+    async def failing() -> CachedResponse:
+        started.set()
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    leader = asyncio.create_task(flight.fetch("k", failing))
+    await started.wait()
+    follower = asyncio.create_task(flight.fetch("k", Handler()))
+    with pytest.raises(RuntimeError):
+        await leader
+    assert (await follower).body == b"1"
+
+
+@pytest.mark.asyncio
+async def test_entries_are_bounded() -> None:
+    flight = SingleFlight(ttl=60, beta=1, max_entries=2)
+    for key in "abc":
+        await flight.fetch(key, Handler())
+    assert len(flight) == 2
@@ -0,0 +1,81 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from app.db.repositories.uptime import ImpactRow
+from app.models.enums import IncidentSeverity
+from app.services.service_status import status_transitions
+
+SERVICE = uuid.UUID(int=1)
+CREATED = datetime(2026, 3, 10, tzinfo=UTC)
+
+
+def at(hours: float) -> datetime:
+    return CREATED + timedelta(hours=hours)
+
+
+def row(
+    start: float,
+    end: float | None,
+    severity: IncidentSeverity = IncidentSeverity.critical,
+    incident: int = 1,
+) -> ImpactRow:
+    # Builds an incident interval in hours from the service's creation.
+    return ImpactRow(
+        service_id=SERVICE,
+        severity=severity,
+        created_at=at(start),
+        resolved_at=at(end) if end is not None else None,
+        incident_id=uuid.UUID(int=incident),
+    )
+
+
+def statuses(rows: list[ImpactRow]) -> list[tuple[float, str]]:
+    return [
+        ((when - CREATED) / timedelta(hours=1), status)
+        for when, status, _ in status_transitions(CREATED, rows)
+    ]
+
+
+def test_service_without_incidents_is_operational_from_creation() -> None:
+    assert status_transitions(CREATED, []) == [(CREATED, "operational", None)]
+
+
+def test_incident_opens_and_closes_a_status() -> None:
+    assert statuses([row(1, 3)]) == [
+        (0, "operational"),
+        (1, "outage"),
+        (3, "operational"),
+    ]
+
+
+def test_open_incident_leaves_the_status_in_effect() -> None:
+    assert statuses([row(2, None, IncidentSeverity.low)]) == [
+        (0, "operational"),
+        (2, "degraded"),
+    ]
+
+
+def test_overlapping_incidents_log_only_status_changes() -> None:
+    rows = [
+        row(1, 6, IncidentSeverity.medium, incident=1),
+        row(2, 4, IncidentSeverity.high, incident=2),
+        row(3, 5, IncidentSeverity.critical, incident=3),
+    ]
+    assert statuses(rows) == [
+        (0, "operational"),
+        (1, "degraded"),
+        (2, "outage"),
+        (5, "degraded"),
+        (6, "operational"),
+    ]
+
+
+def test_handover_at_the_same_instant_is_not_a_change() -> None:
+    rows = [row(1, 2, incident=1), row(2, 3, IncidentSeverity.high, incident=2)]
+    assert statuses(rows) == [(0, "operational"), (1, "outage"), (3, "operational")]
+
+
+def test_transition_is_attributed_to_the_incident_that_caused_it() -> None:
+    rows = [row(1, 4, incident=1), row(2, 3, IncidentSeverity.low, incident=2)]
+    incidents = [incident for _, _, incident in status_transitions(CREATED, rows)]
+    assert incidents == [None, uuid.UUID(int=1), uuid.UUID(int=1)]
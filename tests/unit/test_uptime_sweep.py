@@ -0,0 +1,121 @@
+import uuid
+from datetime import UTC, date, datetime, timedelta
+
+from app.db.repositories.uptime import ImpactRow
+from app.models.enums import IncidentSeverity
+from app.services.uptime import DayImpact, sweep_daily_impact
+
+SERVICE = uuid.UUID(int=1)
+OTHER_SERVICE = uuid.UUID(int=2)
+DAY = date(2026, 3, 10)
+MIDNIGHT = datetime(2026, 3, 10, tzinfo=UTC)
+SINCE = MIDNIGHT
+UNTIL = MIDNIGHT + timedelta(days=3)
+
+
+def at(hours: float) -> datetime:
+    return MIDNIGHT + timedelta(hours=hours)
+
+
+def row(
+    start: float,
+    end: float | None,
+    severity: IncidentSeverity = IncidentSeverity.critical,
+    service_id: uuid.UUID = SERVICE,
+) -> ImpactRow:
+    # Builds an incident interval in hours from midnight on DAY.
+    return ImpactRow(
+        service_id=service_id,
+        severity=severity,
+        created_at=at(start),
+        resolved_at=at(end) if end is not None else None,
+    )
+
+
+def hours(seconds: float) -> float:
+    return seconds / 3600
+
+
+# --- single incidents ---
+
+
+def test_no_incidents_has_no_impact() -> None:
+    assert sweep_daily_impact([], SINCE, UNTIL) == {}
+
+
+def test_critical_incident_counts_as_outage() -> None:
+    result = sweep_daily_impact([row(1, 3)], SINCE, UNTIL)
+    assert result == {(SERVICE, DAY): DayImpact(2 * 3600, 0)}
+
+
+def test_low_incident_counts_as_degraded() -> None:
+    result = sweep_daily_impact([row(1, 3, IncidentSeverity.low)], SINCE, UNTIL)
+    assert result == {(SERVICE, DAY): DayImpact(0, 2 * 3600)}
+
+
+def test_incident_spanning_midnight_is_split_across_days() -> None:
+    result = sweep_daily_impact([row(22, 26)], SINCE, UNTIL)
+    assert hours(result[(SERVICE, DAY)].outage_seconds) == 2
+    assert hours(result[(SERVICE, DAY + timedelta(days=1))].outage_seconds) == 2
+
+
+def test_open_incident_runs_until_the_end_of_the_sweep() -> None:
+    result = sweep_daily_impact([row(12, None)], SINCE, at(18))
+    assert hours(result[(SERVICE, DAY)].outage_seconds) == 6
+
+
+def test_incident_is_clipped_to_the_sweep_window() -> None:
+    result = sweep_daily_impact([row(-5, 2)], SINCE, UNTIL)
+    assert result == {(SERVICE, DAY): DayImpact(2 * 3600, 0)}
+
+
+# --- overlapping incidents ---
+
+
+def test_overlapping_outages_are_not_double_counted() -> None:
+    result = sweep_daily_impact([row(1, 4), row(2, 6)], SINCE, UNTIL)
+    assert hours(result[(SERVICE, DAY)].outage_seconds) == 5
+
+
+def test_outage_takes_precedence_over_degraded() -> None:
+    rows = [row(0, 10, IncidentSeverity.medium), row(4, 6, IncidentSeverity.high)]
+    result = sweep_daily_impact(rows, SINCE, UNTIL)
+    assert result[(SERVICE, DAY)] == DayImpact(2 * 3600, 8 * 3600)
+
+
+def test_services_are_swept_independently() -> None:
+    rows = [row(1, 2), row(1, 5, IncidentSeverity.low, service_id=OTHER_SERVICE)]
+    result = sweep_daily_impact(rows, SINCE, UNTIL)
+    assert result[(SERVICE, DAY)] == DayImpact(3600, 0)
+    assert result[(OTHER_SERVICE, DAY)] == DayImpact(0, 4 * 3600)
+
+
+# --- maintenance ---
+
+
+def span(start: float, end: float) -> tuple[float, float]:
+    return at(start).timestamp(), at(end).timestamp()
+
+
+def test_maintenance_is_not_credited() -> None:
+    result = sweep_daily_impact([row(1, 5)], SINCE, UNTIL, {SERVICE: [span(2, 4)]})
+    assert result == {(SERVICE, DAY): DayImpact(2 * 3600, 0)}
+
+
+def test_maintenance_covers_degraded_time_too() -> None:
+    rows = [row(1, 5, IncidentSeverity.low)]
+    result = sweep_daily_impact(rows, SINCE, UNTIL, {SERVICE: [span(0, 3)]})
+    assert result == {(SERVICE, DAY): DayImpact(0, 2 * 3600)}
+
+
+def test_maintenance_is_clipped_to_the_sweep_window() -> None:
+    result = sweep_daily_impact(
+        [row(0, 6)], at(2), UNTIL, {SERVICE: [span(-10, 3), span(70, 90)]}
+    )
+    assert result == {(SERVICE, DAY): DayImpact(3 * 3600, 0)}
+
+
+def test_maintenance_applies_only_to_its_service() -> None:
+    rows = [row(1, 2), row(1, 2, service_id=OTHER_SERVICE)]
+    result = sweep_daily_impact(rows, SINCE, UNTIL, {OTHER_SERVICE: [span(0, 3)]})
+    assert result == {(SERVICE, DAY): DayImpact(3600, 0)}
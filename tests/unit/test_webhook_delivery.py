@@ -0,0 +1,38 @@
+import hashlib
+import hmac
+import random
+
+from app.services.webhooks import backoff_delay, sign
+
+
+class FixedRandom(random.Random):
+    # uniform() returns the given end of the range.
+    def __init__(self, high: bool) -> None:
+        super().__init__()
+        self.high = high
+
+    def uniform(self, a: float, b: float) -> float:
+        return b if self.high else a
+
+
+def test_backoff_doubles_per_attempt() -> None:
+    no_jitter = FixedRandom(high=False)
+    delays = [backoff_delay(n, 5, 3600, no_jitter) for n in range(1, 5)]
+    assert delays == [5, 10, 20, 40]
+
+
+def test_backoff_is_capped() -> None:
+    assert backoff_delay(20, 5, 3600, FixedRandom(high=False)) == 3600
+
+
+def test_jitter_takes_off_at_most_half() -> None:
+    assert backoff_delay(3, 5, 3600, FixedRandom(high=True)) == 10
+    rng = random.Random(1)
+    for _ in range(100):
+        assert 10 <= backoff_delay(3, 5, 3600, rng) <= 20
+
+
+def test_signature_is_hmac_sha256_of_body() -> None:
+    body = b'{"events": []}'
+    expected = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+    assert sign("s3cret", body) == f"sha256={expected}"